@@ -0,0 +1,35 @@
+"""add files_synced_sha to projects
+
+Revision ID: a3c5e7f90b12
+Revises: 33d711c094a5
+Create Date: 2026-10-18 10:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e7f90b12"
+down_revision: Union[str, None] = "33d711c094a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column(
+            "files_synced_sha",
+            sa.String(length=40),
+            nullable=True,
+            comment="Commit SHA the file index was last synced from",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "files_synced_sha")
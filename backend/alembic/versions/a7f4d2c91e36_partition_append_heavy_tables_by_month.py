@@ -0,0 +1,123 @@
+"""partition append-heavy tables by month
+
+Revision ID: a7f4d2c91e36
+Revises: e2b7c94d1a05
+Create Date: 2026-10-18 18:24:07.551930
+
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7f4d2c91e36"
+down_revision: Union[str, None] = "e2b7c94d1a05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> timestamp column it is range-partitioned on
+PARTITIONED_TABLES = {
+    "notifications": "created_at",
+    "github_webhook_deliveries": "received_at",
+    "task_activities": "created_at",
+}
+
+# Unique constraints, which must include the partition key once partitioned
+UNIQUE_CONSTRAINTS = {
+    "github_webhook_deliveries": ("uq_webhook_delivery_id", "delivery_id"),
+}
+
+# Future months created up front; the maintenance job keeps extending them
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _rebuild(table: str, partition_key: Optional[str]) -> None:
+    """
+    Recreate a table, partitioned by month on partition_key or unpartitioned.
+
+    Builds the new table next to the old one (same columns, defaults, check
+    constraints and comments), copies the rows, swaps the names and then
+    restores the primary key, unique constraints, indexes and foreign keys
+    captured from the old table. Unique indexes become plain indexes on the
+    partitioned table, which cannot enforce uniqueness without the key.
+    """
+    conn = op.get_bind()
+    params = {"table": table}
+    indexes = list(
+        conn.execute(
+            sa.text(
+                "SELECT indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = :table "
+                "AND indexname NOT IN ("
+                "SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass))"
+            ),
+            params,
+        ).scalars()
+    )
+    foreign_keys = conn.execute(
+        sa.text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'"
+        ),
+        params,
+    ).all()
+
+    new_table = f"{table}_rebuild"
+    partition_clause = f" PARTITION BY RANGE ({partition_key})" if partition_key else ""
+    op.execute(
+        f"CREATE TABLE {new_table} (LIKE {table} INCLUDING DEFAULTS "
+        f"INCLUDING CONSTRAINTS INCLUDING COMMENTS){partition_clause}"
+    )
+
+    if partition_key:
+        oldest = conn.execute(sa.text(f"SELECT min({partition_key}) FROM {table}")).scalar()
+        now = datetime.now(timezone.utc)
+        first = (oldest or now).astimezone(timezone.utc)
+        month = datetime(first.year, first.month, 1, tzinfo=timezone.utc)
+        last = _add_months(datetime(now.year, now.month, 1, tzinfo=timezone.utc), MONTHS_AHEAD)
+        while month <= last:
+            op.execute(
+                f"CREATE TABLE {table}_p{month.year:04d}{month.month:02d} "
+                f"PARTITION OF {new_table} FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {new_table} DEFAULT")
+
+    op.execute(f"INSERT INTO {new_table} SELECT * FROM {table}")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+
+    key_columns = f"id, {partition_key}" if partition_key else "id"
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({key_columns})")
+    if table in UNIQUE_CONSTRAINTS:
+        name, column = UNIQUE_CONSTRAINTS[table]
+        unique_columns = f"{column}, {partition_key}" if partition_key else column
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({unique_columns})")
+    for indexdef in indexes:
+        # Indexes of a partitioned table are reported as "ON ONLY <table>"
+        indexdef = indexdef.replace(" ON ONLY ", " ON ", 1)
+        if partition_key:
+            indexdef = indexdef.replace("CREATE UNIQUE INDEX", "CREATE INDEX", 1)
+        op.execute(indexdef)
+    for name, definition in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+
+
+def upgrade() -> None:
+    for table, partition_key in PARTITIONED_TABLES.items():
+        _rebuild(table, partition_key)
+
+
+def downgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        _rebuild(table, None)
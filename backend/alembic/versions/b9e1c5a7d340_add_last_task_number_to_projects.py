@@ -0,0 +1,53 @@
+"""add last_task_number to projects
+
+Revision ID: b9e1c5a7d340
+Revises: a7f4d2c91e36
+Create Date: 2026-10-18 19:10:52.304118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e1c5a7d340"
+down_revision: Union[str, None] = "a7f4d2c91e36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column(
+            "last_task_number",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Last task identifier number allocated in this project",
+        ),
+    )
+    # Continue numbering after the highest existing identifier (or task count,
+    # for projects whose identifiers were generated from the count)
+    op.execute(
+        """
+        UPDATE projects SET last_task_number = numbered.last_number
+        FROM (
+            SELECT project_id,
+                   GREATEST(
+                       count(*),
+                       max(CAST(substring(identifier FROM '([0-9]+)$') AS integer))
+                   ) AS last_number
+            FROM tasks
+            GROUP BY project_id
+        ) AS numbered
+        WHERE projects.id = numbered.project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "last_task_number")
@@ -0,0 +1,148 @@
+"""add trigger-maintained task aggregates
+
+Revision ID: c3d8f1e2a9b7
+Revises: b9e1c5a7d340
+Create Date: 2026-10-18 19:52:31.418206
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8f1e2a9b7"
+down_revision: Union[str, None] = "b9e1c5a7d340"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _deltas(rows: str, sign: str) -> str:
+    """Project and milestone counter deltas of a transition table."""
+    return (
+        f"SELECT project_id AS scope_id, 'project' AS scope, project_id, status, "
+        f"{sign}1 AS task_count, {sign}coalesce(estimate_hours, 0) AS estimate_hours "
+        f"FROM {rows} "
+        f"UNION ALL "
+        f"SELECT milestone_id, 'milestone', project_id, status, "
+        f"{sign}1, {sign}coalesce(estimate_hours, 0) "
+        f"FROM {rows} WHERE milestone_id IS NOT NULL"
+    )
+
+
+def _apply(deltas: str) -> str:
+    """Upsert summed deltas, skipping ones that cancel out or target deleted scopes."""
+    return f"""
+        INSERT INTO task_aggregates
+            (scope_id, status, scope, project_id, task_count, estimate_hours, updated_at)
+        SELECT scope_id, status, scope, project_id, sum(task_count), sum(estimate_hours), now()
+        FROM ({deltas}) AS deltas
+        WHERE EXISTS (SELECT 1 FROM projects WHERE projects.id = deltas.project_id)
+          AND (deltas.scope = 'project'
+               OR EXISTS (SELECT 1 FROM milestones WHERE milestones.id = deltas.scope_id))
+        GROUP BY scope_id, status, scope, project_id
+        HAVING sum(task_count) <> 0 OR sum(estimate_hours) <> 0
+        ORDER BY scope_id, status
+        ON CONFLICT (scope_id, status) DO UPDATE SET
+            task_count = task_aggregates.task_count + EXCLUDED.task_count,
+            estimate_hours = task_aggregates.estimate_hours + EXCLUDED.estimate_hours,
+            updated_at = EXCLUDED.updated_at;"""
+
+
+_INSERTED = _deltas("new_rows", "")
+_DELETED = _deltas("old_rows", "-")
+
+TASK_AGGREGATE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION apply_task_aggregate_deltas() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_apply(_INSERTED)}
+    ELSIF TG_OP = 'UPDATE' THEN{_apply(f"{_INSERTED} UNION ALL {_DELETED}")}
+    ELSE{_apply(_DELETED)}
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+TASK_AGGREGATE_TRIGGERS = {
+    "tasks_aggregate_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "tasks_aggregate_update": (
+        "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "tasks_aggregate_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_aggregates",
+        sa.Column(
+            "scope_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="Project or milestone ID, depending on scope",
+        ),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column(
+            "scope",
+            sa.String(length=20),
+            nullable=False,
+            comment="Scope type: project or milestone",
+        ),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("task_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "estimate_hours",
+            sa.Float(),
+            server_default="0",
+            nullable=False,
+            comment="Sum of estimate_hours of the counted tasks",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("scope_id", "status"),
+    )
+    op.create_index(
+        op.f("ix_task_aggregates_project_id"), "task_aggregates", ["project_id"], unique=False
+    )
+
+    # Backfill before the triggers exist; both run in the migration transaction
+    op.execute(
+        """
+        INSERT INTO task_aggregates (scope_id, status, scope, project_id, task_count, estimate_hours)
+        SELECT project_id, status, 'project', project_id,
+               count(*), coalesce(sum(estimate_hours), 0)
+        FROM tasks
+        GROUP BY project_id, status
+        UNION ALL
+        SELECT milestone_id, status, 'milestone', project_id,
+               count(*), coalesce(sum(estimate_hours), 0)
+        FROM tasks
+        WHERE milestone_id IS NOT NULL
+        GROUP BY milestone_id, project_id, status
+        """
+    )
+
+    op.execute(TASK_AGGREGATE_FUNCTION)
+    for name, timing in TASK_AGGREGATE_TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {timing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION apply_task_aggregate_deltas()"
+        )
+
+
+def downgrade() -> None:
+    for name in TASK_AGGREGATE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_aggregate_deltas()")
+    op.drop_index(op.f("ix_task_aggregates_project_id"), table_name="task_aggregates")
+    op.drop_table("task_aggregates")
@@ -0,0 +1,43 @@
+"""add trigram file search indexes
+
+Revision ID: c4d8e2a61f37
+Revises: a3c5e7f90b12
+Create Date: 2026-10-18 13:05:21.442817
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e2a61f37"
+down_revision: Union[str, None] = "a3c5e7f90b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_file_path_trgm",
+        "files",
+        ["path"],
+        postgresql_using="gin",
+        postgresql_ops={"path": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_file_content_trgm",
+        "files",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+        postgresql_where=sa.text("content IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_content_trgm", table_name="files")
+    op.drop_index("ix_file_path_trgm", table_name="files")
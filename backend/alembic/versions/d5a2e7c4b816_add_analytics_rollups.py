@@ -0,0 +1,113 @@
+"""add analytics rollups and watermarks
+
+Revision ID: d5a2e7c4b816
+Revises: c3d8f1e2a9b7
+Create Date: 2026-10-18 20:34:12.907315
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a2e7c4b816"
+down_revision: Union[str, None] = "c3d8f1e2a9b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_rollups",
+        sa.Column(
+            "period",
+            sa.String(length=10),
+            nullable=False,
+            comment="Rollup granularity: day or week",
+        ),
+        sa.Column(
+            "period_start",
+            sa.Date(),
+            nullable=False,
+            comment="First day of the period (weeks start on Monday, UTC)",
+        ),
+        sa.Column(
+            "scope", sa.String(length=20), nullable=False, comment="Scope type: project or user"
+        ),
+        sa.Column(
+            "scope_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="Project or user ID, depending on scope",
+        ),
+        sa.Column("tasks_created", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "tasks_completed",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Tasks done in the period (throughput); by assignee for user scope",
+        ),
+        sa.Column(
+            "cycle_time_p50_hours",
+            sa.Float(),
+            nullable=True,
+            comment="Median hours from started to done",
+        ),
+        sa.Column(
+            "cycle_time_p90_hours",
+            sa.Float(),
+            nullable=True,
+            comment="90th percentile hours from started to done",
+        ),
+        sa.Column("ai_operations", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("ai_tokens", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "ai_cost",
+            sa.Numeric(precision=12, scale=6),
+            server_default="0",
+            nullable=False,
+            comment="AI cost in the period",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("period", "period_start", "scope", "scope_id"),
+    )
+    op.create_index(
+        "ix_analytics_rollups_scope_series",
+        "analytics_rollups",
+        ["scope_id", "period", "period_start"],
+        unique=False,
+    )
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column(
+            "watermark",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Source rows changed before this time are rolled up",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rollup_watermarks")
+    op.drop_index("ix_analytics_rollups_scope_series", table_name="analytics_rollups")
+    op.drop_table("analytics_rollups")
@@ -0,0 +1,35 @@
+"""add prs_synced_at to github_integrations
+
+Revision ID: d6a1f3b80c24
+Revises: c4d8e2a61f37
+Create Date: 2026-10-18 14:21:07.590314
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6a1f3b80c24"
+down_revision: Union[str, None] = "c4d8e2a61f37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "github_integrations",
+        sa.Column(
+            "prs_synced_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Latest pull request updated_at seen by sync (incremental cursor)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("github_integrations", "prs_synced_at")
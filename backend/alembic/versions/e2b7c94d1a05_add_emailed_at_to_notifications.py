@@ -0,0 +1,43 @@
+"""add emailed_at to notifications
+
+Revision ID: e2b7c94d1a05
+Revises: d6a1f3b80c24
+Create Date: 2026-10-18 16:02:41.118203
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c94d1a05"
+down_revision: Union[str, None] = "d6a1f3b80c24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notifications",
+        sa.Column(
+            "emailed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When notification was emailed (instantly or in a digest)",
+        ),
+    )
+    op.create_index(
+        "ix_notifications_email_pending",
+        "notifications",
+        ["user_id", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("emailed_at IS NULL AND is_read = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_email_pending", table_name="notifications")
+    op.drop_column("notifications", "emailed_at")
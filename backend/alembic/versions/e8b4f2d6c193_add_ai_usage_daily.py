@@ -0,0 +1,131 @@
+"""add ai usage daily aggregate
+
+Revision ID: e8b4f2d6c193
+Revises: d5a2e7c4b816
+Create Date: 2026-10-18 22:05:47.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b4f2d6c193"
+down_revision: Union[str, None] = "d5a2e7c4b816"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Builds the aggregate from the existing usage log
+BACKFILL_SQL = """
+INSERT INTO ai_usage_daily (
+    id, usage_date, user_id, project_id, model_name, operation,
+    operations, tokens_input, tokens_output, cost, created_at, updated_at
+)
+SELECT gen_random_uuid(), usage_date, user_id, project_id, model_name, operation,
+       count(*), sum(tokens_input), sum(tokens_output), sum(cost), now(), now()
+FROM ai_usage
+GROUP BY usage_date, user_id, project_id, model_name, operation
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_usage_daily",
+        sa.Column("usage_date", sa.Date(), nullable=False, comment="Day of the operations"),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="UUID of user who performed the operations",
+        ),
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="UUID of associated project (nullable for personal operations)",
+        ),
+        sa.Column(
+            "model_name", sa.String(length=100), nullable=False, comment="Name of AI model used"
+        ),
+        sa.Column(
+            "operation",
+            sa.String(length=20),
+            nullable=False,
+            comment="Type of AI operation performed",
+        ),
+        sa.Column(
+            "operations",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of operations",
+        ),
+        sa.Column(
+            "tokens_input",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+            comment="Sum of input tokens",
+        ),
+        sa.Column(
+            "tokens_output",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+            comment="Sum of output tokens",
+        ),
+        sa.Column(
+            "cost",
+            sa.Numeric(precision=14, scale=6),
+            server_default="0",
+            nullable=False,
+            comment="Sum of cost",
+        ),
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "usage_date",
+            "user_id",
+            "project_id",
+            "model_name",
+            "operation",
+            name="uq_ai_usage_daily_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        "ix_ai_usage_daily_user_date", "ai_usage_daily", ["user_id", "usage_date"], unique=False
+    )
+    op.create_index(
+        "ix_ai_usage_daily_project_date",
+        "ai_usage_daily",
+        ["project_id", "usage_date"],
+        unique=False,
+    )
+    op.create_index("ix_ai_usage_daily_date", "ai_usage_daily", ["usage_date"], unique=False)
+
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_usage_daily_date", table_name="ai_usage_daily")
+    op.drop_index("ix_ai_usage_daily_project_date", table_name="ai_usage_daily")
+    op.drop_index("ix_ai_usage_daily_user_date", table_name="ai_usage_daily")
+    op.drop_table("ai_usage_daily")
@@ -0,0 +1,109 @@
+"""add trigger-marked analytics dirty days
+
+Revision ID: f1c7a3e9d254
+Revises: e8b4f2d6c193
+Create Date: 2026-10-19 09:12:40.561873
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c7a3e9d254"
+down_revision: Union[str, None] = "e8b4f2d6c193"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TASK_COLUMNS = (
+    "created_at",
+    "completed_at",
+    "started_at",
+    "status",
+    "project_id",
+    "assignee_id",
+)
+
+
+def _mark(timestamps: str) -> str:
+    """Insert the UTC days of a (ts) relation, locking keys in order."""
+    return f"""
+        INSERT INTO analytics_dirty_days (day)
+        SELECT DISTINCT (ts AT TIME ZONE 'UTC')::date AS day
+        FROM ({timestamps}) AS changes
+        WHERE ts IS NOT NULL
+        ORDER BY day
+        ON CONFLICT (day) DO NOTHING;"""
+
+
+def _timestamps(rows: str) -> str:
+    """Created and completed timestamps of a transition table."""
+    return f"SELECT created_at AS ts FROM {rows} UNION ALL SELECT completed_at FROM {rows}"
+
+
+_OLD_COLUMNS = ", ".join(f"o.{column}" for column in ROLLUP_TASK_COLUMNS)
+_NEW_COLUMNS = ", ".join(f"n.{column}" for column in ROLLUP_TASK_COLUMNS)
+
+_UPDATED = (
+    f"SELECT ts FROM old_rows o JOIN new_rows n ON n.id = o.id "
+    f"CROSS JOIN LATERAL (VALUES (o.created_at), (o.completed_at), "
+    f"(n.created_at), (n.completed_at)) AS days(ts) "
+    f"WHERE ({_OLD_COLUMNS}) IS DISTINCT FROM ({_NEW_COLUMNS})"
+)
+
+ROLLUP_DIRTY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION mark_analytics_dirty_days() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_mark(_timestamps("new_rows"))}
+    ELSIF TG_OP = 'UPDATE' THEN{_mark(_UPDATED)}
+    ELSE{_mark(_timestamps("old_rows"))}
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+ROLLUP_DIRTY_TRIGGERS = {
+    "tasks_analytics_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "tasks_analytics_update": (
+        "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "tasks_analytics_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_dirty_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "marked_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When the day was first marked since the last claim",
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+    op.execute(ROLLUP_DIRTY_FUNCTION)
+    for name, timing in ROLLUP_DIRTY_TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {timing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION mark_analytics_dirty_days()"
+        )
+
+    # Rollups built before the triggers may still count reopened or deleted
+    # tasks; dropping the watermark makes the next run rebuild the backfill window
+    op.execute("DELETE FROM rollup_watermarks WHERE name = 'analytics_rollups'")
+
+
+def downgrade() -> None:
+    for name in ROLLUP_DIRTY_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS mark_analytics_dirty_days()")
+    op.drop_table("analytics_dirty_days")
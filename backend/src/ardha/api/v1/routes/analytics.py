@@ -0,0 +1,108 @@
+"""
+Analytics API routes.
+
+This module provides chart endpoints served from the precomputed daily and
+weekly analytics rollups:
+- Project series (tasks created/completed, throughput, cycle time, AI cost)
+- Current user's series (assigned tasks and own AI usage)
+"""
+
+import logging
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.core.database import get_db
+from ardha.core.security import get_current_active_user
+from ardha.models.user import User
+from ardha.schemas.responses.analytics import RollupSeriesResponse
+from ardha.services.analytics_service import AnalyticsService, InsufficientAnalyticsPermissionsError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+# ============= Chart Endpoints =============
+
+
+@router.get(
+    "/projects/{project_id}/rollups",
+    response_model=RollupSeriesResponse,
+    summary="Get project analytics series",
+    description="Get a project's daily or weekly metrics from the precomputed rollups.",
+)
+async def get_project_rollups(
+    project_id: UUID,
+    period: str = Query("day", pattern="^(day|week)$", description="day or week"),
+    start: date | None = Query(None, description="First day (default: 30 days / 12 weeks ago)"),
+    end: date | None = Query(None, description="Last day (default: today)"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> RollupSeriesResponse:
+    """
+    Get a project's analytics series.
+
+    **Permissions:** Requires project viewer access.
+
+    Points are one per day or week (weeks start on Monday, UTC) with gaps
+    zero-filled. Rollups are refreshed hourly by a background job.
+
+    **Returns:**
+    - **200 OK**: Series of tasks created/completed, throughput, cycle time
+      percentiles and AI usage
+    - **400 Bad Request**: Invalid date range
+    - **403 Forbidden**: User lacks permissions
+    """
+    try:
+        service = AnalyticsService(db)
+        return await service.get_project_series(project_id, current_user.id, period, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InsufficientAnalyticsPermissionsError as e:
+        logger.warning(f"Permission denied getting project analytics: {e}")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting project analytics: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get project analytics",
+        )
+
+
+@router.get(
+    "/users/me/rollups",
+    response_model=RollupSeriesResponse,
+    summary="Get my analytics series",
+    description="Get the current user's daily or weekly metrics from the precomputed rollups.",
+)
+async def get_my_rollups(
+    period: str = Query("day", pattern="^(day|week)$", description="day or week"),
+    start: date | None = Query(None, description="First day (default: 30 days / 12 weeks ago)"),
+    end: date | None = Query(None, description="Last day (default: today)"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> RollupSeriesResponse:
+    """
+    Get the current user's analytics series.
+
+    Task metrics count tasks assigned to the user; AI metrics count the
+    user's own operations across all projects.
+
+    **Returns:**
+    - **200 OK**: Series of the user's metrics
+    - **400 Bad Request**: Invalid date range
+    """
+    try:
+        service = AnalyticsService(db)
+        return await service.get_user_series(current_user.id, period, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting user analytics: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get user analytics",
+        )
@@ -6,11 +6,13 @@ CRUD operations, content management, and file history.
 """
 
 import logging
+import mimetypes
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ardha.core.database import get_db
@@ -211,6 +213,11 @@ async def get_file_content(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+    except FileValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Error getting file content {file_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -219,6 +226,71 @@ async def get_file_content(
         )
 
 
+@router.get(
+    "/{file_id}/raw",
+    summary="Stream raw file content",
+    description="Stream file content at a git ref in chunks. User must be a project member.",
+)
+async def get_file_raw(
+    file_id: UUID,
+    ref: str = Query("HEAD", description="Git reference (default: HEAD)"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream raw file content.
+
+    Query parameters:
+    - **ref**: Git reference (commit SHA, branch, tag, default: HEAD)
+
+    User must be a project member to view file content.
+
+    Returns the file bytes with its blob SHA as ETag. Content beyond the
+    configured size cap is cut off and flagged with X-Content-Truncated.
+    """
+    try:
+        from ardha.core.config import get_settings
+
+        settings = get_settings()
+
+        project_root = Path(settings.files.project_root)
+        project_root.mkdir(parents=True, exist_ok=True)
+
+        service = FileService(db, project_root)
+        file, info, chunks = await service.open_file_stream(file_id, current_user.id, ref)
+
+        headers = {
+            "Content-Length": str(min(info["size"], settings.git.blob_max_bytes)),
+            "ETag": f'"{info["sha"]}"',
+        }
+        if info["truncated"]:
+            headers["X-Content-Truncated"] = "true"
+
+        return StreamingResponse(
+            chunks,
+            media_type=mimetypes.guess_type(file.path)[0] or "application/octet-stream",
+            headers=headers,
+        )
+
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except FilePermissionError as e:
+        logger.warning(f"Permission denied accessing file content: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error streaming file content {file_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get file content",
+        )
+
+
 @router.patch(
     "/{file_id}",
     response_model=FileResponse,
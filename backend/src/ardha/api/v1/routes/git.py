@@ -10,6 +10,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ardha.core.database import get_db
@@ -696,7 +697,7 @@ async def get_git_status(
         # Get status from git service
         project_root = settings.files.project_root
         git_service = GitCommitService(db, project_root)
-        status_info = git_service.git_service.get_status()
+        status_info = await git_service.git.get_status()
 
         return status_info
 
@@ -756,6 +757,66 @@ async def get_commit_diff(
         )
 
 
+@router.get(
+    "/commits/{commit_id}/diff/stream",
+    summary="Stream commit diff",
+    description=(
+        "Stream a commit's diff as a unified patch or per-file hunks (NDJSON), "
+        "capped per file and in total. User must be a project member."
+    ),
+)
+async def stream_commit_diff(
+    commit_id: UUID,
+    diff_format: str = Query(
+        "patch", alias="format", pattern="^(patch|hunks)$", description="patch or hunks"
+    ),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream the diff a commit introduced.
+
+    Query parameters:
+    - **format**: "patch" for a unified diff, "hunks" for one JSON object per
+      changed file per line (path, status, line counts, hunks)
+
+    User must be a project member to view commit diff.
+
+    Files whose patch exceeds the per-file cap end with a truncation marker
+    line (patch) or "truncated": true (hunks); output stops at the total cap.
+    """
+    try:
+        from ardha.core.config import get_settings
+
+        settings = get_settings()
+        project_root = settings.files.project_root
+        service = GitCommitService(db, project_root)
+        chunks = await service.stream_commit_diff(commit_id, current_user.id, diff_format)
+
+        return StreamingResponse(
+            chunks,
+            media_type="application/x-ndjson" if diff_format == "hunks" else "text/x-diff",
+        )
+
+    except GitCommitNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except GitCommitPermissionError as e:
+        logger.warning(f"Permission denied accessing commit diff: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error streaming diff for commit {commit_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get commit diff",
+        )
+
+
 @router.post(
     "/projects/{project_id}/push",
     summary="Push commits to remote",
@@ -903,7 +964,7 @@ async def create_branch(
         # Create branch using git service
         project_root = settings.files.project_root
         git_commit_service = GitCommitService(db, project_root)
-        git_commit_service.git_service.create_branch(branch_name, start_point)
+        await git_commit_service.git.create_branch(branch_name, start_point)
 
         return {"branch": branch_name, "created": True}
 
@@ -957,7 +1018,7 @@ async def checkout_branch(
         # Switch branch using git service
         project_root = settings.files.project_root
         git_commit_service = GitCommitService(db, project_root)
-        git_commit_service.git_service.switch_branch(branch_name, create)
+        await git_commit_service.git.switch_branch(branch_name, create)
 
         return {"branch": branch_name, "switched": True}
 
@@ -647,6 +647,7 @@ async def get_milestone_summary(
     - **total_tasks**: Total number of tasks
     - **completed_tasks**: Number of completed tasks
     - **auto_progress**: Auto-calculated progress from task completion
+    - **estimate_hours** / **completed_estimate_hours**: Summed task estimates
 
     **Returns:**
     - **200 OK**: Milestone summary
@@ -669,6 +670,8 @@ async def get_milestone_summary(
             total_tasks=summary["total_tasks"],
             completed_tasks=summary["completed_tasks"],
             auto_progress=summary["auto_progress"],
+            estimate_hours=summary["estimate_hours"],
+            completed_estimate_hours=summary["completed_estimate_hours"],
         )
     except MilestoneNotFoundError as e:
         logger.warning(f"Milestone not found: {e}")
@@ -711,6 +714,8 @@ async def get_project_roadmap(
     - Gantt chart views
     - Project planning dashboards
 
+    Each milestone includes task_count, completed_task_count and estimate_hours.
+
     **Returns:**
     - **200 OK**: List of all milestones ordered by order/dates
     - **403 Forbidden**: User lacks permissions
@@ -718,14 +723,17 @@ async def get_project_roadmap(
     """
     try:
         service = MilestoneService(db)
-        milestones = await service.get_project_roadmap(project_id, current_user.id)
+        roadmap = await service.get_project_roadmap(project_id, current_user.id)
 
         # Add computed fields
         responses = []
-        for milestone in milestones:
+        for milestone, stats in roadmap:
             response = MilestoneResponse.model_validate(milestone)
             response.is_overdue = milestone.is_overdue
             response.days_remaining = milestone.days_remaining
+            response.task_count = stats.total
+            response.completed_task_count = stats.completed
+            response.estimate_hours = stats.estimate_hours
             responses.append(response)
 
         return responses
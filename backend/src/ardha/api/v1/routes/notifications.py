@@ -278,31 +278,24 @@ async def get_notification_stats(
     try:
         stats = await service.get_notification_stats(user_id=current_user.id)
 
-        # Convert recent notifications to NotificationResponse objects
-        recent_notifications = []
-        for notif_data in stats["recent_notifications"]:
-            # Get full notification from database for complete data
-            from ardha.repositories.notification_repository import NotificationRepository
-
-            repo = NotificationRepository(db)
-            notif = await repo.get_by_id(UUID(notif_data["id"]))
-            if notif:
-                recent_notifications.append(
-                    NotificationResponse(
-                        id=notif.id,
-                        user_id=notif.user_id,
-                        type=notif.type,
-                        title=notif.title,
-                        message=notif.message,
-                        data=notif.data,
-                        link_type=notif.link_type,
-                        link_id=notif.link_id,
-                        is_read=notif.is_read,
-                        read_at=notif.read_at,
-                        created_at=notif.created_at,
-                        expires_at=notif.expires_at,
-                    )
-                )
+        # Recent notifications come from the cached inbox with every field set
+        recent_notifications = [
+            NotificationResponse(
+                id=n.id,
+                user_id=n.user_id,
+                type=n.type,
+                title=n.title,
+                message=n.message,
+                data=n.data,
+                link_type=n.link_type,
+                link_id=n.link_id,
+                is_read=n.is_read,
+                read_at=n.read_at,
+                created_at=n.created_at,
+                expires_at=n.expires_at,
+            )
+            for n in stats["recent_notifications"]
+        ]
 
         return NotificationStatsResponse(
             total_count=stats["total_count"],
@@ -7,7 +7,7 @@ This module provides REST API endpoints for task management including:
 - Dependencies
 - Tags
 - Activity log
-- Special views (Board, Calendar, Timeline)
+- Special views (Board, Calendar, Timeline, Plan)
 """
 
 import logging
@@ -37,6 +37,8 @@ from ardha.schemas.responses.task import (
     TaskCalendarResponse,
     TaskDependencyResponse,
     TaskListResponse,
+    TaskPlanItemResponse,
+    TaskPlanResponse,
     TaskResponse,
     TaskTagResponse,
     TaskTimelineResponse,
@@ -796,6 +798,36 @@ async def list_task_dependencies(
         )
 
 
+@router.get(
+    "/{task_id}/blockers",
+    response_model=list[TaskResponse],
+    summary="List transitive blockers",
+    description="Get every incomplete task this task waits on, directly or indirectly.",
+)
+async def list_task_blockers(
+    task_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> list[TaskResponse]:
+    """Get incomplete dependencies of a task, following the whole chain."""
+    service = TaskService(db)
+
+    try:
+        blockers = await service.get_transitive_blockers(task_id, current_user.id)
+        return [_build_task_response(task) for task in blockers]
+
+    except TaskNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found",
+        )
+    except InsufficientTaskPermissionsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+
+
 # ============= Tags =============
 
 
@@ -1137,3 +1169,52 @@ async def get_task_timeline(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+
+
+@router.get(
+    "/projects/{project_id}/tasks/plan",
+    response_model=TaskPlanResponse,
+    summary="Get execution plan",
+    description="Get tasks in dependency order with Gantt levels and the critical path.",
+)
+async def get_task_plan(
+    project_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> TaskPlanResponse:
+    """Get topologically ordered plan built from the cached dependency graph."""
+    service = TaskService(db)
+
+    try:
+        graph, plan = await service.get_execution_plan(project_id, current_user.id)
+
+        nodes = {node.id: node for node in graph.nodes}
+        depends_on = graph.depends_on()
+        critical = set(plan.critical_path)
+
+        return TaskPlanResponse(
+            project_id=project_id,
+            tasks=[
+                TaskPlanItemResponse(
+                    **nodes[task_id].model_dump(),
+                    level=plan.levels[task_id],
+                    depends_on=depends_on[task_id],
+                    on_critical_path=task_id in critical,
+                )
+                for task_id in plan.order
+            ],
+            total=len(plan.order),
+            critical_path=plan.critical_path,
+            critical_path_hours=plan.critical_path_hours,
+        )
+
+    except InsufficientTaskPermissionsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except CircularDependencyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
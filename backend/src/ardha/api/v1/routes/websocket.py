@@ -6,15 +6,20 @@ This module provides WebSocket endpoints for real-time communication including:
 - Ping/pong keepalive mechanism
 - JWT token authentication
 - Connection management and cleanup
+
+WebSocket endpoints deliberately do not depend on get_db: a dependency
+session would stay checked out for the lifetime of the socket and starve
+the REST API's connection pool. Handlers that need the database must borrow
+a short-lived session (async with async_session_factory() as db) and
+release it before waiting on the socket again.
 """
 
 import logging
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
-from ardha.core.database import get_db
 from ardha.core.security import decode_token
 from ardha.core.websocket_manager import get_websocket_manager
 
@@ -23,6 +28,27 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/ws", tags=["websocket"])
 
 
+# ============= Helpers =============
+
+
+def authenticate_websocket_token(token: str) -> Optional[UUID]:
+    """
+    Resolve the user ID for a WebSocket token without touching the database.
+
+    Args:
+        token: JWT authentication token
+
+    Returns:
+        User UUID if the token is valid, None otherwise
+    """
+    try:
+        payload = decode_token(token)
+        return UUID(payload.get("sub"))
+    except Exception as e:
+        logger.warning(f"WebSocket authentication failed: {e}")
+        return None
+
+
 # ============= WebSocket Endpoints =============
 
 
@@ -30,7 +56,6 @@ router = APIRouter(prefix="/ws", tags=["websocket"])
 async def notification_websocket(
     websocket: WebSocket,
     token: str = Query(..., description="JWT authentication token"),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     WebSocket endpoint for real-time notifications.
@@ -47,7 +72,7 @@ async def notification_websocket(
         - {"type": "error", "data": {...}} - Error message
 
     Connection Flow:
-        1. Validate JWT token
+        1. Validate JWT token (no database session is held by the socket)
         2. Accept WebSocket connection
         3. Register with WebSocketManager
         4. Listen for incoming messages
@@ -57,7 +82,6 @@ async def notification_websocket(
     Args:
         websocket: FastAPI WebSocket connection
         token: JWT authentication token
-        db: Database session (for future use if needed)
 
     Raises:
         WebSocketDisconnect: When connection is closed
@@ -66,17 +90,9 @@ async def notification_websocket(
     user_id = None
 
     try:
-        # Step 1: Validate JWT token
-        try:
-            payload = decode_token(token)
-            user_id = UUID(payload.get("sub"))
-
-            if not user_id:
-                await websocket.close(code=1008, reason="Invalid token: missing user ID")
-                return
-
-        except Exception as e:
-            logger.warning(f"WebSocket authentication failed: {e}")
+        # Step 1: Validate JWT token (stateless, no database session)
+        user_id = authenticate_websocket_token(token)
+        if user_id is None:
             await websocket.close(code=1008, reason="Authentication failed")
             return
 
@@ -93,7 +109,7 @@ async def notification_websocket(
 
                 # Handle ping/pong for keepalive
                 if data.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await ws_manager.send_to_connection(websocket, {"type": "pong"})
                     logger.debug(f"Responded to ping from user {user_id}")
 
                 # Log any other message types (for debugging)
@@ -2,24 +2,26 @@
 GitHub Webhook Receiver endpoint.
 
 Provides public endpoint for receiving GitHub webhook events with signature
-verification. Processes events asynchronously for fast response times.
+verification. Verified deliveries are persisted to the Redis webhook queue
+and acknowledged immediately; queue consumers process them in order per
+repository, with retries and a dead-letter stream.
 """
 
 import json
 import logging
+from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ardha.core.database import get_db
+from ardha.core.config import settings
+from ardha.core.database import async_session_factory, get_db
+from ardha.core.webhook_queue import get_webhook_queue
 from ardha.repositories.github_integration import GitHubIntegrationRepository
 from ardha.repositories.pull_request import PullRequestRepository
 from ardha.services.git_commit_service import GitCommitService
-from ardha.services.github_webhook_service import (
-    GitHubWebhookService,
-    WebhookProcessingError,
-    WebhookVerificationError,
-)
+from ardha.services.github_webhook_service import GitHubWebhookService, get_webhook_secret_cache
 from ardha.services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
@@ -38,7 +40,6 @@ router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 )
 async def receive_github_webhook(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     x_github_event: str = Header(..., alias="X-GitHub-Event"),
     x_github_delivery: str = Header(..., alias="X-GitHub-Delivery"),
@@ -57,30 +58,33 @@ async def receive_github_webhook(
     - X-Hub-Signature-256: HMAC signature for verification
 
     The endpoint:
-    1. Finds the GitHub integration by repository
-    2. Verifies the webhook signature
-    3. Queues the event for async processing
+    1. Finds the GitHub integration by repository (cached secret)
+    2. Verifies the signature against the raw request body
+    3. Persists the delivery to the webhook queue (deduplicated by delivery ID)
     4. Returns 200 immediately (< 10 seconds)
 
     Args:
         request: FastAPI request object with JSON body
-        background_tasks: FastAPI background tasks for async processing
+        db: Database session (used only when the secret cache misses)
         x_github_event: GitHub event type header
         x_github_delivery: GitHub delivery UUID header
         x_hub_signature_256: HMAC signature header
 
     Returns:
-        Dict with status confirmation
+        Dict with status confirmation ("received" or "duplicate")
 
     Raises:
         HTTPException 400: If payload is malformed
         HTTPException 401: If signature verification fails
         HTTPException 404: If no integration found for repository
+        HTTPException 503: If the delivery could not be queued (GitHub may redeliver)
     """
+    body = await request.body()
+
     # Parse JSON payload
     try:
-        payload = await request.json()
-    except json.JSONDecodeError:
+        payload = json.loads(body)
+    except ValueError:
         logger.warning(f"Invalid JSON in webhook delivery {x_github_delivery}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -88,7 +92,7 @@ async def receive_github_webhook(
         )
 
     # Extract repository information
-    repo_data = payload.get("repository", {})
+    repo_data = payload.get("repository", {}) if isinstance(payload, dict) else {}
     repo_owner = repo_data.get("owner", {}).get("login")
     repo_name = repo_data.get("name")
 
@@ -104,9 +108,13 @@ async def receive_github_webhook(
         f"(delivery {x_github_delivery})"
     )
 
-    # Find GitHub integration by repository (using injected db session)
+    # Find GitHub integration by repository (cached; db only on a miss)
     integration_repo = GitHubIntegrationRepository(db)
-    integration = await integration_repo.get_by_repository(repo_owner, repo_name)
+    integration = await get_webhook_secret_cache().get(
+        repo_owner,
+        repo_name,
+        lambda: integration_repo.get_by_repository(repo_owner, repo_name),
+    )
 
     if not integration:
         logger.warning(f"No integration found for repository {repo_owner}/{repo_name}")
@@ -115,104 +123,78 @@ async def receive_github_webhook(
             detail=f"No integration configured for repository {repo_owner}/{repo_name}",
         )
 
-    # Extract action from payload
-    action = payload.get("action")
-
-    # Queue webhook processing in background
-    background_tasks.add_task(
-        process_webhook_async,
-        integration_id=str(integration.id),  # Convert UUID to string
-        delivery_id=x_github_delivery,
-        event_type=x_github_event,
-        action=action,
-        payload=payload,
-        signature=x_hub_signature_256,
-    )
+    integration_id, webhook_secret = integration
+    if not GitHubWebhookService.verify_webhook_signature(webhook_secret, body, x_hub_signature_256):
+        logger.warning(f"Invalid webhook signature for delivery {x_github_delivery}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook signature",
+        )
+
+    # Persist to the durable queue; entries for one integration stay ordered
+    try:
+        queued = await get_webhook_queue().enqueue(
+            x_github_delivery,
+            partition_key=str(integration_id),
+            fields={
+                "integration_id": str(integration_id),
+                "event_type": x_github_event,
+                "action": payload.get("action") or "",
+                "signature": x_hub_signature_256,
+                "body": body.decode("utf-8"),
+            },
+        )
+    except RedisError as e:
+        logger.error(f"Failed to queue webhook {x_github_delivery}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue unavailable",
+        )
 
     # Return 200 immediately (GitHub expects response within 10 seconds)
-    logger.info(f"Queued webhook {x_github_delivery} for async processing")
+    logger.info(f"Queued webhook {x_github_delivery} for processing")
     return {
-        "status": "received",
+        "status": "received" if queued else "duplicate",
         "delivery_id": x_github_delivery,
         "event_type": x_github_event,
     }
 
 
-# ============= Async Processing Function =============
+# ============= Queue Consumer Handler =============
 
 
-async def process_webhook_async(
-    integration_id: str,
-    delivery_id: str,
-    event_type: str,
-    action: str | None,
-    payload: dict,
-    signature: str,
-) -> None:
+async def process_queued_webhook(fields: dict[str, str]) -> None:
     """
-    Process webhook event asynchronously.
+    Process one webhook delivery taken from the queue.
 
-    This function runs in the background after the webhook endpoint
-    returns a 200 response to GitHub.
+    Runs in a webhook queue consumer with its own database session and
+    commits on success. Any exception propagates so the consumer retries
+    the delivery and eventually dead-letters it.
 
     Args:
-        integration_id: GitHub integration UUID
-        delivery_id: GitHub delivery UUID
-        event_type: Event type (pull_request, push, etc.)
-        action: Optional action (opened, closed, etc.)
-        payload: Webhook payload
-        signature: HMAC signature for verification
+        fields: Queue entry fields written by receive_github_webhook
     """
-    # Create new database session for background task
-    from uuid import UUID
-
-    from ardha.core.database import async_session_factory
+    delivery_id = fields["delivery_id"]
 
     async with async_session_factory() as db:
-        try:
-            # Initialize services
-            integration_repo = GitHubIntegrationRepository(db)
-            pr_repo = PullRequestRepository(db)
-            task_service = TaskService(db)
-
-            # Initialize commit service (needs project root)
-            # For now, we'll skip commit service dependency
-            # In production, this would come from config
-            from ardha.core.config import get_settings
-
-            settings = get_settings()
-            commit_service = GitCommitService(
-                db,
-                str(settings.files.project_root) if hasattr(settings, "files") else "/tmp",  # nosec B108
-            )
-
-            # Initialize webhook service
-            webhook_service = GitHubWebhookService(
-                integration_repo=integration_repo,
-                pr_repo=pr_repo,
-                task_service=task_service,
-                commit_service=commit_service,
-                db=db,
-            )
-
-            # Process webhook
-            await webhook_service.process_webhook(
-                integration_id=UUID(integration_id),
-                delivery_id=delivery_id,
-                event_type=event_type,
-                action=action,
-                payload=payload,
-                signature=signature,
-            )
-
-            logger.info(f"Successfully processed webhook {delivery_id} in background")
-
-        except WebhookVerificationError as e:
-            logger.error(f"Webhook verification failed for {delivery_id}: {e}")
-        except WebhookProcessingError as e:
-            logger.error(f"Webhook processing failed for {delivery_id}: {e}")
-        except Exception as e:
-            logger.error(
-                f"Unexpected error processing webhook {delivery_id}: {e}",
-                exc_info=True,
-            )
+        # Initialize services
+        integration_repo = GitHubIntegrationRepository(db)
+        webhook_service = GitHubWebhookService(
+            integration_repo=integration_repo,
+            pr_repo=PullRequestRepository(db),
+            task_service=TaskService(db),
+            commit_service=GitCommitService(db, settings.files.project_root),
+            db=db,
+        )
+
+        await webhook_service.process_webhook(
+            integration_id=UUID(fields["integration_id"]),
+            delivery_id=delivery_id,
+            event_type=fields["event_type"],
+            action=fields.get("action") or None,
+            payload=json.loads(fields["body"]),
+            signature=fields.get("signature"),
+        )
+        await db.commit()
+
+    logger.info(f"Successfully processed webhook {delivery_id}")
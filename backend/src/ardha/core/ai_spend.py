@@ -0,0 +1,309 @@
+"""
+Redis running totals of daily AI spend.
+
+This module answers budget checks in O(1) instead of summing usage rows:
+- One key per user and per project per day holding the day's spend
+- Totals are seeded from the ai_usage_daily aggregate on first read and
+  incremented once the transaction logging an operation commits
+- Increments only apply to seeded keys, so a total is never built from a
+  partial count; a key that missed an increment is corrected when it
+  expires and is reseeded
+- Every increment bumps a per-total generation, and a seed is stored only
+  if the generation is unchanged since before its database read, so a seed
+  that raced an increment is dropped instead of losing it
+
+Redis failures are logged and treated as misses; callers then read the
+aggregate table directly.
+"""
+
+import asyncio
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ardha.core.config import settings
+from ardha.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding increments to apply once the transaction commits
+PENDING_INCREMENTS = "ai_spend_pending_increments"
+
+# KEYS: total, gen; ARGV: expected generation, ttl, total
+SEED_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+if redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[2], 'NX') then
+    return 1
+end
+return 0
+"""
+
+# KEYS: (total, gen) pairs; ARGV: amount, ttl
+# Bumps every generation and increments only totals that are already seeded
+ADD_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call('INCR', KEYS[i + 1])
+    redis.call('EXPIRE', KEYS[i + 1], ARGV[2])
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        redis.call('INCRBYFLOAT', KEYS[i], ARGV[1])
+    end
+end
+return 1
+"""
+
+
+class AISpendCounter:
+    """
+    Daily AI spend totals per user and project.
+
+    Attributes:
+        redis: Async Redis client
+        ttl: Seconds before a seeded total expires and is reloaded
+        key_prefix: Redis key prefix
+        enabled: When False every read is a miss and writes are skipped
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl: int = 3600,
+        key_prefix: str = "ardha:ai_spend",
+        enabled: bool = True,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.enabled = enabled
+
+        self._seed = redis.register_script(SEED_SCRIPT)
+        self._add = redis.register_script(ADD_SCRIPT)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, scope: str, scope_id: UUID, day: date) -> Optional[Decimal]:
+        """
+        Get a seeded spend total.
+
+        Args:
+            scope: "user" or "project"
+            scope_id: User or project UUID
+            day: Day of the total
+
+        Returns:
+            Spend so far on the day, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.get(self._key(scope, scope_id, day))
+        except Exception as e:
+            logger.warning(f"AI spend cache read failed: {e}")
+            return None
+
+        return Decimal(raw.decode()) if raw is not None else None
+
+    async def begin_seed(self, scope: str, scope_id: UUID, day: date) -> Optional[str]:
+        """
+        Take the generation to pass to seed() before querying the database.
+
+        Args:
+            scope: "user" or "project"
+            scope_id: User or project UUID
+            day: Day of the total
+
+        Returns:
+            Generation token, or None when the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.get(self._key(scope, scope_id, day, "gen"))
+        except Exception as e:
+            logger.warning(f"AI spend cache read failed: {e}")
+            return None
+
+        return raw.decode() if raw is not None else "0"
+
+    async def seed(
+        self,
+        scope: str,
+        scope_id: UUID,
+        day: date,
+        total: Decimal,
+        generation: Optional[str],
+    ) -> bool:
+        """
+        Store a total loaded from the database unless one is already seeded.
+
+        Skipped when an increment was applied since begin_seed(), since the
+        loaded total may not include it.
+
+        Args:
+            scope: "user" or "project"
+            scope_id: User or project UUID
+            day: Day of the total
+            total: Spend read from the daily aggregate
+            generation: Token from begin_seed()
+
+        Returns:
+            True if stored
+        """
+        if generation is None:
+            return False
+
+        try:
+            return bool(
+                await self._seed(
+                    keys=[self._key(scope, scope_id, day), self._key(scope, scope_id, day, "gen")],
+                    args=[generation, self.ttl, str(total)],
+                )
+            )
+        except Exception as e:
+            logger.warning(f"AI spend cache seed failed: {e}")
+            return False
+
+    async def get_or_load(
+        self,
+        scope: str,
+        scope_id: UUID,
+        day: date,
+        loader: Callable[[], Awaitable[Decimal]],
+    ) -> Decimal:
+        """
+        Get a spend total, seeding it from the database on miss.
+
+        Args:
+            scope: "user" or "project"
+            scope_id: User or project UUID
+            day: Day of the total
+            loader: Coroutine function reading the total from the aggregate
+
+        Returns:
+            Spend so far on the day
+        """
+        total = await self.get(scope, scope_id, day)
+        if total is not None:
+            return total
+
+        generation = await self.begin_seed(scope, scope_id, day)
+        total = await loader()
+        await self.seed(scope, scope_id, day, total, generation)
+        return total
+
+    async def add(
+        self,
+        user_id: UUID,
+        project_id: Optional[UUID],
+        day: date,
+        cost: Decimal,
+    ) -> None:
+        """
+        Add a committed operation's cost to the user's and project's totals.
+
+        Args:
+            user_id: User who performed the operation
+            project_id: Associated project, if any
+            day: Usage date of the operation
+            cost: Cost of the operation
+        """
+        if not self.enabled or not cost:
+            return
+
+        keys = [self._key("user", user_id, day), self._key("user", user_id, day, "gen")]
+        if project_id is not None:
+            keys += [
+                self._key("project", project_id, day),
+                self._key("project", project_id, day, "gen"),
+            ]
+
+        try:
+            await self._add(keys=keys, args=[str(cost), self.ttl])
+        except Exception as e:
+            logger.warning(f"AI spend cache increment failed: {e}")
+
+    def add_on_commit(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        project_id: Optional[UUID],
+        day: date,
+        cost: Decimal,
+    ) -> None:
+        """
+        Add an operation's cost once the session's transaction commits.
+
+        The increment is discarded if the transaction rolls back, so totals
+        never count usage rows that were not written.
+
+        Args:
+            db: Session logging the operation
+            user_id: User who performed the operation
+            project_id: Associated project, if any
+            day: Usage date of the operation
+            cost: Cost of the operation
+        """
+        if not self.enabled or not cost:
+            return
+
+        session = db.sync_session
+        if not event.contains(session, "after_commit", self._after_commit):
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_rollback", self._after_rollback)
+        session.info.setdefault(PENDING_INCREMENTS, []).append((user_id, project_id, day, cost))
+
+    def _after_commit(self, session: Session) -> None:
+        increments: List[Tuple[UUID, Optional[UUID], date, Decimal]] = session.info.pop(
+            PENDING_INCREMENTS, []
+        )
+        if not increments:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError as e:
+            logger.warning(f"AI spend cache increment after commit skipped: {e}")
+            return
+        for increment in increments:
+            task = loop.create_task(self.add(*increment))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(PENDING_INCREMENTS, None)
+
+    def _key(self, scope: str, scope_id: UUID, day: date, suffix: Optional[str] = None) -> str:
+        key = f"{self.key_prefix}:{scope}:{scope_id}:{day.isoformat()}"
+        return f"{key}:{suffix}" if suffix else key
+
+
+# Global AI spend counter instance
+_ai_spend_counter: Optional[AISpendCounter] = None
+
+
+def get_ai_spend_counter() -> AISpendCounter:
+    """
+    Get global AI spend counter instance.
+
+    Returns:
+        AISpendCounter instance configured from settings.ai
+    """
+    global _ai_spend_counter
+
+    if _ai_spend_counter is None:
+        _ai_spend_counter = AISpendCounter(
+            redis=get_redis(),
+            ttl=settings.ai.spend_cache_ttl,
+            enabled=settings.ai.spend_cache_enabled,
+        )
+
+    return _ai_spend_counter
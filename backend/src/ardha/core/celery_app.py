@@ -42,7 +42,9 @@ celery_app.conf.update(
         "ardha.jobs.memory_cleanup.*": {"queue": "cleanup"},
         "git.*": {"queue": "memory"},  # Git jobs use memory queue
         "tasks.*": {"queue": "analytics"},  # Task jobs use analytics queue
+        "notifications.*": {"queue": "notifications"},  # Outbound notification delivery
         "cost.*": {"queue": "analytics"},  # Cost jobs use analytics queue
+        "analytics.*": {"queue": "analytics"},  # Analytics rollups
         "maintenance.*": {"queue": "maintenance"},  # Maintenance jobs
     },
     # Task annotations
@@ -61,6 +63,10 @@ celery_app.conf.update(
             "rate_limit": "5/m",  # Max 5 per minute
             "time_limit": 600,  # 10 minutes
         },
+        "analytics.*": {
+            "rate_limit": "5/m",  # Max 5 per minute
+            "time_limit": 600,  # 10 minutes
+        },
         "maintenance.*": {
             "rate_limit": "1/h",  # Max 1 per hour
             "time_limit": 1800,  # 30 minutes
@@ -100,11 +106,28 @@ celery_app.conf.beat_schedule = {
         "task": "tasks.calculate_team_velocity",
         "schedule": crontab(hour="2", minute="0"),
     },
+    # Task aggregate drift repair daily at 3:30 AM
+    "reconcile-task-aggregates": {
+        "task": "tasks.reconcile_task_aggregates",
+        "schedule": crontab(hour="3", minute="30"),
+    },
     # Overdue task reminders daily at 9 AM
     "send-overdue-reminders": {
         "task": "tasks.send_overdue_task_reminders",
         "schedule": crontab(hour="9", minute="0"),
     },
+    # Daily notification digests at 8 AM
+    "send-daily-notification-digests": {
+        "task": "notifications.send_notification_digests",
+        "schedule": crontab(hour="8", minute="0"),
+        "args": ("daily",),
+    },
+    # Weekly notification digests every Monday at 8 AM
+    "send-weekly-notification-digests": {
+        "task": "notifications.send_notification_digests",
+        "schedule": crontab(hour="8", minute="0", day_of_week="1"),
+        "args": ("weekly",),
+    },
     # Daily cost report generation at 6 AM
     "generate-daily-cost-report": {
         "task": "cost.generate_daily_cost_report",
@@ -120,6 +143,11 @@ celery_app.conf.beat_schedule = {
         "task": "cost.calculate_project_analytics",
         "schedule": crontab(hour="10", minute="0", day_of_week="0"),
     },
+    # Incremental analytics rollups every hour at :15
+    "build-analytics-rollups": {
+        "task": "analytics.build_rollups",
+        "schedule": crontab(minute="15"),
+    },
     # Session cleanup weekly on Sunday at 3 AM
     "cleanup-old-sessions": {
         "task": "maintenance.cleanup_old_sessions",
@@ -130,6 +158,11 @@ celery_app.conf.beat_schedule = {
         "task": "maintenance.backup_database",
         "schedule": crontab(hour="2", minute="0"),
     },
+    # Monthly partition pre-creation and retention daily at 1 AM
+    "manage-partitions": {
+        "task": "maintenance.manage_partitions",
+        "schedule": crontab(hour="1", minute="0"),
+    },
 }
 
 
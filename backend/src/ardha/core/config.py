@@ -30,6 +30,23 @@ class DatabaseSettings(BaseModel):
         return self.url
 
 
+class PartitionSettings(BaseModel):
+    """Monthly partitioning and retention of append-heavy tables."""
+
+    months_ahead: int = Field(
+        default=3, ge=1, le=24, description="Future monthly partitions kept pre-created"
+    )
+    notifications_retention_months: int = Field(
+        default=6, ge=0, description="Months of notifications kept (0 keeps everything)"
+    )
+    webhook_deliveries_retention_months: int = Field(
+        default=3, ge=0, description="Months of webhook deliveries kept (0 keeps everything)"
+    )
+    task_activities_retention_months: int = Field(
+        default=24, ge=0, description="Months of task activity kept (0 keeps everything)"
+    )
+
+
 class RedisSettings(BaseModel):
     """Redis configuration settings."""
 
@@ -37,6 +54,31 @@ class RedisSettings(BaseModel):
     max_connections: int = Field(default=50, ge=1, le=200, description="Maximum Redis connections")
 
 
+class WebSocketSettings(BaseModel):
+    """WebSocket cluster configuration settings."""
+
+    cluster_enabled: bool = Field(
+        default=True, description="Fan out WebSocket messages across workers via Redis pub/sub"
+    )
+    channel_prefix: str = Field(
+        default="ardha:ws", description="Prefix for WebSocket pub/sub channels and presence keys"
+    )
+    presence_ttl_seconds: int = Field(
+        default=30, ge=5, le=600, description="Seconds before unrefreshed presence entries expire"
+    )
+    heartbeat_interval_seconds: int = Field(
+        default=10, ge=1, le=300, description="Interval between presence heartbeats"
+    )
+    send_queue_size: int = Field(
+        default=256, ge=1, le=10000, description="Outbound frames buffered per connection"
+    )
+    backpressure_policy: str = Field(
+        default="disconnect",
+        pattern="^(drop|disconnect)$",
+        description="Action when a connection's send queue is full",
+    )
+
+
 class QdrantSettings(BaseModel):
     """Qdrant vector database configuration settings."""
 
@@ -66,6 +108,18 @@ class SecuritySettings(BaseModel):
     session_cookie_httponly: bool = Field(
         default=True, description="Whether session cookies should be HTTP only"
     )
+    principal_cache_enabled: bool = Field(
+        default=True, description="Cache authenticated users and project roles"
+    )
+    principal_cache_local_ttl_seconds: float = Field(
+        default=5.0, ge=0, le=300, description="In-process principal cache TTL in seconds"
+    )
+    principal_cache_redis_ttl_seconds: int = Field(
+        default=300, ge=1, le=86400, description="Redis principal cache TTL in seconds"
+    )
+    principal_cache_max_entries: int = Field(
+        default=10000, ge=1, description="Maximum in-process principal cache entries"
+    )
 
     @field_validator("jwt_secret_key")
     @classmethod
@@ -95,6 +149,20 @@ class AISettings(BaseModel):
     openrouter_circuit_breaker_cooldown: int = Field(
         default=300, ge=60, le=1800, description="Circuit breaker cooldown period in seconds"
     )
+    daily_budget_user: float = Field(
+        default=2.0, ge=0, description="Daily AI spend limit per user in USD (0 = unlimited)"
+    )
+    daily_budget_project: float = Field(
+        default=0.0, ge=0, description="Daily AI spend limit per project in USD (0 = unlimited)"
+    )
+    spend_cache_enabled: bool = Field(
+        default=True, description="Whether to keep daily AI spend running totals in Redis"
+    )
+    spend_cache_ttl: int = Field(
+        default=3600,
+        ge=60,
+        description="Seconds before a spend total is reseeded from the daily aggregate",
+    )
 
 
 class EmailSettings(BaseModel):
@@ -109,6 +177,69 @@ class EmailSettings(BaseModel):
         default="noreply@ardha.dev", description="From email address for notifications"
     )
     from_name: str = Field(default="Ardha", description="From name for notification emails")
+    pool_size: int = Field(
+        default=2, ge=1, le=20, description="Persistent SMTP connections kept per worker"
+    )
+    idle_timeout: int = Field(
+        default=120,
+        ge=0,
+        description="Seconds an idle SMTP connection is reused before reconnecting",
+    )
+    timeout: int = Field(default=30, ge=1, description="SMTP command timeout in seconds")
+    max_retries: int = Field(
+        default=5, ge=0, description="Retries for notification emails that failed to send"
+    )
+    retry_backoff: int = Field(
+        default=30, ge=1, description="Base delay in seconds, doubled on each retry"
+    )
+    digest_max_items: int = Field(
+        default=50, ge=1, description="Notifications listed in one digest email"
+    )
+
+
+class NotificationSettings(BaseModel):
+    """Notification read-path cache settings."""
+
+    cache_enabled: bool = Field(
+        default=True, description="Serve unread counts and recent inboxes from Redis"
+    )
+    cache_ttl: int = Field(
+        default=3600,
+        ge=60,
+        description="Seconds a user's cached counter and inbox live before reloading",
+    )
+    inbox_size: int = Field(
+        default=100, ge=10, le=100, description="Most recent notifications cached per user"
+    )
+
+
+class TaskSettings(BaseModel):
+    """Task dependency graph cache settings."""
+
+    graph_cache_enabled: bool = Field(
+        default=True, description="Serve plan and Gantt dependency graphs from Redis"
+    )
+    graph_cache_ttl: int = Field(
+        default=300,
+        ge=10,
+        description="Seconds a project's cached dependency graph lives before reloading",
+    )
+
+
+class AnalyticsSettings(BaseModel):
+    """Analytics rollup settings."""
+
+    rollup_backfill_days: int = Field(
+        default=90, ge=1, description="Days of history rolled up on the first run"
+    )
+    rollup_overlap_minutes: int = Field(
+        default=10,
+        ge=0,
+        description="Minutes re-scanned before the watermark to catch late commits",
+    )
+    max_chart_days: int = Field(
+        default=366, ge=7, description="Longest date range a rollup chart request may span"
+    )
 
 
 class OAuthSettings(BaseModel):
@@ -134,6 +265,108 @@ class FileSettings(BaseModel):
     project_root: str = Field(default="./projects", description="Root directory for project files")
 
 
+class GitSettings(BaseModel):
+    """Git execution and result cache settings."""
+
+    max_workers: int = Field(
+        default=8, ge=1, le=64, description="Threads running git operations per worker process"
+    )
+    cache_max_entries: int = Field(
+        default=4096, ge=0, description="Maximum cached immutable git results (0 disables)"
+    )
+    cache_max_bytes: int = Field(
+        default=67108864, ge=0, description="Approximate size cap of the git result cache"  # 64MB
+    )
+    diff_max_bytes: int = Field(
+        default=10485760, ge=1024, description="Cap on streamed diff output per request"  # 10MB
+    )
+    diff_max_file_bytes: int = Field(
+        default=1048576, ge=1024, description="Cap on streamed diff output per file"  # 1MB
+    )
+    blob_max_bytes: int = Field(
+        default=104857600, ge=1024, description="Cap on streamed file content"  # 100MB
+    )
+
+
+class CodeIndexSettings(BaseModel):
+    """Code index settings for the Qdrant "code" collection."""
+
+    enabled: bool = Field(default=True, description="Index repository code after each git sync")
+    max_file_bytes: int = Field(
+        default=262144, ge=1024, description="Skip blobs larger than this"  # 256KB
+    )
+    chunk_max_chars: int = Field(
+        default=1200, ge=200, description="Maximum characters per embedded chunk"
+    )
+    embed_batch_size: int = Field(
+        default=64, ge=1, le=512, description="Chunks embedded and upserted per batch"
+    )
+    read_batch_size: int = Field(default=100, ge=1, description="Blobs read from git per batch")
+
+
+class GitHubSettings(BaseModel):
+    """GitHub REST API sync settings."""
+
+    api_url: str = Field(default="https://api.github.com", description="GitHub REST API base URL")
+    sync_concurrency: int = Field(
+        default=8, ge=1, le=64, description="Concurrent GitHub requests per sync"
+    )
+    request_timeout_seconds: float = Field(
+        default=30.0, gt=0, description="Timeout for a single GitHub request"
+    )
+    etag_ttl_seconds: int = Field(
+        default=604800, ge=0, description="Lifetime of cached ETags and bodies (0 disables)"
+    )
+    rate_limit_reserve: int = Field(
+        default=100, ge=0, description="Requests left unused before sync waits for the reset"
+    )
+    rate_limit_max_wait_seconds: int = Field(
+        default=300, ge=0, description="Longest rate-limit wait before a sync gives up"
+    )
+    client_pool_size: int = Field(
+        default=256, ge=1, description="Integrations with a pooled, authenticated API client"
+    )
+    client_executor_workers: int = Field(
+        default=16, ge=1, le=256, description="Threads shared by all pooled API clients"
+    )
+    token_cache_ttl_seconds: int = Field(
+        default=900, ge=0, description="Lifetime of decrypted tokens and their clients (0 disables)"
+    )
+
+
+class WebhookSettings(BaseModel):
+    """Webhook ingestion queue settings."""
+
+    consumers_enabled: bool = Field(
+        default=True, description="Run webhook queue consumers in this process"
+    )
+    stream_prefix: str = Field(
+        default="ardha:webhooks", description="Prefix for webhook stream, lease and dedup keys"
+    )
+    shards: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Ordered shard streams (change only with an empty queue)",
+    )
+    max_attempts: int = Field(
+        default=5, ge=1, le=50, description="Processing attempts before dead-lettering"
+    )
+    retry_base_seconds: float = Field(
+        default=1.0, ge=0, description="Backoff before the first retry, doubled per attempt"
+    )
+    retry_max_seconds: float = Field(default=60.0, ge=0, description="Maximum retry backoff")
+    lease_ttl_seconds: int = Field(
+        default=30, ge=3, le=600, description="Seconds before an abandoned shard is taken over"
+    )
+    dedup_ttl_seconds: int = Field(
+        default=604800, ge=60, description="How long delivery IDs are remembered"  # 7 days
+    )
+    secret_cache_ttl_seconds: int = Field(
+        default=60, ge=0, le=3600, description="In-process webhook secret cache lifetime"
+    )
+
+
 class RateLimitSettings(BaseModel):
     """Rate limiting configuration settings."""
 
@@ -141,6 +374,9 @@ class RateLimitSettings(BaseModel):
         default=100, ge=1, le=10000, description="Rate limit requests per minute"
     )
     burst: int = Field(default=200, ge=1, le=20000, description="Rate limit burst size")
+    middleware_enabled: bool = Field(
+        default=False, description="Apply the global per-principal limit to every request"
+    )
 
 
 class CORSSettings(BaseModel):
@@ -179,13 +415,22 @@ class Settings(BaseSettings):
     # Sub-settings (use BaseModel for nested, not BaseSettings)
     # Environment variables with nested delimiter (__) will populate these
     database: DatabaseSettings = Field(default_factory=lambda: DatabaseSettings())
+    partitions: PartitionSettings = Field(default_factory=lambda: PartitionSettings())
     redis: RedisSettings = Field(default_factory=lambda: RedisSettings())
+    websocket: WebSocketSettings = Field(default_factory=lambda: WebSocketSettings())
     qdrant: QdrantSettings = Field(default_factory=lambda: QdrantSettings())
     security: SecuritySettings = Field(default_factory=lambda: SecuritySettings(jwt_secret_key=""))
     ai: AISettings = Field(default_factory=lambda: AISettings(openrouter_api_key=""))
     email: EmailSettings = Field(default_factory=lambda: EmailSettings())
+    notifications: NotificationSettings = Field(default_factory=lambda: NotificationSettings())
+    tasks: TaskSettings = Field(default_factory=lambda: TaskSettings())
+    analytics: AnalyticsSettings = Field(default_factory=lambda: AnalyticsSettings())
     oauth: OAuthSettings = Field(default_factory=lambda: OAuthSettings())
     files: FileSettings = Field(default_factory=lambda: FileSettings())
+    git: GitSettings = Field(default_factory=lambda: GitSettings())
+    code_index: CodeIndexSettings = Field(default_factory=lambda: CodeIndexSettings())
+    github: GitHubSettings = Field(default_factory=lambda: GitHubSettings())
+    webhooks: WebhookSettings = Field(default_factory=lambda: WebhookSettings())
     rate_limit: RateLimitSettings = Field(default_factory=lambda: RateLimitSettings())
     cors: CORSSettings = Field(default_factory=lambda: CORSSettings())
 
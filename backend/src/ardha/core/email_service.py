@@ -2,20 +2,23 @@
 Email service for sending notification emails.
 
 This module provides email functionality including:
-- SMTP client integration with aiosmtplib
-- Jinja2 template rendering for HTML emails
+- Pooled, persistent SMTP connections with aiosmtplib
+- Jinja2 templates compiled once per process
 - Email validation and configuration
 - Support for single notifications and daily/weekly digests
 """
 
+import asyncio
 import logging
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound, select_autoescape
 
 from ardha.core.config import get_settings
 from ardha.models.notification import Notification
@@ -23,36 +26,223 @@ from ardha.models.user import User
 
 logger = logging.getLogger(__name__)
 
+EMAIL_TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "email"
+
+# Templates compiled up front when the first EmailService is created
+EMAIL_TEMPLATES = ("notification_single.html", "notification_digest.html")
+
+
+@lru_cache
+def get_email_templates() -> Tuple[Environment, Dict[str, Template]]:
+    """
+    Get the process-wide Jinja2 environment with pre-compiled email templates.
+
+    Returns:
+        Tuple of (environment, compiled templates by name)
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(EMAIL_TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+    templates = {name: env.get_template(name) for name in EMAIL_TEMPLATES}
+    logger.info(f"Compiled {len(templates)} email templates from {EMAIL_TEMPLATE_DIR}")
+    return env, templates
+
+
+class SMTPConnectionPool:
+    """
+    Pool of persistent, authenticated SMTP connections.
+
+    Connections are opened lazily, kept after each message and reused while
+    they have been idle for less than idle_timeout, so a batch of emails
+    pays for one TCP/TLS handshake and login instead of one per message. A
+    connection the server dropped while idle is replaced and the message
+    resent once.
+
+    Connections belong to the event loop that opened them; when called
+    from a different loop the pool starts over.
+
+    Attributes:
+        size: Maximum number of concurrent connections
+        idle_timeout: Seconds an idle connection may be reused
+        connections_opened: Number of connections opened so far
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        size: int = 2,
+        idle_timeout: float = 120,
+        timeout: float = 30,
+    ) -> None:
+        """
+        Initialize the pool without connecting.
+
+        Args:
+            hostname: SMTP server host
+            port: SMTP server port
+            username: Login username (optional)
+            password: Login password (optional)
+            use_tls: Whether to connect over TLS
+            size: Maximum number of concurrent connections
+            idle_timeout: Seconds an idle connection may be reused
+            timeout: SMTP command timeout in seconds
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def send(self, message: MIMEMultipart) -> None:
+        """
+        Send a message over a pooled connection.
+
+        Args:
+            message: Message to send
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message
+        """
+        self._bind_loop()
+        assert self._slots is not None
+
+        async with self._slots:
+            for attempt in range(2):
+                client, reused = await self._acquire()
+                try:
+                    await client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    self._discard(client)
+                    if attempt or not reused:
+                        raise
+                    logger.debug("Pooled SMTP connection was closed by the server, reconnecting")
+                    continue
+                except BaseException:
+                    self._discard(client)
+                    raise
+
+                self._idle.append((client, time.monotonic()))
+                return
+
+    async def close(self) -> None:
+        """Quit all idle connections."""
+        idle, self._idle = self._idle, []
+        for client, _ in idle:
+            try:
+                await client.quit()
+            except Exception:
+                self._discard(client)
+
+    def _bind_loop(self) -> None:
+        """Reset the pool when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._idle = []
+            self._slots = asyncio.Semaphore(self.size)
+
+    async def _acquire(self) -> Tuple[aiosmtplib.SMTP, bool]:
+        """
+        Take a fresh-enough idle connection or open a new one.
+
+        Returns:
+            Tuple of (connection, whether it was reused)
+        """
+        now = time.monotonic()
+        while self._idle:
+            client, last_used = self._idle.pop()
+            if client.is_connected and now - last_used <= self.idle_timeout:
+                return client, True
+            self._discard(client)
+
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connections_opened += 1
+        logger.debug(f"Opened SMTP connection to {self.hostname}:{self.port}")
+        return client, False
+
+    @staticmethod
+    def _discard(client: aiosmtplib.SMTP) -> None:
+        """Drop a connection without a QUIT round trip."""
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+_smtp_pool: Optional[SMTPConnectionPool] = None
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """
+    Get the process-wide SMTP connection pool.
+
+    Returns:
+        SMTPConnectionPool configured from email settings
+    """
+    global _smtp_pool
+    if _smtp_pool is None:
+        email = get_settings().email
+        _smtp_pool = SMTPConnectionPool(
+            hostname=email.smtp_host,
+            port=email.smtp_port,
+            username=email.smtp_username,
+            password=email.smtp_password,
+            use_tls=email.use_tls,
+            size=email.pool_size,
+            idle_timeout=email.idle_timeout,
+            timeout=email.timeout,
+        )
+    return _smtp_pool
+
 
 class EmailService:
     """
     Service for sending emails via SMTP.
 
     Handles email composition, template rendering with Jinja2,
-    and SMTP delivery using aiosmtplib. Supports both single
-    notification emails and aggregated digest emails.
+    and SMTP delivery over the shared connection pool. Supports both
+    single notification emails and aggregated digest emails.
 
     Attributes:
         settings: Application settings with email configuration
-        jinja_env: Jinja2 environment for template rendering
+        jinja_env: Shared Jinja2 environment for template rendering
+        templates: Pre-compiled templates by name
+        smtp_pool: Shared SMTP connection pool
     """
 
-    def __init__(self) -> None:
-        """Initialize EmailService with settings and Jinja2 environment."""
-        self.settings = get_settings()
-
-        # Get template directory path
-        template_dir = Path(__file__).parent.parent / "templates" / "email"
-
-        # Initialize Jinja2 environment for email templates
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+    def __init__(self, smtp_pool: Optional[SMTPConnectionPool] = None) -> None:
+        """
+        Initialize EmailService with settings, templates and SMTP pool.
 
-        logger.info(f"EmailService initialized with template directory: {template_dir}")
+        Args:
+            smtp_pool: Connection pool to send through (defaults to the shared pool)
+        """
+        self.settings = get_settings()
+        self.jinja_env, self.templates = get_email_templates()
+        self.smtp_pool = smtp_pool or get_smtp_pool()
 
     async def send_email(
         self,
@@ -98,15 +288,8 @@ class EmailService:
             html_part = MIMEText(html_content, "html")
             message.attach(html_part)
 
-            # Send via SMTP
-            await aiosmtplib.send(
-                message,
-                hostname=self.settings.email.smtp_host,
-                port=self.settings.email.smtp_port,
-                username=self.settings.email.smtp_username,
-                password=self.settings.email.smtp_password,
-                use_tls=self.settings.email.use_tls,
-            )
+            # Send over a pooled SMTP connection
+            await self.smtp_pool.send(message)
 
             logger.info(f"Email sent successfully to {to_email}: {subject}")
             return True
@@ -161,28 +344,37 @@ class EmailService:
             logger.error(f"Error sending notification email to {user.email}: {e}")
             return False
 
-    async def send_daily_digest(self, user: User, notifications: List[Notification]) -> bool:
+    async def send_digest(
+        self, user: User, notifications: List[Notification], frequency: str
+    ) -> bool:
         """
-        Send daily digest email with all unread notifications.
+        Send one digest email listing a user's pending notifications.
+
+        At most digest_max_items notifications are listed; the subject and
+        header carry the full count.
 
         Args:
             user: User to send digest to
-            notifications: List of notifications for digest
+            notifications: Notifications for the digest, oldest first
+            frequency: Digest period ("daily" or "weekly")
 
         Returns:
             True if email sent successfully, False otherwise
         """
         if not notifications:
-            logger.debug(f"No notifications for daily digest for user {user.id}")
+            logger.debug(f"No notifications for {frequency} digest for user {user.id}")
             return False
 
+        digest_type = frequency.capitalize()
+        listed = notifications[-self.settings.email.digest_max_items :]
+
         try:
             # Render digest template
             html_content = self.render_template(
                 "notification_digest.html",
                 {
                     "user_name": user.full_name or user.username,
-                    "digest_type": "Daily",
+                    "digest_type": digest_type,
                     "notification_count": len(notifications),
                     "notifications": [
                         {
@@ -193,13 +385,13 @@ class EmailService:
                             "link_id": str(notif.link_id) if notif.link_id else None,
                             "created_at": notif.created_at.isoformat(),
                         }
-                        for notif in notifications
+                        for notif in listed
                     ],
                     "app_url": self._get_app_url(),
                 },
             )
 
-            subject = f"Ardha Daily Digest: {len(notifications)} notifications"
+            subject = f"Ardha {digest_type} Digest: {len(notifications)} notifications"
 
             return await self.send_email(
                 to_email=user.email,
@@ -208,12 +400,12 @@ class EmailService:
             )
 
         except Exception as e:
-            logger.error(f"Error sending daily digest to {user.email}: {e}")
+            logger.error(f"Error sending {frequency} digest to {user.email}: {e}")
             return False
 
-    async def send_weekly_digest(self, user: User, notifications: List[Notification]) -> bool:
+    async def send_daily_digest(self, user: User, notifications: List[Notification]) -> bool:
         """
-        Send weekly digest email with all unread notifications.
+        Send daily digest email with all unread notifications.
 
         Args:
             user: User to send digest to
@@ -222,44 +414,20 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
-        if not notifications:
-            logger.debug(f"No notifications for weekly digest for user {user.id}")
-            return False
+        return await self.send_digest(user, notifications, "daily")
 
-        try:
-            # Render digest template
-            html_content = self.render_template(
-                "notification_digest.html",
-                {
-                    "user_name": user.full_name or user.username,
-                    "digest_type": "Weekly",
-                    "notification_count": len(notifications),
-                    "notifications": [
-                        {
-                            "title": notif.title,
-                            "message": notif.message,
-                            "type": notif.type,
-                            "link_type": notif.link_type,
-                            "link_id": str(notif.link_id) if notif.link_id else None,
-                            "created_at": notif.created_at.isoformat(),
-                        }
-                        for notif in notifications
-                    ],
-                    "app_url": self._get_app_url(),
-                },
-            )
-
-            subject = f"Ardha Weekly Digest: {len(notifications)} notifications"
+    async def send_weekly_digest(self, user: User, notifications: List[Notification]) -> bool:
+        """
+        Send weekly digest email with all unread notifications.
 
-            return await self.send_email(
-                to_email=user.email,
-                subject=subject,
-                html_content=html_content,
-            )
+        Args:
+            user: User to send digest to
+            notifications: List of notifications for digest
 
-        except Exception as e:
-            logger.error(f"Error sending weekly digest to {user.email}: {e}")
-            return False
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        return await self.send_digest(user, notifications, "weekly")
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -276,7 +444,9 @@ class EmailService:
             TemplateNotFound: If template doesn't exist
         """
         try:
-            template = self.jinja_env.get_template(template_name)
+            template = self.templates.get(template_name) or self.jinja_env.get_template(
+                template_name
+            )
             return template.render(**context)
 
         except TemplateNotFound:
@@ -0,0 +1,541 @@
+"""
+Redis cache of unread counts and recent inboxes for notifications.
+
+This module keeps notification polling off the database:
+- Per-user unread counter, adjusted by deltas on create, read and delete
+- Per-user inbox of the most recent notifications with their read state
+- Every change is one server-side Lua script call per user, so the counter
+  and inbox never disagree; fan-out to many users is one pipeline
+- Cold caches are filled from the database with a generation check, so a
+  fill that raced a concurrent change is dropped instead of stored
+- Reads and deletes take a change token with begin_change() before their
+  database write; a fill stored at or after that token may already hold
+  the committed state, so applying the delta drops it instead of counting
+  the change twice
+
+Counters change by the number of rows the database actually changed, so
+updates commute with each other and a user's cache stays exact without
+locking. Redis failures are logged and treated as misses; the TTL bounds
+how long anything missed here can stay stale.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from ardha.core.config import settings
+from ardha.core.redis import get_redis
+from ardha.models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+# Keys per user (KEYS[1..5] in every script):
+#   state  -> hash {unread, complete, filled}; its presence marks the cache as warm,
+#             filled is the generation it was loaded at
+#   inbox  -> sorted set of notification IDs scored by created_at
+#   items  -> hash of notification ID -> JSON snapshot
+#   read   -> hash of notification ID -> read_at for inbox entries read
+#   gen    -> change counter used to discard racing fills
+KEY_SUFFIXES = ("state", "inbox", "items", "read", "gen")
+
+# ARGV: expected generation, ttl, unread, complete, then (id, score, json, read_at) groups
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[5]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+redis.call('HSET', KEYS[1], 'unread', ARGV[3], 'complete', ARGV[4], 'filled', ARGV[1])
+for i = 5, #ARGV, 4 do
+    redis.call('ZADD', KEYS[2], ARGV[i + 1], ARGV[i])
+    redis.call('HSET', KEYS[3], ARGV[i], ARGV[i + 2])
+    if ARGV[i + 3] ~= '' then
+        redis.call('HSET', KEYS[4], ARGV[i], ARGV[i + 3])
+    end
+end
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[2])
+end
+return 1
+"""
+
+# ARGV: ttl, inbox size, then (id, score, json) groups of new unread notifications
+PUSH_SCRIPT = """
+redis.call('INCR', KEYS[5])
+redis.call('EXPIRE', KEYS[5], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local added = 0
+for i = 3, #ARGV, 3 do
+    added = added + redis.call('ZADD', KEYS[2], ARGV[i + 1], ARGV[i])
+    redis.call('HSET', KEYS[3], ARGV[i], ARGV[i + 2])
+end
+redis.call('HINCRBY', KEYS[1], 'unread', added)
+local overflow = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[2])
+if overflow > 0 then
+    local dropped = redis.call('ZRANGE', KEYS[2], 0, overflow - 1)
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, overflow - 1)
+    for _, id in ipairs(dropped) do
+        redis.call('HDEL', KEYS[3], id)
+        redis.call('HDEL', KEYS[4], id)
+    end
+    redis.call('HSET', KEYS[1], 'complete', '0')
+end
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[1])
+end
+return 1
+"""
+
+# Shared preamble of scripts applying a committed change; ARGV[2] is the
+# token from begin_change(). A state filled at or after it may already
+# include the change, so it is dropped rather than adjusted.
+CHANGE_PREAMBLE = """
+redis.call('INCR', KEYS[5])
+redis.call('EXPIRE', KEYS[5], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if tonumber(redis.call('HGET', KEYS[1], 'filled') or '0') >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+    return 0
+end
+"""
+
+# ARGV: ttl, change token, read_at, then IDs the database just changed from unread to read
+READ_SCRIPT = (
+    CHANGE_PREAMBLE
+    + """
+for i = 4, #ARGV do
+    if redis.call('HEXISTS', KEYS[3], ARGV[i]) == 1 then
+        redis.call('HSET', KEYS[4], ARGV[i], ARGV[3])
+    end
+end
+redis.call('HINCRBY', KEYS[1], 'unread', 3 - #ARGV)
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[1])
+end
+return 1
+"""
+)
+
+# ARGV: ttl, change token, unread delta, then IDs of deleted notifications
+REMOVE_SCRIPT = (
+    CHANGE_PREAMBLE
+    + """
+for i = 4, #ARGV do
+    redis.call('ZREM', KEYS[2], ARGV[i])
+    redis.call('HDEL', KEYS[3], ARGV[i])
+    redis.call('HDEL', KEYS[4], ARGV[i])
+end
+redis.call('HINCRBY', KEYS[1], 'unread', ARGV[3])
+return 1
+"""
+)
+
+
+class CachedNotification(BaseModel):
+    """Serializable snapshot of a Notification row (read state kept apart)."""
+
+    id: UUID
+    user_id: UUID
+    type: str
+    title: str
+    message: str
+    data: Optional[Dict[str, Any]] = None
+    link_type: Optional[str] = None
+    link_id: Optional[UUID] = None
+    created_at: datetime
+    expires_at: Optional[datetime] = None
+
+    @classmethod
+    def from_notification(cls, notification: Notification) -> "CachedNotification":
+        """Build snapshot from a loaded Notification."""
+        return cls.model_validate({name: getattr(notification, name) for name in cls.model_fields})
+
+    def to_notification(self, read_at: Optional[datetime] = None) -> Notification:
+        """Build a detached Notification instance (never attached to a session)."""
+        return Notification(**self.model_dump(), is_read=read_at is not None, read_at=read_at)
+
+
+class InboxSnapshot(NamedTuple):
+    """Cached unread count and most recent notifications for one user."""
+
+    unread_count: int
+    notifications: List[Notification]
+    # True when the inbox holds every notification the user has
+    complete: bool
+
+
+class NotificationCache:
+    """
+    Redis-backed unread counters and recent inboxes.
+
+    Reads return None on a miss; callers load from the database and store
+    the result with fill(), passing the generation taken by
+    begin_fill() before their queries.
+
+    Attributes:
+        redis: Async Redis client
+        ttl: Lifetime in seconds of a user's entries, refreshed on change
+        inbox_size: Most recent notifications kept per user
+        key_prefix: Redis key prefix
+        enabled: When False every read is a miss and writes are skipped
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl: int = 3600,
+        inbox_size: int = 100,
+        key_prefix: str = "ardha:notifications",
+        enabled: bool = True,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.inbox_size = inbox_size
+        self.key_prefix = key_prefix
+        self.enabled = enabled
+
+        self._fill = redis.register_script(FILL_SCRIPT)
+        self._push = redis.register_script(PUSH_SCRIPT)
+        self._read = redis.register_script(READ_SCRIPT)
+        self._remove = redis.register_script(REMOVE_SCRIPT)
+
+    # ============= Reads =============
+
+    async def get_unread_count(self, user_id: UUID) -> Optional[int]:
+        """
+        Get cached unread count.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Unread count, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.hget(self._key(user_id, "state"), "unread")
+        except Exception as e:
+            logger.warning(f"Notification cache read failed: {e}")
+            return None
+
+        return max(int(raw), 0) if raw is not None else None
+
+    async def get_inbox(self, user_id: UUID) -> Optional[InboxSnapshot]:
+        """
+        Get cached unread count and recent notifications, newest first.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            InboxSnapshot, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hgetall(self._key(user_id, "state"))
+                pipe.zrevrange(self._key(user_id, "inbox"), 0, -1)
+                pipe.hgetall(self._key(user_id, "items"))
+                pipe.hgetall(self._key(user_id, "read"))
+                state, ids, items, read = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Notification cache read failed: {e}")
+            return None
+
+        if not state:
+            return None
+
+        try:
+            notifications = []
+            for notification_id in ids:
+                read_at = read.get(notification_id)
+                snapshot = CachedNotification.model_validate_json(items[notification_id])
+                notifications.append(
+                    snapshot.to_notification(
+                        datetime.fromisoformat(read_at.decode()) if read_at else None
+                    )
+                )
+            return InboxSnapshot(
+                unread_count=max(int(state[b"unread"]), 0),
+                notifications=notifications,
+                complete=state.get(b"complete") == b"1",
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Discarding malformed cached inbox for {user_id}: {e}")
+            await self.invalidate([user_id])
+            return None
+
+    # ============= Fill =============
+
+    async def begin_fill(self, user_id: UUID) -> Optional[str]:
+        """
+        Take the generation to pass to fill() before querying the database.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Generation token, or None when the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.get(self._key(user_id, "gen"))
+        except Exception as e:
+            logger.warning(f"Notification cache read failed: {e}")
+            return None
+
+        return raw.decode() if raw is not None else "0"
+
+    async def fill(
+        self,
+        user_id: UUID,
+        generation: Optional[str],
+        unread_count: int,
+        notifications: Sequence[Notification],
+    ) -> bool:
+        """
+        Store a user's counter and inbox loaded from the database.
+
+        Skipped when anything changed for the user since begin_fill().
+
+        Args:
+            user_id: User UUID
+            generation: Token from begin_fill()
+            unread_count: Unread count from the database
+            notifications: Most recent notifications, newest first
+
+        Returns:
+            True if stored
+        """
+        if generation is None:
+            return False
+
+        recent = notifications[: self.inbox_size]
+        args: List[Any] = [
+            generation,
+            self.ttl,
+            unread_count,
+            "1" if len(notifications) < self.inbox_size else "0",
+        ]
+        for notification in recent:
+            args.extend(self._entry(notification))
+            read_at = notification.read_at or notification.created_at
+            args.append(read_at.isoformat() if notification.is_read else "")
+
+        try:
+            return bool(await self._fill(keys=self._keys(user_id), args=args))
+        except Exception as e:
+            logger.warning(f"Notification cache fill failed: {e}")
+            return False
+
+    # ============= Changes =============
+
+    async def add(self, notifications: Iterable[Notification]) -> None:
+        """
+        Record newly created (unread) notifications.
+
+        Notifications for many users are applied in one pipeline.
+
+        Args:
+            notifications: Created notifications
+        """
+        if not self.enabled:
+            return
+
+        by_user: Dict[UUID, List[Any]] = defaultdict(list)
+        for notification in notifications:
+            by_user[notification.user_id].extend(self._entry(notification))
+        if not by_user:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for user_id, entries in by_user.items():
+                    await self._push(
+                        keys=self._keys(user_id),
+                        args=[self.ttl, self.inbox_size, *entries],
+                        client=pipe,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Notification cache update failed for {len(by_user)} users: {e}")
+            await self.invalidate(by_user)
+
+    async def begin_change(self, user_id: UUID) -> Optional[str]:
+        """
+        Take the token to pass to mark_read() or remove() before the database write.
+
+        Bumps the generation, so fills already running are discarded.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Change token, or None when the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(self._key(user_id, "gen"))
+                pipe.expire(self._key(user_id, "gen"), self.ttl)
+                generation, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Notification cache update failed: {e}")
+            return None
+
+        return str(generation)
+
+    async def mark_read(
+        self,
+        user_id: UUID,
+        notification_ids: Sequence[UUID],
+        read_at: datetime,
+        token: Optional[str],
+    ) -> None:
+        """
+        Record notifications the database changed from unread to read.
+
+        Args:
+            user_id: User UUID
+            notification_ids: IDs that were unread until now
+            read_at: Read timestamp
+            token: Token from begin_change(), taken before the write
+        """
+        if not self.enabled or not notification_ids:
+            return
+        if token is None:
+            await self.invalidate([user_id])
+            return
+
+        try:
+            await self._read(
+                keys=self._keys(user_id),
+                args=[self.ttl, token, read_at.isoformat(), *map(str, notification_ids)],
+            )
+        except Exception as e:
+            logger.warning(f"Notification cache update failed: {e}")
+            await self.invalidate([user_id])
+
+    async def remove(
+        self,
+        user_id: UUID,
+        notification_id: UUID,
+        was_unread: bool,
+        token: Optional[str],
+    ) -> None:
+        """
+        Record a deleted notification.
+
+        Args:
+            user_id: User UUID
+            notification_id: Deleted notification UUID
+            was_unread: Whether it counted towards the unread total
+            token: Token from begin_change(), taken before the write
+        """
+        if not self.enabled:
+            return
+        if token is None:
+            await self.invalidate([user_id])
+            return
+
+        try:
+            await self._remove(
+                keys=self._keys(user_id),
+                args=[self.ttl, token, -1 if was_unread else 0, str(notification_id)],
+            )
+        except Exception as e:
+            logger.warning(f"Notification cache update failed: {e}")
+            await self.invalidate([user_id])
+
+    # ============= Invalidation =============
+
+    async def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        """
+        Drop cached state so the next read reloads from the database.
+
+        Args:
+            user_ids: User UUIDs
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    keys = self._keys(user_id)
+                    pipe.delete(*keys[:4])
+                    pipe.incr(keys[4])
+                    pipe.expire(keys[4], self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Notification cache invalidation failed: {e}")
+
+    async def clear(self) -> int:
+        """
+        Invalidate every cached user, e.g. after bulk deletes in maintenance jobs.
+
+        Returns:
+            Number of users invalidated
+        """
+        user_ids = []
+        try:
+            async for key in self.redis.scan_iter(match=f"{self.key_prefix}:*:state", count=1000):
+                user_ids.append(UUID(key.decode().split(":")[-2]))
+        except Exception as e:
+            logger.warning(f"Notification cache scan failed: {e}")
+
+        await self.invalidate(user_ids)
+        return len(user_ids)
+
+    # ============= Internals =============
+
+    def _key(self, user_id: UUID, suffix: str) -> str:
+        return f"{self.key_prefix}:{user_id}:{suffix}"
+
+    def _keys(self, user_id: UUID) -> List[str]:
+        return [self._key(user_id, suffix) for suffix in KEY_SUFFIXES]
+
+    @staticmethod
+    def _entry(notification: Notification) -> Tuple[str, float, str]:
+        return (
+            str(notification.id),
+            notification.created_at.timestamp(),
+            CachedNotification.from_notification(notification).model_dump_json(),
+        )
+
+
+# Global notification cache instance
+_notification_cache: Optional[NotificationCache] = None
+
+
+def get_notification_cache() -> NotificationCache:
+    """
+    Get global notification cache instance.
+
+    Returns:
+        NotificationCache instance configured from settings.notifications
+    """
+    global _notification_cache
+
+    if _notification_cache is None:
+        _notification_cache = NotificationCache(
+            redis=get_redis(),
+            ttl=settings.notifications.cache_ttl,
+            inbox_size=settings.notifications.inbox_size,
+            enabled=settings.notifications.cache_enabled,
+        )
+
+    return _notification_cache
@@ -0,0 +1,381 @@
+"""
+Principal cache for authenticated users and their project roles.
+
+This module keeps auth lookups off the database for typical API calls:
+- In-process TTL cache (short TTL, bounded size) as the first tier
+- Redis as the shared second tier across workers
+- Request-scoped memo so nested services reuse one role map per request
+- Invalidation on user and project membership changes via ORM events,
+  repeated after the transaction commits so an entry a concurrent request
+  loaded from the pre-commit rows is dropped
+
+Entries in other workers' in-process tier may lag an invalidation by at
+most principal_cache_local_ttl_seconds; Redis entries are deleted directly.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ardha.core.config import settings
+from ardha.core.redis import get_redis
+from ardha.models.project_member import ProjectMember
+from ardha.models.user import User
+
+logger = logging.getLogger(__name__)
+
+RoleMap = Dict[UUID, str]
+
+# Session.info key of the cache keys to invalidate when the transaction commits
+PENDING_INVALIDATIONS = "principal_pending_invalidations"
+
+# Per-request memo of role maps: {(cache id, user_id): (generation, roles)}
+_request_roles: ContextVar[Optional[Dict[Tuple[int, UUID], Tuple[int, RoleMap]]]] = ContextVar(
+    "principal_request_roles", default=None
+)
+
+
+class CachedUser(BaseModel):
+    """
+    Serializable snapshot of a User row.
+
+    Excludes password_hash so credentials never leave the database.
+    """
+
+    id: UUID
+    email: str
+    username: str
+    full_name: Optional[str] = None
+    is_active: bool = True
+    is_superuser: bool = False
+    avatar_url: Optional[str] = None
+    github_id: Optional[str] = None
+    google_id: Optional[str] = None
+    last_login_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        """Build snapshot from a loaded User."""
+        return cls.model_validate({name: getattr(user, name) for name in cls.model_fields})
+
+    def to_user(self) -> User:
+        """Build a detached User instance (never attached to a session)."""
+        return User(**self.model_dump())
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of users and project-role maps.
+
+    Reads go request scope -> in-process -> Redis; callers load from the
+    database on a miss and store the result back. Redis failures are
+    logged and treated as misses so auth never depends on Redis.
+
+    Attributes:
+        redis: Async Redis client, or None for in-process only
+        local_ttl: In-process entry lifetime in seconds
+        redis_ttl: Redis entry lifetime in seconds
+        max_entries: Maximum in-process entries before oldest are evicted
+        key_prefix: Redis key prefix
+        enabled: When False every lookup is a miss
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        local_ttl: float = 5.0,
+        redis_ttl: int = 300,
+        max_entries: int = 10000,
+        key_prefix: str = "ardha:principal",
+        enabled: bool = True,
+    ) -> None:
+        self.redis = redis
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self.enabled = enabled
+
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._pending_deletes: Set[str] = set()
+        self._generation = 0
+        # Scheduled Redis deletes (kept referenced until done)
+        self._tasks: Set[asyncio.Task] = set()
+
+    # ============= Request Scope =============
+
+    @staticmethod
+    def begin_request() -> None:
+        """Start a fresh request-scoped memo in the current context."""
+        _request_roles.set({})
+
+    # ============= Users =============
+
+    async def get_user(self, user_id: UUID) -> Optional[User]:
+        """
+        Get cached user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Detached User instance, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        raw = await self._get(self._user_key(user_id))
+        if raw is None:
+            return None
+
+        try:
+            return CachedUser.model_validate_json(raw).to_user()
+        except ValueError as e:
+            logger.warning(f"Discarding malformed cached user {user_id}: {e}")
+            return None
+
+    async def set_user(self, user: User) -> None:
+        """
+        Store user snapshot in both tiers.
+
+        Args:
+            user: Loaded User instance
+        """
+        if not self.enabled:
+            return
+
+        await self._set(self._user_key(user.id), CachedUser.from_user(user).model_dump_json())
+
+    # ============= Project Roles =============
+
+    async def get_roles(self, user_id: UUID) -> Optional[RoleMap]:
+        """
+        Get cached project-role map for a user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Mapping of project ID to role, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        scope = _request_roles.get()
+        memo = scope.get((id(self), user_id)) if scope is not None else None
+        if memo is not None and memo[0] == self._generation:
+            return memo[1]
+
+        raw = await self._get(self._roles_key(user_id))
+        if raw is None:
+            return None
+
+        try:
+            roles = {UUID(project_id): role for project_id, role in json.loads(raw).items()}
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Discarding malformed cached roles for {user_id}: {e}")
+            return None
+
+        self._remember(user_id, roles)
+        return roles
+
+    async def set_roles(self, user_id: UUID, roles: RoleMap) -> None:
+        """
+        Store project-role map in both tiers.
+
+        Args:
+            user_id: User UUID
+            roles: Mapping of project ID to role
+        """
+        if not self.enabled:
+            return
+
+        payload = json.dumps({str(project_id): role for project_id, role in roles.items()})
+        await self._set(self._roles_key(user_id), payload)
+        self._remember(user_id, roles)
+
+    # ============= Invalidation =============
+
+    def invalidate_user(self, user_id: UUID, session: Optional[Session] = None) -> None:
+        """
+        Drop cached user record.
+
+        Safe to call from synchronous code (ORM events); the Redis delete
+        is applied before the next cache read in this process.
+
+        Args:
+            user_id: User UUID
+            session: Session whose uncommitted change affects the user; the
+                entry is dropped again once it commits
+        """
+        self._invalidate(self._user_key(user_id), session)
+
+    def invalidate_roles(self, user_id: UUID, session: Optional[Session] = None) -> None:
+        """
+        Drop cached project-role map.
+
+        Args:
+            user_id: User UUID
+            session: Session whose uncommitted change affects the roles; the
+                map is dropped again once it commits
+        """
+        self._invalidate(self._roles_key(user_id), session)
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier and any request-scoped memo."""
+        self._local.clear()
+        self._generation += 1
+
+    async def flush_invalidations(self) -> None:
+        """Apply pending Redis deletes."""
+        if not self._pending_deletes or self.redis is None:
+            self._pending_deletes.clear()
+            return
+
+        keys = list(self._pending_deletes)
+        self._pending_deletes.difference_update(keys)
+        try:
+            await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Principal cache invalidation failed: {e}")
+
+    # ============= Internals =============
+
+    def _user_key(self, user_id: UUID) -> str:
+        return f"{self.key_prefix}:user:{user_id}"
+
+    def _roles_key(self, user_id: UUID) -> str:
+        return f"{self.key_prefix}:roles:{user_id}"
+
+    def _remember(self, user_id: UUID, roles: RoleMap) -> None:
+        scope = _request_roles.get()
+        if scope is not None:
+            scope[(id(self), user_id)] = (self._generation, roles)
+
+    def _invalidate(self, key: str, session: Optional[Session] = None) -> None:
+        self._drop(key)
+
+        if session is not None:
+            pending: Set[str] = session.info.setdefault(PENDING_INVALIDATIONS, set())
+            if not pending:
+                event.listen(session, "after_commit", self._after_commit, once=True)
+            pending.add(key)
+
+    def _after_commit(self, session: Session) -> None:
+        for key in session.info.pop(PENDING_INVALIDATIONS, set()):
+            self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        self._local.pop(key, None)
+        self._generation += 1
+        if self.redis is None:
+            return
+
+        self._pending_deletes.add(key)
+        try:
+            task = asyncio.get_running_loop().create_task(self.flush_invalidations())
+        except RuntimeError:
+            return  # No loop; applied on the next read
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _get(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                return value
+            del self._local[key]
+
+        if self.redis is None:
+            return None
+
+        await self.flush_invalidations()
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Principal cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = raw.decode() if isinstance(raw, bytes) else raw
+        self._store_local(key, value)
+        return value
+
+    async def _set(self, key: str, value: str) -> None:
+        self._store_local(key, value)
+        if self.redis is None:
+            return
+
+        await self.flush_invalidations()
+        try:
+            await self.redis.set(key, value, ex=self.redis_ttl)
+        except Exception as e:
+            logger.warning(f"Principal cache write failed: {e}")
+
+    def _store_local(self, key: str, value: str) -> None:
+        if self.local_ttl <= 0:
+            return
+
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+
+# ============= ORM Invalidation Hooks =============
+
+
+def _on_user_change(mapper, connection, target: User) -> None:
+    get_principal_cache().invalidate_user(target.id, object_session(target))
+
+
+def _on_membership_change(mapper, connection, target: ProjectMember) -> None:
+    get_principal_cache().invalidate_roles(target.user_id, object_session(target))
+
+
+event.listen(User, "after_update", _on_user_change)
+event.listen(User, "after_delete", _on_user_change)
+event.listen(ProjectMember, "after_insert", _on_membership_change)
+event.listen(ProjectMember, "after_update", _on_membership_change)
+event.listen(ProjectMember, "after_delete", _on_membership_change)
+
+
+# Global principal cache instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Get global principal cache instance.
+
+    Returns:
+        PrincipalCache instance configured from settings.security
+    """
+    global _principal_cache
+
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            redis=get_redis(),
+            local_ttl=settings.security.principal_cache_local_ttl_seconds,
+            redis_ttl=settings.security.principal_cache_redis_ttl_seconds,
+            max_entries=settings.security.principal_cache_max_entries,
+            enabled=settings.security.principal_cache_enabled,
+        )
+
+    return _principal_cache
@@ -7,7 +7,7 @@ with collection management, embedding operations, and search capabilities.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 from uuid import UUID
 
 from qdrant_client import AsyncQdrantClient, models
@@ -417,6 +417,63 @@ class QdrantService:
             logger.error(f"Failed to search in {collection_name}: {e}")
             raise QdrantError(f"Vector search failed: {e}", error_type="search_error")
 
+    async def search_by_vector(
+        self,
+        collection_type: str,
+        query_vector: List[float],
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        identifier: Optional[Union[str, UUID]] = None,
+        points_filter: Optional[Filter] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search with a query vector computed by the caller.
+
+        Use this when the stored vectors came from upsert_embedded, so the
+        query is embedded by the same service as the indexed text.
+
+        Args:
+            collection_type: Type of collection
+            query_vector: Query embedding
+            limit: Maximum number of results
+            score_threshold: Minimum similarity score
+            identifier: Optional identifier for specific collection
+            points_filter: Optional Qdrant filter
+
+        Returns:
+            List of similar points with scores and metadata
+
+        Raises:
+            QdrantError: If search fails
+        """
+        collection_name = self._get_collection_name(collection_type, identifier)
+
+        try:
+            search_result = await self.client.search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                query_filter=points_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vectors=False,
+            )
+
+            return [
+                {
+                    "id": scored_point.id,
+                    "score": scored_point.score,
+                    "text": (scored_point.payload or {}).get("text", ""),
+                    "metadata": (scored_point.payload or {}).get("metadata", {}),
+                    "created_at": (scored_point.payload or {}).get("created_at"),
+                }
+                for scored_point in search_result
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to search in {collection_name}: {e}")
+            raise QdrantError(f"Vector search failed: {e}", error_type="search_error")
+
     async def get_collection_info(
         self, collection_type: str, identifier: Optional[Union[str, UUID]] = None
     ) -> Dict[str, Any]:
@@ -514,6 +571,158 @@ class QdrantService:
             logger.error(f"Failed to delete points from {collection_name}: {e}")
             raise QdrantError(f"Point deletion failed: {e}", error_type="deletion_error")
 
+    async def upsert_embedded(
+        self,
+        collection_type: str,
+        points: List[Dict[str, Any]],
+        identifier: Optional[Union[str, UUID]] = None,
+    ) -> bool:
+        """
+        Upsert points whose vectors were computed by the caller.
+
+        Unlike upsert_vectors, no embedding happens here, so callers can
+        embed many texts in one batch (e.g. through the local embedding
+        service) and write them with a single request.
+
+        Args:
+            collection_type: Type of collection
+            points: List of points with id, vector, text, and metadata
+            identifier: Optional identifier for specific collection
+
+        Returns:
+            True if upsert successful
+
+        Raises:
+            QdrantError: If upsert fails
+        """
+        collection_name = self._get_collection_name(collection_type, identifier)
+
+        try:
+            await self.client.upsert(
+                collection_name=collection_name,
+                points=[
+                    models.PointStruct(
+                        id=point["id"],
+                        vector=point["vector"],
+                        payload={
+                            "text": point["text"],
+                            "metadata": point.get("metadata", {}),
+                            "created_at": point.get("created_at"),
+                        },
+                    )
+                    for point in points
+                ],
+            )
+
+            logger.info(f"Upserted {len(points)} embedded vectors to {collection_name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to upsert vectors to {collection_name}: {e}")
+            raise QdrantError(f"Vector upsert failed: {e}", error_type="upsert_error")
+
+    async def get_existing_ids(
+        self,
+        collection_type: str,
+        point_ids: List[Union[str, UUID]],
+        identifier: Optional[Union[str, UUID]] = None,
+    ) -> Set[str]:
+        """
+        Check which point IDs are stored, without fetching payloads or vectors.
+
+        Args:
+            collection_type: Type of collection
+            point_ids: Point IDs to look up
+            identifier: Optional identifier for specific collection
+
+        Returns:
+            Set of the given IDs (as strings) that exist in the collection
+
+        Raises:
+            QdrantError: If lookup fails
+        """
+        collection_name = self._get_collection_name(collection_type, identifier)
+
+        try:
+            records = await self.client.retrieve(
+                collection_name=collection_name,
+                ids=[str(pid) for pid in point_ids],
+                with_payload=False,
+                with_vectors=False,
+            )
+            return {str(record.id) for record in records}
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve points from {collection_name}: {e}")
+            raise QdrantError(f"Point lookup failed: {e}", error_type="retrieve_error")
+
+    async def delete_by_filter(
+        self,
+        collection_type: str,
+        points_filter: Filter,
+        identifier: Optional[Union[str, UUID]] = None,
+    ) -> bool:
+        """
+        Delete every point matching a filter.
+
+        Args:
+            collection_type: Type of collection
+            points_filter: Qdrant filter selecting the points to delete
+            identifier: Optional identifier for specific collection
+
+        Returns:
+            True if deletion successful
+
+        Raises:
+            QdrantError: If deletion fails
+        """
+        collection_name = self._get_collection_name(collection_type, identifier)
+
+        try:
+            await self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.FilterSelector(filter=points_filter),
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete points from {collection_name}: {e}")
+            raise QdrantError(f"Point deletion failed: {e}", error_type="deletion_error")
+
+    async def create_payload_index(
+        self,
+        collection_type: str,
+        field_name: str,
+        identifier: Optional[Union[str, UUID]] = None,
+    ) -> bool:
+        """
+        Create a keyword index on a payload field for fast filtering.
+
+        Args:
+            collection_type: Type of collection
+            field_name: Payload field (e.g. "metadata.project_id")
+            identifier: Optional identifier for specific collection
+
+        Returns:
+            True if index created (or already present)
+
+        Raises:
+            QdrantError: If index creation fails
+        """
+        collection_name = self._get_collection_name(collection_type, identifier)
+
+        try:
+            await self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to index {field_name} in {collection_name}: {e}")
+            raise QdrantError(f"Payload index creation failed: {e}", error_type="index_error")
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on Qdrant service.
@@ -1,62 +1,303 @@
 """
 Rate limiting utilities for API endpoints.
 
-This module provides rate limiting functionality using Redis as a backend
-to track request counts per user and enforce limits.
+This module provides rate limiting backed by a single server-side Lua
+script implementing GCRA (the generic cell rate algorithm, a token bucket
+that stores one timestamp per key). Each check is one atomic round trip:
+
+- Several tiers (per-user, per-project, per-route) are evaluated together;
+  the request is admitted only if every tier admits it.
+- Rejected requests do not consume quota.
+- Quota can be inspected without consuming it (cost 0), so rate limit
+  headers never cost a slot.
+
+Limits are applied per route with the RateLimit dependency, or globally
+per principal with RateLimitMiddleware.
 """
 
-import asyncio
 import logging
 import time
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, ConfigDict, Field
 from redis.asyncio import Redis
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import JSONResponse
 
 from ardha.core.config import settings
-from ardha.core.security import get_current_user
+from ardha.core.redis import get_redis
+from ardha.core.security import get_current_user, verify_token
 from ardha.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
+# GCRA over N keys in one atomic call.
+#
+# KEYS[i]        -> stored theoretical arrival time (TAT, ms) for tier i
+# ARGV[1]        -> cost (0 = inspect only)
+# ARGV[2i], [2i+1] -> emission interval (ms per request) and burst for tier i
+#
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms, limiting_tier}
+# where limiting_tier is the 1-based index of the most restrictive tier.
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local cost = tonumber(ARGV[1])
+
+local allowed = 1
+local remaining = -1
+local retry_after = 0
+local limiting_ok = 1
+local limiting_rejected = 1
+local tats = {}
+local new_tats = {}
+
+for i, key in ipairs(KEYS) do
+    local emission = tonumber(ARGV[i * 2])
+    local tolerance = emission * tonumber(ARGV[i * 2 + 1])
+
+    local tat = tonumber(redis.call('GET', key) or now)
+    if tat < now then
+        tat = now
+    end
+
+    local new_tat = tat + emission * cost
+    local diff = now - (new_tat - tolerance)
+
+    local tier_remaining = 0
+    if diff < 0 then
+        allowed = 0
+        if -diff > retry_after then
+            retry_after = -diff
+            limiting_rejected = i
+        end
+    else
+        tier_remaining = math.floor(diff / emission)
+    end
+
+    if remaining < 0 or tier_remaining < remaining then
+        remaining = tier_remaining
+        limiting_ok = i
+    end
+
+    tats[i] = tat
+    new_tats[i] = new_tat
+end
+
+local consume = allowed == 1 and cost > 0
+local reset_after = 0
+
+for i, key in ipairs(KEYS) do
+    local stored = tats[i]
+    if consume then
+        stored = new_tats[i]
+        redis.call('SET', key, stored, 'PX', math.max(1, math.ceil(stored - now)))
+    end
+    if stored - now > reset_after then
+        reset_after = stored - now
+    end
+end
+
+local limiting = limiting_ok
+if allowed == 0 then
+    limiting = limiting_rejected
+end
+
+return {allowed, remaining, retry_after, reset_after, limiting}
+"""
+
+
+class RateLimitTier(BaseModel):
+    """
+    A single rate limit rule.
+
+    Sustained throughput is limit requests per period seconds; up to burst
+    requests may be made back to back after an idle period.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(description="Tier name used in keys (e.g. 'user', 'project', 'chat')")
+    limit: int = Field(ge=1, description="Requests allowed per period")
+    period: int = Field(default=60, ge=1, description="Period length in seconds")
+    burst: Optional[int] = Field(default=None, ge=1, description="Bucket size (default: limit)")
+
+    @property
+    def capacity(self) -> int:
+        """Maximum back-to-back requests."""
+        return self.burst or self.limit
+
+    @property
+    def emission_interval_ms(self) -> float:
+        """Milliseconds between requests at the sustained rate."""
+        return self.period * 1000 / self.limit
+
+
+class RateLimitResult(BaseModel):
+    """Outcome of a rate limit check across one or more tiers."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float = Field(description="Seconds until the limiting bucket is full again")
+    retry_after: float = Field(description="Seconds until the request would be admitted")
+    tier: Optional[str] = Field(default=None, description="Most restrictive tier")
+
+    @property
+    def reset_time(self) -> int:
+        """Unix timestamp when the limiting bucket is full again."""
+        return int(time.time() + self.reset_after)
+
+    def to_headers(self) -> Dict[str, str]:
+        """
+        Standard rate limit response headers.
+
+        Returns:
+            Dictionary of header names to values
+        """
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_time),
+        }
+        if not self.allowed:
+            retry_after = str(max(1, int(self.retry_after + 0.999)))
+            headers["X-RateLimit-Retry-After"] = retry_after
+            headers["Retry-After"] = retry_after
+        return headers
+
+
 class RateLimiter:
     """
-    Redis-based rate limiter for API endpoints.
+    Redis-based GCRA rate limiter for API endpoints.
 
-    Tracks request counts per user in sliding time windows
-    and enforces configurable limits with proper error responses.
+    All tiers for a request are checked and updated by one atomic Lua
+    script call, so concurrent requests cannot race past a limit.
 
     Attributes:
         redis: Redis client for storing rate limit data
-        requests_per_minute: Maximum requests per minute
-        burst_size: Maximum burst size for short spikes
+        key_prefix: Prefix for rate limit keys
+        requests_per_minute: Default per-user limit (used by is_allowed)
+        burst_size: Default per-user burst (used by is_allowed)
     """
 
-    def __init__(self, redis: Redis, requests_per_minute: int = 10, burst_size: int = 20):
+    def __init__(
+        self,
+        redis: Redis,
+        requests_per_minute: int = 10,
+        burst_size: int = 20,
+        key_prefix: str = "rate_limit",
+    ):
         """
         Initialize rate limiter.
 
         Args:
             redis: Redis client instance
-            requests_per_minute: Maximum requests allowed per minute
-            burst_size: Maximum burst size for short spikes
+            requests_per_minute: Default per-user requests allowed per minute
+            burst_size: Default per-user burst size for short spikes
+            key_prefix: Prefix for rate limit keys
         """
         self.redis = redis
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
+        self.key_prefix = key_prefix
+        self._script = redis.register_script(GCRA_SCRIPT)
 
-    async def is_allowed(self, user_id: UUID, window_seconds: int = 60) -> tuple[bool, dict]:
+    def key(self, tier: RateLimitTier, *parts: object) -> str:
+        """
+        Build Redis key for a tier and its subject.
+
+        Args:
+            tier: Rate limit tier
+            *parts: Subject identifiers (user ID, project ID, route, ...)
+
+        Returns:
+            Redis key string
+        """
+        return ":".join([self.key_prefix, tier.name, *(str(part) for part in parts)])
+
+    async def check(
+        self, limits: Sequence[Tuple[str, RateLimitTier]], cost: int = 1
+    ) -> RateLimitResult:
         """
-        Check if user is allowed to make a request.
+        Check and consume quota across tiers in one atomic call.
 
-        Uses sliding window algorithm with Redis to track requests
-        in the time window and enforce limits.
+        Quota is consumed only if every tier admits the request.
+
+        Args:
+            limits: (key, tier) pairs to evaluate together
+            cost: Number of slots to consume (0 inspects without consuming)
+
+        Returns:
+            RateLimitResult for the most restrictive tier
+        """
+        if not limits:
+            raise ValueError("At least one rate limit tier is required")
+
+        keys = [key for key, _ in limits]
+        args: List[float] = [cost]
+        for _, tier in limits:
+            args.extend([tier.emission_interval_ms, tier.capacity])
+
+        try:
+            allowed, remaining, retry_ms, reset_ms, limiting = await self._script(
+                keys=keys, args=args
+            )
+        except Exception as e:
+            logger.error(f"Rate limit check failed for {keys}: {e}", exc_info=True)
+            # Fail open - allow request if rate limiting fails
+            tier = limits[0][1]
+            return RateLimitResult(
+                allowed=True,
+                limit=tier.limit,
+                remaining=tier.capacity,
+                reset_after=0,
+                retry_after=0,
+                tier=tier.name,
+            )
+
+        tier = limits[int(limiting) - 1][1]
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=tier.limit,
+            remaining=int(remaining),
+            reset_after=float(reset_ms) / 1000,
+            retry_after=float(retry_ms) / 1000,
+            tier=tier.name,
+        )
+
+    async def peek(self, limits: Sequence[Tuple[str, RateLimitTier]]) -> RateLimitResult:
+        """
+        Inspect remaining quota without consuming it.
+
+        Args:
+            limits: (key, tier) pairs to evaluate together
+
+        Returns:
+            RateLimitResult for the most restrictive tier
+        """
+        return await self.check(limits, cost=0)
+
+    def _default_user_limit(self, user_id: UUID, window_seconds: int) -> Tuple[str, RateLimitTier]:
+        """Per-user (key, tier) pair from the limiter's default settings."""
+        tier = RateLimitTier(
+            name="user",
+            limit=self.requests_per_minute,
+            period=window_seconds,
+            burst=self.burst_size,
+        )
+        return self.key(tier, user_id), tier
+
+    async def is_allowed(self, user_id: UUID, window_seconds: int = 60) -> tuple[bool, dict]:
+        """
+        Check if user is allowed to make a request (consumes one slot if so).
 
         Args:
             user_id: UUID of user making request
-            window_seconds: Time window in seconds (default: 60)
+            window_seconds: Period for requests_per_minute (default: 60)
 
         Returns:
             Tuple of (is_allowed, rate_limit_info)
@@ -72,78 +313,12 @@ class RateLimiter:
             "retry_after": int
         }
         """
-        current_time = int(time.time())
-        window_start = current_time - window_seconds
-
-        # Redis key for this user's requests
-        key = f"rate_limit:{user_id}"
-
-        try:
-            # Use Redis pipeline for atomic operations
-            pipe = self.redis.pipeline()
-
-            # Remove old entries outside the window
-            pipe.zremrangebyscore(key, 0, window_start)
-
-            # Count current requests in window
-            pipe.zcard(key)
-
-            # Add current request
-            pipe.zadd(key, {str(current_time): current_time})
-
-            # Set expiration on the key
-            pipe.expire(key, window_seconds)
-
-            # Execute pipeline
-            results = await pipe.execute()
-
-            current_requests = results[1]  # zcard result
-
-            # Check if within limits
-            if current_requests > self.requests_per_minute:
-                # Calculate retry after (when oldest request expires)
-                oldest_request_time = await self.redis.zrange(key, 0, 0, withscores=True)
-                retry_after = 0
-
-                if oldest_request_time:
-                    retry_after = int(oldest_request_time[0][1] + window_seconds - current_time)
-                    retry_after = max(1, retry_after)  # At least 1 second
-
-                return False, {
-                    "allowed": False,
-                    "remaining": 0,
-                    "reset_time": current_time + retry_after,
-                    "limit": self.requests_per_minute,
-                    "retry_after": retry_after,
-                }
-
-            remaining = max(0, self.requests_per_minute - current_requests)
-
-            return True, {
-                "allowed": True,
-                "remaining": remaining,
-                "reset_time": current_time + window_seconds,
-                "limit": self.requests_per_minute,
-                "retry_after": 0,
-            }
-
-        except Exception as e:
-            logger.error(f"Rate limit check failed for user {user_id}: {e}", exc_info=True)
-            # Fail open - allow request if rate limiting fails
-            return True, {
-                "allowed": True,
-                "remaining": self.requests_per_minute,
-                "reset_time": current_time + window_seconds,
-                "limit": self.requests_per_minute,
-                "retry_after": 0,
-            }
+        result = await self.check([self._default_user_limit(user_id, window_seconds)])
+        return result.allowed, _result_to_info(result)
 
     async def get_rate_limit_headers(self, user_id: UUID) -> dict:
         """
-        Get rate limit headers for response.
-
-        Returns standard rate limit headers that can be added
-        to HTTP responses for client visibility.
+        Get rate limit headers for response without consuming quota.
 
         Args:
             user_id: UUID of user
@@ -151,16 +326,19 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit headers
         """
-        _, info = await self.is_allowed(user_id)
+        result = await self.peek([self._default_user_limit(user_id, 60)])
+        return result.to_headers()
 
-        return {
-            "X-RateLimit-Limit": str(info["limit"]),
-            "X-RateLimit-Remaining": str(info["remaining"]),
-            "X-RateLimit-Reset": str(info["reset_time"]),
-            "X-RateLimit-Retry-After": (
-                str(info["retry_after"]) if info["retry_after"] > 0 else None
-            ),
-        }
+
+def _result_to_info(result: RateLimitResult) -> dict:
+    """Convert result to the legacy rate limit info dictionary."""
+    return {
+        "allowed": result.allowed,
+        "remaining": result.remaining,
+        "reset_time": result.reset_time,
+        "limit": result.limit,
+        "retry_after": int(result.retry_after + 0.999),
+    }
 
 
 # Global rate limiter instance
@@ -177,12 +355,8 @@ async def get_rate_limiter() -> RateLimiter:
     global _rate_limiter
 
     if _rate_limiter is None:
-        # Import here to avoid circular imports
-        from redis.asyncio import Redis
-
-        redis_client = Redis.from_url(settings.redis.url)
         _rate_limiter = RateLimiter(
-            redis=redis_client,
+            redis=get_redis(),
             requests_per_minute=settings.rate_limit.per_minute,
             burst_size=settings.rate_limit.burst,
         )
@@ -190,45 +364,221 @@ async def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
-async def check_chat_rate_limit(current_user: User = Depends(get_current_user)) -> None:
+def rate_limit_exceeded(result: RateLimitResult, message: str) -> HTTPException:
     """
-    Check chat-specific rate limit and raise exception if exceeded.
-
-    This is a FastAPI dependency that enforces rate limiting
-    for chat endpoints (10 messages per minute).
+    Build 429 exception for a rejected request.
 
     Args:
-        current_user: Currently authenticated user
+        result: Rejected rate limit result
+        message: Human readable message
 
-    Raises:
-        HTTPException: 429 if rate limit exceeded
+    Returns:
+        HTTPException with rate limit details and headers
     """
-    rate_limiter = await get_rate_limiter()
-
-    # Use stricter limit for chat messages (10 per minute)
-    chat_limiter = RateLimiter(
-        redis=rate_limiter.redis,
-        requests_per_minute=10,
-        burst_size=15,
+    info = _result_to_info(result)
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "error": "Rate limit exceeded",
+            "message": message,
+            "retry_after": info["retry_after"],
+            "limit": info["limit"],
+            "reset_time": info["reset_time"],
+            "tier": result.tier,
+        },
+        headers=result.to_headers(),
     )
 
-    is_allowed, info = await chat_limiter.is_allowed(current_user.id)
-
-    if not is_allowed:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "error": "Rate limit exceeded",
-                "message": f"Too many messages. Please wait {info['retry_after']} seconds.",
-                "retry_after": info["retry_after"],
-                "limit": info["limit"],
-                "reset_time": info["reset_time"],
-            },
-            headers={
-                "X-RateLimit-Limit": str(info["limit"]),
-                "X-RateLimit-Remaining": str(info["remaining"]),
-                "X-RateLimit-Reset": str(info["reset_time"]),
-                "X-RateLimit-Retry-After": str(info["retry_after"]),
-                "Retry-After": str(info["retry_after"]),
-            },
+
+class RateLimit:
+    """
+    FastAPI dependency enforcing per-user, per-project and per-route tiers.
+
+    All configured tiers are checked in one atomic call. On success the
+    rate limit headers are added to the response (for endpoints that
+    return data rather than a Response object); on rejection a 429 is raised.
+
+    Usage:
+        @router.post(
+            "/projects/{project_id}/tasks",
+            dependencies=[Depends(RateLimit(
+                user=RateLimitTier(name="user", limit=100),
+                project=RateLimitTier(name="project", limit=1000),
+                route=RateLimitTier(name="task_create", limit=30),
+            ))],
         )
+    """
+
+    def __init__(
+        self,
+        user: Optional[RateLimitTier] = None,
+        project: Optional[RateLimitTier] = None,
+        route: Optional[RateLimitTier] = None,
+        project_param: str = "project_id",
+        message: str = "Too many requests. Please wait {retry_after} seconds.",
+    ):
+        """
+        Configure dependency tiers.
+
+        Args:
+            user: Tier keyed by user
+            project: Tier keyed by the project path parameter (skipped if absent)
+            route: Tier keyed by route template and user
+            project_param: Name of the path parameter holding the project ID
+            message: 429 message template ({retry_after} is substituted)
+        """
+        if not (user or project or route):
+            raise ValueError("RateLimit requires at least one tier")
+
+        self.user = user
+        self.project = project
+        self.route = route
+        self.project_param = project_param
+        self.message = message
+
+    def limits_for(self, limiter: RateLimiter, request: Request, user_id: UUID) -> list:
+        """
+        Resolve (key, tier) pairs for a request.
+
+        Args:
+            limiter: RateLimiter used to build keys
+            request: Incoming request
+            user_id: Authenticated user ID
+
+        Returns:
+            List of (key, tier) pairs
+        """
+        limits = []
+        if self.user:
+            limits.append((limiter.key(self.user, user_id), self.user))
+
+        project_id = request.path_params.get(self.project_param)
+        if self.project and project_id:
+            limits.append((limiter.key(self.project, project_id), self.project))
+
+        if self.route:
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", request.url.path)
+            route_key = f"{request.method}:{route_path}"
+            limits.append((limiter.key(self.route, route_key, user_id), self.route))
+
+        return limits
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        current_user: User = Depends(get_current_user),
+    ) -> RateLimitResult:
+        limiter = await get_rate_limiter()
+        limits = self.limits_for(limiter, request, current_user.id)
+
+        if not limits:
+            # Only a project tier configured and no project in path
+            return RateLimitResult(allowed=True, limit=0, remaining=0, reset_after=0, retry_after=0)
+
+        result = await limiter.check(limits)
+
+        if not result.allowed:
+            retry_after = _result_to_info(result)["retry_after"]
+            raise rate_limit_exceeded(result, self.message.format(retry_after=retry_after))
+
+        for name, value in result.to_headers().items():
+            response.headers[name] = value
+
+        return result
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Global per-principal rate limit for every HTTP request.
+
+    The principal is the JWT subject when a valid bearer token is present
+    (decoded statelessly, no database lookup) and the client IP otherwise.
+    Finer-grained tiers belong on individual routes via RateLimit.
+    """
+
+    def __init__(
+        self,
+        app,
+        tier: Optional[RateLimitTier] = None,
+        exempt_paths: Sequence[str] = ("/health", "/", "/docs", "/openapi.json"),
+        limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+            tier: Global tier (default: settings.rate_limit per_minute/burst)
+            exempt_paths: Paths never rate limited
+            limiter_factory: Callable returning the RateLimiter (for tests)
+        """
+        super().__init__(app)
+        self.tier = tier or RateLimitTier(
+            name="global",
+            limit=settings.rate_limit.per_minute,
+            burst=settings.rate_limit.burst,
+        )
+        self.exempt_paths = set(exempt_paths)
+        self._limiter_factory = limiter_factory
+
+    def principal(self, request: Request) -> str:
+        """
+        Identify the caller for the global tier.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            "user:<id>" for authenticated requests, "ip:<addr>" otherwise
+        """
+        authorization = request.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            payload = verify_token(authorization[7:])
+            if payload and payload.get("sub"):
+                return f"user:{payload['sub']}"
+
+        client_host = request.client.host if request.client else "unknown"
+        return f"ip:{client_host}"
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path in self.exempt_paths or request.method == "OPTIONS":
+            return await call_next(request)
+
+        limiter = self._limiter_factory() if self._limiter_factory else await get_rate_limiter()
+        result = await limiter.check([(limiter.key(self.tier, self.principal(request)), self.tier)])
+
+        if not result.allowed:
+            info = _result_to_info(result)
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "detail": {
+                        "error": "Rate limit exceeded",
+                        "message": f"Too many requests. Please wait {info['retry_after']} seconds.",
+                        "retry_after": info["retry_after"],
+                        "limit": info["limit"],
+                        "reset_time": info["reset_time"],
+                        "tier": result.tier,
+                    }
+                },
+                headers=result.to_headers(),
+            )
+
+        response = await call_next(request)
+        for name, value in result.to_headers().items():
+            response.headers.setdefault(name, value)
+        return response
+
+
+# ============= Route Tiers =============
+
+# Chat messages: 10 per minute per user
+CHAT_MESSAGE_TIER = RateLimitTier(name="chat", limit=10, period=60)
+
+# FastAPI dependency enforcing the chat tier; raises 429 when exceeded
+check_chat_rate_limit = RateLimit(
+    user=CHAT_MESSAGE_TIER,
+    message="Too many messages. Please wait {retry_after} seconds.",
+)
@@ -0,0 +1,63 @@
+"""
+Shared Redis client for the Ardha backend.
+
+This module provides a lazily created, process-wide async Redis client
+backed by a single connection pool. Services that need Redis (pub/sub,
+presence tracking, caches, rate limiting) should use get_redis() instead
+of creating their own clients so connections are shared per worker.
+"""
+
+import logging
+from typing import Optional
+
+from redis.asyncio import ConnectionPool, Redis
+
+from ardha.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+_pool: Optional[ConnectionPool] = None
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """
+    Get the shared async Redis client.
+
+    The client is created on first use with a connection pool sized from
+    settings.redis.max_connections. Responses are returned as bytes.
+
+    Returns:
+        Shared Redis client instance
+    """
+    global _pool, _client
+
+    if _client is None:
+        _pool = ConnectionPool.from_url(
+            settings.redis.url,
+            max_connections=settings.redis.max_connections,
+        )
+        _client = Redis(connection_pool=_pool)
+        logger.info("Shared Redis client initialized")
+
+    return _client
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client and its connection pool.
+
+    Should be called on application shutdown.
+    """
+    global _pool, _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+    logger.info("Shared Redis client closed")
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ardha.core.config import settings
 from ardha.core.database import get_db
+from ardha.core.principal_cache import get_principal_cache
 from ardha.models.user import User
 from ardha.repositories.user_repository import UserRepository
 
@@ -177,9 +178,12 @@ async def get_current_user(
     This dependency:
     1. Extracts the Bearer token from the Authorization header
     2. Decodes and validates the JWT token
-    3. Fetches the user from the database
+    3. Fetches the user from the principal cache, or the database on a miss
     4. Returns the User object if valid
 
+    Cached users are detached snapshots without password_hash. The call
+    also starts the request-scoped principal memo used by permission checks.
+
     Args:
         token: JWT token extracted from Authorization header
         db: Database session for user lookup
@@ -221,13 +225,20 @@ async def get_current_user(
         logger.warning(f"JWT validation failed: {e}")
         raise credentials_exception
 
-    # Fetch user from database
-    user_repository = UserRepository(db)
-    user = await user_repository.get_by_id(user_id)
+    principal_cache = get_principal_cache()
+    principal_cache.begin_request()
 
+    user = await principal_cache.get_user(user_id)
     if user is None:
-        logger.warning(f"User not found for ID: {user_id}")
-        raise credentials_exception
+        # Fetch user from database
+        user_repository = UserRepository(db)
+        user = await user_repository.get_by_id(user_id)
+
+        if user is None:
+            logger.warning(f"User not found for ID: {user_id}")
+            raise credentials_exception
+
+        await principal_cache.set_user(user)
 
     logger.debug(f"Authenticated user: {user.email} (ID: {user.id})")
     return user
@@ -0,0 +1,426 @@
+"""
+Per-project task dependency graph and its Redis cache.
+
+This module serves the plan, Gantt and roadmap views without walking
+dependencies row by row:
+- TaskGraph: adjacency of a project's tasks loaded in two queries, with
+  topological ordering, dependency levels and critical path computed in
+  memory in O(tasks + dependencies)
+- TaskGraphCache: one JSON document per project in Redis, filled with a
+  generation check so a fill that raced a dependency change is dropped
+
+Task mutations invalidate the project's graph when they write and again
+after their transaction commits, so a graph read from the pre-commit state
+in between is dropped; the TTL bounds how long a missed invalidation
+(e.g. Redis unavailable) can serve a stale graph.
+Reachability questions for a single task (cycle checks, transitive
+blockers) are answered by recursive CTEs in TaskRepository instead.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ardha.core.config import settings
+from ardha.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Statuses that no longer contribute remaining work to the critical path
+CLOSED_STATUSES = ("done", "cancelled")
+
+# Hours assumed for open tasks without an estimate
+DEFAULT_ESTIMATE_HOURS = 1.0
+
+# Session.info key of the project IDs to invalidate when the transaction commits
+PENDING_INVALIDATIONS = "task_graph_pending_invalidations"
+
+# ARGV: expected generation, ttl, graph JSON
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[2])
+return 1
+"""
+
+
+class GraphNode(BaseModel):
+    """Task fields needed to order and schedule a project's tasks."""
+
+    id: UUID
+    identifier: str
+    title: str
+    status: str
+    estimate_hours: Optional[float] = None
+
+    @property
+    def remaining_hours(self) -> float:
+        """Hours of work left on the task (0 once closed)."""
+        if self.status in CLOSED_STATUSES:
+            return 0.0
+        return self.estimate_hours if self.estimate_hours is not None else DEFAULT_ESTIMATE_HOURS
+
+
+class TaskPlan(NamedTuple):
+    """Execution plan of a project's tasks."""
+
+    # Task IDs, each after all of its dependencies
+    order: List[UUID]
+    # Task ID -> longest chain of dependencies before it (Gantt lane)
+    levels: Dict[UUID, int]
+    # Chain with the most remaining work, in execution order
+    critical_path: List[UUID]
+    critical_path_hours: float
+
+
+class TaskGraph(BaseModel):
+    """
+    Dependency graph of one project's tasks.
+
+    Attributes:
+        project_id: Project UUID
+        nodes: Tasks in creation order
+        edges: (task_id, depends_on_task_id) pairs between those tasks
+    """
+
+    project_id: UUID
+    nodes: List[GraphNode]
+    edges: List[Tuple[UUID, UUID]]
+
+    @classmethod
+    def build(
+        cls,
+        project_id: UUID,
+        nodes: Iterable[GraphNode],
+        edges: Iterable[Tuple[UUID, UUID]],
+    ) -> "TaskGraph":
+        """
+        Build a graph, dropping edges to tasks outside the node set.
+
+        Args:
+            project_id: Project UUID
+            nodes: Project tasks
+            edges: (task_id, depends_on_task_id) pairs
+
+        Returns:
+            TaskGraph instance
+        """
+        nodes = list(nodes)
+        known = {node.id for node in nodes}
+        return cls(
+            project_id=project_id,
+            nodes=nodes,
+            edges=[(task, dep) for task, dep in edges if task in known and dep in known],
+        )
+
+    def depends_on(self) -> Dict[UUID, List[UUID]]:
+        """
+        Get the adjacency list of each task's direct dependencies.
+
+        Returns:
+            Mapping of task ID to the IDs it depends on (every task present)
+        """
+        adjacency: Dict[UUID, List[UUID]] = {node.id: [] for node in self.nodes}
+        for task_id, depends_on_task_id in self.edges:
+            adjacency[task_id].append(depends_on_task_id)
+        return adjacency
+
+    def topological_order(self) -> List[UUID]:
+        """
+        Order tasks so every task comes after all of its dependencies.
+
+        Kahn's algorithm; tasks that become ready together keep creation order.
+
+        Returns:
+            Task IDs in execution order
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        pending = {node.id: 0 for node in self.nodes}
+        dependents: Dict[UUID, List[UUID]] = {node.id: [] for node in self.nodes}
+        for task_id, depends_on_task_id in self.edges:
+            pending[task_id] += 1
+            dependents[depends_on_task_id].append(task_id)
+
+        ready = deque(node.id for node in self.nodes if not pending[node.id])
+        order: List[UUID] = []
+        while ready:
+            task_id = ready.popleft()
+            order.append(task_id)
+            for dependent in dependents[task_id]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(self.nodes):
+            stuck = [node.identifier for node in self.nodes if pending[node.id]]
+            raise ValueError(f"Task dependencies contain a cycle through {', '.join(stuck[:5])}")
+        return order
+
+    def levels(self, order: Optional[Sequence[UUID]] = None) -> Dict[UUID, int]:
+        """
+        Get each task's level: the longest chain of dependencies before it.
+
+        Args:
+            order: Precomputed topological_order(), if available
+
+        Returns:
+            Mapping of task ID to level (0 for tasks without dependencies)
+        """
+        adjacency = self.depends_on()
+        levels: Dict[UUID, int] = {}
+        for task_id in order if order is not None else self.topological_order():
+            levels[task_id] = 1 + max((levels[dep] for dep in adjacency[task_id]), default=-1)
+        return levels
+
+    def critical_path(self, order: Optional[Sequence[UUID]] = None) -> Tuple[List[UUID], float]:
+        """
+        Find the chain of dependent tasks with the most remaining work.
+
+        Args:
+            order: Precomputed topological_order(), if available
+
+        Returns:
+            Tuple of (task IDs in execution order, total remaining hours)
+        """
+        adjacency = self.depends_on()
+        hours = {node.id: node.remaining_hours for node in self.nodes}
+        finish: Dict[UUID, float] = {}
+        previous: Dict[UUID, Optional[UUID]] = {}
+
+        for task_id in order if order is not None else self.topological_order():
+            longest = max(adjacency[task_id], key=finish.__getitem__, default=None)
+            previous[task_id] = longest
+            finish[task_id] = hours[task_id] + (finish[longest] if longest is not None else 0.0)
+
+        if not finish:
+            return [], 0.0
+
+        task_id: Optional[UUID] = max(finish, key=finish.__getitem__)
+        total = finish[task_id]
+        path: List[UUID] = []
+        while task_id is not None:
+            path.append(task_id)
+            task_id = previous[task_id]
+        path.reverse()
+        return path, total
+
+    def plan(self) -> TaskPlan:
+        """
+        Compute order, levels and critical path from one topological sort.
+
+        Returns:
+            TaskPlan for the graph
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        order = self.topological_order()
+        path, hours = self.critical_path(order)
+        return TaskPlan(
+            order=order,
+            levels=self.levels(order),
+            critical_path=path,
+            critical_path_hours=hours,
+        )
+
+
+class TaskGraphCache:
+    """
+    Redis cache of per-project task graphs.
+
+    Reads return None on a miss; callers load the graph from the database
+    and store it with fill(), passing the generation taken by begin_fill()
+    before their queries.
+
+    Attributes:
+        redis: Async Redis client
+        ttl: Lifetime in seconds of a cached graph
+        key_prefix: Redis key prefix
+        enabled: When False every read is a miss and writes are skipped
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl: int = 300,
+        key_prefix: str = "ardha:task_graph",
+        enabled: bool = True,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.enabled = enabled
+
+        self._fill = redis.register_script(FILL_SCRIPT)
+        # Post-commit invalidations in flight (kept referenced until done)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, project_id: UUID) -> Optional[TaskGraph]:
+        """
+        Get a project's cached graph.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            TaskGraph, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.get(self._key(project_id, "graph"))
+        except Exception as e:
+            logger.warning(f"Task graph cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        try:
+            return TaskGraph.model_validate_json(raw)
+        except ValueError as e:
+            logger.warning(f"Discarding malformed cached task graph for {project_id}: {e}")
+            await self.invalidate([project_id])
+            return None
+
+    async def begin_fill(self, project_id: UUID) -> Optional[str]:
+        """
+        Take the generation to pass to fill() before querying the database.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Generation token, or None when the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            raw = await self.redis.get(self._key(project_id, "gen"))
+        except Exception as e:
+            logger.warning(f"Task graph cache read failed: {e}")
+            return None
+
+        return raw.decode() if raw is not None else "0"
+
+    async def fill(self, graph: TaskGraph, generation: Optional[str]) -> bool:
+        """
+        Store a graph loaded from the database.
+
+        Skipped when the project's tasks changed since begin_fill().
+
+        Args:
+            graph: Graph loaded from the database
+            generation: Token from begin_fill()
+
+        Returns:
+            True if stored
+        """
+        if generation is None:
+            return False
+
+        try:
+            return bool(
+                await self._fill(
+                    keys=[self._key(graph.project_id, "graph"), self._key(graph.project_id, "gen")],
+                    args=[generation, self.ttl, graph.model_dump_json()],
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Task graph cache fill failed: {e}")
+            return False
+
+    async def invalidate(self, project_ids: Iterable[UUID]) -> None:
+        """
+        Drop cached graphs so the next read reloads from the database.
+
+        Args:
+            project_ids: Project UUIDs
+        """
+        if not self.enabled:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for project_id in set(project_ids):
+                    pipe.delete(self._key(project_id, "graph"))
+                    pipe.incr(self._key(project_id, "gen"))
+                    pipe.expire(self._key(project_id, "gen"), self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Task graph cache invalidation failed: {e}")
+
+    async def invalidate_on_commit(self, db: AsyncSession, project_ids: Iterable[UUID]) -> None:
+        """
+        Invalidate graphs changed by a session's open transaction.
+
+        Invalidates now, so fills already running are discarded, and again
+        once the transaction commits, dropping graphs that reads filled from
+        the pre-commit state in between.
+
+        Args:
+            db: Session holding the uncommitted change
+            project_ids: Project UUIDs
+        """
+        project_ids = set(project_ids)
+        if not self.enabled or not project_ids:
+            return
+
+        await self.invalidate(project_ids)
+
+        pending: Set[UUID] = db.sync_session.info.setdefault(PENDING_INVALIDATIONS, set())
+        if not pending:
+            event.listen(db.sync_session, "after_commit", self._after_commit, once=True)
+        pending.update(project_ids)
+
+    def _after_commit(self, session: Session) -> None:
+        project_ids = session.info.pop(PENDING_INVALIDATIONS, set())
+        if not project_ids:
+            return
+
+        try:
+            task = asyncio.get_running_loop().create_task(self.invalidate(project_ids))
+        except RuntimeError as e:
+            logger.warning(f"Task graph cache invalidation after commit skipped: {e}")
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _key(self, project_id: UUID, suffix: str) -> str:
+        return f"{self.key_prefix}:{project_id}:{suffix}"
+
+
+# Global task graph cache instance
+_task_graph_cache: Optional[TaskGraphCache] = None
+
+
+def get_task_graph_cache() -> TaskGraphCache:
+    """
+    Get global task graph cache instance.
+
+    Returns:
+        TaskGraphCache instance configured from settings.tasks
+    """
+    global _task_graph_cache
+
+    if _task_graph_cache is None:
+        _task_graph_cache = TaskGraphCache(
+            redis=get_redis(),
+            ttl=settings.tasks.graph_cache_ttl,
+            enabled=settings.tasks.graph_cache_enabled,
+        )
+
+    return _task_graph_cache
@@ -0,0 +1,393 @@
+"""
+Durable webhook delivery queue on Redis streams.
+
+Webhook endpoints only verify and enqueue; consumers do the work later:
+- Deliveries are deduplicated by delivery ID and appended to one of N shard
+  streams in a single atomic script, so a redelivery never enqueues twice
+- The shard is chosen from a partition key (the integration), so all events
+  for one repository land in the same stream and are processed in order
+- Each shard is consumed by exactly one worker at a time, guarded by a
+  renewable Redis lease; shards spread across every process running a pool
+- Failed entries are retried in place with exponential backoff (holding back
+  later entries of that shard) and moved to a dead-letter stream after
+  max_attempts
+- Entries are acknowledged and deleted only after processing, so entries a
+  crashed worker had read are picked up again by the next lease holder
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+import zlib
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from ardha.core.config import settings
+from ardha.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Handler invoked for each queued delivery with its decoded fields
+WebhookHandler = Callable[[Dict[str, str]], Awaitable[None]]
+
+# Claim the delivery ID and append to the shard stream atomically.
+# KEYS: dedup key, stream key. ARGV: dedup ttl seconds, field/value pairs...
+ENQUEUE_SCRIPT = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return false
+end
+return redis.call('XADD', KEYS[2], '*', unpack(ARGV, 2))
+"""
+
+# Extend a lease only while this node still holds it. KEYS: lease. ARGV: owner, ttl ms
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Drop a lease only if this node holds it. KEYS: lease. ARGV: owner
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class WebhookQueue:
+    """
+    Sharded Redis stream queue with delivery-ID deduplication.
+
+    Attributes:
+        redis: Async Redis client
+        prefix: Prefix for stream, lease and dedup key names
+        shards: Number of shard streams
+        dedup_ttl: Seconds a delivery ID is remembered
+        group: Consumer group name used on every shard stream
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "ardha:webhooks",
+        shards: int = 8,
+        dedup_ttl: int = 604800,
+        group: str = "webhook-consumers",
+    ) -> None:
+        self.redis = redis
+        self.prefix = prefix
+        self.shards = shards
+        self.dedup_ttl = dedup_ttl
+        self.group = group
+        self._enqueue = redis.register_script(ENQUEUE_SCRIPT)
+
+    # ============= Keys =============
+
+    def shard_for(self, partition_key: str) -> int:
+        """Map a partition key to its shard (stable across processes)."""
+        return zlib.crc32(partition_key.encode("utf-8")) % self.shards
+
+    def stream_key(self, shard: int) -> str:
+        """Redis stream holding entries of one shard."""
+        return f"{self.prefix}:stream:{shard}"
+
+    def lease_key(self, shard: int) -> str:
+        """Redis key naming the node currently consuming a shard."""
+        return f"{self.prefix}:lease:{shard}"
+
+    def dedup_key(self, delivery_id: str) -> str:
+        """Redis key marking a delivery ID as seen."""
+        return f"{self.prefix}:seen:{delivery_id}"
+
+    @property
+    def dead_letter_key(self) -> str:
+        """Redis stream holding entries that exhausted their retries."""
+        return f"{self.prefix}:dead"
+
+    # ============= Producer =============
+
+    async def enqueue(self, delivery_id: str, partition_key: str, fields: Dict[str, str]) -> bool:
+        """
+        Durably enqueue a delivery unless it was seen before.
+
+        Args:
+            delivery_id: Unique delivery ID used for deduplication
+            partition_key: Key whose entries must be processed in order
+            fields: Entry fields (string values)
+
+        Returns:
+            True if enqueued, False if the delivery ID is a duplicate
+
+        Raises:
+            redis.RedisError: If Redis is unreachable (nothing is enqueued)
+        """
+        shard = self.shard_for(partition_key)
+        args: List[str] = [str(self.dedup_ttl), "delivery_id", delivery_id]
+        for name, value in fields.items():
+            args.extend([name, value])
+
+        entry_id = await self._enqueue(
+            keys=[self.dedup_key(delivery_id), self.stream_key(shard)], args=args
+        )
+        if entry_id is None:
+            logger.info(f"Skipping duplicate webhook delivery {delivery_id}")
+            return False
+
+        logger.debug(f"Enqueued webhook delivery {delivery_id} on shard {shard}")
+        return True
+
+    # ============= Consumer Support =============
+
+    async def ensure_group(self, shard: int) -> None:
+        """Create the consumer group (and stream) for a shard if missing."""
+        try:
+            await self.redis.xgroup_create(
+                self.stream_key(shard), self.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def complete(self, shard: int, entry_id: str) -> None:
+        """Acknowledge and remove a processed entry."""
+        stream = self.stream_key(shard)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.xack(stream, self.group, entry_id)
+        pipe.xdel(stream, entry_id)
+        await pipe.execute()
+
+    async def dead_letter(
+        self, shard: int, entry_id: str, fields: Dict[str, str], error: str, attempts: int
+    ) -> None:
+        """Copy an entry to the dead-letter stream, then remove it from its shard."""
+        await self.redis.xadd(
+            self.dead_letter_key,
+            {
+                **fields,
+                "error": error[:1000],
+                "attempts": str(attempts),
+                "shard": str(shard),
+                "failed_at": str(int(time.time())),
+            },
+        )
+        await self.complete(shard, entry_id)
+
+    async def pending_count(self) -> int:
+        """Number of entries waiting or in flight across all shards."""
+        pipe = self.redis.pipeline(transaction=False)
+        for shard in range(self.shards):
+            pipe.xlen(self.stream_key(shard))
+        return sum(await pipe.execute())
+
+
+class WebhookConsumerPool:
+    """
+    Per-process pool consuming the shards whose leases it can take.
+
+    One task runs per shard; a task competes for the shard lease, and while
+    it holds the lease it is the only consumer of that stream cluster-wide.
+
+    Attributes:
+        queue: Queue to consume
+        node_id: Unique identifier of this process (lease owner value)
+        max_attempts: Processing attempts before an entry is dead-lettered
+        retry_base: Backoff before the first retry, doubled per attempt
+        retry_max: Upper bound on the backoff in seconds
+        lease_ttl: Seconds before an unrenewed lease expires
+        block_ms: Milliseconds to block waiting for new entries
+        batch_size: Maximum entries read per call
+    """
+
+    def __init__(
+        self,
+        queue: WebhookQueue,
+        handler: WebhookHandler,
+        max_attempts: int = 5,
+        retry_base: float = 1.0,
+        retry_max: float = 60.0,
+        lease_ttl: float = 30.0,
+        block_ms: int = 5000,
+        batch_size: int = 10,
+        node_id: Optional[str] = None,
+    ) -> None:
+        self.queue = queue
+        self.node_id = node_id or uuid.uuid4().hex
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease_ttl = lease_ttl
+        self.block_ms = block_ms
+        self.batch_size = batch_size
+
+        self._handler = handler
+        self._renew_lease = queue.redis.register_script(RENEW_LEASE_SCRIPT)
+        self._release_lease = queue.redis.register_script(RELEASE_LEASE_SCRIPT)
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether shard tasks are running."""
+        return self._running
+
+    # ============= Lifecycle =============
+
+    async def start(self) -> None:
+        """Start one consumer task per shard."""
+        if self._running:
+            return
+
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._run_shard(shard)) for shard in range(self.queue.shards)
+        ]
+        logger.info(f"Webhook consumers started (node {self.node_id}, {self.queue.shards} shards)")
+
+    async def stop(self) -> None:
+        """Stop consumer tasks and release held leases."""
+        if not self._running:
+            return
+
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"Webhook consumers stopped (node {self.node_id})")
+
+    # ============= Shard Loop =============
+
+    async def _run_shard(self, shard: int) -> None:
+        """Take the shard lease whenever it is free and consume while holding it."""
+        lease = self.queue.lease_key(shard)
+        while self._running:
+            try:
+                acquired = await self.queue.redis.set(
+                    lease, self.node_id, nx=True, px=int(self.lease_ttl * 1000)
+                )
+                if not acquired:
+                    await asyncio.sleep(self.lease_ttl / 3)
+                    continue
+
+                try:
+                    await self._consume(shard)
+                finally:
+                    await self._release_lease(keys=[lease], args=[self.node_id])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Webhook consumer for shard {shard} failed: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    async def _consume(self, shard: int) -> None:
+        """Process entries of a shard in order until the lease is lost."""
+        await self.queue.ensure_group(shard)
+        keepalive = asyncio.create_task(self._keep_lease(shard))
+        stream = self.queue.stream_key(shard)
+        # A fixed consumer name lets the next lease holder re-read entries
+        # a crashed holder had received but not acknowledged ("0" = own pending)
+        consumer = f"shard-{shard}"
+        cursor = "0"
+
+        try:
+            while self._running and not keepalive.done():
+                response = await self.queue.redis.xreadgroup(
+                    self.queue.group,
+                    consumer,
+                    {stream: cursor},
+                    count=self.batch_size,
+                    block=None if cursor == "0" else self.block_ms,
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    if cursor == "0":
+                        cursor = ">"
+                    # Yield even if the client returned without blocking
+                    await asyncio.sleep(0)
+                    continue
+
+                for entry_id, raw_fields in entries:
+                    if keepalive.done():
+                        break
+                    await self._process(shard, _decode(entry_id), _decode_fields(raw_fields))
+        finally:
+            keepalive.cancel()
+            try:
+                await keepalive
+            except asyncio.CancelledError:
+                pass
+
+    async def _keep_lease(self, shard: int) -> None:
+        """Renew the shard lease until renewal fails (lease lost)."""
+        lease = self.queue.lease_key(shard)
+        ttl_ms = int(self.lease_ttl * 1000)
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            if not await self._renew_lease(keys=[lease], args=[self.node_id, ttl_ms]):
+                logger.warning(f"Lost webhook lease for shard {shard} (node {self.node_id})")
+                return
+
+    async def _process(self, shard: int, entry_id: str, fields: Dict[str, str]) -> None:
+        """Run the handler with retries; dead-letter the entry when attempts run out."""
+        delivery_id = fields.get("delivery_id", entry_id)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self._handler(fields)
+                await self.queue.complete(shard, entry_id)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    logger.error(
+                        f"Webhook delivery {delivery_id} failed after {attempt} attempts, "
+                        f"moving to dead-letter queue: {e}"
+                    )
+                    await self.queue.dead_letter(shard, entry_id, fields, str(e), attempt)
+                    return
+
+                delay = min(self.retry_max, self.retry_base * 2 ** (attempt - 1))
+                logger.warning(
+                    f"Webhook delivery {delivery_id} failed (attempt {attempt}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+
+def _decode(value: object) -> str:
+    """Decode a Redis bytes value to str."""
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _decode_fields(fields: Dict) -> Dict[str, str]:
+    """Decode stream entry fields to a str dict."""
+    return {_decode(name): _decode(value) for name, value in fields.items()}
+
+
+# Global queue instance
+_webhook_queue: Optional[WebhookQueue] = None
+
+
+def get_webhook_queue() -> WebhookQueue:
+    """
+    Get global webhook queue instance.
+
+    Returns:
+        WebhookQueue on the shared Redis client
+    """
+    global _webhook_queue
+
+    if _webhook_queue is None:
+        _webhook_queue = WebhookQueue(
+            get_redis(),
+            prefix=settings.webhooks.stream_prefix,
+            shards=settings.webhooks.shards,
+            dedup_ttl=settings.webhooks.dedup_ttl_seconds,
+        )
+
+    return _webhook_queue
@@ -0,0 +1,374 @@
+"""
+Redis backplane for cluster-wide WebSocket delivery.
+
+The in-process WebSocketManager only knows about sockets connected to its
+own uvicorn worker. This module connects the managers of every worker:
+
+- Pub/sub fan-out: each worker subscribes to one Redis channel per room it
+  holds locally (personal rooms "user:<uuid>" included). Publishers send to
+  the room channel and every worker holding members delivers locally.
+- Presence: room membership is mirrored into Redis sorted sets scored by
+  expiry time and refreshed by a heartbeat, so entries from crashed workers
+  age out on their own. is_user_connected() and get_room_users() read these
+  sets to answer for the whole cluster.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+logger = logging.getLogger(__name__)
+
+
+# Callback used to deliver an encoded frame to local members of a room:
+# (room_id, payload, exclude_user) -> number of local users reached
+LocalDeliveryCallback = Callable[[str, str, Optional[UUID]], Awaitable[int]]
+
+
+class WebSocketBackplane:
+    """
+    Redis pub/sub and presence layer shared by all WebSocket workers.
+
+    Attributes:
+        redis: Async Redis client used for publishing and presence
+        node_id: Unique identifier of this worker process
+        prefix: Prefix for channel and presence key names
+        presence_ttl: Seconds before an unrefreshed presence entry expires
+        heartbeat_interval: Seconds between presence refreshes
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        deliver_local: LocalDeliveryCallback,
+        prefix: str = "ardha:ws",
+        presence_ttl: int = 30,
+        heartbeat_interval: int = 10,
+        node_id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize backplane (does not connect until start() is called).
+
+        Args:
+            redis: Async Redis client
+            deliver_local: Callback delivering a message to local room members
+            prefix: Prefix for channel and key names
+            presence_ttl: Presence entry lifetime in seconds
+            heartbeat_interval: Presence refresh interval in seconds
+            node_id: Worker identifier (random if not provided)
+        """
+        self.redis = redis
+        self.node_id = node_id or uuid.uuid4().hex
+        self.prefix = prefix
+        self.presence_ttl = presence_ttl
+        self.heartbeat_interval = heartbeat_interval
+
+        self._deliver_local = deliver_local
+        self._pubsub: Optional[PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+        # Local view used for heartbeats: room_id -> {user_ids held by this node}
+        self._local_members: Dict[str, Set[UUID]] = {}
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the backplane is connected and listening."""
+        return self._running
+
+    # ============= Lifecycle =============
+
+    async def start(self) -> None:
+        """
+        Connect to Redis, subscribe to this node's control channel and
+        start the listener and heartbeat tasks.
+
+        Raises:
+            redis.RedisError: If Redis is unreachable
+        """
+        if self._running:
+            return
+
+        await self.redis.ping()
+
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        # Always hold one subscription so get_message() has something to wait on
+        await self._pubsub.subscribe(self._node_channel())
+
+        self._running = True
+        self._listener_task = asyncio.create_task(self._listen())
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+        logger.info(f"WebSocket backplane started (node {self.node_id})")
+
+    async def stop(self) -> None:
+        """Stop background tasks, drop this node's presence and close pub/sub."""
+        if not self._running:
+            return
+
+        self._running = False
+
+        for task in (self._listener_task, self._heartbeat_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for room_id, user_ids in self._local_members.items():
+                members = [self._presence_member(user_id) for user_id in user_ids]
+                if members:
+                    pipe.zrem(self._presence_key(room_id), *members)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to clear presence for node {self.node_id}: {e}")
+
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pub/sub connection: {e}")
+            self._pubsub = None
+
+        self._local_members.clear()
+        logger.info(f"WebSocket backplane stopped (node {self.node_id})")
+
+    # ============= Membership =============
+
+    async def add_member(self, room_id: str, user_id: UUID) -> None:
+        """
+        Register a local room member in Redis.
+
+        Subscribes to the room channel when this is the first local member.
+
+        Args:
+            room_id: Room identifier
+            user_id: UUID of user joining
+        """
+        if not self._running:
+            return
+
+        first_local_member = room_id not in self._local_members
+        self._local_members.setdefault(room_id, set()).add(user_id)
+
+        try:
+            if first_local_member and self._pubsub is not None:
+                await self._pubsub.subscribe(self._room_channel(room_id))
+
+            await self._refresh_presence(room_id, [user_id])
+
+        except Exception as e:
+            logger.warning(f"Failed to register {user_id} in room {room_id} on backplane: {e}")
+
+    async def remove_member(self, room_id: str, user_id: UUID) -> None:
+        """
+        Remove a local room member from Redis.
+
+        Unsubscribes from the room channel when no local members remain.
+
+        Args:
+            room_id: Room identifier
+            user_id: UUID of user leaving
+        """
+        if not self._running:
+            return
+
+        local_members = self._local_members.get(room_id)
+        if local_members is None:
+            return
+
+        local_members.discard(user_id)
+        last_local_member = not local_members
+        if last_local_member:
+            del self._local_members[room_id]
+
+        try:
+            await self.redis.zrem(self._presence_key(room_id), self._presence_member(user_id))
+
+            if last_local_member and self._pubsub is not None:
+                await self._pubsub.unsubscribe(self._room_channel(room_id))
+
+        except Exception as e:
+            logger.warning(f"Failed to remove {user_id} from room {room_id} on backplane: {e}")
+
+    # ============= Publishing =============
+
+    async def publish(
+        self, room_id: str, payload: str, exclude_user: Optional[UUID] = None
+    ) -> int:
+        """
+        Publish encoded frame to every worker holding members of room.
+
+        The frame is forwarded verbatim so receivers never re-serialize it.
+
+        Args:
+            room_id: Room identifier
+            payload: Pre-encoded JSON text frame
+            exclude_user: Optional user_id that receivers should skip
+
+        Returns:
+            Number of workers that received the message
+
+        Raises:
+            redis.RedisError: If publishing fails
+        """
+        envelope = json.dumps(
+            {
+                "room_id": room_id,
+                "exclude_user": str(exclude_user) if exclude_user else None,
+                "payload": payload,
+            }
+        )
+        return await self.redis.publish(self._room_channel(room_id), envelope)
+
+    async def publish_many(self, frames: List[Tuple[str, str]]) -> List[int]:
+        """
+        Publish several frames in one pipelined round trip.
+
+        Args:
+            frames: (room_id, payload) pairs of pre-encoded JSON text frames
+
+        Returns:
+            Number of workers that received each frame, in input order
+
+        Raises:
+            redis.RedisError: If publishing fails
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        for room_id, payload in frames:
+            envelope = json.dumps({"room_id": room_id, "exclude_user": None, "payload": payload})
+            pipe.publish(self._room_channel(room_id), envelope)
+        return await pipe.execute()
+
+    # ============= Presence Queries =============
+
+    async def get_room_users(self, room_id: str) -> Set[UUID]:
+        """
+        Get users present in room on any worker.
+
+        Args:
+            room_id: Room identifier
+
+        Returns:
+            Set of user UUIDs with unexpired presence entries
+        """
+        members = await self.redis.zrangebyscore(self._presence_key(room_id), time.time(), "+inf")
+
+        user_ids: Set[UUID] = set()
+        for member in members:
+            if isinstance(member, bytes):
+                member = member.decode()
+            try:
+                user_ids.add(UUID(member.rsplit("|", 1)[1]))
+            except (IndexError, ValueError):
+                logger.debug(f"Ignoring malformed presence member {member!r}")
+
+        return user_ids
+
+    async def is_user_connected(self, user_id: UUID) -> bool:
+        """
+        Check if user has a live connection on any worker.
+
+        Args:
+            user_id: UUID of user to check
+
+        Returns:
+            True if user's personal room has an unexpired presence entry
+        """
+        count = await self.redis.zcount(
+            self._presence_key(f"user:{user_id}"), time.time(), "+inf"
+        )
+        return count > 0
+
+    # ============= Background Tasks =============
+
+    async def _listen(self) -> None:
+        """Receive published envelopes and deliver them to local sockets."""
+        while self._running:
+            try:
+                if self._pubsub is None:
+                    return
+
+                raw = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if raw is None or raw.get("type") != "message":
+                    continue
+
+                envelope = json.loads(raw["data"])
+                exclude = envelope.get("exclude_user")
+
+                await self._deliver_local(
+                    envelope["room_id"],
+                    envelope["payload"],
+                    UUID(exclude) if exclude else None,
+                )
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket backplane listener error: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    async def _heartbeat(self) -> None:
+        """Periodically refresh this node's presence entries and prune expired ones."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.heartbeat_interval)
+
+                for room_id, user_ids in list(self._local_members.items()):
+                    await self._refresh_presence(room_id, list(user_ids))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebSocket presence heartbeat failed: {e}")
+
+    async def _refresh_presence(self, room_id: str, user_ids: list) -> None:
+        """
+        Write presence entries for local members with a fresh expiry.
+
+        Args:
+            room_id: Room identifier
+            user_ids: Local user UUIDs to refresh
+        """
+        if not user_ids:
+            return
+
+        now = time.time()
+        key = self._presence_key(room_id)
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zadd(key, {self._presence_member(uid): now + self.presence_ttl for uid in user_ids})
+        pipe.zremrangebyscore(key, "-inf", now)
+        pipe.expire(key, self.presence_ttl * 2)
+        await pipe.execute()
+
+    # ============= Key Helpers =============
+
+    def _room_channel(self, room_id: str) -> str:
+        """Pub/sub channel for room."""
+        return f"{self.prefix}:room:{room_id}"
+
+    def _node_channel(self) -> str:
+        """Pub/sub control channel for this node."""
+        return f"{self.prefix}:node:{self.node_id}"
+
+    def _presence_key(self, room_id: str) -> str:
+        """Sorted set holding presence entries for room."""
+        return f"{self.prefix}:presence:{room_id}"
+
+    def _presence_member(self, user_id: UUID) -> str:
+        """Presence set member for a user held by this node."""
+        return f"{self.node_id}|{user_id}"
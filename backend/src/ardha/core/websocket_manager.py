@@ -5,16 +5,22 @@ This module provides a singleton WebSocketManager class that handles:
 - WebSocket connection pooling per user
 - Room-based broadcasting (user rooms, project rooms)
 - Thread-safe connection management
-- Real-time message delivery
+- Real-time message delivery through per-connection send queues
+- Optional Redis backplane so messages and presence span all workers
 """
 
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 from fastapi import WebSocket, WebSocketDisconnect
+from redis.asyncio import Redis
+
+from ardha.core.config import settings
+from ardha.core.websocket_backplane import WebSocketBackplane
+from ardha.core.websocket_writer import ConnectionWriter
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +33,18 @@ class WebSocketManager:
     all connections. Provides user-based connection pooling and
     room-based broadcasting for group notifications.
 
+    Messages are serialized once per send and handed to each connection's
+    ConnectionWriter, so a broadcast never waits on an individual socket.
+
+    When a backplane is started, messages are published through Redis so
+    every worker delivers to its own sockets, and presence queries answer
+    for the whole cluster. Without a backplane the manager is process-local.
+
     Attributes:
         active_connections: Dict mapping user_id to list of WebSocket connections
         rooms: Dict mapping room_id to set of user_ids
+        writers: Dict mapping WebSocket to its outbound ConnectionWriter
+        backplane: Redis backplane for cross-worker delivery (None if local-only)
         _lock: Async lock for thread-safe operations
     """
 
@@ -58,12 +73,75 @@ class WebSocketManager:
         # Room management: room_id -> {user_ids}
         self.rooms: Dict[str, Set[UUID]] = {}
 
+        # Outbound queues: WebSocket -> ConnectionWriter
+        self.writers: Dict[WebSocket, ConnectionWriter] = {}
+
         # Lock for thread-safe operations
         self._lock: asyncio.Lock = asyncio.Lock()
 
+        # Cross-worker delivery (set by start_backplane)
+        self.backplane: Optional[WebSocketBackplane] = None
+
         self._initialized = True
         logger.info("WebSocketManager initialized as singleton")
 
+    # ============= Backplane Lifecycle =============
+
+    @property
+    def is_clustered(self) -> bool:
+        """Whether messages and presence are shared across workers via Redis."""
+        return self.backplane is not None and self.backplane.is_running
+
+    async def start_backplane(self, redis: Redis) -> bool:
+        """
+        Start Redis backplane for cluster-wide delivery.
+
+        Falls back to process-local delivery if Redis is unreachable.
+
+        Args:
+            redis: Async Redis client
+
+        Returns:
+            True if backplane started, False if running local-only
+        """
+        if self.is_clustered:
+            return True
+
+        backplane = WebSocketBackplane(
+            redis=redis,
+            deliver_local=self._deliver_local,
+            prefix=settings.websocket.channel_prefix,
+            presence_ttl=settings.websocket.presence_ttl_seconds,
+            heartbeat_interval=settings.websocket.heartbeat_interval_seconds,
+        )
+
+        try:
+            await backplane.start()
+        except Exception as e:
+            logger.warning(f"WebSocket backplane unavailable, delivering locally only: {e}")
+            return False
+
+        self.backplane = backplane
+
+        # Register connections accepted before the backplane came up
+        async with self._lock:
+            memberships = [
+                (room_id, user_id)
+                for room_id, user_ids in self.rooms.items()
+                for user_id in user_ids
+                if user_id in self.active_connections
+            ]
+        for room_id, user_id in memberships:
+            await backplane.add_member(room_id, user_id)
+
+        return True
+
+    async def stop_backplane(self) -> None:
+        """Stop Redis backplane and return to process-local delivery."""
+        if self.backplane is not None:
+            await self.backplane.stop()
+            self.backplane = None
+
     # ============= Connection Management =============
 
     async def connect(self, websocket: WebSocket, user_id: UUID) -> None:
@@ -80,7 +158,20 @@ class WebSocketManager:
         try:
             await websocket.accept()
 
+            async def on_writer_close(writer: ConnectionWriter) -> None:
+                await self.disconnect(websocket, user_id)
+
+            writer = ConnectionWriter(
+                websocket,
+                max_queue_size=settings.websocket.send_queue_size,
+                backpressure_policy=settings.websocket.backpressure_policy,
+                on_close=on_writer_close,
+            )
+            writer.start()
+
             async with self._lock:
+                self.writers[websocket] = writer
+
                 # Initialize user's connection list if first connection
                 if user_id not in self.active_connections:
                     self.active_connections[user_id] = []
@@ -92,6 +183,9 @@ class WebSocketManager:
                 room_id = f"user:{user_id}"
                 await self._join_room_unsafe(user_id, room_id)
 
+            if self.is_clustered:
+                await self.backplane.add_member(room_id, user_id)
+
             # Send connection confirmation
             await self.send_to_connection(
                 websocket,
@@ -123,7 +217,11 @@ class WebSocketManager:
             websocket: FastAPI WebSocket instance to remove
             user_id: UUID of user disconnecting
         """
+        left_rooms: List[str] = []
+
         async with self._lock:
+            writer = self.writers.pop(websocket, None)
+
             if user_id in self.active_connections:
                 # Remove specific connection
                 if websocket in self.active_connections[user_id]:
@@ -137,10 +235,19 @@ class WebSocketManager:
                     for room_id in list(self.rooms.keys()):
                         if user_id in self.rooms[room_id]:
                             self.rooms[room_id].discard(user_id)
+                            left_rooms.append(room_id)
                             # Remove empty rooms
                             if not self.rooms[room_id]:
                                 del self.rooms[room_id]
 
+        if self.is_clustered:
+            for room_id in left_rooms:
+                await self.backplane.remove_member(room_id, user_id)
+
+        # Stop writer before closing so no frame races the close
+        if writer is not None:
+            await writer.close()
+
         # Close connection gracefully
         try:
             await websocket.close()
@@ -157,18 +264,26 @@ class WebSocketManager:
         """
         Check if user has any active connections.
 
+        Checks every worker when the backplane is running.
+
         Args:
             user_id: UUID of user to check
 
         Returns:
             True if user has at least one active connection
         """
+        if self.is_clustered:
+            try:
+                return await self.backplane.is_user_connected(user_id)
+            except Exception as e:
+                logger.warning(f"Cluster presence lookup failed, using local state: {e}")
+
         async with self._lock:
             return user_id in self.active_connections and len(self.active_connections[user_id]) > 0
 
     async def get_user_connections(self, user_id: UUID) -> List[WebSocket]:
         """
-        Get all active connections for user.
+        Get all active connections for user on this worker.
 
         Args:
             user_id: UUID of user
@@ -181,31 +296,114 @@ class WebSocketManager:
 
     # ============= Messaging =============
 
+    @staticmethod
+    def encode_message(message: Dict[str, Any]) -> str:
+        """
+        Serialize message to a JSON text frame.
+
+        Args:
+            message: Message data dictionary
+
+        Returns:
+            Encoded JSON string
+        """
+        return json.dumps(message, default=str)
+
     async def send_personal_message(self, user_id: UUID, message: Dict[str, Any]) -> bool:
         """
         Send message to specific user (all their connections).
 
+        With the backplane running, the message is published to the user's
+        personal room and delivered by whichever workers hold the user.
+
         Args:
             user_id: UUID of user to send message to
             message: Message data dictionary
 
         Returns:
-            True if message sent to at least one connection, False otherwise
+            True if message queued (or published) for at least one connection, False otherwise
+        """
+        payload = self.encode_message(message)
+
+        if self.is_clustered:
+            try:
+                receivers = await self.backplane.publish(f"user:{user_id}", payload)
+                logger.debug(f"Published personal message for user {user_id} to {receivers} nodes")
+                return receivers > 0
+            except Exception as e:
+                logger.warning(f"Backplane publish failed, delivering locally: {e}")
+
+        return await self._send_local_user(user_id, payload)
+
+    async def send_personal_messages(self, messages: List[Tuple[UUID, Dict[str, Any]]]) -> int:
+        """
+        Send one message each to many users as a batch.
+
+        With the backplane running all frames are published in one
+        pipelined round trip; otherwise local connections are snapshotted
+        under a single lock acquisition and the frames are queued.
+
+        Args:
+            messages: (user_id, message) pairs
+
+        Returns:
+            Number of messages queued (or published) for at least one connection
+        """
+        frames = [(user_id, self.encode_message(message)) for user_id, message in messages]
+        if not frames:
+            return 0
+
+        if self.is_clustered:
+            try:
+                receivers = await self.backplane.publish_many(
+                    [(f"user:{user_id}", payload) for user_id, payload in frames]
+                )
+                return sum(1 for count in receivers if count > 0)
+            except Exception as e:
+                logger.warning(f"Backplane batch publish failed, delivering locally: {e}")
+
+        async with self._lock:
+            targets = [
+                (payload, [self.writers.get(ws) for ws in self.active_connections.get(user_id, [])])
+                for user_id, payload in frames
+            ]
+
+        delivered = 0
+        for payload, writers in targets:
+            queued = [writer.offer(payload) for writer in writers if writer is not None]
+            if any(queued):
+                delivered += 1
+
+        logger.debug(f"Sent {delivered}/{len(frames)} personal messages in batch")
+        return delivered
+
+    async def _send_local_user(self, user_id: UUID, payload: str) -> bool:
+        """
+        Queue encoded frame on user's connections on this worker.
+
+        Args:
+            user_id: UUID of user to send message to
+            payload: Pre-encoded JSON text frame
+
+        Returns:
+            True if frame queued for at least one connection, False otherwise
         """
-        connections = await self.get_user_connections(user_id)
+        async with self._lock:
+            connections = self.active_connections.get(user_id, [])
+            targets = [(ws, self.writers.get(ws)) for ws in connections]
 
-        if not connections:
+        if not targets:
             logger.debug(f"User {user_id} has no active connections")
             return False
 
         success_count = 0
-        for ws in connections:
-            if await self.send_to_connection(ws, message):
+        for ws, writer in targets:
+            if await self._enqueue(ws, writer, payload):
                 success_count += 1
 
         logger.debug(
             f"Sent personal message to user {user_id}: "
-            f"{success_count}/{len(connections)} successful"
+            f"{success_count}/{len(targets)} successful"
         )
 
         return success_count > 0
@@ -219,12 +417,34 @@ class WebSocketManager:
             message: Message data dictionary
 
         Returns:
-            True if message sent successfully, False otherwise
+            True if message queued or sent successfully, False otherwise
         """
+        return await self._enqueue(
+            websocket, self.writers.get(websocket), self.encode_message(message)
+        )
+
+    async def _enqueue(
+        self, websocket: WebSocket, writer: Optional[ConnectionWriter], payload: str
+    ) -> bool:
+        """
+        Hand encoded frame to connection's writer.
+
+        Connections without a writer (not registered through connect())
+        are written to directly.
+
+        Args:
+            websocket: WebSocket connection
+            writer: ConnectionWriter for websocket, if registered
+            payload: Pre-encoded JSON text frame
+
+        Returns:
+            True if frame queued or sent, False otherwise
+        """
+        if writer is not None:
+            return writer.offer(payload)
+
         try:
-            # Serialize message to JSON
-            message_json = json.dumps(message, default=str)
-            await websocket.send_text(message_json)
+            await websocket.send_text(payload)
             return True
 
         except WebSocketDisconnect:
@@ -241,26 +461,65 @@ class WebSocketManager:
         """
         Broadcast message to all users in room.
 
+        The message is serialized once. With the backplane running it is
+        published once and each worker delivers to its local room members.
+
         Args:
             room_id: Room identifier
             message: Message data dictionary
             exclude_user: Optional user_id to exclude from broadcast
 
         Returns:
-            Number of users successfully reached
+            Number of users reached (cluster-wide room size when clustered)
         """
-        users_in_room = await self.get_room_users(room_id)
+        payload = self.encode_message(message)
+
+        if self.is_clustered:
+            try:
+                await self.backplane.publish(room_id, payload, exclude_user)
+                users_in_room = await self.backplane.get_room_users(room_id)
+                users_in_room.discard(exclude_user)
+                return len(users_in_room)
+            except Exception as e:
+                logger.warning(f"Backplane broadcast failed, delivering locally: {e}")
+
+        return await self._deliver_local(room_id, payload, exclude_user)
+
+    async def _deliver_local(
+        self, room_id: str, payload: str, exclude_user: Optional[UUID] = None
+    ) -> int:
+        """
+        Queue encoded frame for room members connected to this worker.
+
+        Only enqueues, so the cost is independent of client write speed;
+        the writers drain their queues concurrently. Also used by the
+        backplane listener for frames published by other workers.
+
+        Args:
+            room_id: Room identifier
+            payload: Pre-encoded JSON text frame
+            exclude_user: Optional user_id to exclude from delivery
+
+        Returns:
+            Number of local users successfully reached
+        """
+        async with self._lock:
+            users_in_room = self.rooms.get(room_id, set()).copy()
+            targets = {
+                user_id: [self.writers.get(ws) for ws in self.active_connections.get(user_id, [])]
+                for user_id in users_in_room
+                if user_id != exclude_user
+            }
 
         if not users_in_room:
             logger.debug(f"Room {room_id} has no users")
             return 0
 
         success_count = 0
-        for user_id in users_in_room:
-            if exclude_user and user_id == exclude_user:
-                continue
-
-            if await self.send_personal_message(user_id, message):
+        for writers in targets.values():
+            # Evaluate every writer (no short-circuit) so each connection gets the frame
+            queued = [writer.offer(payload) for writer in writers if writer is not None]
+            if any(queued):
                 success_count += 1
 
         logger.debug(
@@ -281,6 +540,10 @@ class WebSocketManager:
         """
         async with self._lock:
             await self._join_room_unsafe(user_id, room_id)
+            is_local = user_id in self.active_connections
+
+        if is_local and self.is_clustered:
+            await self.backplane.add_member(room_id, user_id)
 
     async def _join_room_unsafe(self, user_id: UUID, room_id: str) -> None:
         """
@@ -314,16 +577,27 @@ class WebSocketManager:
 
                 logger.debug(f"User {user_id} left room {room_id}")
 
+        if self.is_clustered:
+            await self.backplane.remove_member(room_id, user_id)
+
     async def get_room_users(self, room_id: str) -> Set[UUID]:
         """
         Get all user IDs in room.
 
+        Includes users connected to other workers when the backplane is running.
+
         Args:
             room_id: Room identifier
 
         Returns:
             Set of user UUIDs in room (empty set if room doesn't exist)
         """
+        if self.is_clustered:
+            try:
+                return await self.backplane.get_room_users(room_id)
+            except Exception as e:
+                logger.warning(f"Cluster room lookup failed, using local state: {e}")
+
         async with self._lock:
             return self.rooms.get(room_id, set()).copy()
 
@@ -342,15 +616,19 @@ class WebSocketManager:
 
     async def get_connection_stats(self) -> Dict[str, Any]:
         """
-        Get connection statistics.
+        Get connection statistics for this worker.
 
         Returns:
             Dictionary with connection stats
         """
         async with self._lock:
             return {
+                "node_id": self.backplane.node_id if self.is_clustered else None,
+                "clustered": self.is_clustered,
                 "total_users": len(self.active_connections),
                 "total_connections": sum(len(conns) for conns in self.active_connections.values()),
+                "queued_frames": sum(writer.pending for writer in self.writers.values()),
+                "dropped_frames": sum(writer.dropped_count for writer in self.writers.values()),
                 "total_rooms": len(self.rooms),
                 "users_per_room": {room_id: len(users) for room_id, users in self.rooms.items()},
             }
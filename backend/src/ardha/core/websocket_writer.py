@@ -0,0 +1,148 @@
+"""
+Per-connection outbound queue for WebSocket delivery.
+
+Each accepted WebSocket gets a ConnectionWriter: a bounded queue of
+pre-encoded text frames drained by a dedicated writer task. Broadcasting
+only enqueues, so a slow client delays nobody but itself. When a client
+falls behind far enough to fill its queue, the configured backpressure
+policy either drops the new frame or disconnects the client.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional, Set
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+# Backpressure policies
+BACKPRESSURE_DROP = "drop"
+BACKPRESSURE_DISCONNECT = "disconnect"
+
+# on_close callbacks still running; the event loop only keeps weak references
+_close_tasks: Set[asyncio.Task] = set()
+
+
+class ConnectionWriter:
+    """
+    Bounded outbound queue and writer task for one WebSocket.
+
+    Attributes:
+        websocket: WebSocket connection written to
+        max_queue_size: Maximum number of frames waiting to be sent
+        backpressure_policy: "drop" or "disconnect" when the queue is full
+        dropped_count: Number of frames dropped because of backpressure
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = 256,
+        backpressure_policy: str = BACKPRESSURE_DISCONNECT,
+        on_close: Optional[Callable[["ConnectionWriter"], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Initialize writer (call start() to begin draining).
+
+        Args:
+            websocket: WebSocket connection to write to
+            max_queue_size: Queue capacity in frames
+            backpressure_policy: "drop" or "disconnect"
+            on_close: Callback invoked once when the writer gives up on the
+                connection (send failure or backpressure disconnect)
+        """
+        if backpressure_policy not in (BACKPRESSURE_DROP, BACKPRESSURE_DISCONNECT):
+            raise ValueError(f"Invalid backpressure policy: {backpressure_policy}")
+
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.backpressure_policy = backpressure_policy
+        self.dropped_count = 0
+
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        self._on_close = on_close
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the writer stopped accepting frames."""
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting to be written."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def offer(self, payload: str) -> bool:
+        """
+        Enqueue an encoded frame without waiting.
+
+        Args:
+            payload: Pre-encoded JSON text frame
+
+        Returns:
+            True if queued, False if dropped or the connection is closing
+        """
+        if self._closed:
+            return False
+
+        try:
+            self._queue.put_nowait(payload)
+            return True
+
+        except asyncio.QueueFull:
+            if self.backpressure_policy == BACKPRESSURE_DROP:
+                self.dropped_count += 1
+                logger.debug(f"WebSocket send queue full, dropped frame ({self.dropped_count})")
+                return False
+
+            logger.warning(
+                f"WebSocket send queue full ({self.max_queue_size} frames), "
+                "disconnecting slow client"
+            )
+            self._give_up()
+            return False
+
+    async def close(self) -> None:
+        """Stop the writer task and discard unsent frames."""
+        self._closed = True
+
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Drain queue in order, writing each frame to the socket."""
+        while True:
+            payload = await self._queue.get()
+            try:
+                await self.websocket.send_text(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"WebSocket write failed: {e}")
+                self._give_up()
+                return
+
+    def _give_up(self) -> None:
+        """Stop accepting frames and notify owner once."""
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._on_close is not None:
+            task = asyncio.create_task(self._on_close(self))
+            _close_tasks.add(task)
+            task.add_done_callback(_close_tasks.discard)
@@ -6,6 +6,12 @@ with the Base metadata for Alembic migrations.
 """
 
 from ardha.models.ai_usage import AIUsage  # noqa: F401
+from ardha.models.ai_usage_daily import AIUsageDaily  # noqa: F401
+from ardha.models.analytics_rollup import (  # noqa: F401
+    AnalyticsRollup,
+    RollupDirtyDay,
+    RollupWatermark,
+)
 from ardha.models.base import Base
 from ardha.models.chat import Chat  # noqa: F401
 from ardha.models.database import Database  # noqa: F401
@@ -25,6 +31,7 @@ from ardha.models.project import Project  # noqa: F401
 from ardha.models.project_member import ProjectMember  # noqa: F401
 from ardha.models.task import Task  # noqa: F401
 from ardha.models.task_activity import TaskActivity  # noqa: F401
+from ardha.models.task_aggregate import TaskAggregate  # noqa: F401
 from ardha.models.task_dependency import TaskDependency  # noqa: F401
 from ardha.models.task_tag import TaskTag  # noqa: F401
 from ardha.models.user import User  # noqa: F401
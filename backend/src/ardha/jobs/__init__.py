@@ -1,6 +1,7 @@
 """Background job modules."""
 
 # NEW: Cost and analytics jobs
+from ardha.jobs.analytics_jobs import build_analytics_rollups
 from ardha.jobs.cost_jobs import (
     analyze_ai_usage_patterns,
     calculate_project_analytics,
@@ -8,10 +9,10 @@ from ardha.jobs.cost_jobs import (
 )
 
 # NEW: Git and task jobs
-from ardha.jobs.git_jobs import ingest_commit_to_memory
+from ardha.jobs.git_jobs import index_project_code, ingest_commit_to_memory
 
 # NEW: Maintenance and backup jobs
-from ardha.jobs.maintenance_jobs import backup_database, cleanup_old_sessions
+from ardha.jobs.maintenance_jobs import backup_database, cleanup_old_sessions, manage_partitions
 from ardha.jobs.memory_cleanup import (
     archive_old_memories,
     cleanup_expired_memories,
@@ -26,7 +27,12 @@ from ardha.jobs.memory_jobs import (
     optimize_memory_importance,
     process_pending_embeddings,
 )
-from ardha.jobs.task_jobs import calculate_team_velocity, send_overdue_task_reminders
+from ardha.jobs.notification_jobs import send_notification_digests, send_notification_emails
+from ardha.jobs.task_jobs import (
+    calculate_team_velocity,
+    reconcile_task_aggregates,
+    send_overdue_task_reminders,
+)
 
 __all__ = [
     # Memory jobs
@@ -43,14 +49,21 @@ __all__ = [
     "cleanup_old_links",
     # NEW: Git jobs
     "ingest_commit_to_memory",
+    "index_project_code",
+    # Notification jobs
+    "send_notification_emails",
+    "send_notification_digests",
     # NEW: Task jobs
     "calculate_team_velocity",
     "send_overdue_task_reminders",
+    "reconcile_task_aggregates",
     # NEW: Cost and analytics jobs
     "generate_daily_cost_report",
     "analyze_ai_usage_patterns",
     "calculate_project_analytics",
+    "build_analytics_rollups",
     # NEW: Maintenance and backup jobs
     "cleanup_old_sessions",
     "backup_database",
+    "manage_partitions",
 ]
@@ -0,0 +1,103 @@
+"""
+Analytics rollup background jobs.
+
+This module provides the Celery task that keeps the daily and weekly
+per-project and per-user analytics rollups current, rebuilding only the
+days marked dirty by task changes and the days with AI usage since its
+last run.
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict
+
+from ardha.core.celery_app import celery_app
+from ardha.core.config import get_settings
+from ardha.core.database import async_session_factory
+from ardha.repositories.analytics_repository import (
+    ROLLUP_PERIODS,
+    AnalyticsRepository,
+    period_start,
+)
+
+logger = logging.getLogger(__name__)
+
+# Watermark of the rollups built by build_analytics_rollups
+ROLLUP_WATERMARK = "analytics_rollups"
+
+
+@celery_app.task(
+    name="analytics.build_rollups",
+    queue="analytics",
+    time_limit=600,  # 10 minutes
+    soft_time_limit=540,  # 9 minutes
+)
+async def build_analytics_rollups() -> Dict[str, Any]:
+    """
+    Rebuild the analytics rollup periods touched since the last run.
+
+    Claims the days marked dirty by task changes in a short transaction of
+    its own, then rebuilds the days and weeks containing them and the days
+    with AI usage after the watermark (minus
+    settings.analytics.rollup_overlap_minutes, for transactions that
+    committed late) in one transaction and advances the watermark. If the
+    rebuild fails the claimed days are marked dirty again. The first run
+    rebuilds every day of settings.analytics.rollup_backfill_days.
+
+    Returns:
+        Dict with rebuilt periods and rows written per granularity
+    """
+    logger.info("Starting analytics rollup build")
+
+    analytics_settings = get_settings().analytics
+    now = datetime.now(UTC)
+
+    async with async_session_factory() as db:
+        repository = AnalyticsRepository(db)
+
+        watermark = await repository.get_watermark(ROLLUP_WATERMARK)
+        if watermark is None:
+            since = now - timedelta(days=analytics_settings.rollup_backfill_days)
+        else:
+            since = watermark - timedelta(minutes=analytics_settings.rollup_overlap_minutes)
+
+        # Committed on its own so task writes marking these days don't wait
+        # for the rebuild
+        claimed = await repository.claim_dirty_days()
+        await db.commit()
+
+        try:
+            days = claimed | await repository.find_changed_days(since)
+            if watermark is None:
+                days.update(
+                    since.date() + timedelta(days=offset)
+                    for offset in range((now.date() - since.date()).days + 1)
+                )
+
+            statistics: Dict[str, Dict[str, int]] = {}
+            for period in ROLLUP_PERIODS:
+                starts = {period_start(day, period) for day in days}
+                rows = await repository.rebuild(period, starts)
+                statistics[period] = {"periods": len(starts), "rows": rows}
+
+            await repository.set_watermark(ROLLUP_WATERMARK, now)
+            await db.commit()
+        except Exception:
+            logger.error(f"Analytics rollup build failed, re-marking {len(claimed)} days")
+            await db.rollback()
+            await repository.mark_dirty_days(claimed)
+            await db.commit()
+            raise
+
+    logger.info(
+        f"Analytics rollup build complete: {len(days)} changed days since "
+        f"{since.isoformat()}, {sum(s['rows'] for s in statistics.values())} rows written"
+    )
+
+    return {
+        "success": True,
+        "built_at": now.isoformat(),
+        "since": since.isoformat(),
+        "changed_days": len(days),
+        "statistics": statistics,
+    }
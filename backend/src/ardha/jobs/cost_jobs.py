@@ -2,21 +2,23 @@
 Cost tracking and analytics background jobs.
 
 This module provides Celery tasks for AI cost reporting,
-usage analytics, and project metrics.
+usage analytics, and project metrics. AI figures are read from the
+ai_usage_daily aggregate rather than the per-operation ai_usage log.
 """
 
 import logging
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from typing import Any
 
 from sqlalchemy import Integer, and_, cast, func, select
 
 from ardha.core.celery_app import celery_app
 from ardha.core.database import async_session_factory
-from ardha.models.ai_usage import AIUsage
+from ardha.models.ai_usage_daily import AIUsageDaily
 from ardha.models.project import Project
 from ardha.models.task import Task
-from ardha.models.user import User
+from ardha.repositories.ai_usage_repository import AIUsageRepository
 
 logger = logging.getLogger(__name__)
 
@@ -45,169 +47,101 @@ async def generate_daily_cost_report() -> dict[str, Any]:
 
     try:
         async with async_session_factory() as db:
-            # Get yesterday's date range
+            # Yesterday's usage, read from the daily aggregate in one query
             now = datetime.now(timezone.utc)
-            yesterday_start = (now - timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            yesterday_end = yesterday_start + timedelta(days=1)
+            yesterday = (now - timedelta(days=1)).date()
+            rows = await AIUsageRepository(db).get_daily_rows(yesterday, yesterday, with_names=True)
 
-            # Total costs (aggregate across all users)
-            stmt_total = select(func.coalesce(func.sum(AIUsage.cost), 0)).where(
-                and_(
-                    AIUsage.created_at >= yesterday_start,
-                    AIUsage.created_at < yesterday_end,
-                )
-            )
-            result = await db.execute(stmt_total)
-            total_cost = result.scalar()
-
-            # Total tokens
-            stmt_tokens = select(
-                func.sum(AIUsage.tokens_input).label("input"),
-                func.sum(AIUsage.tokens_output).label("output"),
-            ).where(
-                and_(
-                    AIUsage.created_at >= yesterday_start,
-                    AIUsage.created_at < yesterday_end,
-                )
-            )
-            result = await db.execute(stmt_tokens)
-            tokens = result.one()
-            total_input_tokens = tokens.input or 0
-            total_output_tokens = tokens.output or 0
+            total_cost = sum((row.cost for row in rows), Decimal("0"))
+            total_input_tokens = sum(row.tokens_input for row in rows)
+            total_output_tokens = sum(row.tokens_output for row in rows)
             total_tokens = total_input_tokens + total_output_tokens
 
             # Operation breakdown
-            stmt_operations = (
-                select(
-                    AIUsage.operation,
-                    func.count(AIUsage.id).label("count"),
-                    func.sum(AIUsage.cost).label("cost"),
-                    func.sum(AIUsage.tokens_input).label("input_tokens"),
-                    func.sum(AIUsage.tokens_output).label("output_tokens"),
-                )
-                .where(
-                    and_(
-                        AIUsage.created_at >= yesterday_start,
-                        AIUsage.created_at < yesterday_end,
-                    )
+            operations: dict[str, dict[str, Any]] = {}
+            for row in rows:
+                op = operations.setdefault(
+                    row.operation,
+                    {
+                        "operation": row.operation,
+                        "count": 0,
+                        "cost": Decimal("0"),
+                        "input_tokens": 0,
+                        "output_tokens": 0,
+                    },
                 )
-                .group_by(AIUsage.operation)
-            )
-            result = await db.execute(stmt_operations)
-            operations = result.all()
+                op["count"] += row.operations
+                op["cost"] += row.cost
+                op["input_tokens"] += row.tokens_input
+                op["output_tokens"] += row.tokens_output
 
             operation_breakdown = [
                 {
-                    "operation": op.operation.value,
-                    "count": op.count,
-                    "cost": float(op.cost or 0),
-                    "input_tokens": op.input_tokens or 0,
-                    "output_tokens": op.output_tokens or 0,
-                    "total_tokens": ((op.input_tokens or 0) + (op.output_tokens or 0)),
+                    **op,
+                    "cost": float(op["cost"]),
+                    "total_tokens": op["input_tokens"] + op["output_tokens"],
                 }
-                for op in operations
+                for op in operations.values()
             ]
 
             # Model breakdown
-            stmt_models = (
-                select(
-                    AIUsage.model_name,
-                    func.count(AIUsage.id).label("count"),
-                    func.sum(AIUsage.cost).label("cost"),
+            models: dict[str, dict[str, Any]] = {}
+            for row in rows:
+                model = models.setdefault(
+                    row.model_name, {"model": row.model_name, "count": 0, "cost": Decimal("0")}
                 )
-                .where(
-                    and_(
-                        AIUsage.created_at >= yesterday_start,
-                        AIUsage.created_at < yesterday_end,
-                    )
-                )
-                .group_by(AIUsage.model_name)
-            )
-            result = await db.execute(stmt_models)
-            models = result.all()
+                model["count"] += row.operations
+                model["cost"] += row.cost
 
-            model_breakdown = [
-                {
-                    "model": model.model_name,
-                    "count": model.count,
-                    "cost": float(model.cost or 0),
-                }
-                for model in models
-            ]
+            model_breakdown = [{**model, "cost": float(model["cost"])} for model in models.values()]
 
             # User breakdown (top 10)
-            stmt_users = (
-                select(
-                    AIUsage.user_id,
-                    User.username,
-                    User.email,
-                    func.count(AIUsage.id).label("count"),
-                    func.sum(AIUsage.cost).label("cost"),
-                )
-                .join(User, AIUsage.user_id == User.id)
-                .where(
-                    and_(
-                        AIUsage.created_at >= yesterday_start,
-                        AIUsage.created_at < yesterday_end,
-                    )
+            users: dict[Any, dict[str, Any]] = {}
+            for row in rows:
+                user = users.setdefault(
+                    row.user_id,
+                    {
+                        "user_id": str(row.user_id),
+                        "username": row.username,
+                        "email": row.email,
+                        "operations": 0,
+                        "cost": Decimal("0"),
+                    },
                 )
-                .group_by(AIUsage.user_id, User.username, User.email)
-                .order_by(func.sum(AIUsage.cost).desc())
-                .limit(10)
-            )
-            result = await db.execute(stmt_users)
-            users = result.all()
+                user["operations"] += row.operations
+                user["cost"] += row.cost
 
             user_breakdown = [
-                {
-                    "user_id": str(user.user_id),
-                    "username": user.username,
-                    "email": user.email,
-                    "operations": user.count,
-                    "cost": float(user.cost or 0),
-                }
-                for user in users
+                {**user, "cost": float(user["cost"])}
+                for user in sorted(users.values(), key=lambda u: u["cost"], reverse=True)[:10]
             ]
 
             # Project breakdown (top 10)
-            stmt_projects = (
-                select(
-                    AIUsage.project_id,
-                    Project.name,
-                    func.count(AIUsage.id).label("count"),
-                    func.sum(AIUsage.cost).label("cost"),
-                )
-                .join(Project, AIUsage.project_id == Project.id, isouter=True)
-                .where(
-                    and_(
-                        AIUsage.created_at >= yesterday_start,
-                        AIUsage.created_at < yesterday_end,
-                        AIUsage.project_id.isnot(None),
-                    )
+            projects: dict[Any, dict[str, Any]] = {}
+            for row in rows:
+                if row.project_id is None:
+                    continue
+                proj = projects.setdefault(
+                    row.project_id,
+                    {
+                        "project_id": str(row.project_id),
+                        "project_name": row.project_name,
+                        "operations": 0,
+                        "cost": Decimal("0"),
+                    },
                 )
-                .group_by(AIUsage.project_id, Project.name)
-                .order_by(func.sum(AIUsage.cost).desc())
-                .limit(10)
-            )
-            result = await db.execute(stmt_projects)
-            projects = result.all()
+                proj["operations"] += row.operations
+                proj["cost"] += row.cost
 
             project_breakdown = [
-                {
-                    "project_id": str(proj.project_id),
-                    "project_name": proj.name,
-                    "operations": proj.count,
-                    "cost": float(proj.cost or 0),
-                }
-                for proj in projects
+                {**proj, "cost": float(proj["cost"])}
+                for proj in sorted(projects.values(), key=lambda p: p["cost"], reverse=True)[:10]
             ]
 
             # Build report
             total_operations = sum(op["count"] for op in operation_breakdown)
             report = {
-                "date": yesterday_start.date().isoformat(),
+                "date": yesterday.isoformat(),
                 "generated_at": now.isoformat(),
                 "summary": {
                     "total_cost": float(total_cost or 0),
@@ -270,63 +204,59 @@ async def analyze_ai_usage_patterns() -> dict[str, Any]:
 
     try:
         async with async_session_factory() as db:
-            # Get last 7 days of data
+            # Last 7 days (plus today) of data, read from the daily aggregate in one query
             now = datetime.now(timezone.utc)
-            week_ago = now - timedelta(days=7)
+            today = now.date()
+            rows = await AIUsageRepository(db).get_daily_rows(today - timedelta(days=7), today)
 
             # Find high-cost operations (top 10)
-            stmt_expensive = (
-                select(
-                    AIUsage.operation,
-                    AIUsage.model_name,
-                    func.avg(AIUsage.cost).label("avg_cost"),
-                    func.count(AIUsage.id).label("count"),
-                    func.sum(AIUsage.cost).label("total_cost"),
+            pairs: dict[tuple[str, str], dict[str, Any]] = {}
+            for row in rows:
+                pair = pairs.setdefault(
+                    (row.operation, row.model_name),
+                    {
+                        "operation": row.operation,
+                        "model": row.model_name,
+                        "count": 0,
+                        "total_cost": Decimal("0"),
+                    },
                 )
-                .where(AIUsage.created_at >= week_ago)
-                .group_by(AIUsage.operation, AIUsage.model_name)
-                .order_by(func.avg(AIUsage.cost).desc())
-                .limit(10)
-            )
-            result = await db.execute(stmt_expensive)
-            expensive_ops = result.all()
+                pair["count"] += row.operations
+                pair["total_cost"] += row.cost
 
-            high_cost_operations = [
-                {
-                    "operation": op.operation.value,
-                    "model": op.model_name,
-                    "average_cost": float(op.avg_cost or 0),
-                    "count": op.count,
-                    "total_cost": float(op.total_cost or 0),
-                }
-                for op in expensive_ops
-            ]
+            high_cost_operations = sorted(
+                (
+                    {
+                        "operation": pair["operation"],
+                        "model": pair["model"],
+                        "average_cost": (
+                            float(pair["total_cost"] / pair["count"]) if pair["count"] else 0.0
+                        ),
+                        "count": pair["count"],
+                        "total_cost": float(pair["total_cost"]),
+                    }
+                    for pair in pairs.values()
+                ),
+                key=lambda op: op["average_cost"],
+                reverse=True,
+            )[:10]
 
             # Detect usage spikes (daily comparison)
+            days: dict[Any, dict[str, Any]] = {}
+            for row in rows:
+                day = days.setdefault(row.usage_date, {"cost": Decimal("0"), "operations": 0})
+                day["cost"] += row.cost
+                day["operations"] += row.operations
+
             daily_costs = []
             for i in range(7):
-                day_start = (now - timedelta(days=i + 1)).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                day_end = day_start + timedelta(days=1)
-
-                stmt_day = select(
-                    func.sum(AIUsage.cost).label("cost"),
-                    func.count(AIUsage.id).label("count"),
-                ).where(
-                    and_(
-                        AIUsage.created_at >= day_start,
-                        AIUsage.created_at < day_end,
-                    )
-                )
-                result = await db.execute(stmt_day)
-                day_data = result.one()
-
+                day = today - timedelta(days=i + 1)
+                day_data = days.get(day, {"cost": Decimal("0"), "operations": 0})
                 daily_costs.append(
                     {
-                        "date": day_start.date().isoformat(),
-                        "cost": float(day_data.cost or 0),
-                        "operations": day_data.count or 0,
+                        "date": day.isoformat(),
+                        "cost": float(day_data["cost"]),
+                        "operations": day_data["operations"],
                     }
                 )
 
@@ -341,31 +271,29 @@ async def analyze_ai_usage_patterns() -> dict[str, Any]:
             ]
 
             # Model usage distribution
-            stmt_model_dist = (
-                select(
-                    AIUsage.model_name,
-                    func.count(AIUsage.id).label("usage_count"),
-                    func.sum(AIUsage.cost).label("total_cost"),
+            model_dist: dict[str, dict[str, Any]] = {}
+            for row in rows:
+                model = model_dist.setdefault(
+                    row.model_name, {"usage_count": 0, "total_cost": Decimal("0")}
                 )
-                .where(AIUsage.created_at >= week_ago)
-                .group_by(AIUsage.model_name)
-            )
-            result = await db.execute(stmt_model_dist)
-            model_dist = result.all()
+                model["usage_count"] += row.operations
+                model["total_cost"] += row.cost
 
             # Calculate total count for percentage
-            total_model_count = sum(row.usage_count for row in model_dist) or 0
+            total_model_count = sum(model["usage_count"] for model in model_dist.values())
 
             model_distribution = [
                 {
-                    "model": row.model_name,
-                    "usage_count": row.usage_count,
-                    "total_cost": float(row.total_cost or 0),
+                    "model": model_name,
+                    "usage_count": model["usage_count"],
+                    "total_cost": float(model["total_cost"]),
                     "percentage": (
-                        (row.usage_count / total_model_count * 100) if total_model_count > 0 else 0
+                        (model["usage_count"] / total_model_count * 100)
+                        if total_model_count > 0
+                        else 0
                     ),
                 }
-                for row in model_dist
+                for model_name, model in model_dist.items()
             ]
 
             # Generate recommendations
@@ -460,6 +388,24 @@ async def calculate_project_analytics() -> dict[str, Any]:
             result = await db.execute(stmt_projects)
             projects = result.scalars().all()
 
+            # AI usage per project, read from the daily aggregate in one query
+            stmt_ai = (
+                select(
+                    AIUsageDaily.project_id,
+                    func.sum(AIUsageDaily.operations).label("operations"),
+                    func.sum(AIUsageDaily.cost).label("cost"),
+                )
+                .where(
+                    and_(
+                        AIUsageDaily.project_id.isnot(None),
+                        AIUsageDaily.usage_date >= month_ago.date(),
+                    )
+                )
+                .group_by(AIUsageDaily.project_id)
+            )
+            result = await db.execute(stmt_ai)
+            ai_usage = {row.project_id: row for row in result.all()}
+
             project_analytics = []
 
             for project in projects:
@@ -477,22 +423,9 @@ async def calculate_project_analytics() -> dict[str, Any]:
                 task_stats = result.one()
 
                 # AI usage metrics - project-specific cost
-                stmt_project_cost = select(func.coalesce(func.sum(AIUsage.cost), 0)).where(
-                    and_(
-                        AIUsage.project_id == project.id,
-                        AIUsage.created_at >= month_ago,
-                    )
-                )
-                result_cost = await db.execute(stmt_project_cost)
-                project_cost = result_cost.scalar()
-
-                stmt_ai_ops = select(func.count(AIUsage.id)).where(
-                    and_(
-                        AIUsage.project_id == project.id,
-                        AIUsage.created_at >= month_ago,
-                    )
-                )
-                ai_operations = await db.scalar(stmt_ai_ops) or 0
+                project_usage = ai_usage.get(project.id)
+                project_cost = project_usage.cost if project_usage else 0
+                ai_operations = project_usage.operations if project_usage else 0
 
                 # Calculate completion rate
                 total_tasks = task_stats.total or 0
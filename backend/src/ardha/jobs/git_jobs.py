@@ -2,17 +2,20 @@
 Git-related background jobs.
 
 This module provides Celery tasks for Git operations including
-commit memory ingestion and code analysis.
+commit memory ingestion and code indexing.
 """
 
 import logging
 import re
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from ardha.core.celery_app import celery_app
 from ardha.core.database import async_session_factory
 from ardha.repositories.git_commit import GitCommitRepository
+from ardha.services.async_git_service import AsyncGitService
+from ardha.services.code_index_service import get_code_index_service
 from ardha.services.memory_service import MemoryService
 
 logger = logging.getLogger(__name__)
@@ -148,3 +151,43 @@ async def ingest_commit_to_memory(commit_id: str) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error ingesting commit {commit_id}: {e}")
         raise
+
+
+@celery_app.task(
+    name="git.index_project_code",
+    queue="memory",
+    time_limit=1800,  # 30 minutes
+    soft_time_limit=1500,  # 25 minutes
+    max_retries=3,
+    default_retry_delay=60,  # 1 minute
+)
+async def index_project_code(
+    project_id: str, repo_path: str, base_sha: Optional[str], head_sha: str
+) -> Dict[str, Any]:
+    """
+    Update the project's code index after a git sync.
+
+    Only blobs changed between base_sha and head_sha are chunked and
+    embedded; without a base the whole tree is checked and blobs that are
+    already indexed are skipped.
+
+    Args:
+        project_id: UUID of the project
+        repo_path: Path to the project's git repository
+        base_sha: Previously synced commit, or None for a full pass
+        head_sha: Commit to index
+
+    Returns:
+        Dict with indexing counts
+    """
+    logger.info(f"Starting code indexing for project {project_id} at {head_sha[:7]}")
+
+    try:
+        stats = await get_code_index_service().sync(
+            UUID(project_id), AsyncGitService(Path(repo_path)), base_sha, head_sha
+        )
+        return {"success": True, "project_id": project_id, "head_sha": head_sha, **stats}
+
+    except Exception as e:
+        logger.error(f"Error indexing code for project {project_id}: {e}")
+        raise
@@ -2,7 +2,7 @@
 Maintenance and backup background jobs.
 
 This module provides Celery tasks for system maintenance including
-session cleanup and database backups.
+session cleanup, database backups and monthly partition management.
 """
 
 import logging
@@ -10,12 +10,20 @@ import os
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from redis.asyncio import Redis
 
 from ardha.core.celery_app import celery_app
 from ardha.core.config import get_settings
+from ardha.core.database import async_session_factory
+from ardha.core.notification_cache import get_notification_cache
+from ardha.repositories.partition_repository import (
+    PARTITIONED_TABLES,
+    PartitionRepository,
+    add_months,
+    month_start,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -359,4 +367,70 @@ def cleanup_old_backups(backup_dir: Path, days_to_keep: int = 30) -> int:
         return 0
 
 
+@celery_app.task(
+    name="maintenance.manage_partitions",
+    queue="maintenance",
+    time_limit=600,  # 10 minutes
+    soft_time_limit=540,  # 9 minutes
+)
+async def manage_partitions() -> Dict[str, Any]:
+    """
+    Pre-create upcoming monthly partitions and drop expired ones.
+
+    For notifications, webhook deliveries and task activities:
+    - Creates partitions for the current month and settings.partitions.months_ahead
+      months ahead, so rows never land in the default partition
+    - Drops partitions older than the table's retention, which removes a
+      whole month of rows without a DELETE
+
+    A failure on one table is logged and does not stop the others.
+
+    Returns:
+        Dict with created and dropped partitions per table
+    """
+    logger.info("Starting partition maintenance")
+
+    partition_settings = get_settings().partitions
+    retention_months = {
+        "notifications": partition_settings.notifications_retention_months,
+        "github_webhook_deliveries": partition_settings.webhook_deliveries_retention_months,
+        "task_activities": partition_settings.task_activities_retention_months,
+    }
+    current_month = month_start(datetime.now(timezone.utc))
+    statistics: Dict[str, Dict[str, List[str]]] = {}
+    failed: List[str] = []
+
+    async with async_session_factory() as db:
+        repository = PartitionRepository(db)
+        for table in PARTITIONED_TABLES:
+            try:
+                created = await repository.create_partitions(
+                    table, current_month, partition_settings.months_ahead + 1
+                )
+                dropped: List[str] = []
+                if retention_months[table]:
+                    cutoff = add_months(current_month, -retention_months[table])
+                    dropped = await repository.drop_partitions_before(table, cutoff)
+                statistics[table] = {"created": created, "dropped": dropped}
+            except Exception as e:
+                logger.error(f"Error maintaining partitions of {table}: {e}")
+                failed.append(table)
+
+    if statistics.get("notifications", {}).get("dropped"):
+        await get_notification_cache().clear()
+
+    logger.info(
+        f"Partition maintenance complete: "
+        f"{sum(len(s['created']) for s in statistics.values())} created, "
+        f"{sum(len(s['dropped']) for s in statistics.values())} dropped"
+    )
+
+    return {
+        "success": not failed,
+        "maintained_at": datetime.now(timezone.utc).isoformat(),
+        "statistics": statistics,
+        "failed": failed,
+    }
+
+
 logger.info("Maintenance jobs configured successfully")
@@ -0,0 +1,116 @@
+"""
+Notification delivery background jobs.
+
+This module provides Celery tasks that take slow notification delivery
+(SMTP) off the request path:
+- Instant notification emails, retried with exponential backoff
+- Daily and weekly digest emails, one per user per period
+"""
+
+import logging
+from typing import Any, Dict, List
+from uuid import UUID
+
+from ardha.core.celery_app import celery_app
+from ardha.core.config import get_settings
+from ardha.core.database import async_session_factory
+from ardha.core.email_service import EmailService
+from ardha.repositories.notification_repository import NotificationRepository
+from ardha.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@celery_app.task(
+    name="notifications.send_notification_emails",
+    queue="notifications",
+    bind=True,
+    time_limit=300,  # 5 minutes
+    soft_time_limit=240,  # 4 minutes
+    max_retries=settings.email.max_retries,
+    default_retry_delay=settings.email.retry_backoff,
+)
+async def send_notification_emails(self, notification_ids: List[str]) -> Dict[str, Any]:
+    """
+    Send instant emails for newly created notifications.
+
+    Queued by NotificationService after notifications are stored, so the
+    request that triggered them never waits on SMTP. Sent notifications
+    are marked as emailed, which makes redelivery of the task harmless;
+    the ones that failed are retried in a new task with exponential
+    backoff until max_retries is reached.
+
+    Args:
+        notification_ids: UUIDs of notifications to email
+
+    Returns:
+        Dict with sent and failed counts
+    """
+    logger.info(f"Sending {len(notification_ids)} notification emails")
+
+    email_service = EmailService()
+    if not email_service._is_configured():
+        logger.warning("Email not configured, dropping notification emails")
+        return {"success": False, "sent": 0, "failed": len(notification_ids)}
+
+    async with async_session_factory() as db:
+        repository = NotificationRepository(db)
+        notifications = await repository.get_by_ids(
+            [UUID(notification_id) for notification_id in notification_ids]
+        )
+
+        sent: List[UUID] = []
+        failed: List[str] = []
+        for notification in notifications:
+            if notification.emailed_at is not None or notification.user is None:
+                continue
+            if await email_service.send_notification_email(notification.user, notification):
+                sent.append(notification.id)
+            else:
+                failed.append(str(notification.id))
+
+        await repository.mark_emailed(sent)
+
+    if failed:
+        if self.request.retries < self.max_retries:
+            countdown = settings.email.retry_backoff * 2**self.request.retries
+            logger.warning(
+                f"{len(failed)} notification emails failed, retrying in {countdown}s "
+                f"(attempt {self.request.retries + 1}/{self.max_retries})"
+            )
+            raise self.retry(args=[failed], countdown=countdown)
+
+        logger.error(f"Giving up on {len(failed)} notification emails after retries")
+
+    return {"success": not failed, "sent": len(sent), "failed": len(failed)}
+
+
+@celery_app.task(
+    name="notifications.send_notification_digests",
+    queue="notifications",
+    time_limit=1800,  # 30 minutes
+    soft_time_limit=1700,
+)
+async def send_notification_digests(frequency: str) -> Dict[str, Any]:
+    """
+    Send daily or weekly digest emails.
+
+    Args:
+        frequency: Digest period ("daily" or "weekly")
+
+    Returns:
+        Dict with digest statistics
+    """
+    logger.info(f"Sending {frequency} notification digests")
+
+    try:
+        async with async_session_factory() as db:
+            stats = await NotificationService(db).send_digests(frequency)
+
+        return {"success": True, "frequency": frequency, **stats}
+
+    except Exception as e:
+        logger.error(f"Error sending {frequency} notification digests: {e}")
+        raise
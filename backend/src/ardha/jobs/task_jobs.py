@@ -2,7 +2,8 @@
 Task-related background jobs.
 
 This module provides Celery tasks for task management operations
-including velocity calculation and reminder notifications.
+including velocity calculation, reminder notifications and repair of
+the denormalized task aggregates.
 """
 
 import logging
@@ -11,14 +12,20 @@ from typing import Any, Dict, List
 from uuid import UUID
 
 from sqlalchemy import and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from ardha.core.celery_app import celery_app
 from ardha.core.database import async_session_factory
+from ardha.models.project import Project
 from ardha.models.task import Task
 from ardha.models.user import User
+from ardha.repositories.task_aggregate_repository import TaskAggregateRepository
 
 logger = logging.getLogger(__name__)
 
+# Attempts per project when reconciliation races concurrent task changes
+RECONCILE_ATTEMPTS = 3
+
 
 @celery_app.task(
     name="tasks.calculate_team_velocity",
@@ -198,3 +205,69 @@ async def send_overdue_task_reminders() -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error sending overdue reminders: {e}")
         raise
+
+
+@celery_app.task(
+    name="tasks.reconcile_task_aggregates",
+    queue="analytics",
+    time_limit=600,  # 10 minutes
+    soft_time_limit=540,  # 9 minutes
+)
+async def reconcile_task_aggregates() -> Dict[str, Any]:
+    """
+    Repair drift in the per-project and per-milestone task aggregates.
+
+    Each project is recomputed from the tasks table in its own short
+    REPEATABLE READ transaction, so a task changed meanwhile makes the
+    repair fail with a serialization error instead of being overwritten
+    with stale counts; such projects are retried up to RECONCILE_ATTEMPTS
+    times. Only rows that differ are rewritten.
+
+    Returns:
+        Dict with reconciliation statistics
+    """
+    logger.info("Starting task aggregate reconciliation")
+
+    async with async_session_factory() as db:
+        project_ids = list((await db.scalars(select(Project.id))).all())
+
+    drifted: Dict[str, int] = {}
+    failed: List[str] = []
+    retries = 0
+
+    for project_id in project_ids:
+        for attempt in range(1, RECONCILE_ATTEMPTS + 1):
+            try:
+                async with async_session_factory() as db:
+                    await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                    repaired = await TaskAggregateRepository(db).reconcile(project_id)
+                    await db.commit()
+                if repaired:
+                    drifted[str(project_id)] = repaired
+                break
+            except SQLAlchemyError as e:
+                if attempt == RECONCILE_ATTEMPTS:
+                    logger.error(f"Giving up reconciling task aggregates of {project_id}: {e}")
+                    failed.append(str(project_id))
+                else:
+                    retries += 1
+                    logger.warning(
+                        f"Retrying task aggregate reconciliation of {project_id} "
+                        f"(attempt {attempt}): {e}"
+                    )
+
+    logger.info(
+        f"Task aggregate reconciliation complete: {len(project_ids)} projects, "
+        f"{sum(drifted.values())} rows repaired in {len(drifted)} projects, "
+        f"{len(failed)} failed"
+    )
+
+    return {
+        "success": not failed,
+        "reconciled_at": datetime.now(timezone.utc).isoformat(),
+        "projects_checked": len(project_ids),
+        "rows_repaired": sum(drifted.values()),
+        "drifted_projects": drifted,
+        "retries": retries,
+        "failed": failed,
+    }
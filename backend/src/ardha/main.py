@@ -2,11 +2,15 @@
 Main FastAPI application for Ardha backend.
 """
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from ardha.api.v1.routes import (
+    analytics,
     auth,
     chats,
     databases,
@@ -26,6 +30,44 @@ from ardha.api.v1.routes import (
 )
 from ardha.api.v1.webhooks import github as github_webhooks
 from ardha.core.config import settings
+from ardha.core.rate_limit import RateLimitMiddleware
+from ardha.core.redis import close_redis, get_redis
+from ardha.core.webhook_queue import WebhookConsumerPool, get_webhook_queue
+from ardha.core.websocket_manager import get_websocket_manager
+from ardha.services.async_git_service import shutdown_git_executor
+from ardha.services.github_client_pool import get_github_client_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop process-wide resources shared by all requests."""
+    ws_manager = get_websocket_manager()
+
+    # Share WebSocket delivery and presence across uvicorn workers
+    if settings.websocket.cluster_enabled:
+        await ws_manager.start_backplane(get_redis())
+
+    # Drain the durable webhook queue (shards are leased across all workers)
+    webhook_consumers = None
+    if settings.webhooks.consumers_enabled:
+        webhook_consumers = WebhookConsumerPool(
+            get_webhook_queue(),
+            github_webhooks.process_queued_webhook,
+            max_attempts=settings.webhooks.max_attempts,
+            retry_base=settings.webhooks.retry_base_seconds,
+            retry_max=settings.webhooks.retry_max_seconds,
+            lease_ttl=settings.webhooks.lease_ttl_seconds,
+        )
+        await webhook_consumers.start()
+
+    yield
+
+    if webhook_consumers is not None:
+        await webhook_consumers.stop()
+    await ws_manager.stop_backplane()
+    await close_redis()
+    shutdown_git_executor()
+    get_github_client_pool().close()
 
 
 def create_app() -> FastAPI:
@@ -35,6 +77,7 @@ def create_app() -> FastAPI:
         description="Ardha backend API",
         version="0.1.0",
         debug=settings.debug,
+        lifespan=lifespan,
     )
 
     # Configure CORS
@@ -49,6 +92,10 @@ def create_app() -> FastAPI:
     # Add trusted host middleware for WebSocket support
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["localhost", "127.0.0.1", "*"])
 
+    # Global per-user/per-IP rate limit (route tiers use the RateLimit dependency)
+    if settings.rate_limit.middleware_enabled:
+        app.add_middleware(RateLimitMiddleware)
+
     # Include API routers
     app.include_router(auth.router, prefix="/api/v1")
     app.include_router(oauth.router, prefix="/api/v1")
@@ -66,6 +113,7 @@ def create_app() -> FastAPI:
     app.include_router(websocket.router, prefix="/api/v1")
     app.include_router(task_generation.router, prefix="/api/v1")
     app.include_router(workflows.router, prefix="/api/v1")
+    app.include_router(analytics.router, prefix="/api/v1")
 
     # Include webhook routers (public endpoints)
     app.include_router(github_webhooks.router, prefix="/api/v1")  # GitHub webhooks
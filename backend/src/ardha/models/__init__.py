@@ -5,6 +5,8 @@ This package contains all SQLAlchemy ORM models for the Ardha application.
 """
 
 from ardha.models.ai_usage import AIUsage
+from ardha.models.ai_usage_daily import AIUsageDaily
+from ardha.models.analytics_rollup import AnalyticsRollup, RollupDirtyDay, RollupWatermark
 from ardha.models.base import Base, BaseModel, SoftDeleteMixin
 from ardha.models.chat import Chat
 from ardha.models.database import Database
@@ -26,6 +28,7 @@ from ardha.models.project import Project
 from ardha.models.project_member import ProjectMember
 from ardha.models.task import Task
 from ardha.models.task_activity import TaskActivity
+from ardha.models.task_aggregate import TaskAggregate
 from ardha.models.task_dependency import TaskDependency
 from ardha.models.task_tag import TaskTag
 from ardha.models.user import User
@@ -43,9 +46,14 @@ __all__ = [
     "TaskDependency",
     "TaskTag",
     "TaskActivity",
+    "TaskAggregate",
     "Chat",
     "Message",
     "AIUsage",
+    "AIUsageDaily",
+    "AnalyticsRollup",
+    "RollupWatermark",
+    "RollupDirtyDay",
     "WorkflowExecution",
     "OpenSpecProposal",
     "File",
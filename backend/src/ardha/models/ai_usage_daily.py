@@ -0,0 +1,116 @@
+"""
+AI usage daily aggregate model.
+
+This module defines the per-day AI usage totals maintained alongside the
+ai_usage log: AIUsageRepository.create() upserts the matching row in the
+same transaction as the log insert, so cost reports, usage statistics and
+budget checks read a few aggregate rows instead of scanning every operation.
+"""
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ardha.models.base import Base, BaseModel
+
+
+class AIUsageDaily(BaseModel, Base):
+    """
+    AI usage of one user on one day, per project, model and operation.
+
+    Attributes:
+        usage_date: Day of the operations
+        user_id: User who performed the operations
+        project_id: Associated project (None for personal operations)
+        model_name: AI model used
+        operation: AI operation type
+        operations: Number of operations
+        tokens_input: Sum of input tokens
+        tokens_output: Sum of output tokens
+        cost: Sum of cost
+    """
+
+    __tablename__ = "ai_usage_daily"
+
+    # ============= Key Fields =============
+
+    usage_date: Mapped[date] = mapped_column(Date, nullable=False, comment="Day of the operations")
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="UUID of user who performed the operations",
+    )
+
+    # No foreign key: the log sets project_id NULL when a project is deleted,
+    # which would collide with the user's personal row for the same key.
+    project_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        comment="UUID of associated project (nullable for personal operations)",
+    )
+
+    model_name: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="Name of AI model used"
+    )
+
+    operation: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="Type of AI operation performed"
+    )
+
+    # ============= Totals =============
+
+    operations: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0", comment="Number of operations"
+    )
+
+    tokens_input: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0", comment="Sum of input tokens"
+    )
+
+    tokens_output: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0", comment="Sum of output tokens"
+    )
+
+    cost: Mapped[Decimal] = mapped_column(
+        Numeric(14, 6), nullable=False, default=0, server_default="0", comment="Sum of cost"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "usage_date",
+            "user_id",
+            "project_id",
+            "model_name",
+            "operation",
+            name="uq_ai_usage_daily_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_ai_usage_daily_user_date", "user_id", "usage_date"),
+        Index("ix_ai_usage_daily_project_date", "project_id", "usage_date"),
+        Index("ix_ai_usage_daily_date", "usage_date"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"<AIUsageDaily(usage_date={self.usage_date}, "
+            f"user_id={self.user_id}, "
+            f"project_id={self.project_id}, "
+            f"model_name='{self.model_name}', "
+            f"operation='{self.operation}', "
+            f"cost={self.cost})>"
+        )
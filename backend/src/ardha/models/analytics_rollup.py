@@ -0,0 +1,241 @@
+"""
+Analytics rollup models for precomputed dashboard metrics.
+
+This module defines the daily and weekly per-project and per-user metric
+rows built by the analytics rollup job, the watermark recording how far
+the job has read AI usage, and the days whose task metrics changed.
+Statement-level triggers on tasks mark those days on every insert,
+relevant update (including reopening) and delete, so the job rebuilds
+exactly the affected periods. Charts read rollups instead of scanning
+the source tables.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ardha.models.base import Base
+from ardha.models.task import Task
+
+
+class AnalyticsRollup(Base):
+    """
+    Metrics of one project or user over one day or week.
+
+    Rows are replaced whole when their period is rebuilt, so every metric
+    (including percentiles, which cannot be summed) is exact for the period.
+    """
+
+    __tablename__ = "analytics_rollups"
+
+    # ============= Primary Fields =============
+
+    period: Mapped[str] = mapped_column(
+        String(10), primary_key=True, comment="Rollup granularity: day or week"
+    )
+
+    period_start: Mapped[date] = mapped_column(
+        Date, primary_key=True, comment="First day of the period (weeks start on Monday, UTC)"
+    )
+
+    scope: Mapped[str] = mapped_column(
+        String(20), primary_key=True, comment="Scope type: project or user"
+    )
+
+    scope_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        comment="Project or user ID, depending on scope",
+    )
+
+    # ============= Task Metrics =============
+
+    tasks_created: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    tasks_completed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Tasks done in the period (throughput); by assignee for user scope",
+    )
+
+    cycle_time_p50_hours: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Median hours from started to done"
+    )
+
+    cycle_time_p90_hours: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="90th percentile hours from started to done"
+    )
+
+    # ============= AI Metrics =============
+
+    ai_operations: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    ai_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+    ai_cost: Mapped[Decimal] = mapped_column(
+        Numeric(12, 6), nullable=False, server_default="0", comment="AI cost in the period"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        # Chart reads: one scope's series over a date range
+        Index("ix_analytics_rollups_scope_series", "scope_id", "period", "period_start"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of AnalyticsRollup."""
+        return (
+            f"<AnalyticsRollup(period={self.period}, start={self.period_start}, "
+            f"scope={self.scope}, scope_id={self.scope_id})>"
+        )
+
+
+class RollupWatermark(Base):
+    """
+    How far a rollup job has read its append-only sources (AI usage).
+
+    The next run only rebuilds periods with AI usage recorded after the
+    watermark; task changes are tracked by RollupDirtyDay instead.
+    """
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    watermark: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Source rows changed before this time are rolled up",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of RollupWatermark."""
+        return f"<RollupWatermark(name={self.name}, watermark={self.watermark})>"
+
+
+class RollupDirtyDay(Base):
+    """
+    A UTC day whose task metrics changed since the rollup job last ran.
+
+    Rows are written by triggers on tasks and claimed (deleted) by the job
+    in a short transaction before it rebuilds the day's periods; a failed
+    rebuild marks its claimed days again.
+    """
+
+    __tablename__ = "analytics_dirty_days"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    marked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        comment="When the day was first marked since the last claim",
+    )
+
+    def __repr__(self) -> str:
+        """String representation of RollupDirtyDay."""
+        return f"<RollupDirtyDay(day={self.day})>"
+
+
+# ============= Dirty Day Triggers =============
+
+# Task columns read by the rollups; updates of other columns mark nothing
+ROLLUP_TASK_COLUMNS = (
+    "created_at",
+    "completed_at",
+    "started_at",
+    "status",
+    "project_id",
+    "assignee_id",
+)
+
+
+def _mark(timestamps: str) -> str:
+    """Insert the UTC days of a (ts) relation, locking keys in order."""
+    return f"""
+        INSERT INTO analytics_dirty_days (day)
+        SELECT DISTINCT (ts AT TIME ZONE 'UTC')::date AS day
+        FROM ({timestamps}) AS changes
+        WHERE ts IS NOT NULL
+        ORDER BY day
+        ON CONFLICT (day) DO NOTHING;"""
+
+
+def _timestamps(rows: str) -> str:
+    """Created and completed timestamps of a transition table."""
+    return f"SELECT created_at AS ts FROM {rows} UNION ALL SELECT completed_at FROM {rows}"
+
+
+_OLD_COLUMNS = ", ".join(f"o.{column}" for column in ROLLUP_TASK_COLUMNS)
+_NEW_COLUMNS = ", ".join(f"n.{column}" for column in ROLLUP_TASK_COLUMNS)
+
+# Rows whose rollup columns changed contribute their old and new days, so
+# reopening a task (completed_at cleared) rebuilds its old completion day
+_UPDATED = (
+    f"SELECT ts FROM old_rows o JOIN new_rows n ON n.id = o.id "
+    f"CROSS JOIN LATERAL (VALUES (o.created_at), (o.completed_at), "
+    f"(n.created_at), (n.completed_at)) AS days(ts) "
+    f"WHERE ({_OLD_COLUMNS}) IS DISTINCT FROM ({_NEW_COLUMNS})"
+)
+
+ROLLUP_DIRTY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION mark_analytics_dirty_days() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_mark(_timestamps("new_rows"))}
+    ELSIF TG_OP = 'UPDATE' THEN{_mark(_UPDATED)}
+    ELSE{_mark(_timestamps("old_rows"))}
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# One statement-level trigger per operation (transition tables differ)
+ROLLUP_DIRTY_TRIGGERS = [
+    "CREATE TRIGGER tasks_analytics_insert AFTER INSERT ON tasks "
+    "REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mark_analytics_dirty_days()",
+    "CREATE TRIGGER tasks_analytics_update AFTER UPDATE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mark_analytics_dirty_days()",
+    "CREATE TRIGGER tasks_analytics_delete AFTER DELETE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mark_analytics_dirty_days()",
+]
+
+# Install the triggers whenever tasks is created from metadata (migrations do it themselves)
+for _statement in [ROLLUP_DIRTY_FUNCTION, *ROLLUP_DIRTY_TRIGGERS]:
+    event.listen(
+        Task.__table__,
+        "after_create",
+        DDL(_statement.replace("%", "%%")).execute_if(dialect="postgresql"),
+    )
@@ -5,13 +5,14 @@ This module provides the foundation for all database models, including:
 - DeclarativeBase for SQLAlchemy ORM
 - BaseModel mixin with id and timestamps
 - SoftDeleteMixin for soft deletion support
+- Default partitions for monthly partitioned tables
 """
 
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, func
+from sqlalchemy import DDL, Boolean, DateTime, Table, event, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -80,3 +81,24 @@ class SoftDeleteMixin:
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, comment="Timestamp when record was soft deleted"
     )
+
+
+def add_default_partition(table: Table) -> None:
+    """
+    Create a DEFAULT partition whenever a partitioned table is created from metadata.
+
+    Monthly partitions are created by migrations and the partition
+    maintenance job. Tables created with ``Base.metadata.create_all``
+    (tests, local setups) only get this catch-all partition, which keeps
+    them writable.
+
+    Args:
+        table: Table declared with ``postgresql_partition_by``
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT").execute_if(
+            dialect="postgresql"
+        ),
+    )
@@ -24,9 +24,12 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.schema import DDL
 
 from ardha.models.base import Base, BaseModel
 
@@ -224,6 +227,20 @@ class File(Base, BaseModel):
         Index(
             "ix_file_last_modified", "last_modified_at", postgresql_ops={"last_modified_at": "DESC"}
         ),
+        # Trigram indexes for fuzzy path search and substring content search (pg_trgm)
+        Index(
+            "ix_file_path_trgm",
+            "path",
+            postgresql_using="gin",
+            postgresql_ops={"path": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_file_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_where=text("content IS NOT NULL"),
+        ),
         # Check constraints
         CheckConstraint("size_bytes >= 0", name="ck_file_size_bytes"),
         CheckConstraint(
@@ -378,3 +395,11 @@ class File(Base, BaseModel):
             Hex-encoded SHA-256 hash
         """
         return sha256(content.encode("utf-8")).hexdigest()
+
+
+# The trigram indexes need pg_trgm; create it when the table is created outside migrations
+event.listen(
+    File.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -144,6 +144,7 @@ class GitHubIntegration(Base, BaseModel):
         webhook_events: List of subscribed webhook events
         is_active: Whether integration is active
         last_sync_at: Last successful sync timestamp
+        prs_synced_at: Latest PR updated_at seen by sync (incremental cursor)
         sync_error: Last sync error message
         connection_status: Connection state
         total_prs: Total pull requests tracked
@@ -292,6 +293,12 @@ class GitHubIntegration(Base, BaseModel):
         comment="Last sync error message",
     )
 
+    prs_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Latest pull request updated_at seen by sync (incremental cursor)",
+    )
+
     connection_status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
@@ -3,6 +3,8 @@ GitHub Webhook models for event processing.
 
 This module defines the GitHubWebhookDelivery model for tracking webhook
 events from GitHub, including processing status and error handling.
+Deliveries are range-partitioned by month on received_at, so old
+payloads are pruned by dropping whole partitions.
 """
 
 from datetime import datetime, timezone
@@ -25,7 +27,7 @@ from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from ardha.models.base import Base, BaseModel
+from ardha.models.base import Base, BaseModel, add_default_partition
 
 if TYPE_CHECKING:
     from ardha.models.github_integration import GitHubIntegration
@@ -79,7 +81,6 @@ class GitHubWebhookDelivery(Base, BaseModel):
     delivery_id: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        unique=True,
         index=True,
         comment="GitHub's delivery UUID",
     )
@@ -198,8 +199,11 @@ class GitHubWebhookDelivery(Base, BaseModel):
 
     # ============= Audit Fields =============
 
+    # Part of the primary key because the table is partitioned by month on it
     received_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
         nullable=False,
         server_default=func.now(),
         index=True,
@@ -224,8 +228,11 @@ class GitHubWebhookDelivery(Base, BaseModel):
     # ============= Constraints & Indexes =============
 
     __table_args__ = (
-        # Unique constraint: GitHub guarantees delivery_id uniqueness
-        UniqueConstraint("delivery_id", name="uq_webhook_delivery_id"),
+        # Unique constraint: GitHub guarantees delivery_id uniqueness. Unique
+        # constraints on a partitioned table must include the partition key;
+        # redeliveries are caught by the webhook queue's dedup keys and the
+        # delivery lookup before insert.
+        UniqueConstraint("delivery_id", "received_at", name="uq_webhook_delivery_id"),
         # Index for integration queries
         Index("ix_webhook_integration", "github_integration_id"),
         # Index for event type queries
@@ -258,8 +265,12 @@ class GitHubWebhookDelivery(Base, BaseModel):
             "retry_count >= 0",
             name="ck_webhook_retry_count",
         ),
+        {"postgresql_partition_by": "RANGE (received_at)"},
     )
 
+    # Rows are identified by id alone; received_at only routes them to a partition
+    __mapper_args__ = {"primary_key": ["id"]}
+
     # ============= Methods =============
 
     def __repr__(self) -> str:
@@ -330,3 +341,6 @@ class GitHubWebhookDelivery(Base, BaseModel):
         """
         self.retry_count += 1
         self.status = "pending"
+
+
+add_default_partition(GitHubWebhookDelivery.__table__)
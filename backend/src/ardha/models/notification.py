@@ -6,19 +6,21 @@ This module defines the Notification model with support for:
 - Read/unread status tracking
 - Entity linking (tasks, projects, databases, chats)
 - Optional expiration for temporary notifications
+- Email delivery tracking for instant emails and digests
 - Rich notification data with JSON metadata
+- Monthly range partitions on created_at, so retention drops whole months
 """
 
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ardha.models.base import Base, BaseModel
+from ardha.models.base import Base, BaseModel, add_default_partition
 
 if TYPE_CHECKING:
     from ardha.models.user import User
@@ -41,6 +43,7 @@ class Notification(Base, BaseModel):
         link_id: UUID of linked entity
         is_read: Whether notification has been read
         read_at: When notification was marked as read
+        emailed_at: When notification was emailed (instantly or in a digest)
         expires_at: Optional expiration timestamp
     """
 
@@ -117,10 +120,18 @@ class Notification(Base, BaseModel):
         comment="When notification was marked as read",
     )
 
+    emailed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When notification was emailed (instantly or in a digest)",
+    )
+
     # ============= Timestamps =============
 
+    # Part of the primary key because the table is partitioned by month on it
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
         index=True,
@@ -153,6 +164,13 @@ class Notification(Base, BaseModel):
             "is_read",
             "created_at",
         ),
+        # Partial index for the digest builder's pending-email scan
+        Index(
+            "ix_notifications_email_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("emailed_at IS NULL AND is_read = false"),
+        ),
         # Check constraint for valid notification types
         CheckConstraint(
             "type IN ('task_assigned', 'task_completed', 'task_overdue', "
@@ -169,8 +187,12 @@ class Notification(Base, BaseModel):
             "length(message) <= 1000",
             name="ck_notification_message_length",
         ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
+    # Rows are identified by id alone; created_at only routes them to a partition
+    __mapper_args__ = {"primary_key": ["id"]}
+
     # ============= Helper Methods =============
 
     def mark_as_read(self) -> None:
@@ -197,3 +219,6 @@ class Notification(Base, BaseModel):
             f"user_id={self.user_id}, "
             f"is_read={self.is_read})>"
         )
+
+
+add_default_partition(Notification.__table__)
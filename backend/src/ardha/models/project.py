@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ardha.models.base import Base, BaseModel
@@ -46,6 +46,7 @@ class Project(BaseModel, Base):
         tech_stack: JSON array of technology tags (e.g., ["Python", "React"])
         git_repo_url: Optional Git repository URL
         git_branch: Default Git branch name (default: 'main')
+        files_synced_sha: Commit SHA the file index was last synced from
         openspec_enabled: Whether OpenSpec is enabled for this project
         openspec_path: Path to OpenSpec directory within project
         is_archived: Whether project is archived (soft delete)
@@ -98,6 +99,19 @@ class Project(BaseModel, Base):
         String(255), default="main", nullable=False, comment="Default Git branch name"
     )
 
+    files_synced_sha: Mapped[str | None] = mapped_column(
+        String(40), nullable=True, comment="Commit SHA the file index was last synced from"
+    )
+
+    # Task numbering
+    last_task_number: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Last task identifier number allocated in this project",
+    )
+
     # OpenSpec configuration
     openspec_enabled: Mapped[bool] = mapped_column(
         Boolean, default=True, nullable=False, comment="Whether OpenSpec is enabled"
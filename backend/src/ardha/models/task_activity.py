@@ -2,17 +2,20 @@
 TaskActivity model for audit logging.
 
 This module defines the activity/audit log for all task changes,
-allowing full history tracking of task modifications.
+allowing full history tracking of task modifications. The table is
+range-partitioned by month on created_at, so old history is pruned by
+dropping whole partitions.
 """
 
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ardha.models.base import Base, BaseModel
+from ardha.models.base import Base, BaseModel, add_default_partition
 
 if TYPE_CHECKING:
     from ardha.models.task import Task
@@ -82,7 +85,15 @@ class TaskActivity(Base, BaseModel):
         comment="Optional user comment explaining the change",
     )
 
-    # created_at inherited from BaseModel
+    # Overrides BaseModel.created_at: part of the primary key because the
+    # table is partitioned by month on it
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        comment="Timestamp when record was created",
+    )
 
     # ============= Relationships =============
 
@@ -98,11 +109,19 @@ class TaskActivity(Base, BaseModel):
         back_populates="task_activities",
     )
 
+    __table_args__ = ({"postgresql_partition_by": "RANGE (created_at)"},)
+
+    # Rows are identified by id alone; created_at only routes them to a partition
+    __mapper_args__ = {"primary_key": ["id"]}
+
     def __repr__(self) -> str:
         """String representation of TaskActivity."""
         return f"<TaskActivity(task_id={self.task_id}, action={self.action})>"
 
 
+add_default_partition(TaskActivity.__table__)
+
+
 # Common activity action types (for reference):
 ACTIVITY_ACTIONS = {
     "created": "Task created",
@@ -0,0 +1,159 @@
+"""
+TaskAggregate model for denormalized task counts.
+
+This module defines per-project and per-milestone task counters by status
+(count and estimate hours). They are maintained by statement-level
+triggers on the tasks table, so every write path (ORM, bulk INSERT,
+set-based UPDATE, cascading deletes) adjusts them in the same transaction
+as the task change, and roadmap and summary views read them instead of
+scanning tasks.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DDL, DateTime, Float, ForeignKey, Integer, String, event, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ardha.models.base import Base
+from ardha.models.task import Task
+
+
+class TaskAggregate(Base):
+    """
+    Task counters for one scope (project or milestone) and status.
+
+    A project row counts all of the project's tasks; a milestone row counts
+    the tasks linked to that milestone. Rows are created on first use and
+    stay (possibly at zero) until the reconciliation job removes them.
+    """
+
+    __tablename__ = "task_aggregates"
+
+    # ============= Primary Fields =============
+
+    scope_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        comment="Project or milestone ID, depending on scope",
+    )
+
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    scope: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Scope type: project or milestone",
+    )
+
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # ============= Counters =============
+
+    task_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    estimate_hours: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default="0",
+        comment="Sum of estimate_hours of the counted tasks",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of TaskAggregate."""
+        return (
+            f"<TaskAggregate(scope={self.scope}, scope_id={self.scope_id}, "
+            f"status={self.status}, count={self.task_count})>"
+        )
+
+
+# ============= Maintenance Triggers =============
+
+
+def _deltas(rows: str, sign: str) -> str:
+    """Project and milestone counter deltas of a transition table."""
+    return (
+        f"SELECT project_id AS scope_id, 'project' AS scope, project_id, status, "
+        f"{sign}1 AS task_count, {sign}coalesce(estimate_hours, 0) AS estimate_hours "
+        f"FROM {rows} "
+        f"UNION ALL "
+        f"SELECT milestone_id, 'milestone', project_id, status, "
+        f"{sign}1, {sign}coalesce(estimate_hours, 0) "
+        f"FROM {rows} WHERE milestone_id IS NOT NULL"
+    )
+
+
+def _apply(deltas: str) -> str:
+    """
+    Upsert summed deltas into task_aggregates.
+
+    Changes that cancel out (an UPDATE of unrelated columns) write nothing,
+    rows are locked in key order so concurrent statements cannot deadlock,
+    and deltas for projects or milestones being deleted are skipped.
+    """
+    return f"""
+        INSERT INTO task_aggregates
+            (scope_id, status, scope, project_id, task_count, estimate_hours, updated_at)
+        SELECT scope_id, status, scope, project_id, sum(task_count), sum(estimate_hours), now()
+        FROM ({deltas}) AS deltas
+        WHERE EXISTS (SELECT 1 FROM projects WHERE projects.id = deltas.project_id)
+          AND (deltas.scope = 'project'
+               OR EXISTS (SELECT 1 FROM milestones WHERE milestones.id = deltas.scope_id))
+        GROUP BY scope_id, status, scope, project_id
+        HAVING sum(task_count) <> 0 OR sum(estimate_hours) <> 0
+        ORDER BY scope_id, status
+        ON CONFLICT (scope_id, status) DO UPDATE SET
+            task_count = task_aggregates.task_count + EXCLUDED.task_count,
+            estimate_hours = task_aggregates.estimate_hours + EXCLUDED.estimate_hours,
+            updated_at = EXCLUDED.updated_at;"""
+
+
+_INSERTED = _deltas("new_rows", "")
+_DELETED = _deltas("old_rows", "-")
+
+TASK_AGGREGATE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION apply_task_aggregate_deltas() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_apply(_INSERTED)}
+    ELSIF TG_OP = 'UPDATE' THEN{_apply(f"{_INSERTED} UNION ALL {_DELETED}")}
+    ELSE{_apply(_DELETED)}
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# One statement-level trigger per operation (transition tables differ)
+TASK_AGGREGATE_TRIGGERS = [
+    "CREATE TRIGGER tasks_aggregate_insert AFTER INSERT ON tasks "
+    "REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION apply_task_aggregate_deltas()",
+    "CREATE TRIGGER tasks_aggregate_update AFTER UPDATE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION apply_task_aggregate_deltas()",
+    "CREATE TRIGGER tasks_aggregate_delete AFTER DELETE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION apply_task_aggregate_deltas()",
+]
+
+# Install the triggers whenever tasks is created from metadata (migrations do it themselves)
+for _statement in [TASK_AGGREGATE_FUNCTION, *TASK_AGGREGATE_TRIGGERS]:
+    event.listen(
+        Task.__table__,
+        "after_create",
+        DDL(_statement.replace("%", "%%")).execute_if(dialect="postgresql"),
+    )
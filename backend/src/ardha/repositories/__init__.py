@@ -7,6 +7,7 @@ between the service layer and SQLAlchemy models.
 """
 
 from ardha.repositories.ai_usage_repository import AIUsageRepository
+from ardha.repositories.analytics_repository import AnalyticsRepository
 from ardha.repositories.chat_repository import ChatRepository
 from ardha.repositories.database_entry_repository import DatabaseEntryRepository
 from ardha.repositories.database_property_repository import DatabasePropertyRepository
@@ -19,8 +20,10 @@ from ardha.repositories.milestone_repository import MilestoneRepository
 from ardha.repositories.notification_preference_repository import NotificationPreferenceRepository
 from ardha.repositories.notification_repository import NotificationRepository
 from ardha.repositories.openspec import OpenSpecRepository
+from ardha.repositories.partition_repository import PartitionRepository
 from ardha.repositories.project_repository import ProjectRepository
 from ardha.repositories.pull_request import PullRequestRepository
+from ardha.repositories.task_aggregate_repository import TaskAggregateRepository
 from ardha.repositories.task_repository import TaskRepository
 from ardha.repositories.user_repository import UserRepository
 
@@ -28,10 +31,12 @@ __all__ = [
     "UserRepository",
     "ProjectRepository",
     "TaskRepository",
+    "TaskAggregateRepository",
     "MilestoneRepository",
     "ChatRepository",
     "MessageRepository",
     "AIUsageRepository",
+    "AnalyticsRepository",
     "OpenSpecRepository",
     "FileRepository",
     "GitCommitRepository",
@@ -42,4 +47,5 @@ __all__ = [
     "DatabaseEntryRepository",
     "NotificationRepository",
     "NotificationPreferenceRepository",
+    "PartitionRepository",
 ]
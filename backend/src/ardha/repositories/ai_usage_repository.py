@@ -3,20 +3,28 @@ AI Usage repository for data access abstraction.
 
 This module provides repository pattern implementation for AIUsage model,
 handling all database operations related to AI operation tracking and analytics.
+
+Every logged operation is also added to its ai_usage_daily row in the same
+transaction; totals, statistics and reports read that aggregate rather than
+the per-operation log.
 """
 
 import logging
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List
+from typing import Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ardha.models.ai_usage import AIOperation, AIUsage
+from ardha.models.ai_usage_daily import AIUsageDaily
+from ardha.models.project import Project
+from ardha.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +62,7 @@ class AIUsageRepository:
         usage_date: date | None = None,
     ) -> AIUsage:
         """
-        Create a new AI usage record.
+        Create a new AI usage record and add it to the daily aggregate.
 
         Args:
             user_id: UUID of user who performed the operation
@@ -108,6 +116,7 @@ class AIUsageRepository:
             self.db.add(ai_usage)
             await self.db.flush()
             await self.db.refresh(ai_usage)
+            await self._add_to_daily(ai_usage)
 
             logger.info(f"Created AI usage record for user {user_id}: {model_name} {operation}")
             return ai_usage
@@ -206,6 +215,45 @@ class AIUsageRepository:
             )
             raise
 
+    async def get_daily_cost(
+        self,
+        usage_date: date,
+        user_id: Optional[UUID] = None,
+        project_id: Optional[UUID] = None,
+    ) -> Decimal:
+        """
+        Get a user's or project's total cost on one day from the daily aggregate.
+
+        Args:
+            usage_date: Day to total
+            user_id: UUID of user (optional)
+            project_id: UUID of project (optional)
+
+        Returns:
+            Total cost as Decimal
+
+        Raises:
+            ValueError: If neither user_id nor project_id is given
+            SQLAlchemyError: If database query fails
+        """
+        if user_id is None and project_id is None:
+            raise ValueError("user_id or project_id is required")
+
+        try:
+            stmt = select(func.coalesce(func.sum(AIUsageDaily.cost), 0)).where(
+                AIUsageDaily.usage_date == usage_date
+            )
+            if user_id is not None:
+                stmt = stmt.where(AIUsageDaily.user_id == user_id)
+            if project_id is not None:
+                stmt = stmt.where(AIUsageDaily.project_id == project_id)
+
+            total_cost = await self.db.scalar(stmt)
+            return Decimal(total_cost) if total_cost is not None else Decimal("0.00")
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting daily cost for {usage_date}: {e}", exc_info=True)
+            raise
+
     async def get_user_total_cost(
         self,
         user_id: UUID,
@@ -231,11 +279,11 @@ class AIUsageRepository:
             raise ValueError("start_date must be before or equal to end_date")
 
         try:
-            stmt = select(func.coalesce(func.sum(AIUsage.cost), 0)).where(
+            stmt = select(func.coalesce(func.sum(AIUsageDaily.cost), 0)).where(
                 and_(
-                    AIUsage.user_id == user_id,
-                    AIUsage.usage_date >= start_date,
-                    AIUsage.usage_date <= end_date,
+                    AIUsageDaily.user_id == user_id,
+                    AIUsageDaily.usage_date >= start_date,
+                    AIUsageDaily.usage_date <= end_date,
                 )
             )
 
@@ -279,70 +327,9 @@ class AIUsageRepository:
             raise ValueError("start_date must be before or equal to end_date")
 
         try:
-            # Get aggregate stats
-            agg_stmt = select(
-                func.coalesce(func.sum(AIUsage.cost), 0).label("total_cost"),
-                func.coalesce(func.sum(AIUsage.tokens_input), 0).label("total_tokens_input"),
-                func.coalesce(func.sum(AIUsage.tokens_output), 0).label("total_tokens_output"),
-            ).where(
-                and_(
-                    AIUsage.user_id == user_id,
-                    AIUsage.usage_date >= start_date,
-                    AIUsage.usage_date <= end_date,
-                )
-            )
-
-            agg_result = await self.db.execute(agg_stmt)
-            agg_row = agg_result.first()
-
-            # Get operation counts
-            op_stmt = (
-                select(
-                    AIUsage.operation,
-                    func.count(AIUsage.id).label("count"),
-                )
-                .where(
-                    and_(
-                        AIUsage.user_id == user_id,
-                        AIUsage.usage_date >= start_date,
-                        AIUsage.usage_date <= end_date,
-                    )
-                )
-                .group_by(AIUsage.operation)
-            )
-
-            op_result = await self.db.execute(op_stmt)
-            operation_counts = {row.operation: row.count for row in op_result}
-
-            # Get model usage
-            model_stmt = (
-                select(
-                    AIUsage.model_name,
-                    func.count(AIUsage.id).label("count"),
-                    func.coalesce(func.sum(AIUsage.cost), 0).label("cost"),
-                )
-                .where(
-                    and_(
-                        AIUsage.user_id == user_id,
-                        AIUsage.usage_date >= start_date,
-                        AIUsage.usage_date <= end_date,
-                    )
-                )
-                .group_by(AIUsage.model_name)
+            return await self._get_usage_stats(
+                AIUsageDaily.user_id == user_id, start_date, end_date
             )
-
-            model_result = await self.db.execute(model_stmt)
-            model_usage = {
-                row.model_name: {"count": row.count, "cost": row.cost} for row in model_result
-            }
-
-            return {
-                "total_cost": agg_row.total_cost if agg_row else Decimal("0.00"),
-                "total_tokens_input": agg_row.total_tokens_input if agg_row else 0,
-                "total_tokens_output": agg_row.total_tokens_output if agg_row else 0,
-                "operation_counts": operation_counts,
-                "model_usage": model_usage,
-            }
         except SQLAlchemyError as e:
             logger.error(f"Error getting usage stats for user {user_id}: {e}", exc_info=True)
             raise
@@ -372,70 +359,9 @@ class AIUsageRepository:
             raise ValueError("start_date must be before or equal to end_date")
 
         try:
-            # Get aggregate stats
-            agg_stmt = select(
-                func.coalesce(func.sum(AIUsage.cost), 0).label("total_cost"),
-                func.coalesce(func.sum(AIUsage.tokens_input), 0).label("total_tokens_input"),
-                func.coalesce(func.sum(AIUsage.tokens_output), 0).label("total_tokens_output"),
-            ).where(
-                and_(
-                    AIUsage.project_id == project_id,
-                    AIUsage.usage_date >= start_date,
-                    AIUsage.usage_date <= end_date,
-                )
-            )
-
-            agg_result = await self.db.execute(agg_stmt)
-            agg_row = agg_result.first()
-
-            # Get operation counts
-            op_stmt = (
-                select(
-                    AIUsage.operation,
-                    func.count(AIUsage.id).label("count"),
-                )
-                .where(
-                    and_(
-                        AIUsage.project_id == project_id,
-                        AIUsage.usage_date >= start_date,
-                        AIUsage.usage_date <= end_date,
-                    )
-                )
-                .group_by(AIUsage.operation)
+            return await self._get_usage_stats(
+                AIUsageDaily.project_id == project_id, start_date, end_date
             )
-
-            op_result = await self.db.execute(op_stmt)
-            operation_counts = {row.operation: row.count for row in op_result}
-
-            # Get model usage
-            model_stmt = (
-                select(
-                    AIUsage.model_name,
-                    func.count(AIUsage.id).label("count"),
-                    func.coalesce(func.sum(AIUsage.cost), 0).label("cost"),
-                )
-                .where(
-                    and_(
-                        AIUsage.project_id == project_id,
-                        AIUsage.usage_date >= start_date,
-                        AIUsage.usage_date <= end_date,
-                    )
-                )
-                .group_by(AIUsage.model_name)
-            )
-
-            model_result = await self.db.execute(model_stmt)
-            model_usage = {
-                row.model_name: {"count": row.count, "cost": row.cost} for row in model_result
-            }
-
-            return {
-                "total_cost": agg_row.total_cost if agg_row else Decimal("0.00"),
-                "total_tokens_input": agg_row.total_tokens_input if agg_row else 0,
-                "total_tokens_output": agg_row.total_tokens_output if agg_row else 0,
-                "operation_counts": operation_counts,
-                "model_usage": model_usage,
-            }
         except SQLAlchemyError as e:
             logger.error(f"Error getting usage stats for project {project_id}: {e}", exc_info=True)
             raise
@@ -464,18 +390,18 @@ class AIUsageRepository:
 
             stmt = (
                 select(
-                    AIUsage.usage_date,
-                    func.coalesce(func.sum(AIUsage.cost), 0).label("daily_cost"),
+                    AIUsageDaily.usage_date,
+                    func.coalesce(func.sum(AIUsageDaily.cost), 0).label("daily_cost"),
                 )
                 .where(
                     and_(
-                        AIUsage.user_id == user_id,
-                        AIUsage.usage_date >= start_date,
-                        AIUsage.usage_date <= end_date,
+                        AIUsageDaily.user_id == user_id,
+                        AIUsageDaily.usage_date >= start_date,
+                        AIUsageDaily.usage_date <= end_date,
                     )
                 )
-                .group_by(AIUsage.usage_date)
-                .order_by(AIUsage.usage_date.desc())
+                .group_by(AIUsageDaily.usage_date)
+                .order_by(AIUsageDaily.usage_date.desc())
             )
 
             result = await self.db.execute(stmt)
@@ -483,3 +409,155 @@ class AIUsageRepository:
         except SQLAlchemyError as e:
             logger.error(f"Error getting daily cost summary for user {user_id}: {e}", exc_info=True)
             raise
+
+    async def get_daily_rows(
+        self,
+        start_date: date,
+        end_date: date,
+        with_names: bool = False,
+    ) -> List[Any]:
+        """
+        Get the daily aggregate rows of all users within a date range.
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            with_names: Also return username, email and project_name columns
+
+        Returns:
+            Rows with usage_date, user_id, project_id, model_name, operation,
+            operations, tokens_input, tokens_output and cost
+
+        Raises:
+            ValueError: If date range is invalid
+            SQLAlchemyError: If database query fails
+        """
+        if start_date > end_date:
+            raise ValueError("start_date must be before or equal to end_date")
+
+        try:
+            columns = [
+                AIUsageDaily.usage_date,
+                AIUsageDaily.user_id,
+                AIUsageDaily.project_id,
+                AIUsageDaily.model_name,
+                AIUsageDaily.operation,
+                AIUsageDaily.operations,
+                AIUsageDaily.tokens_input,
+                AIUsageDaily.tokens_output,
+                AIUsageDaily.cost,
+            ]
+            stmt = select(*columns)
+            if with_names:
+                stmt = (
+                    select(
+                        *columns,
+                        User.username,
+                        User.email,
+                        Project.name.label("project_name"),
+                    )
+                    .join(User, AIUsageDaily.user_id == User.id)
+                    .join(Project, AIUsageDaily.project_id == Project.id, isouter=True)
+                )
+            stmt = stmt.where(
+                and_(
+                    AIUsageDaily.usage_date >= start_date,
+                    AIUsageDaily.usage_date <= end_date,
+                )
+            )
+
+            result = await self.db.execute(stmt)
+            return list(result.all())
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Error fetching daily usage rows from {start_date} to {end_date}: {e}",
+                exc_info=True,
+            )
+            raise
+
+    # ============= Daily Aggregate Helpers =============
+
+    async def _add_to_daily(self, ai_usage: AIUsage) -> None:
+        """
+        Add a logged operation to its daily aggregate row.
+
+        Args:
+            ai_usage: Flushed AIUsage record
+        """
+        stmt = pg_insert(AIUsageDaily).values(
+            usage_date=ai_usage.usage_date,
+            user_id=ai_usage.user_id,
+            project_id=ai_usage.project_id,
+            model_name=ai_usage.model_name,
+            operation=ai_usage.operation,
+            operations=1,
+            tokens_input=ai_usage.tokens_input,
+            tokens_output=ai_usage.tokens_output,
+            cost=ai_usage.cost,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_ai_usage_daily_key",
+            set_={
+                "operations": AIUsageDaily.operations + 1,
+                "tokens_input": AIUsageDaily.tokens_input + stmt.excluded.tokens_input,
+                "tokens_output": AIUsageDaily.tokens_output + stmt.excluded.tokens_output,
+                "cost": AIUsageDaily.cost + stmt.excluded.cost,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def _get_usage_stats(self, scope_filter: Any, start_date: date, end_date: date) -> dict:
+        """
+        Build usage statistics from one grouped query over the daily aggregate.
+
+        Args:
+            scope_filter: Condition selecting the user's or project's rows
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            Dictionary with usage statistics (see get_user_usage_stats)
+        """
+        stmt = (
+            select(
+                AIUsageDaily.operation,
+                AIUsageDaily.model_name,
+                func.sum(AIUsageDaily.operations).label("count"),
+                func.sum(AIUsageDaily.tokens_input).label("tokens_input"),
+                func.sum(AIUsageDaily.tokens_output).label("tokens_output"),
+                func.sum(AIUsageDaily.cost).label("cost"),
+            )
+            .where(
+                and_(
+                    scope_filter,
+                    AIUsageDaily.usage_date >= start_date,
+                    AIUsageDaily.usage_date <= end_date,
+                )
+            )
+            .group_by(AIUsageDaily.operation, AIUsageDaily.model_name)
+        )
+
+        result = await self.db.execute(stmt)
+
+        total_cost = Decimal("0.00")
+        total_tokens_input = 0
+        total_tokens_output = 0
+        operation_counts: dict = {}
+        model_usage: dict = {}
+        for row in result:
+            total_cost += row.cost
+            total_tokens_input += row.tokens_input
+            total_tokens_output += row.tokens_output
+            operation_counts[row.operation] = operation_counts.get(row.operation, 0) + row.count
+            usage = model_usage.setdefault(row.model_name, {"count": 0, "cost": Decimal("0.00")})
+            usage["count"] += row.count
+            usage["cost"] += row.cost
+
+        return {
+            "total_cost": total_cost,
+            "total_tokens_input": total_tokens_input,
+            "total_tokens_output": total_tokens_output,
+            "operation_counts": operation_counts,
+            "model_usage": model_usage,
+        }
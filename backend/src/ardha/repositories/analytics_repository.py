@@ -0,0 +1,326 @@
+"""
+Repository for precomputed analytics rollups.
+
+This module builds and reads the daily and weekly per-project and
+per-user metrics in analytics_rollups:
+- Watermark tracking so each run only revisits changed periods
+- Claiming the days touched by task changes (marked by triggers) and
+  finding the days with AI usage changes
+- Set-based rebuild of whole periods (counts, cycle time percentiles, AI cost)
+- Chart reads of one scope's series over a date range
+"""
+
+import logging
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import Date, bindparam, delete, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.models.ai_usage_daily import AIUsageDaily
+from ardha.models.analytics_rollup import AnalyticsRollup, RollupDirtyDay, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+# Rollup granularities (also their date_trunc units)
+ROLLUP_PERIODS = ("day", "week")
+
+ROLLUP_SCOPES = ("project", "user")
+
+# Rebuilds the rows of the given periods from tasks and ai_usage_daily. Projects
+# and users are rolled up together with GROUPING SETS; the user of a task
+# is its assignee, the user of an AI operation the one who ran it.
+REBUILD_SQL = """
+WITH task_events AS (
+    SELECT date_trunc(:period, created_at AT TIME ZONE 'UTC')::date AS period_start,
+           project_id, assignee_id, 1 AS created, 0 AS completed, NULL::float8 AS cycle_hours
+    FROM tasks
+    WHERE created_at >= :range_start AND created_at < :range_end
+    UNION ALL
+    SELECT date_trunc(:period, completed_at AT TIME ZONE 'UTC')::date,
+           project_id, assignee_id, 0, 1,
+           extract(epoch FROM completed_at - started_at) / 3600
+    FROM tasks
+    WHERE status = 'done' AND completed_at >= :range_start AND completed_at < :range_end
+),
+task_rollups AS (
+    SELECT period_start,
+           CASE WHEN grouping(project_id) = 0 THEN 'project' ELSE 'user' END AS scope,
+           CASE WHEN grouping(project_id) = 0 THEN project_id ELSE assignee_id END AS scope_id,
+           sum(created) AS tasks_created,
+           sum(completed) AS tasks_completed,
+           percentile_cont(0.5) WITHIN GROUP (ORDER BY cycle_hours) AS cycle_p50,
+           percentile_cont(0.9) WITHIN GROUP (ORDER BY cycle_hours) AS cycle_p90
+    FROM task_events
+    WHERE period_start = ANY(:starts)
+    GROUP BY period_start, GROUPING SETS ((project_id), (assignee_id))
+    HAVING grouping(project_id) = 0 OR assignee_id IS NOT NULL
+),
+ai_events AS (
+    SELECT date_trunc(:period, usage_date)::date AS period_start,
+           project_id, user_id, operations, tokens_input + tokens_output AS tokens, cost
+    FROM ai_usage_daily
+    WHERE usage_date >= CAST(:range_start AS date) AND usage_date < CAST(:range_end AS date)
+),
+ai_rollups AS (
+    SELECT period_start,
+           CASE WHEN grouping(project_id) = 0 THEN 'project' ELSE 'user' END AS scope,
+           CASE WHEN grouping(project_id) = 0 THEN project_id ELSE user_id END AS scope_id,
+           sum(operations) AS ai_operations,
+           sum(tokens) AS ai_tokens,
+           sum(cost) AS ai_cost
+    FROM ai_events
+    WHERE period_start = ANY(:starts)
+    GROUP BY period_start, GROUPING SETS ((project_id), (user_id))
+    HAVING grouping(project_id) = 1 OR project_id IS NOT NULL
+)
+INSERT INTO analytics_rollups (
+    period, period_start, scope, scope_id,
+    tasks_created, tasks_completed, cycle_time_p50_hours, cycle_time_p90_hours,
+    ai_operations, ai_tokens, ai_cost, updated_at
+)
+SELECT CAST(:period AS varchar),
+       coalesce(t.period_start, a.period_start),
+       coalesce(t.scope, a.scope),
+       coalesce(t.scope_id, a.scope_id),
+       coalesce(t.tasks_created, 0),
+       coalesce(t.tasks_completed, 0),
+       t.cycle_p50,
+       t.cycle_p90,
+       coalesce(a.ai_operations, 0),
+       coalesce(a.ai_tokens, 0),
+       coalesce(a.ai_cost, 0),
+       now()
+FROM task_rollups t
+FULL OUTER JOIN ai_rollups a
+    ON a.period_start = t.period_start AND a.scope = t.scope AND a.scope_id = t.scope_id
+"""
+
+
+# ============= Period Helpers =============
+
+
+def period_start(day: date, period: str) -> date:
+    """
+    Get the first day of the period containing a day.
+
+    Args:
+        day: Any day
+        period: "day" or "week" (weeks start on Monday)
+
+    Returns:
+        First day of the period
+    """
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def period_length(period: str) -> timedelta:
+    """
+    Get the length of a rollup period.
+
+    Args:
+        period: "day" or "week"
+
+    Returns:
+        Period length
+    """
+    return timedelta(days=7 if period == "week" else 1)
+
+
+class AnalyticsRepository:
+    """Repository for building and reading analytics rollups."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy async session
+        """
+        self.db = db
+
+    # ============= Watermarks =============
+
+    async def get_watermark(self, name: str) -> Optional[datetime]:
+        """
+        Get how far a rollup job has read its sources.
+
+        Args:
+            name: Watermark name
+
+        Returns:
+            Watermark timestamp, or None before the first run
+        """
+        try:
+            return await self.db.scalar(
+                select(RollupWatermark.watermark).where(RollupWatermark.name == name)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error reading watermark {name}: {e}")
+            raise
+
+    async def set_watermark(self, name: str, watermark: datetime) -> None:
+        """
+        Record how far a rollup job has read its sources.
+
+        Args:
+            name: Watermark name
+            watermark: New watermark timestamp
+        """
+        stmt = pg_insert(RollupWatermark).values(name=name, watermark=watermark)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RollupWatermark.name],
+            set_={"watermark": stmt.excluded.watermark, "updated_at": func.now()},
+        )
+        try:
+            await self.db.execute(stmt)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error updating watermark {name}: {e}")
+            raise
+
+    # ============= Rollup Building =============
+
+    async def claim_dirty_days(self) -> Set[date]:
+        """
+        Claim the days marked dirty by task changes.
+
+        Task changes (inserts, updates of rollup columns including reopening,
+        and deletes) are marked in analytics_dirty_days by triggers; the rows
+        are deleted here. The caller must commit right away: task writes
+        marking a claimed day wait on the uncommitted delete of its row.
+
+        Returns:
+            Set of UTC days to rebuild
+        """
+        try:
+            result = await self.db.execute(delete(RollupDirtyDay).returning(RollupDirtyDay.day))
+        except SQLAlchemyError as e:
+            logger.error(f"Database error claiming dirty analytics days: {e}")
+            raise
+        return set(result.scalars().all())
+
+    async def mark_dirty_days(self, days: Iterable[date]) -> None:
+        """
+        Mark days to rebuild, e.g. claimed days whose rebuild failed.
+
+        Args:
+            days: UTC days to rebuild on the next run
+        """
+        days = sorted(set(days))
+        if not days:
+            return
+
+        stmt = pg_insert(RollupDirtyDay).values([{"day": day} for day in days])
+        try:
+            await self.db.execute(stmt.on_conflict_do_nothing(index_elements=[RollupDirtyDay.day]))
+        except SQLAlchemyError as e:
+            logger.error(f"Database error marking dirty analytics days: {e}")
+            raise
+
+    async def find_changed_days(self, since: datetime) -> Set[date]:
+        """
+        Find the days whose AI usage changed since a time.
+
+        Args:
+            since: Start of the AI usage change window
+
+        Returns:
+            Set of UTC days to rebuild
+        """
+        stmt = (
+            select(AIUsageDaily.usage_date)
+            .where(AIUsageDaily.usage_date >= since.astimezone(UTC).date())
+            .distinct()
+        )
+        try:
+            result = await self.db.execute(stmt)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error finding changed analytics days: {e}")
+            raise
+        return set(result.scalars().all())
+
+    async def rebuild(self, period: str, starts: Iterable[date]) -> int:
+        """
+        Recompute the rollup rows of whole periods.
+
+        Existing rows of those periods are replaced, so scopes without
+        activity any more disappear.
+
+        Args:
+            period: "day" or "week"
+            starts: First days of the periods to rebuild
+
+        Returns:
+            Number of rollup rows written
+        """
+        starts = sorted(set(starts))
+        if not starts:
+            return 0
+
+        range_start = datetime.combine(starts[0], time.min, tzinfo=UTC)
+        range_end = datetime.combine(starts[-1], time.min, tzinfo=UTC) + period_length(period)
+        try:
+            await self.db.execute(
+                delete(AnalyticsRollup).where(
+                    AnalyticsRollup.period == period, AnalyticsRollup.period_start.in_(starts)
+                )
+            )
+            result = await self.db.execute(
+                text(REBUILD_SQL).bindparams(bindparam("starts", type_=ARRAY(Date))),
+                {
+                    "period": period,
+                    "starts": starts,
+                    "range_start": range_start,
+                    "range_end": range_end,
+                },
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error rebuilding {period} analytics rollups: {e}")
+            raise
+        return result.rowcount or 0
+
+    # ============= Chart Queries =============
+
+    async def get_series(
+        self,
+        scope: str,
+        scope_id: UUID,
+        period: str,
+        start: date,
+        end: date,
+    ) -> List[AnalyticsRollup]:
+        """
+        Get one project's or user's rollups over a date range.
+
+        Args:
+            scope: "project" or "user"
+            scope_id: Project or user UUID
+            period: "day" or "week"
+            start: First period start included
+            end: Last period start included
+
+        Returns:
+            Rollups ordered by period start (periods without activity are absent)
+        """
+        try:
+            result = await self.db.execute(
+                select(AnalyticsRollup)
+                .where(
+                    AnalyticsRollup.scope_id == scope_id,
+                    AnalyticsRollup.period == period,
+                    AnalyticsRollup.scope == scope,
+                    AnalyticsRollup.period_start >= start,
+                    AnalyticsRollup.period_start <= end,
+                )
+                .order_by(AnalyticsRollup.period_start)
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Database error reading {scope} {scope_id} rollups: {e}")
+            raise
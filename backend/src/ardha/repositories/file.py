@@ -6,11 +6,12 @@ handling all database operations related to file management and git tracking.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -23,6 +24,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows per statement for bulk file writes (keeps bind parameters under limits)
+BULK_CHUNK_SIZE = 1000
+
 
 class FileRepository:
     """
@@ -228,49 +232,120 @@ class FileRepository:
             logger.error(f"Error listing files in directory {directory}: {e}", exc_info=True)
             raise
 
+    def _search_filter(
+        self,
+        project_id: UUID,
+        query: str,
+        search_content: bool,
+        file_types: Optional[List[FileType]],
+    ) -> Tuple[Any, Any]:
+        """
+        Build the WHERE clause and relevance score for a file search.
+
+        Paths match on a case-insensitive substring or on pg_trgm word
+        similarity (``%>``), both served by the ix_file_path_trgm index.
+        Content substring matches use ix_file_content_trgm.
+
+        Returns:
+            Tuple of (filter clause, relevance expression)
+        """
+        escaped = query.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+        path_match = File.path.ilike(f"%{escaped}%", escape="!")
+        matches = [path_match, File.path.op("%>")(query)]
+        if search_content:
+            matches.append(File.content.ilike(f"%{escaped}%", escape="!"))
+
+        conditions = [File.project_id == project_id, File.is_deleted.is_(False), or_(*matches)]
+        if file_types:
+            conditions.append(File.file_type.in_([file_type.value for file_type in file_types]))
+
+        # Exact name > name prefix > path substring; similarity breaks ties and
+        # ranks fuzzy-only and content-only matches below literal path hits
+        relevance = case(
+            (func.lower(File.name) == query.lower(), 3),
+            (File.name.ilike(f"{escaped}%", escape="!"), 2),
+            (path_match, 1),
+            else_=0,
+        ) + func.word_similarity(query, File.path)
+        return and_(*conditions), relevance
+
     async def search_files(
         self,
         project_id: UUID,
         query: str,
         search_content: bool = False,
+        file_types: Optional[List[FileType]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
     ) -> List[File]:
         """
-        Search files by name and optionally content.
+        Search files by fuzzy path match and optionally content.
+
+        Results are ranked by relevance (exact file name, name prefix, path
+        substring, trigram similarity), then shorter paths first.
 
         Args:
             project_id: UUID of the project
             query: Search query string
             search_content: Whether to search in file content
+            file_types: Optional file types to restrict results to
+            skip: Number of results to skip (pagination)
+            limit: Maximum number of results (None for all)
 
         Returns:
-            List of matching File objects
+            List of matching File objects, best match first
 
         Raises:
             SQLAlchemyError: If database query fails
         """
         try:
-            # Build search conditions
-            name_condition = File.name.ilike(f"%{query}%")
-            path_condition = File.path.ilike(f"%{query}%")
+            condition, relevance = self._search_filter(
+                project_id, query, search_content, file_types
+            )
+            stmt = (
+                select(File)
+                .where(condition)
+                .order_by(relevance.desc(), func.length(File.path), File.path)
+                .offset(skip)
+            )
+            if limit is not None:
+                stmt = stmt.limit(limit)
 
-            # Base conditions
-            base_conditions = [File.project_id == project_id, File.is_deleted.is_(False)]
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error searching files with query '{query}': {e}", exc_info=True)
+            raise
 
-            # Search conditions (name or path)
-            search_conditions = [name_condition, path_condition]
+    async def count_search_results(
+        self,
+        project_id: UUID,
+        query: str,
+        search_content: bool = False,
+        file_types: Optional[List[FileType]] = None,
+    ) -> int:
+        """
+        Count files matching a search.
 
-            # Add content search if requested
-            if search_content:
-                content_condition = File.content.ilike(f"%{query}%")
-                search_conditions.append(content_condition)
+        Args:
+            project_id: UUID of the project
+            query: Search query string
+            search_content: Whether to search in file content
+            file_types: Optional file types to restrict results to
 
-            stmt = select(File).where(and_(*base_conditions, or_(*search_conditions)))
+        Returns:
+            Number of matching files
 
-            stmt = stmt.order_by(File.path)
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            condition, _ = self._search_filter(project_id, query, search_content, file_types)
+            stmt = select(func.count()).select_from(File).where(condition)
             result = await self.session.execute(stmt)
-            return list(result.scalars().all())
+            return result.scalar_one()
         except SQLAlchemyError as e:
-            logger.error(f"Error searching files with query '{query}': {e}", exc_info=True)
+            logger.error(f"Error counting files for query '{query}': {e}", exc_info=True)
             raise
 
     async def update(self, file_id: UUID, update_data: Dict[str, Any]) -> Optional[File]:
@@ -625,3 +700,152 @@ class FileRepository:
         except SQLAlchemyError as e:
             logger.error(f"Error getting files modified since {since}: {e}", exc_info=True)
             raise
+
+    async def get_path_hashes(self, project_id: UUID) -> Dict[str, Tuple[Optional[str], bool]]:
+        """
+        Load the path index of a project in one query.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            Mapping of path to (content_hash, is_deleted), including
+            soft-deleted files
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            stmt = select(File.path, File.content_hash, File.is_deleted).where(
+                File.project_id == project_id
+            )
+            result = await self.session.execute(stmt)
+            return {path: (content_hash, is_deleted) for path, content_hash, is_deleted in result}
+        except SQLAlchemyError as e:
+            logger.error(f"Error loading path index for project {project_id}: {e}", exc_info=True)
+            raise
+
+    async def bulk_upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update files by (project_id, path) with multi-row statements.
+
+        Existing rows (including soft-deleted ones) get the new hash and
+        size and are restored; descriptive columns are left untouched.
+
+        Args:
+            rows: Column dictionaries for File rows
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            written = 0
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                stmt = pg_insert(File).values(rows[start : start + BULK_CHUNK_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_file_project_path",
+                    set_={
+                        "content_hash": stmt.excluded.content_hash,
+                        "size_bytes": stmt.excluded.size_bytes,
+                        "last_modified_at": stmt.excluded.last_modified_at,
+                        "is_deleted": False,
+                        "deleted_at": None,
+                    },
+                )
+                result = await self.session.execute(stmt)
+                written += result.rowcount
+            await self.session.flush()
+            return written
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk upserting files: {e}", exc_info=True)
+            raise
+
+    async def bulk_soft_delete(self, project_id: UUID, paths: List[str]) -> int:
+        """
+        Soft delete files by path.
+
+        Args:
+            project_id: UUID of the project
+            paths: File paths to mark deleted
+
+        Returns:
+            Number of rows updated
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            deleted = 0
+            now = datetime.now(timezone.utc)
+            for start in range(0, len(paths), BULK_CHUNK_SIZE):
+                stmt = (
+                    update(File)
+                    .where(
+                        File.project_id == project_id,
+                        File.path.in_(paths[start : start + BULK_CHUNK_SIZE]),
+                        File.is_deleted.is_(False),
+                    )
+                    .values(is_deleted=True, deleted_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await self.session.execute(stmt)
+                deleted += result.rowcount
+            await self.session.flush()
+            return deleted
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk deleting files for project {project_id}: {e}", exc_info=True)
+            raise
+
+    async def bulk_rename(self, project_id: UUID, renames: List[Dict[str, Any]]) -> int:
+        """
+        Move files to new paths in place, keeping their IDs and commit links.
+
+        Executed as a single executemany UPDATE.
+
+        Args:
+            project_id: UUID of the project
+            renames: Dictionaries with old_path plus the new path, name,
+                extension, file_type, language, content_hash, size_bytes
+                and last_modified_at
+
+        Returns:
+            Number of files renamed
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not renames:
+            return 0
+
+        try:
+            table = File.__table__
+            stmt = (
+                update(table)
+                .where(table.c.project_id == project_id, table.c.path == bindparam("old_path"))
+                .values(
+                    path=bindparam("new_path"),
+                    name=bindparam("new_name"),
+                    extension=bindparam("new_extension"),
+                    file_type=bindparam("new_file_type"),
+                    language=bindparam("new_language"),
+                    content_hash=bindparam("new_content_hash"),
+                    size_bytes=bindparam("new_size_bytes"),
+                    last_modified_at=bindparam("new_last_modified_at"),
+                    is_deleted=False,
+                    deleted_at=None,
+                )
+            )
+            params = [
+                {"old_path": rename["old_path"]}
+                | {f"new_{key}": value for key, value in rename.items() if key != "old_path"}
+                for rename in renames
+            ]
+            await self.session.execute(stmt, params)
+            await self.session.flush()
+            return len(renames)
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk renaming files for project {project_id}: {e}", exc_info=True)
+            raise
@@ -7,10 +7,11 @@ handling all database operations related to git commit history and task/file lin
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -374,6 +375,34 @@ class GitCommitRepository:
             await self.session.rollback()
             raise
 
+    async def bulk_link_tasks(self, links: List[Dict[str, Any]]) -> int:
+        """
+        Insert many commit-task links with a single statement.
+
+        Links that already exist are skipped. Does not commit, so callers can
+        apply the links together with related changes.
+
+        Args:
+            links: Dicts with task_id, commit_id and link_type
+
+        Returns:
+            Number of links inserted
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not links:
+            return 0
+
+        try:
+            stmt = pg_insert(task_commits).values(links).on_conflict_do_nothing()
+            result = await self.session.execute(stmt)
+            logger.info(f"Linked {result.rowcount} commit-task pairs")
+            return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk linking commits to tasks: {e}", exc_info=True)
+            raise
+
     async def unlink_from_tasks(self, commit_id: UUID, task_ids: List[UUID]) -> None:
         """
         Unlink a commit from multiple tasks.
@@ -597,3 +626,122 @@ class GitCommitRepository:
             logger.error(f"Error in bulk creating git commits: {e}", exc_info=True)
             await self.session.rollback()
             raise
+
+    async def get_shas(self, project_id: UUID) -> Set[str]:
+        """
+        Get the SHAs of all commits already stored for a project.
+
+        Used by history sync to skip known commits without a query per commit.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            Set of full commit SHAs
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            stmt = select(GitCommit.sha).where(GitCommit.project_id == project_id)
+            result = await self.session.execute(stmt)
+            return set(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching commit SHAs for project {project_id}: {e}", exc_info=True)
+            raise
+
+    async def get_ids_by_shas(self, project_id: UUID, shas: List[str]) -> Dict[str, UUID]:
+        """
+        Map commit SHAs to stored commit IDs in one query.
+
+        Args:
+            project_id: UUID of the project
+            shas: Full commit SHAs
+
+        Returns:
+            Dict mapping SHA to commit UUID (unknown SHAs omitted)
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            if not shas:
+                return {}
+
+            stmt = select(GitCommit.sha, GitCommit.id).where(
+                GitCommit.project_id == project_id, GitCommit.sha.in_(set(shas))
+            )
+            result = await self.session.execute(stmt)
+            return {sha: commit_id for sha, commit_id in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error mapping commit SHAs for project {project_id}: {e}", exc_info=True)
+            raise
+
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many commits with a single multi-row INSERT and commit.
+
+        Rows that collide with an existing (project_id, sha) are skipped,
+        so concurrent syncs of the same project are safe.
+
+        Args:
+            rows: Column dictionaries for new GitCommit rows
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return 0
+
+        try:
+            stmt = (
+                pg_insert(GitCommit)
+                .values(rows)
+                .on_conflict_do_nothing(constraint="uq_commit_project_sha")
+            )
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+
+            logger.info(f"Bulk inserted {result.rowcount} git commits")
+            return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk inserting git commits: {e}", exc_info=True)
+            await self.session.rollback()
+            raise
+
+    async def insert_new(self, rows: List[Dict[str, Any]]) -> Dict[str, UUID]:
+        """
+        Insert commits that are not stored yet, without committing.
+
+        Rows that collide with an existing (project_id, sha) are skipped.
+
+        Args:
+            rows: Column dictionaries for new GitCommit rows
+
+        Returns:
+            Dict mapping SHA to commit UUID for the rows actually inserted
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return {}
+
+        try:
+            stmt = (
+                pg_insert(GitCommit)
+                .values(rows)
+                .on_conflict_do_nothing(constraint="uq_commit_project_sha")
+                .returning(GitCommit.sha, GitCommit.id)
+            )
+            result = await self.session.execute(stmt)
+            inserted = {sha: commit_id for sha, commit_id in result.all()}
+
+            logger.info(f"Inserted {len(inserted)} of {len(rows)} git commits")
+            return inserted
+        except SQLAlchemyError as e:
+            logger.error(f"Error inserting git commits: {e}", exc_info=True)
+            raise
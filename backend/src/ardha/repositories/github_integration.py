@@ -591,3 +591,26 @@ class GitHubIntegrationRepository:
                 exc_info=True,
             )
             raise
+
+    async def get_webhook_delivery(self, delivery_id: str) -> GitHubWebhookDelivery | None:
+        """
+        Fetch a webhook delivery by GitHub's delivery ID.
+
+        Args:
+            delivery_id: GitHub delivery UUID (X-GitHub-Delivery)
+
+        Returns:
+            GitHubWebhookDelivery if recorded, None otherwise
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            stmt = select(GitHubWebhookDelivery).where(
+                GitHubWebhookDelivery.delivery_id == delivery_id
+            )
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching webhook delivery {delivery_id}: {e}", exc_info=True)
+            raise
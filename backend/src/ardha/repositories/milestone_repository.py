@@ -10,13 +10,19 @@ import logging
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, select, update
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ardha.models.milestone import Milestone
 from ardha.models.task import Task
+from ardha.models.task_aggregate import TaskAggregate
+from ardha.repositories.task_aggregate_repository import (
+    TaskAggregateRepository,
+    TaskStats,
+    build_task_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +38,7 @@ class MilestoneRepository:
 
     Attributes:
         db: SQLAlchemy async session for database operations
+        aggregates: TaskAggregateRepository for task counts and progress
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -42,6 +49,7 @@ class MilestoneRepository:
             db: SQLAlchemy async session for database operations
         """
         self.db = db
+        self.aggregates = TaskAggregateRepository(db)
 
     # ============= Core CRUD Operations =============
 
@@ -240,6 +248,7 @@ class MilestoneRepository:
                 return False
 
             await self.db.delete(milestone)
+            await self.aggregates.delete_scope(milestone_id)
             await self.db.flush()
             logger.info(f"Deleted milestone {milestone_id}")
             return True
@@ -455,7 +464,8 @@ class MilestoneRepository:
         """
         Count tasks by status for a milestone.
 
-        Returns counts for each status: todo, in_progress, in_review, done, cancelled
+        Returns counts for each status: todo, in_progress, in_review, done, cancelled.
+        Read from the milestone's task aggregates rather than counting tasks.
 
         Args:
             milestone_id: UUID of the milestone
@@ -466,34 +476,8 @@ class MilestoneRepository:
         Raises:
             SQLAlchemyError: If database query fails
         """
-        try:
-            stmt = (
-                select(Task.status, func.count(Task.id).label("count"))
-                .where(Task.milestone_id == milestone_id)
-                .group_by(Task.status)
-            )
-            result = await self.db.execute(stmt)
-            rows = result.all()
-
-            # Build dictionary with all statuses (default 0)
-            status_counts = {
-                "todo": 0,
-                "in_progress": 0,
-                "in_review": 0,
-                "done": 0,
-                "cancelled": 0,
-            }
-
-            for row in rows:
-                # Access row attributes properly (row is a Row object)
-                status = row[0]  # Task.status
-                count = row[1]  # count
-                status_counts[status] = count
-
-            return status_counts
-        except SQLAlchemyError as e:
-            logger.error(f"Error counting tasks for milestone {milestone_id}: {e}", exc_info=True)
-            raise
+        stats = await self.aggregates.get_stats(milestone_id)
+        return stats.by_status
 
     async def calculate_progress(self, milestone_id: UUID) -> int:
         """
@@ -511,23 +495,52 @@ class MilestoneRepository:
         Raises:
             SQLAlchemyError: If database query fails
         """
-        try:
-            stmt = select(
-                func.count(Task.id).label("total"),
-                func.count(case((Task.status == "done", 1))).label("completed"),
-            ).where(Task.milestone_id == milestone_id)
+        stats = await self.aggregates.get_stats(milestone_id)
+        return stats.progress
+
+    async def get_milestones_with_stats(
+        self,
+        project_id: UUID,
+    ) -> list[tuple[Milestone, TaskStats]]:
+        """
+        Fetch all milestones of a project with their task statistics.
+
+        One query: milestones outer-joined to their task aggregates.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            List of tuples (Milestone, TaskStats) ordered by order
 
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            stmt = (
+                select(
+                    Milestone,
+                    TaskAggregate.status,
+                    TaskAggregate.task_count,
+                    TaskAggregate.estimate_hours,
+                )
+                .outerjoin(TaskAggregate, TaskAggregate.scope_id == Milestone.id)
+                .where(Milestone.project_id == project_id)
+                .order_by(Milestone.order, Milestone.id)
+            )
             result = await self.db.execute(stmt)
-            row = result.first()
 
-            if not row or row.total == 0:
-                return 0
+            milestones: dict[UUID, tuple[Milestone, list]] = {}
+            for milestone, status, task_count, estimate_hours in result.all():
+                _, rows = milestones.setdefault(milestone.id, (milestone, []))
+                if status is not None:
+                    rows.append((status, task_count, estimate_hours))
 
-            progress = int((row.completed / row.total) * 100)
-            return progress
+            return [(milestone, build_task_stats(rows)) for milestone, rows in milestones.values()]
         except SQLAlchemyError as e:
             logger.error(
-                f"Error calculating progress for milestone {milestone_id}: {e}", exc_info=True
+                f"Error fetching milestones with stats for project {project_id}: {e}",
+                exc_info=True,
             )
             raise
 
@@ -547,27 +560,10 @@ class MilestoneRepository:
         Raises:
             SQLAlchemyError: If database query fails
         """
-        try:
-            # Get all milestones for project
-            milestones = await self.get_project_milestones(project_id, skip=0, limit=1000)
-
-            # Get task counts for each milestone
-            result = []
-            for milestone in milestones:
-                task_count_stmt = select(func.count(Task.id)).where(
-                    Task.milestone_id == milestone.id
-                )
-                count_result = await self.db.execute(task_count_stmt)
-                task_count = count_result.scalar() or 0
-                result.append((milestone, task_count))
-
-            return result
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Error fetching milestones with task counts for project {project_id}: {e}",
-                exc_info=True,
-            )
-            raise
+        return [
+            (milestone, stats.total)
+            for milestone, stats in await self.get_milestones_with_stats(project_id)
+        ]
 
     # ============= Analytics Queries =============
 
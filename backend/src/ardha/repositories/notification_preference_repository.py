@@ -8,9 +8,10 @@ including CRUD operations and specialized preference checking methods.
 import logging
 from datetime import datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -19,6 +20,20 @@ from ardha.models.notification_preference import NotificationPreference
 
 logger = logging.getLogger(__name__)
 
+# Preferences created for users who have never changed their settings
+DEFAULT_PREFERENCES: dict[str, Any] = {
+    "email_enabled": True,
+    "push_enabled": True,
+    "task_assigned": True,
+    "task_completed": True,
+    "task_overdue": True,
+    "mentions": True,
+    "project_invites": True,
+    "database_updates": False,
+    "system_notifications": True,
+    "email_frequency": "instant",
+}
+
 
 class NotificationPreferenceRepository:
     """Repository for notification preference data access operations."""
@@ -150,20 +165,7 @@ class NotificationPreferenceRepository:
                 return preference
 
             # Create default preferences
-            default_data = {
-                "user_id": user_id,
-                "email_enabled": True,
-                "push_enabled": True,
-                "task_assigned": True,
-                "task_completed": True,
-                "task_overdue": True,
-                "mentions": True,
-                "project_invites": True,
-                "database_updates": False,
-                "system_notifications": True,
-                "email_frequency": "instant",
-            }
-            return await self.create(default_data)
+            return await self.create({"user_id": user_id, **DEFAULT_PREFERENCES})
         except IntegrityError:
             # Race condition: another process created preferences
             # Fetch and return the newly created one
@@ -172,6 +174,52 @@ class NotificationPreferenceRepository:
                 return preference
             raise
 
+    async def get_or_create_for_users(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, NotificationPreference]:
+        """
+        Get preferences for many users, creating defaults for those without.
+
+        Existing rows are loaded with one query; missing users get default
+        rows from one multi-row INSERT ... ON CONFLICT DO NOTHING, and
+        defaults are returned for them without reading the rows back.
+        The caller commits.
+
+        Args:
+            user_ids: User UUIDs
+
+        Returns:
+            Mapping of user UUID to preferences (one entry per user)
+        """
+        if not user_ids:
+            return {}
+
+        try:
+            stmt = select(NotificationPreference).where(
+                NotificationPreference.user_id.in_(user_ids)
+            )
+            result = await self.db.execute(stmt)
+            preferences = {pref.user_id: pref for pref in result.scalars()}
+
+            missing = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in preferences]
+            if missing:
+                rows = [
+                    {"id": uuid4(), "user_id": user_id, **DEFAULT_PREFERENCES}
+                    for user_id in missing
+                ]
+                await self.db.execute(
+                    pg_insert(NotificationPreference)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=["user_id"])
+                )
+                for row in rows:
+                    preferences[row["user_id"]] = NotificationPreference(**row)
+
+            return preferences
+        except SQLAlchemyError as e:
+            logger.error(f"Database error loading preferences for {len(user_ids)} users: {e}")
+            raise
+
     async def is_notification_enabled(self, user_id: UUID, notification_type: str) -> bool:
         """
         Check if specific notification type is enabled for user.
@@ -10,12 +10,14 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy import and_, delete, func, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ardha.models.notification import Notification
+from ardha.models.notification_preference import NotificationPreference
+from ardha.repositories.partition_repository import PartitionRepository
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,31 @@ class NotificationRepository:
             logger.error(f"Database error fetching notification {notification_id}: {e}")
             return None
 
+    async def get_by_ids(self, notification_ids: list[UUID]) -> list[Notification]:
+        """
+        Get several notifications with their users in one query.
+
+        Args:
+            notification_ids: Notification UUIDs
+
+        Returns:
+            Notifications found (in no particular order)
+        """
+        if not notification_ids:
+            return []
+
+        try:
+            stmt = (
+                select(Notification)
+                .where(Notification.id.in_(notification_ids))
+                .options(selectinload(Notification.user))
+            )
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Database error fetching {len(notification_ids)} notifications: {e}")
+            raise
+
     async def get_by_user(
         self,
         user_id: UUID,
@@ -283,6 +310,82 @@ class NotificationRepository:
             logger.error(f"Database error marking all as read: {e}")
             raise
 
+    async def mark_read(
+        self, user_id: UUID, notification_ids: list[UUID] | None = None
+    ) -> tuple[list[UUID], datetime]:
+        """
+        Mark a user's unread notifications as read with one UPDATE ... RETURNING.
+
+        Only rows that were unread are changed and returned, so callers can
+        adjust cached unread counters by exactly the number changed.
+        Notifications already loaded in the session are updated in place.
+
+        Args:
+            user_id: Owner UUID (other users' notifications are never changed)
+            notification_ids: Notifications to mark, or None for all unread
+
+        Returns:
+            Tuple of (IDs changed from unread to read, read timestamp)
+        """
+        now = datetime.now(UTC)
+        conditions = [Notification.user_id == user_id, Notification.is_read.is_(False)]
+        if notification_ids is not None:
+            if not notification_ids:
+                return [], now
+            conditions.append(Notification.id.in_(notification_ids))
+
+        try:
+            stmt = (
+                update(Notification)
+                .where(and_(*conditions))
+                .values(is_read=True, read_at=now)
+                .returning(Notification.id)
+                .execution_options(synchronize_session="fetch")
+            )
+            result = await self.db.execute(stmt)
+            changed = list(result.scalars().all())
+            await self.db.commit()
+            logger.info(f"Marked {len(changed)} notifications as read for user {user_id}")
+            return changed, now
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Database error marking notifications as read: {e}")
+            raise
+
+    async def get_inbox(self, user_id: UUID, limit: int) -> tuple[int, list[Notification]]:
+        """
+        Get a user's unread count and most recent notifications.
+
+        Unlike get_by_user and get_unread_count, database errors are raised
+        rather than returned as empty results, so they are never cached.
+
+        Args:
+            user_id: User UUID
+            limit: Maximum notifications to return
+
+        Returns:
+            Tuple of (unread count, notifications ordered by created_at desc)
+        """
+        try:
+            count = await self.db.scalar(
+                select(func.count(Notification.id)).where(
+                    and_(
+                        Notification.user_id == user_id,
+                        Notification.is_read.is_(False),
+                    )
+                )
+            )
+            result = await self.db.scalars(
+                select(Notification)
+                .where(Notification.user_id == user_id)
+                .order_by(Notification.created_at.desc())
+                .limit(limit)
+            )
+            return count or 0, list(result.all())
+        except SQLAlchemyError as e:
+            logger.error(f"Database error loading notification inbox: {e}")
+            raise
+
     async def bulk_create(self, notifications: list[dict[str, Any]]) -> list[Notification]:
         """
         Create multiple notifications in batch.
@@ -319,31 +422,140 @@ class NotificationRepository:
             logger.error(f"Database error in bulk create: {e}")
             raise
 
-    # ============= Maintenance Operations =============
+    async def insert_many(self, notifications: list[dict[str, Any]]) -> list[Notification]:
+        """
+        Insert notifications with one multi-row INSERT ... RETURNING and commit.
 
-    async def delete_old_notifications(self, days: int = 30) -> int:
+        Used for fan-out to many recipients; unlike bulk_create there is no
+        size cap and no per-row refresh (the user relationship is not loaded).
+
+        Args:
+            notifications: List of notification data dictionaries
+
+        Returns:
+            Created notifications in input order
         """
-        Delete notifications older than specified days.
+        if not notifications:
+            return []
+
+        try:
+            result = await self.db.scalars(
+                insert(Notification).returning(Notification, sort_by_parameter_order=True),
+                notifications,
+            )
+            created = list(result.all())
+            await self.db.commit()
+            logger.info(f"Inserted {len(created)} notifications")
+            return created
+        except IntegrityError as e:
+            await self.db.rollback()
+            logger.error(f"Failed to insert notifications: {e}")
+            raise
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Database error inserting notifications: {e}")
+            raise
+
+    # ============= Email Delivery =============
+
+    async def get_pending_email(
+        self,
+        email_frequency: str,
+        after_user: UUID | None = None,
+        limit: int = 5000,
+    ) -> list[tuple[Notification, NotificationPreference]]:
+        """
+        Get unread, not yet emailed notifications of users on a digest frequency.
+
+        Rows come ordered by user and creation time, with the user loaded,
+        so the digest builder can group them in one pass and page by user.
 
         Args:
-            days: Number of days (default: 30)
+            email_frequency: Preference frequency to collect ("daily" or "weekly")
+            after_user: Only return notifications of users after this UUID
+            limit: Maximum number of notifications to return
 
         Returns:
-            Number of notifications deleted
+            List of (notification, owner's preferences) tuples
         """
+        conditions = [
+            NotificationPreference.email_enabled.is_(True),
+            NotificationPreference.email_frequency == email_frequency,
+            Notification.emailed_at.is_(None),
+            Notification.is_read.is_(False),
+        ]
+        if after_user:
+            conditions.append(Notification.user_id > after_user)
+
         try:
-            cutoff_date = datetime.now(UTC) - timedelta(days=days)
-            stmt = delete(Notification).where(Notification.created_at < cutoff_date)
+            stmt = (
+                select(Notification, NotificationPreference)
+                .join(
+                    NotificationPreference,
+                    NotificationPreference.user_id == Notification.user_id,
+                )
+                .where(and_(*conditions))
+                .options(selectinload(Notification.user))
+                .order_by(Notification.user_id, Notification.created_at)
+                .limit(limit)
+            )
+            result = await self.db.execute(stmt)
+            return [(row[0], row[1]) for row in result.all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error fetching pending {email_frequency} emails: {e}")
+            raise
+
+    async def mark_emailed(self, notification_ids: list[UUID]) -> int:
+        """
+        Record that notifications were emailed so digests skip them.
+
+        Args:
+            notification_ids: Notification UUIDs
+
+        Returns:
+            Number of notifications updated
+        """
+        if not notification_ids:
+            return 0
+
+        try:
+            stmt = (
+                update(Notification)
+                .where(Notification.id.in_(notification_ids))
+                .values(emailed_at=datetime.now(UTC))
+            )
             result = await self.db.execute(stmt)
             await self.db.commit()
-            count = result.rowcount or 0
-            logger.info(f"Deleted {count} old notifications (older than {days} days)")
-            return count
+            return result.rowcount or 0
         except SQLAlchemyError as e:
             await self.db.rollback()
-            logger.error(f"Database error deleting old notifications: {e}")
+            logger.error(f"Database error marking notifications emailed: {e}")
             raise
 
+    # ============= Maintenance Operations =============
+
+    async def delete_old_notifications(self, days: int = 30) -> int:
+        """
+        Delete notifications older than specified days.
+
+        Notifications are partitioned by month, so this drops every monthly
+        partition that ends before the cutoff instead of deleting rows.
+        Notifications in the month containing the cutoff are kept until
+        that whole month has expired.
+
+        Args:
+            days: Number of days (default: 30)
+
+        Returns:
+            Number of monthly partitions dropped
+        """
+        cutoff_date = datetime.now(UTC) - timedelta(days=days)
+        dropped = await PartitionRepository(self.db).drop_partitions_before(
+            Notification.__tablename__, cutoff_date
+        )
+        logger.info(f"Dropped {len(dropped)} notification partitions (older than {days} days)")
+        return len(dropped)
+
     async def delete_expired_notifications(self) -> int:
         """
         Delete expired notifications based on expires_at field.
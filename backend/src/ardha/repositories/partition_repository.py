@@ -0,0 +1,230 @@
+"""
+Repository for monthly table partitions.
+
+This module manages the monthly range partitions of append-heavy tables
+(notifications, webhook deliveries, task activities):
+- Pre-creating partitions for upcoming months
+- Listing existing partitions
+- Retention by dropping whole partitions instead of DELETE statements
+"""
+
+import logging
+from datetime import UTC, datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> timestamp column it is partitioned on
+PARTITIONED_TABLES: Dict[str, str] = {
+    "notifications": "created_at",
+    "github_webhook_deliveries": "received_at",
+    "task_activities": "created_at",
+}
+
+
+# ============= Partition Helpers =============
+
+
+def month_start(moment: datetime) -> datetime:
+    """
+    Get the first instant (UTC) of the month containing a timestamp.
+
+    Args:
+        moment: Any timestamp (naive values are treated as UTC)
+
+    Returns:
+        Midnight UTC on the first day of that month
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """
+    Shift a month start by a number of months.
+
+    Args:
+        month: First instant of a month (see month_start)
+        months: Months to add (negative to go back)
+
+    Returns:
+        First instant of the shifted month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """
+    Get the name of a table's partition for a month.
+
+    Args:
+        table: Partitioned table name
+        month: Any timestamp within the month
+
+    Returns:
+        Partition name such as ``notifications_p202610``
+    """
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(table: str, name: str) -> Optional[datetime]:
+    """
+    Parse the month a partition covers from its name.
+
+    Args:
+        table: Partitioned table name
+        name: Partition name
+
+    Returns:
+        First instant of the month, or None for partitions not named by
+        partition_name (such as the default partition)
+    """
+    suffix = name.removeprefix(f"{table}_p")
+    if suffix == name or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    year, month = int(suffix[:4]), int(suffix[4:])
+    if not 1 <= month <= 12:
+        return None
+    return datetime(year, month, 1, tzinfo=UTC)
+
+
+def _check_table(table: str) -> None:
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"Table '{table}' is not partitioned by month")
+
+
+class PartitionRepository:
+    """Repository for creating and dropping monthly partitions."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy async session
+        """
+        self.db = db
+
+    async def list_partitions(self, table: str) -> List[str]:
+        """
+        List the partitions attached to a table.
+
+        Args:
+            table: Partitioned table name
+
+        Returns:
+            Partition names, including the default partition if present
+
+        Raises:
+            ValueError: If the table is not a monthly partitioned table
+            SQLAlchemyError: If the catalog query fails
+        """
+        _check_table(table)
+        try:
+            result = await self.db.execute(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = CAST(:table AS regclass) "
+                    "ORDER BY child.relname"
+                ),
+                {"table": table},
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Database error listing partitions of {table}: {e}")
+            raise
+
+    async def create_partitions(self, table: str, start: datetime, months: int) -> List[str]:
+        """
+        Create the monthly partitions of a table that do not exist yet.
+
+        Args:
+            table: Partitioned table name
+            start: Any timestamp in the first month to cover
+            months: Number of consecutive months to cover
+
+        Returns:
+            Names of the partitions created
+
+        Raises:
+            ValueError: If the table is not a monthly partitioned table
+            SQLAlchemyError: If a partition cannot be created (for example
+                when the default partition already holds rows for that month)
+        """
+        existing = set(await self.list_partitions(table))
+        first = month_start(start)
+        created: List[str] = []
+
+        try:
+            for offset in range(months):
+                month = add_months(first, offset)
+                name = partition_name(table, month)
+                if name in existing:
+                    continue
+                await self.db.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{add_months(month, 1).isoformat()}')"
+                    )
+                )
+                created.append(name)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Database error creating partitions of {table}: {e}")
+            raise
+
+        if created:
+            logger.info(f"Created {len(created)} partitions of {table}: {', '.join(created)}")
+        return created
+
+    async def drop_partitions_before(self, table: str, cutoff: datetime) -> List[str]:
+        """
+        Drop the monthly partitions that only hold rows older than a cutoff.
+
+        The partition containing the cutoff is kept, so rows are retained
+        at least until cutoff and removed at month granularity. Dropping a
+        partition frees its storage at once, without the dead tuples and
+        long locks of a large DELETE.
+
+        Args:
+            table: Partitioned table name
+            cutoff: Rows older than this may be dropped
+
+        Returns:
+            Names of the partitions dropped
+
+        Raises:
+            ValueError: If the table is not a monthly partitioned table
+            SQLAlchemyError: If a partition cannot be dropped
+        """
+        partitions = await self.list_partitions(table)
+        boundary = month_start(cutoff)
+        expired = [
+            name
+            for name in partitions
+            if (month := partition_month(table, name)) is not None
+            and add_months(month, 1) <= boundary
+        ]
+
+        try:
+            for name in expired:
+                await self.db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Database error dropping partitions of {table}: {e}")
+            raise
+
+        if expired:
+            logger.info(f"Dropped {len(expired)} partitions of {table}: {', '.join(expired)}")
+        return expired
@@ -564,3 +564,26 @@ class ProjectRepository:
         except SQLAlchemyError as e:
             logger.error(f"Error fetching member role for project {project_id}: {e}", exc_info=True)
             raise
+
+    async def get_member_roles(self, user_id: UUID) -> dict[UUID, str]:
+        """
+        Get a user's role in every project they belong to.
+
+        Args:
+            user_id: UUID of the user
+
+        Returns:
+            Mapping of project UUID to role string
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            stmt = select(ProjectMember.project_id, ProjectMember.role).where(
+                ProjectMember.user_id == user_id
+            )
+            result = await self.db.execute(stmt)
+            return {project_id: role for project_id, role in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching project roles for user {user_id}: {e}", exc_info=True)
+            raise
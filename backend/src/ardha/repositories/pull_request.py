@@ -143,6 +143,39 @@ class PullRequestRepository:
             )
             raise
 
+    async def get_by_numbers(
+        self, github_integration_id: UUID, pr_numbers: list[int]
+    ) -> dict[int, PullRequest]:
+        """
+        Fetch pull requests of an integration by PR number in one query.
+
+        Args:
+            github_integration_id: UUID of the GitHub integration
+            pr_numbers: GitHub PR numbers
+
+        Returns:
+            Dict mapping PR number to PullRequest (missing numbers omitted)
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        try:
+            if not pr_numbers:
+                return {}
+
+            stmt = select(PullRequest).where(
+                PullRequest.github_integration_id == github_integration_id,
+                PullRequest.pr_number.in_(pr_numbers),
+            )
+            result = await self.session.execute(stmt)
+            return {pr.pr_number: pr for pr in result.scalars().all()}
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Error fetching PRs for integration {github_integration_id}: {e}",
+                exc_info=True,
+            )
+            raise
+
     async def get_by_github_id(self, github_pr_id: int) -> PullRequest | None:
         """
         Fetch a pull request by GitHub's internal PR ID.
@@ -0,0 +1,227 @@
+"""
+Repository for denormalized task aggregates.
+
+This module reads the per-project and per-milestone task counters kept in
+task_aggregates by the tasks table triggers, and repairs them:
+- Counts by status, completed counts and estimate hours per scope
+- Many scopes in one query (roadmaps)
+- Reconciliation against the tasks table, fixing only drifted rows
+"""
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.models.task_aggregate import TaskAggregate
+
+logger = logging.getLogger(__name__)
+
+TASK_STATUSES = ("todo", "in_progress", "in_review", "done", "cancelled")
+
+# Recomputes one project's counters and rewrites only rows that differ.
+# Must run in a REPEATABLE READ transaction: a concurrent task change then
+# fails this statement with a serialization error instead of being
+# overwritten by counts from an older snapshot.
+RECONCILE_SQL = """
+WITH actual AS (
+    SELECT project_id AS scope_id, 'project' AS scope, project_id, status,
+           count(*) AS task_count, coalesce(sum(estimate_hours), 0) AS estimate_hours
+    FROM tasks WHERE project_id = :project_id
+    GROUP BY project_id, status
+    UNION ALL
+    SELECT milestone_id, 'milestone', project_id, status,
+           count(*), coalesce(sum(estimate_hours), 0)
+    FROM tasks WHERE project_id = :project_id AND milestone_id IS NOT NULL
+    GROUP BY milestone_id, project_id, status
+),
+repaired AS (
+    INSERT INTO task_aggregates
+        (scope_id, status, scope, project_id, task_count, estimate_hours, updated_at)
+    SELECT scope_id, status, scope, project_id, task_count, estimate_hours, now() FROM actual
+    ON CONFLICT (scope_id, status) DO UPDATE SET
+        task_count = EXCLUDED.task_count,
+        estimate_hours = EXCLUDED.estimate_hours,
+        updated_at = EXCLUDED.updated_at
+    WHERE task_aggregates.task_count <> EXCLUDED.task_count
+       OR abs(task_aggregates.estimate_hours - EXCLUDED.estimate_hours) > 0.001
+    RETURNING scope_id
+),
+removed AS (
+    DELETE FROM task_aggregates
+    WHERE project_id = :project_id
+      AND NOT EXISTS (
+          SELECT 1 FROM actual
+          WHERE actual.scope_id = task_aggregates.scope_id
+            AND actual.status = task_aggregates.status
+      )
+    RETURNING task_count, estimate_hours
+)
+SELECT
+    (SELECT count(*) FROM repaired),
+    (SELECT count(*) FROM removed WHERE task_count <> 0 OR abs(estimate_hours) > 0.001)
+"""
+
+
+class TaskStats(NamedTuple):
+    """Task counters of one project or milestone."""
+
+    by_status: Dict[str, int]
+    estimate_hours: float
+    completed_estimate_hours: float
+
+    @property
+    def total(self) -> int:
+        """Number of tasks in the scope."""
+        return sum(self.by_status.values())
+
+    @property
+    def completed(self) -> int:
+        """Number of tasks done."""
+        return self.by_status.get("done", 0)
+
+    @property
+    def progress(self) -> int:
+        """Completion percentage (0 when the scope has no tasks)."""
+        return int(self.completed / self.total * 100) if self.total else 0
+
+
+def build_task_stats(rows: Iterable[Tuple[str, int, float]]) -> TaskStats:
+    """
+    Build TaskStats from (status, task_count, estimate_hours) aggregate rows.
+
+    Args:
+        rows: Aggregate rows of one scope
+
+    Returns:
+        TaskStats with every status present
+    """
+    by_status = {status: 0 for status in TASK_STATUSES}
+    estimate_hours = completed_estimate_hours = 0.0
+    for status, task_count, hours in rows:
+        by_status[status] = by_status.get(status, 0) + max(task_count, 0)
+        estimate_hours += hours
+        if status == "done":
+            completed_estimate_hours += hours
+    return TaskStats(
+        by_status=by_status,
+        estimate_hours=round(max(estimate_hours, 0.0), 2),
+        completed_estimate_hours=round(max(completed_estimate_hours, 0.0), 2),
+    )
+
+
+class TaskAggregateRepository:
+    """Repository for reading and reconciling task aggregates."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy async session
+        """
+        self.db = db
+
+    async def get_stats(self, scope_id: UUID) -> TaskStats:
+        """
+        Get task counters of a project or milestone.
+
+        Args:
+            scope_id: Project or milestone UUID
+
+        Returns:
+            TaskStats (all zero when the scope has no tasks)
+
+        Raises:
+            SQLAlchemyError: If the query fails
+        """
+        return (await self.get_stats_for([scope_id]))[scope_id]
+
+    async def get_stats_for(self, scope_ids: Sequence[UUID]) -> Dict[UUID, TaskStats]:
+        """
+        Get task counters of many projects or milestones in one query.
+
+        Args:
+            scope_ids: Project or milestone UUIDs
+
+        Returns:
+            Mapping of every requested scope ID to its TaskStats
+
+        Raises:
+            SQLAlchemyError: If the query fails
+        """
+        if not scope_ids:
+            return {}
+
+        try:
+            result = await self.db.execute(
+                select(
+                    TaskAggregate.scope_id,
+                    TaskAggregate.status,
+                    TaskAggregate.task_count,
+                    TaskAggregate.estimate_hours,
+                ).where(TaskAggregate.scope_id.in_(scope_ids))
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error reading task aggregates: {e}")
+            raise
+
+        rows: Dict[UUID, List[Tuple[str, int, float]]] = {scope_id: [] for scope_id in scope_ids}
+        for scope_id, status, task_count, estimate_hours in result.all():
+            rows[scope_id].append((status, task_count, estimate_hours))
+        return {scope_id: build_task_stats(scope_rows) for scope_id, scope_rows in rows.items()}
+
+    async def delete_scope(self, scope_id: UUID) -> int:
+        """
+        Delete the counters of a project or milestone (e.g. when it is deleted).
+
+        Args:
+            scope_id: Project or milestone UUID
+
+        Returns:
+            Number of aggregate rows deleted
+
+        Raises:
+            SQLAlchemyError: If the delete fails
+        """
+        try:
+            result = await self.db.execute(
+                delete(TaskAggregate).where(TaskAggregate.scope_id == scope_id)
+            )
+            return result.rowcount or 0
+        except SQLAlchemyError as e:
+            logger.error(f"Database error deleting task aggregates of {scope_id}: {e}")
+            raise
+
+    async def reconcile(self, project_id: UUID) -> int:
+        """
+        Repair a project's counters from the tasks table.
+
+        Only rows whose stored values differ are rewritten, and rows for
+        scopes without tasks are removed. Call inside a REPEATABLE READ
+        transaction so a concurrent task change aborts the repair (to be
+        retried) rather than being lost.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Number of aggregate rows that had drifted
+
+        Raises:
+            SQLAlchemyError: If the repair fails (including serialization failures)
+        """
+        try:
+            result = await self.db.execute(text(RECONCILE_SQL), {"project_id": project_id})
+            repaired, removed = result.one()
+        except SQLAlchemyError as e:
+            logger.error(f"Database error reconciling task aggregates of {project_id}: {e}")
+            raise
+
+        drifted = repaired + removed
+        if drifted:
+            logger.warning(f"Repaired {drifted} drifted task aggregates in project {project_id}")
+        return drifted
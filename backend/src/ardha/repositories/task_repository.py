@@ -8,17 +8,20 @@ database queries and CRUD operations for tasks, dependencies, tags, and activiti
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import CTE, and_, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ardha.models.project import Project
-from ardha.models.task import Task
+from ardha.models.task import Task, task_task_tags
 from ardha.models.task_activity import TaskActivity
 from ardha.models.task_dependency import TaskDependency
 from ardha.models.task_tag import TaskTag
+from ardha.repositories.task_aggregate_repository import TaskAggregateRepository
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +98,28 @@ class TaskRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_refs_by_identifiers(
+        self, project_id: UUID, identifiers: list[str]
+    ) -> dict[str, tuple[UUID, str]]:
+        """
+        Resolve many task identifiers in one query.
+
+        Args:
+            project_id: Project UUID
+            identifiers: Task identifier strings (unknown ones are ignored)
+
+        Returns:
+            Mapping of identifier to (task UUID, status)
+        """
+        if not identifiers:
+            return {}
+
+        stmt = select(Task.identifier, Task.id, Task.status).where(
+            and_(Task.project_id == project_id, Task.identifier.in_(set(identifiers)))
+        )
+        result = await self.db.execute(stmt)
+        return {identifier: (task_id, status) for identifier, task_id, status in result.all()}
+
     async def get_project_tasks(
         self,
         project_id: UUID,
@@ -202,8 +227,8 @@ class TaskRepository:
         Returns:
             Created task instance
         """
-        # Generate unique identifier
-        identifier = await self._generate_identifier(task_data["project_id"])
+        # Allocate unique identifier
+        [identifier] = await self.reserve_identifiers(task_data["project_id"])
 
         # Create task
         task = Task(identifier=identifier, **task_data)
@@ -215,6 +240,39 @@ class TaskRepository:
         logger.info(f"Created task {task.identifier} in project {task.project_id}")
         return task
 
+    async def bulk_create(self, project_id: UUID, tasks_data: list[dict[str, Any]]) -> list[Task]:
+        """
+        Create many tasks in one project with a single multi-row INSERT.
+
+        Identifiers are reserved in one counter update (see
+        reserve_identifiers) and assigned in input order.
+
+        Args:
+            project_id: Project UUID
+            tasks_data: Task attribute dicts (without project_id or identifier)
+
+        Returns:
+            Created tasks in input order (relationships not loaded)
+        """
+        if not tasks_data:
+            return []
+
+        identifiers = await self.reserve_identifiers(project_id, len(tasks_data))
+        rows = [
+            {"id": uuid4(), **task_data, "project_id": project_id, "identifier": identifier}
+            for task_data, identifier in zip(tasks_data, identifiers)
+        ]
+        result = await self.db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True), rows
+        )
+        tasks = list(result.all())
+
+        logger.info(
+            f"Created {len(tasks)} tasks ({identifiers[0]}..{identifiers[-1]}) "
+            f"in project {project_id}"
+        )
+        return tasks
+
     async def update(self, task_id: UUID, **kwargs) -> Task:
         """
         Update task fields.
@@ -295,6 +353,33 @@ class TaskRepository:
         logger.info(f"Task {task.identifier} status: {old_status} → {status}")
         return task
 
+    async def complete_tasks(self, task_ids: list[UUID]) -> list[UUID]:
+        """
+        Mark many tasks done with a single UPDATE.
+
+        Tasks that are already done are left untouched.
+
+        Args:
+            task_ids: Task UUIDs
+
+        Returns:
+            UUIDs of the tasks whose status changed
+        """
+        if not task_ids:
+            return []
+
+        stmt = (
+            update(Task)
+            .where(and_(Task.id.in_(set(task_ids)), Task.status != "done"))
+            .values(status="done", completed_at=datetime.now(timezone.utc))
+            .returning(Task.id)
+        )
+        result = await self.db.execute(stmt)
+        completed = list(result.scalars().all())
+
+        logger.info(f"Completed {len(completed)} of {len(set(task_ids))} tasks")
+        return completed
+
     async def assign_user(self, task_id: UUID, user_id: UUID) -> Task:
         """
         Assign task to a user.
@@ -368,6 +453,35 @@ class TaskRepository:
         logger.info(f"Added dependency: {task_id} depends on {depends_on_task_id}")
         return dependency
 
+    async def add_dependencies(self, dependencies: list[tuple[UUID, UUID]]) -> list[UUID]:
+        """
+        Add many dependencies with a single INSERT.
+
+        Callers are responsible for circular dependency checks.
+
+        Args:
+            dependencies: (task_id, depends_on_task_id) pairs
+
+        Returns:
+            IDs of the created dependencies
+        """
+        if not dependencies:
+            return []
+
+        rows = [
+            {
+                "id": uuid4(),
+                "task_id": task_id,
+                "depends_on_task_id": depends_on_task_id,
+                "dependency_type": "depends_on",
+            }
+            for task_id, depends_on_task_id in dependencies
+        ]
+        await self.db.execute(insert(TaskDependency).values(rows))
+
+        logger.info(f"Added {len(rows)} task dependencies")
+        return [row["id"] for row in rows]
+
     async def remove_dependency(
         self,
         task_id: UUID,
@@ -437,6 +551,107 @@ class TaskRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    # ============= Dependency Graph =============
+
+    def _dependency_closure(self, task_id: UUID) -> CTE:
+        """
+        Recursive CTE of a task and every task it depends on, transitively.
+
+        UNION (not UNION ALL) drops already reached tasks, so each task is
+        expanded once and existing cycles cannot make the query loop.
+        """
+        reached = select(literal(task_id, PG_UUID(as_uuid=True)).label("id")).cte(
+            "dependency_closure", recursive=True
+        )
+        return reached.union(
+            select(TaskDependency.depends_on_task_id).where(TaskDependency.task_id == reached.c.id)
+        )
+
+    async def depends_on_transitively(self, task_id: UUID, depends_on_task_id: UUID) -> bool:
+        """
+        Check whether a task depends on another, directly or indirectly.
+
+        Answered by one recursive query; Postgres stops expanding the
+        closure as soon as the target is reached.
+
+        Args:
+            task_id: Task whose dependencies are followed
+            depends_on_task_id: Task to look for
+
+        Returns:
+            True if task_id (transitively) depends on depends_on_task_id
+        """
+        closure = self._dependency_closure(task_id)
+        stmt = select(
+            select(closure.c.id)
+            .where(closure.c.id == depends_on_task_id, closure.c.id != task_id)
+            .exists()
+        )
+        result = await self.db.execute(stmt)
+        return bool(result.scalar())
+
+    async def get_transitive_dependencies(
+        self,
+        task_id: UUID,
+        incomplete_only: bool = False,
+    ) -> list[Task]:
+        """
+        Get every task this task depends on, directly or indirectly.
+
+        Args:
+            task_id: Task UUID
+            incomplete_only: Only return tasks not yet done or cancelled
+                (the tasks still blocking this one)
+
+        Returns:
+            Dependency tasks ordered by creation
+        """
+        closure = self._dependency_closure(task_id)
+        stmt = (
+            select(Task)
+            .join(closure, closure.c.id == Task.id)
+            .where(Task.id != task_id)
+            .options(
+                selectinload(Task.assignee),
+                selectinload(Task.created_by),
+                selectinload(Task.tags),
+            )
+            .order_by(Task.created_at)
+        )
+        if incomplete_only:
+            stmt = stmt.where(Task.status.notin_(["done", "cancelled"]))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_dependency_graph(
+        self, project_id: UUID
+    ) -> tuple[list[dict[str, Any]], list[tuple[UUID, UUID]]]:
+        """
+        Load a project's tasks and dependencies as plain rows.
+
+        Two column-only queries, independent of graph depth.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Tuple of (task rows with id, identifier, title, status and
+            estimate_hours in creation order, (task_id, depends_on_task_id) pairs)
+        """
+        tasks_result = await self.db.execute(
+            select(Task.id, Task.identifier, Task.title, Task.status, Task.estimate_hours)
+            .where(Task.project_id == project_id)
+            .order_by(Task.created_at, Task.identifier)
+        )
+        edges_result = await self.db.execute(
+            select(TaskDependency.task_id, TaskDependency.depends_on_task_id)
+            .join(Task, Task.id == TaskDependency.task_id)
+            .where(Task.project_id == project_id)
+        )
+        tasks = [dict(row) for row in tasks_result.mappings().all()]
+        edges = [(row[0], row[1]) for row in edges_result.all()]
+        return tasks, edges
+
     # ============= Tag Management =============
 
     async def add_tag(self, task_id: UUID, tag_id: UUID) -> None:
@@ -458,6 +673,25 @@ class TaskRepository:
             await self.db.flush()
             logger.info(f"Added tag {tag.name} to task {task.identifier}")
 
+    async def add_tags_to_tasks(self, task_tags: list[tuple[UUID, UUID]]) -> int:
+        """
+        Attach tags to tasks with a single INSERT, skipping existing links.
+
+        Args:
+            task_tags: (task_id, tag_id) pairs
+
+        Returns:
+            Number of links requested
+        """
+        if not task_tags:
+            return 0
+
+        rows = [{"task_id": task_id, "tag_id": tag_id} for task_id, tag_id in set(task_tags)]
+        await self.db.execute(pg_insert(task_task_tags).values(rows).on_conflict_do_nothing())
+
+        logger.debug(f"Linked {len(rows)} task tags")
+        return len(rows)
+
     async def remove_tag(self, task_id: UUID, tag_id: UUID) -> bool:
         """
         Remove a tag from a task.
@@ -537,6 +771,47 @@ class TaskRepository:
         logger.info(f"Created tag {name} for project {project_id}")
         return tag
 
+    async def get_or_create_tags(
+        self,
+        project_id: UUID,
+        names: list[str],
+        color: str = "#6366f1",
+    ) -> dict[str, TaskTag]:
+        """
+        Get or create many tags of a project in two statements.
+
+        Missing tags are inserted with ON CONFLICT DO NOTHING, so concurrent
+        creators of the same tag do not fail, then all tags are loaded.
+
+        Args:
+            project_id: Project UUID
+            names: Tag names (duplicates are ignored)
+            color: Hex color code for newly created tags (default: purple)
+
+        Returns:
+            Mapping of tag name to tag
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        await self.db.execute(
+            pg_insert(TaskTag)
+            .values(
+                [
+                    {"id": uuid4(), "project_id": project_id, "name": name, "color": color}
+                    for name in unique_names
+                ]
+            )
+            .on_conflict_do_nothing(constraint="uq_task_tag_project_name")
+        )
+        result = await self.db.execute(
+            select(TaskTag).where(
+                and_(TaskTag.project_id == project_id, TaskTag.name.in_(unique_names))
+            )
+        )
+        return {tag.name: tag for tag in result.scalars().all()}
+
     # ============= Activity Logging =============
 
     async def log_activity(
@@ -578,6 +853,27 @@ class TaskRepository:
         logger.debug(f"Logged activity for task {task_id}: {action}")
         return activity
 
+    async def log_activities(self, activities: list[dict[str, Any]]) -> int:
+        """
+        Log many task activities with a single INSERT.
+
+        Args:
+            activities: Column dicts with task_id, user_id, action and
+                optionally old_value, new_value and comment
+
+        Returns:
+            Number of activities logged
+        """
+        if not activities:
+            return 0
+
+        defaults = {"old_value": None, "new_value": None, "comment": None}
+        rows = [{"id": uuid4(), **defaults, **activity} for activity in activities]
+        await self.db.execute(insert(TaskActivity).values(rows))
+
+        logger.debug(f"Logged {len(rows)} task activities")
+        return len(rows)
+
     async def get_task_activities(
         self,
         task_id: UUID,
@@ -609,26 +905,16 @@ class TaskRepository:
         """
         Count tasks by status for a project.
 
+        Read from the project's task aggregates rather than counting tasks.
+
         Args:
             project_id: Project UUID
 
         Returns:
             Dictionary mapping status to count
         """
-        stmt = (
-            select(Task.status, func.count(Task.id))
-            .where(Task.project_id == project_id)
-            .group_by(Task.status)
-        )
-        result = await self.db.execute(stmt)
-
-        counts = {status: count for status, count in result.all()}
-
-        # Ensure all statuses are present
-        for status in ["todo", "in_progress", "in_review", "done", "cancelled"]:
-            counts.setdefault(status, 0)
-
-        return counts
+        stats = await TaskAggregateRepository(self.db).get_stats(project_id)
+        return stats.by_status
 
     async def get_upcoming_tasks(
         self,
@@ -720,32 +1006,49 @@ class TaskRepository:
         result = await self.db.execute(stmt)
         return result.scalar() or 0
 
-    # ============= Helper Methods =============
+    # ============= Identifier Allocation =============
 
-    async def _generate_identifier(self, project_id: UUID) -> str:
+    async def reserve_identifiers(self, project_id: UUID, count: int = 1) -> list[str]:
         """
-        Generate next unique identifier for task (e.g., ARD-001, ARD-002).
+        Allocate the next task identifiers of a project (e.g., ARD-001, ARD-002).
+
+        Bumps the project's task counter with a single UPDATE ... RETURNING,
+        so the cost does not depend on the number of tasks in the project.
+        The project row stays locked until the transaction ends, which
+        serializes concurrent creates in the same project. Numbers are never
+        reused after deletes; a rolled back transaction releases its numbers.
 
         Args:
             project_id: Project UUID
+            count: Number of identifiers to reserve
 
         Returns:
-            Generated identifier string
+            Reserved identifiers in ascending order
+
+        Raises:
+            ValueError: If project not found
         """
-        # Count existing tasks in project
-        result = await self.db.execute(
-            select(func.count(Task.id)).where(Task.project_id == project_id)
+        if count < 1:
+            return []
+
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(
+                last_task_number=Project.last_task_number + count,
+                # Allocating task numbers is not a project edit
+                updated_at=Project.updated_at,
+            )
+            .returning(Project.last_task_number, Project.slug)
+            .execution_options(synchronize_session="fetch")
         )
-        count = result.scalar() or 0
-
-        # Get project to extract prefix from slug
-        project = await self.db.get(Project, project_id)
-        if project and project.slug:
-            # Use first 3 letters of slug as prefix
-            prefix = project.slug[:3].upper()
-        else:
-            # Fallback to generic prefix
-            prefix = "TSK"
-
-        # Generate identifier: PREFIX-NNN (e.g., ARD-001)
-        return f"{prefix}-{count + 1:03d}"
+        row = (await self.db.execute(stmt)).one_or_none()
+        if row is None:
+            raise ValueError(f"Project {project_id} not found")
+
+        last_number, slug = row
+        # Use first 3 letters of slug as prefix
+        prefix = slug[:3].upper() if slug else "TSK"
+        return [
+            f"{prefix}-{number:03d}" for number in range(last_number - count + 1, last_number + 1)
+        ]
@@ -9,7 +9,7 @@ queries and provides a clean interface for the service layer.
 import logging
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -83,6 +83,35 @@ class UserRepository:
             logger.error(f"Error fetching user by email {email}: {e}", exc_info=True)
             raise
 
+    async def get_ids_by_emails(self, emails: list[str]) -> dict[str, UUID]:
+        """
+        Map email addresses to user IDs in one query.
+
+        Matching is case-insensitive; keys in the result are lowercased.
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            Mapping of lowercased email to user UUID for addresses that match
+
+        Raises:
+            SQLAlchemyError: If database query fails
+        """
+        if not emails:
+            return {}
+
+        try:
+            lowered = {email.lower() for email in emails}
+            stmt = select(func.lower(User.email), User.id).where(
+                func.lower(User.email).in_(lowered)
+            )
+            result = await self.db.execute(stmt)
+            return {email: user_id for email, user_id in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Error mapping emails to users: {e}", exc_info=True)
+            raise
+
     async def get_by_username(self, username: str) -> User | None:
         """
         Fetch a user by their username.
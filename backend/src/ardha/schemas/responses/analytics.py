@@ -0,0 +1,42 @@
+"""
+Response schemas for analytics charts.
+
+This module defines Pydantic models for the project and user metric series
+served from the precomputed analytics rollups.
+"""
+
+from datetime import date
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RollupPointResponse(BaseModel):
+    """Metrics of one day or week."""
+
+    period_start: date
+    tasks_created: int = 0
+    tasks_completed: int = 0
+    throughput_per_day: float = 0.0  # tasks_completed averaged over the period's days
+    cycle_time_p50_hours: float | None = None
+    cycle_time_p90_hours: float | None = None
+    ai_operations: int = 0
+    ai_tokens: int = 0
+    ai_cost: float = 0.0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RollupSeriesResponse(BaseModel):
+    """Chart series of a project or user, one point per period (gaps zero-filled)."""
+
+    scope: str  # "project" or "user"
+    scope_id: UUID
+    period: str  # "day" or "week"
+    start: date
+    end: date
+    points: list[RollupPointResponse]
+    total_tasks_completed: int
+    total_ai_cost: float
+
+    model_config = ConfigDict(from_attributes=True)
@@ -149,6 +149,14 @@ class GitHubStatsResponse(BaseModel):
     )
 
 
+class GitHubRateLimitResponse(BaseModel):
+    """Rate limit of an integration's token, as of its last GitHub response."""
+
+    limit: int
+    remaining: int
+    reset: Optional[datetime] = None
+
+
 class GitHubConnectionStatusResponse(BaseModel):
     """Response schema for verifying GitHub connection."""
 
@@ -159,6 +167,7 @@ class GitHubConnectionStatusResponse(BaseModel):
     webhook_configured: bool
     last_sync_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    rate_limit: Optional[GitHubRateLimitResponse] = None
 
 
 class WebhookDeliveryResponse(BaseModel):
@@ -29,6 +29,8 @@ class MilestoneResponse(BaseModel):
 
     # Computed fields (optional, can be added by services)
     task_count: int | None = None
+    completed_task_count: int | None = None
+    estimate_hours: float | None = None
     is_overdue: bool | None = None
     days_remaining: int | None = None
 
@@ -43,6 +45,8 @@ class MilestoneSummaryResponse(BaseModel):
     total_tasks: int
     completed_tasks: int
     auto_progress: int  # Calculated progress based on task completion
+    estimate_hours: float = 0.0  # Sum of task estimates
+    completed_estimate_hours: float = 0.0  # Sum of estimates of done tasks
 
     model_config = ConfigDict(from_attributes=True)
 
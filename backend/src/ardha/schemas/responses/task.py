@@ -168,3 +168,30 @@ class TaskTimelineResponse(BaseModel):
     total: int
     earliest_date: datetime | None
     latest_date: datetime | None
+
+
+class TaskPlanItemResponse(BaseModel):
+    """One task of an execution plan with its position in the dependency graph."""
+
+    id: UUID
+    identifier: str
+    title: str
+    status: str
+    estimate_hours: float | None = None
+    level: int  # Longest chain of dependencies before this task (Gantt lane)
+    depends_on: list[UUID] = []
+    on_critical_path: bool = False
+
+
+class TaskPlanResponse(BaseModel):
+    """
+    Response model for the execution plan (roadmap/Gantt ordering).
+
+    Tasks are topologically ordered: every task comes after its dependencies.
+    """
+
+    project_id: UUID
+    tasks: list[TaskPlanItemResponse]
+    total: int
+    critical_path: list[UUID]
+    critical_path_hours: float
@@ -0,0 +1,161 @@
+"""
+Analytics service for dashboard charts.
+
+This module serves per-project and per-user metric series from the
+precomputed analytics rollups, with permission checks, range validation
+and zero-filled gaps so charts need no further processing.
+"""
+
+import logging
+from datetime import UTC, date, datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.core.config import settings
+from ardha.repositories.analytics_repository import (
+    ROLLUP_PERIODS,
+    AnalyticsRepository,
+    period_length,
+    period_start,
+)
+from ardha.schemas.responses.analytics import RollupPointResponse, RollupSeriesResponse
+from ardha.services.project_service import ProjectService
+
+logger = logging.getLogger(__name__)
+
+# Periods shown when a request gives no start date
+DEFAULT_PERIODS = {"day": 30, "week": 12}
+
+
+class InsufficientAnalyticsPermissionsError(Exception):
+    """Raised when user lacks permissions to view analytics."""
+
+    pass
+
+
+class AnalyticsService:
+    """
+    Service for analytics chart business logic.
+
+    Attributes:
+        db: SQLAlchemy async session
+        repository: AnalyticsRepository for rollup access
+        project_service: ProjectService for permission checks
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize AnalyticsService.
+
+        Args:
+            db: SQLAlchemy async session for database operations
+        """
+        self.db = db
+        self.repository = AnalyticsRepository(db)
+        self.project_service = ProjectService(db)
+
+    async def get_project_series(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        period: str = "day",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> RollupSeriesResponse:
+        """
+        Get a project's metric series.
+
+        Requires project viewer access.
+
+        Args:
+            project_id: UUID of the project
+            user_id: UUID of user making the request
+            period: "day" or "week"
+            start: First day shown (default: DEFAULT_PERIODS periods before end)
+            end: Last day shown (default: today)
+
+        Returns:
+            RollupSeriesResponse with one point per period
+
+        Raises:
+            InsufficientAnalyticsPermissionsError: If user lacks permissions
+            ValueError: If the period or date range is invalid
+        """
+        if not await self.project_service.check_permission(project_id, user_id, "viewer"):
+            logger.warning(f"User {user_id} lacks permission to view analytics of {project_id}")
+            raise InsufficientAnalyticsPermissionsError("Only project members can view analytics")
+
+        return await self._get_series("project", project_id, period, start, end)
+
+    async def get_user_series(
+        self,
+        user_id: UUID,
+        period: str = "day",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> RollupSeriesResponse:
+        """
+        Get a user's own metric series (tasks by assignee, AI usage by user).
+
+        Args:
+            user_id: UUID of the user
+            period: "day" or "week"
+            start: First day shown (default: DEFAULT_PERIODS periods before end)
+            end: Last day shown (default: today)
+
+        Returns:
+            RollupSeriesResponse with one point per period
+
+        Raises:
+            ValueError: If the period or date range is invalid
+        """
+        return await self._get_series("user", user_id, period, start, end)
+
+    async def _get_series(
+        self,
+        scope: str,
+        scope_id: UUID,
+        period: str,
+        start: Optional[date],
+        end: Optional[date],
+    ) -> RollupSeriesResponse:
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Period must be one of: {', '.join(ROLLUP_PERIODS)}")
+
+        step = period_length(period)
+        end = period_start(end or datetime.now(UTC).date(), period)
+        start = period_start(start, period) if start else end - step * (DEFAULT_PERIODS[period] - 1)
+        if start > end:
+            raise ValueError("Start date must not be after end date")
+        if (end - start).days > settings.analytics.max_chart_days:
+            raise ValueError(f"Date range must not exceed {settings.analytics.max_chart_days} days")
+
+        rollups = {
+            rollup.period_start: rollup
+            for rollup in await self.repository.get_series(scope, scope_id, period, start, end)
+        }
+
+        points = []
+        day = start
+        while day <= end:
+            rollup = rollups.get(day)
+            if rollup is None:
+                points.append(RollupPointResponse(period_start=day))
+            else:
+                point = RollupPointResponse.model_validate(rollup)
+                point.throughput_per_day = round(rollup.tasks_completed / step.days, 2)
+                points.append(point)
+            day += step
+
+        return RollupSeriesResponse(
+            scope=scope,
+            scope_id=scope_id,
+            period=period,
+            start=start,
+            end=end,
+            points=points,
+            total_tasks_completed=sum(point.tasks_completed for point in points),
+            total_ai_cost=round(sum(point.ai_cost for point in points), 6),
+        )
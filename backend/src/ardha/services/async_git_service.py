@@ -0,0 +1,603 @@
+"""
+Async execution layer for git operations.
+
+GitService is synchronous GitPython; calling it directly from request
+handlers blocks the event loop for the whole git command. This module
+provides the async facade services should use instead:
+- A bounded, process-wide thread pool for git work
+- Per-repository reader/writer locking (reads run concurrently, writes exclusively)
+- An LRU cache of immutable results (blobs at a commit, commit details,
+  diffs between two commits) keyed by object id
+- Chunked streaming of diffs and blobs addressed by SHA
+
+Locks are per worker process; they order operations issued through this
+process, not git commands run by other workers or external tools.
+"""
+
+import asyncio
+import copy
+import logging
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ardha.core.config import settings
+from ardha.services.git_service import GitService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FULL_SHA_PATTERN = re.compile(r"[0-9a-fA-F]{40}")
+
+# Marks the end of a blocking iterator advanced on the executor
+_END = object()
+
+
+# ============= Repository Locks =============
+
+
+class RepoLock:
+    """
+    Async reader/writer lock for one repository.
+
+    Any number of readers may hold the lock together; a writer holds it
+    alone. Waiters are served in arrival order, so a queued writer blocks
+    later readers and a stream of reads cannot starve a pull or commit.
+    """
+
+    def __init__(self) -> None:
+        self._readers = 0
+        self._writer = False
+        self._waiters: Deque[Tuple[bool, asyncio.Future]] = deque()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """Hold the lock shared."""
+        await self._acquire(write=False)
+        try:
+            yield
+        finally:
+            self._release(write=False)
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Hold the lock exclusively."""
+        await self._acquire(write=True)
+        try:
+            yield
+        finally:
+            self._release(write=True)
+
+    async def _acquire(self, write: bool) -> None:
+        if not self._waiters and self._can_grant(write):
+            self._grant(write)
+            return
+
+        waiter = (write, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            if waiter[1].cancelled():
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._wake()
+            else:
+                # Granted just as we were cancelled; hand it straight back
+                self._release(write)
+            raise
+
+    def _can_grant(self, write: bool) -> bool:
+        return not self._writer and (not write or self._readers == 0)
+
+    def _grant(self, write: bool) -> None:
+        if write:
+            self._writer = True
+        else:
+            self._readers += 1
+
+    def _release(self, write: bool) -> None:
+        if write:
+            self._writer = False
+        else:
+            self._readers -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            write, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._can_grant(write):
+                break
+            self._waiters.popleft()
+            self._grant(write)
+            future.set_result(None)
+
+
+_repo_locks: Dict[str, RepoLock] = {}
+
+
+def get_repo_lock(repo_path: Path) -> RepoLock:
+    """
+    Get the process-wide lock for a repository.
+
+    Args:
+        repo_path: Repository root
+
+    Returns:
+        RepoLock shared by every facade on the same path
+    """
+    key = str(repo_path)
+    if key not in _repo_locks:
+        _repo_locks[key] = RepoLock()
+    return _repo_locks[key]
+
+
+# ============= Result Cache =============
+
+
+class GitResultCache:
+    """
+    LRU cache of immutable git results.
+
+    Keys must identify content by object id (commit or blob SHA), never by
+    a movable ref, so entries are valid forever and only evicted for space.
+    Values are copied on read so callers cannot mutate cached results.
+
+    Attributes:
+        max_entries: Maximum number of entries (0 disables caching)
+        max_bytes: Approximate total size cap; larger values are not cached
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate size of cached values."""
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of cached value, or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        value = entry[1]
+        return value if isinstance(value, (str, bytes)) else copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting least recently used entries beyond the limits.
+
+        Args:
+            key: Cache key
+            value: Immutable git result (None is never cached)
+        """
+        if value is None or self.max_entries <= 0:
+            return
+
+        weight = len(value) if isinstance(value, (str, bytes)) else len(repr(value))
+        if weight > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[0]
+
+        self._entries[key] = (weight, value)
+        self._bytes += weight
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted_weight, _ = self._entries.popitem(last=False)[1]
+            self._bytes -= evicted_weight
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._bytes = 0
+
+
+# ============= Async Facade =============
+
+# GitPython keeps persistent cat-file processes per Repo that are not safe to
+# share between threads, so each executor thread gets its own GitService.
+_thread_state = threading.local()
+
+
+def _thread_service(repo_path: Path) -> GitService:
+    services = getattr(_thread_state, "services", None)
+    if services is None:
+        services = _thread_state.services = {}
+    if repo_path not in services:
+        services[repo_path] = GitService(repo_path)
+    return services[repo_path]
+
+
+class AsyncGitService:
+    """
+    Async facade over GitService.
+
+    Runs every git operation on the shared executor under the repository's
+    reader/writer lock, and serves immutable results from the shared cache.
+    Movable refs (branch names, HEAD) are resolved to a commit SHA on each
+    call, so cached content is never stale.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        executor: Optional[ThreadPoolExecutor] = None,
+        cache: Optional[GitResultCache] = None,
+    ):
+        """
+        Initialize AsyncGitService.
+
+        Args:
+            repo_path: Path to git repository root
+            executor: Thread pool to run git on (default: shared pool)
+            cache: Result cache (default: shared cache)
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.executor = executor or get_git_executor()
+        self.cache = cache if cache is not None else get_git_cache()
+        self.lock = get_repo_lock(self.repo_path)
+
+    # ============= Execution =============
+
+    async def read(self, func: Callable[[GitService], T]) -> T:
+        """
+        Run a read-only git operation concurrently with other reads.
+
+        Args:
+            func: Callable receiving a GitService for this repository
+
+        Returns:
+            Result of func
+        """
+        async with self.lock.read():
+            return await self._run(func)
+
+    async def write(self, func: Callable[[GitService], T]) -> T:
+        """
+        Run a git operation that changes the repository, exclusively.
+
+        Args:
+            func: Callable receiving a GitService for this repository
+
+        Returns:
+            Result of func
+        """
+        async with self.lock.write():
+            return await self._run(func)
+
+    async def stream(self, func: Callable[[GitService], Iterator[T]]) -> AsyncIterator[T]:
+        """
+        Iterate a blocking git generator on the executor, one item per step.
+
+        No repository lock is held between items, so a slow client cannot
+        stall writers; only stream content addressed by commit or blob SHA,
+        which git never changes in place.
+
+        Args:
+            func: Callable receiving a GitService and returning an iterator
+
+        Yields:
+            Items produced by the iterator
+        """
+        iterator = await self._run(func)
+        try:
+            while True:
+                item = await self._run(lambda _: next(iterator, _END))
+                if item is _END:
+                    return
+                yield item
+        finally:
+            iterator.close()
+
+    async def _run(self, func: Callable[[GitService], T]) -> T:
+        repo_path = self.repo_path
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor, lambda: func(_thread_service(repo_path))
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Keep holding the lock until git has actually finished
+            await asyncio.wait([future])
+            raise
+
+    async def _cached(self, key: Tuple, func: Callable[[GitService], T]) -> T:
+        key = (str(self.repo_path),) + key
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        value = await self.read(func)
+        self.cache.put(key, value)
+        return value
+
+    async def _commit_sha(self, ref: str) -> Optional[str]:
+        if FULL_SHA_PATTERN.fullmatch(ref):
+            return ref.lower()
+        return await self.resolve_commit(ref)
+
+    # ============= Cached Reads =============
+
+    async def read_file(self, file_path: str, ref: str = "HEAD") -> str:
+        """
+        Read file content at a ref, cached by commit SHA.
+
+        Args:
+            file_path: Path to file
+            ref: Git reference (default: HEAD)
+
+        Returns:
+            File content as string
+        """
+        sha = await self._commit_sha(ref)
+        if sha is None:
+            return await self.read(lambda git: git.read_file(file_path, ref))
+        return await self._cached(
+            ("blob", sha, file_path), lambda git: git.read_file(file_path, sha)
+        )
+
+    async def get_commit_details(self, sha: str) -> Dict:
+        """
+        Get detailed commit information, cached by commit SHA.
+
+        Args:
+            sha: Commit SHA or ref
+
+        Returns:
+            Commit dictionary (see GitService.get_commit_details)
+        """
+        commit_sha = await self._commit_sha(sha)
+        if commit_sha is None:
+            return await self.read(lambda git: git.get_commit_details(sha))
+        return await self._cached(
+            ("commit", commit_sha), lambda git: git.get_commit_details(commit_sha)
+        )
+
+    async def blob_info(self, file_path: str, ref: str = "HEAD") -> Dict:
+        """
+        Look up a file's blob SHA and size at a ref, cached by commit SHA.
+
+        Args:
+            file_path: Path to file
+            ref: Git reference (default: HEAD)
+
+        Returns:
+            Dictionary with blob "sha" and "size" (see GitService.blob_info)
+        """
+        sha = await self._commit_sha(ref)
+        if sha is None:
+            return await self.read(lambda git: git.blob_info(file_path, ref))
+        return await self._cached(
+            ("blob_info", sha, file_path), lambda git: git.blob_info(file_path, sha)
+        )
+
+    async def diff_base(self, sha: str) -> str:
+        """Get a commit's first parent or the empty tree (see GitService.diff_base)."""
+        return await self._cached(("diff_base", sha), lambda git: git.diff_base(sha))
+
+    async def get_diff(
+        self,
+        ref1: Optional[str] = None,
+        ref2: Optional[str] = None,
+        file_path: Optional[str] = None,
+    ) -> str:
+        """
+        Get diff between refs or working tree.
+
+        Diffs between two commits are cached by their SHAs; diffs involving
+        the working tree or index are always computed.
+
+        Args:
+            ref1: First reference (commit, branch)
+            ref2: Second reference (commit, branch)
+            file_path: Optional file path for specific file diff
+
+        Returns:
+            Unified diff format string
+        """
+        if ref1 and ref2:
+            old_sha, new_sha = await self._commit_sha(ref1), await self._commit_sha(ref2)
+            if old_sha and new_sha:
+                return await self._cached(
+                    ("diff", old_sha, new_sha, file_path),
+                    lambda git: git.get_diff(old_sha, new_sha, file_path),
+                )
+        return await self.read(lambda git: git.get_diff(ref1, ref2, file_path))
+
+    async def diff_tree(self, old_ref: str, new_ref: str = "HEAD") -> List[Dict]:
+        """
+        List blob changes between two commits, cached by their SHAs.
+
+        Args:
+            old_ref: Base commit
+            new_ref: Target commit (default: HEAD)
+
+        Returns:
+            Change list (see GitService.diff_tree)
+        """
+        old_sha, new_sha = await self._commit_sha(old_ref), await self._commit_sha(new_ref)
+        if not (old_sha and new_sha):
+            return await self.read(lambda git: git.diff_tree(old_ref, new_ref))
+        return await self._cached(
+            ("diff_tree", old_sha, new_sha), lambda git: git.diff_tree(old_sha, new_sha)
+        )
+
+    # ============= Streams =============
+
+    def stream_blob(self, sha: str, max_bytes: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream blob content by blob SHA (see GitService.stream_blob)."""
+        return self.stream(lambda git: git.stream_blob(sha, max_bytes))
+
+    def stream_diff(self, old_sha: str, new_sha: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Stream a capped patch between two commit SHAs (see GitService.stream_diff)."""
+        return self.stream(lambda git: git.stream_diff(old_sha, new_sha, **kwargs))
+
+    def iter_diff_files(self, old_sha: str, new_sha: str, **kwargs: Any) -> AsyncIterator[Dict]:
+        """Stream per-file hunks between two commit SHAs (see GitService.iter_diff_files)."""
+        return self.stream(lambda git: git.iter_diff_files(old_sha, new_sha, **kwargs))
+
+    # ============= Reads =============
+
+    async def resolve_commit(self, ref: str = "HEAD") -> Optional[str]:
+        """Resolve a ref to a full commit SHA (see GitService.resolve_commit)."""
+        return await self.read(lambda git: git.resolve_commit(ref))
+
+    async def get_status(self) -> Dict:
+        """Get repository status (see GitService.get_status)."""
+        return await self.read(lambda git: git.get_status())
+
+    async def get_file_history(self, file_path: str, max_count: int = 50) -> List[Dict]:
+        """Get commit history for a file (see GitService.get_file_history)."""
+        return await self.read(lambda git: git.get_file_history(file_path, max_count))
+
+    async def get_current_branch(self) -> str:
+        """Get current branch name (see GitService.get_current_branch)."""
+        return await self.read(lambda git: git.get_current_branch())
+
+    async def list_tree(self, ref: str = "HEAD") -> Dict[str, Dict]:
+        """List blobs at a commit (see GitService.list_tree)."""
+        return await self.read(lambda git: git.list_tree(ref))
+
+    async def read_blobs(self, shas: List[str]) -> Dict[str, bytes]:
+        """Read several blobs by SHA (see GitService.read_blobs)."""
+        return await self.read(lambda git: git.read_blobs(shas))
+
+    async def is_ancestor(self, ancestor: str, descendant: str = "HEAD") -> bool:
+        """Check commit ancestry (see GitService.is_ancestor)."""
+        return await self.read(lambda git: git.is_ancestor(ancestor, descendant))
+
+    # ============= Writes =============
+
+    async def write_file(self, *args: Any, **kwargs: Any) -> None:
+        """Write file to the working tree (see GitService.write_file)."""
+        await self.write(lambda git: git.write_file(*args, **kwargs))
+
+    async def delete_file(self, *args: Any, **kwargs: Any) -> None:
+        """Delete file and optionally stage it (see GitService.delete_file)."""
+        await self.write(lambda git: git.delete_file(*args, **kwargs))
+
+    async def rename_file(self, *args: Any, **kwargs: Any) -> None:
+        """Rename file and optionally stage it (see GitService.rename_file)."""
+        await self.write(lambda git: git.rename_file(*args, **kwargs))
+
+    async def stage_files(self, file_paths: List[str]) -> None:
+        """Stage files (see GitService.stage_files)."""
+        await self.write(lambda git: git.stage_files(file_paths))
+
+    async def commit(self, *args: Any, **kwargs: Any) -> Dict:
+        """Create a commit (see GitService.commit)."""
+        return await self.write(lambda git: git.commit(*args, **kwargs))
+
+    async def push(self, *args: Any, **kwargs: Any) -> Any:
+        """Push to a remote (see GitService.push)."""
+        return await self.write(lambda git: git.push(*args, **kwargs))
+
+    async def pull(self, *args: Any, **kwargs: Any) -> Any:
+        """Pull from a remote (see GitService.pull)."""
+        return await self.write(lambda git: git.pull(*args, **kwargs))
+
+    async def create_branch(self, branch_name: str, start_point: Optional[str] = None) -> None:
+        """Create a branch (see GitService.create_branch)."""
+        await self.write(lambda git: git.create_branch(branch_name, start_point))
+
+    async def switch_branch(self, branch_name: str, create: bool = False) -> None:
+        """Switch branch (see GitService.switch_branch)."""
+        await self.write(lambda git: git.switch_branch(branch_name, create))
+
+
+# Global executor and cache instances
+_executor: Optional[ThreadPoolExecutor] = None
+_cache: Optional[GitResultCache] = None
+
+
+def get_git_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared git thread pool.
+
+    Returns:
+        ThreadPoolExecutor sized from settings.git.max_workers
+    """
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.git.max_workers, thread_name_prefix="ardha-git"
+        )
+
+    return _executor
+
+
+def get_git_cache() -> GitResultCache:
+    """
+    Get the shared git result cache.
+
+    Returns:
+        GitResultCache configured from settings.git
+    """
+    global _cache
+
+    if _cache is None:
+        _cache = GitResultCache(
+            max_entries=settings.git.cache_max_entries,
+            max_bytes=settings.git.cache_max_bytes,
+        )
+
+    return _cache
+
+
+def shutdown_git_executor() -> None:
+    """
+    Stop the shared git thread pool.
+
+    Queued operations are cancelled; running git commands finish in the
+    background. Should be called on application shutdown.
+    """
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -103,7 +103,8 @@ class BroadcastService:
 
         Excludes the specified user (usually the user who triggered the action).
         Each member receives an individual notification that respects their
-        personal preferences and quiet hours.
+        personal preferences and quiet hours; all members are handled as one
+        set (see NotificationService.notify_users).
 
         Args:
             project_id: Project UUID
@@ -134,24 +135,17 @@ class BroadcastService:
                 logger.debug(f"No members to notify for project {project_id} after exclusion")
                 return []
 
-            # Create notifications for each member
-            notifications: List[Notification] = []
-            for member in target_members:
-                try:
-                    notif = await self.notification_service.create_notification(
-                        user_id=member.user_id,
-                        notification_type=notification_type,
-                        title=title,
-                        message=message,
-                        data=kwargs.get("data"),
-                        link_type=kwargs.get("link_type", "project"),
-                        link_id=kwargs.get("link_id", project_id),
-                        expires_at=kwargs.get("expires_at"),
-                    )
-                    notifications.append(notif)
-
-                except Exception as e:
-                    logger.warning(f"Failed to notify project member {member.user_id}: {e}")
+            # One set-based fan-out for all members
+            notifications = await self.notification_service.notify_users(
+                [m.user_id for m in target_members],
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                data=kwargs.get("data"),
+                link_type=kwargs.get("link_type", "project"),
+                link_id=kwargs.get("link_id", project_id),
+                expires_at=kwargs.get("expires_at"),
+            )
 
             logger.info(
                 f"Broadcast notification to {len(notifications)} project members "
@@ -206,24 +200,16 @@ class BroadcastService:
                 logger.debug(f"No assignees to notify for task {task_id}")
                 return []
 
-            # Create notifications for each assignee
-            notifications: List[Notification] = []
-            for assignee_id in assignees:
-                try:
-                    notif = await self.notification_service.create_notification(
-                        user_id=assignee_id,
-                        notification_type=notification_type,
-                        title=title,
-                        message=message,
-                        data=kwargs.get("data"),
-                        link_type=kwargs.get("link_type", "task"),
-                        link_id=kwargs.get("link_id", task_id),
-                        expires_at=kwargs.get("expires_at"),
-                    )
-                    notifications.append(notif)
-
-                except Exception as e:
-                    logger.warning(f"Failed to notify task assignee {assignee_id}: {e}")
+            notifications = await self.notification_service.notify_users(
+                assignees,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                data=kwargs.get("data"),
+                link_type=kwargs.get("link_type", "task"),
+                link_id=kwargs.get("link_id", task_id),
+                expires_at=kwargs.get("expires_at"),
+            )
 
             logger.info(
                 f"Broadcast notification to {len(notifications)} task assignees "
@@ -270,20 +256,12 @@ class BroadcastService:
                 logger.warning("No users found for system broadcast")
                 return []
 
-            # Create notifications for each user
-            notifications: List[Notification] = []
-            for user_id in user_ids:
-                try:
-                    notif = await self.notification_service.create_notification(
-                        user_id=user_id,
-                        notification_type="system",
-                        title=title,
-                        message=message,
-                    )
-                    notifications.append(notif)
-
-                except Exception as e:
-                    logger.warning(f"Failed to notify user {user_id}: {e}")
+            notifications = await self.notification_service.notify_users(
+                user_ids,
+                notification_type="system",
+                title=title,
+                message=message,
+            )
 
             logger.info(f"Broadcast system notification to {len(notifications)} users")
 
@@ -14,6 +14,8 @@ from uuid import UUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.ai_spend import get_ai_spend_counter
+from ardha.core.config import settings
 from ardha.core.openrouter import CircuitBreakerOpenError, OpenRouterError
 from ardha.models.ai_usage import AIOperation
 from ardha.models.chat import Chat, ChatMode
@@ -126,6 +128,7 @@ class ChatService:
         self.ai_usage_repo = AIUsageRepository(db)
         self.project_repo = ProjectRepository(db)
         self.project_service = ProjectService(db)
+        self.spend_counter = get_ai_spend_counter()
 
     async def create_chat(
         self,
@@ -337,7 +340,7 @@ class ChatService:
             await self.chat_repo.update_tokens(chat_id, total_tokens, total_cost)
 
             # Log to AI usage table
-            await self.ai_usage_repo.create(
+            usage = await self.ai_usage_repo.create(
                 user_id=user_id,
                 model_name=model,
                 operation=AIOperation.CHAT.value,
@@ -346,6 +349,9 @@ class ChatService:
                 cost=total_cost,
                 project_id=chat.project_id,
             )
+            self.spend_counter.add_on_commit(
+                self.db, user_id, chat.project_id, usage.usage_date, total_cost
+            )
 
             # Trigger memory ingestion for important chats (10+ messages)
             message_count = await self.message_repo.get_message_count(chat_id)
@@ -543,7 +549,9 @@ class ChatService:
         Check if chat is within budget limits.
 
         Implements budget checking with warnings at 90% and blocking at 100%.
-        Uses daily budget limits from configuration.
+        Uses the daily user and project budgets from settings.ai; today's
+        spend is read from the Redis running totals, seeded from the daily
+        usage aggregate on miss.
 
         Args:
             chat: Chat object to check budget for
@@ -551,27 +559,41 @@ class ChatService:
         Raises:
             ChatBudgetExceededError: If budget exceeded
         """
-        # Note: get_settings imported but not used - available for future budget config
-
-        # Get today's usage for user
         today = date.today()
-        daily_usage = await self.ai_usage_repo.get_daily_usage(chat.user_id, today)
-        daily_total = sum(usage.cost for usage in daily_usage)
-
-        # Check against daily budget
-        # For now, use a default daily budget of $2.00
-        # TODO: Add ai_budget_daily to settings when needed
-        daily_budget = Decimal("2.00")
 
-        if daily_total >= daily_budget:
-            raise ChatBudgetExceededError(
-                f"Daily AI budget of ${daily_budget} exceeded. " f"Current usage: ${daily_total}"
+        budgets = []
+        if settings.ai.daily_budget_user > 0:
+            budgets.append(
+                (
+                    "user",
+                    chat.user_id,
+                    Decimal(str(settings.ai.daily_budget_user)),
+                    lambda: self.ai_usage_repo.get_daily_cost(today, user_id=chat.user_id),
+                )
             )
-
-        # Warning at 90%
-        warning_threshold = daily_budget * Decimal("0.9")
-        if daily_total >= warning_threshold:
-            logger.warning(
-                f"Chat {chat.id} approaching budget limit: "
-                f"${daily_total}/${daily_budget} ({(daily_total/daily_budget)*100:.1f}%)"
+        if chat.project_id is not None and settings.ai.daily_budget_project > 0:
+            budgets.append(
+                (
+                    "project",
+                    chat.project_id,
+                    Decimal(str(settings.ai.daily_budget_project)),
+                    lambda: self.ai_usage_repo.get_daily_cost(today, project_id=chat.project_id),
+                )
             )
+
+        for scope, scope_id, daily_budget, loader in budgets:
+            daily_total = await self.spend_counter.get_or_load(scope, scope_id, today, loader)
+
+            if daily_total >= daily_budget:
+                raise ChatBudgetExceededError(
+                    f"Daily AI budget of ${daily_budget} exceeded for {scope}. "
+                    f"Current usage: ${daily_total}"
+                )
+
+            # Warning at 90%
+            warning_threshold = daily_budget * Decimal("0.9")
+            if daily_total >= warning_threshold:
+                logger.warning(
+                    f"Chat {chat.id} approaching {scope} budget limit: "
+                    f"${daily_total}/${daily_budget} ({(daily_total/daily_budget)*100:.1f}%)"
+                )
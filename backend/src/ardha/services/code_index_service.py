@@ -0,0 +1,503 @@
+"""
+Code index for project repositories.
+
+Keeps the Qdrant "code" collection in step with each project's git tree so
+workflows and chat can retrieve code context without reading files:
+- Changed blobs are split at language-aware boundaries (definitions,
+  headings) and packed into chunks up to a size limit
+- Chunks are embedded in batches through the local embedding service
+- Point IDs derive from (project, path, blob SHA, chunk), so blobs that
+  are already indexed are skipped after one ID lookup; binary or blank
+  blobs get a chunk 0 marker point so they are skipped the same way
+- Points of deleted, renamed or superseded blobs are removed by filter
+"""
+
+import logging
+import re
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple
+from uuid import UUID
+
+from qdrant_client.http.models import FieldCondition, Filter, MatchAny, MatchValue
+
+from ardha.core.config import settings
+from ardha.core.qdrant import QdrantService, get_qdrant_service
+from ardha.services.async_git_service import AsyncGitService
+from ardha.services.embedding_service import LocalEmbeddingService, get_embedding_service
+from ardha.services.file_service import EXTENSION_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+CODE_COLLECTION = "code"
+
+# Marks indexed repository code apart from workflow memories in the same collection
+CODE_INDEX_SOURCE = "repository"
+
+# Marks chunk 0 placeholders of blobs that produce no chunks; never searched
+CODE_INDEX_MARKER_SOURCE = "repository_skipped"
+
+# Namespace for deterministic chunk point IDs
+POINT_NAMESPACE = UUID("6d2ffe48-f57a-4d10-8b9f-dacaf5c51e2d")
+
+# Documentation formats indexed alongside source files
+DOCUMENT_LANGUAGES = {".md": "markdown", ".mdx": "markdown", ".rst": "rst", ".txt": "text"}
+
+_JS_BOUNDARY = re.compile(
+    r"^(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?"
+    r"(?:function\b|class\b|interface\b|type[ \t]+\w+|(?:const|let)[ \t]+\w+[ \t]*=[ \t]*(?:async\b|\())"
+)
+_JVM_BOUNDARY = re.compile(
+    r"^[ \t]{0,4}(?:public|private|protected|internal|class|interface|enum|record|struct|fun|func)\b"
+)
+_C_BOUNDARY = re.compile(r"^(?:struct|class|namespace|typedef|template)\b|^[A-Za-z_][^;(]*\([^;]*$")
+
+# Lines that open a new chunk section, per language; others split on blank lines
+CHUNK_BOUNDARIES: Dict[str, Pattern[str]] = {
+    "python": re.compile(r"^[ \t]{0,4}(?:@|(?:async[ \t]+)?def[ \t]|class[ \t])"),
+    "javascript": _JS_BOUNDARY,
+    "typescript": _JS_BOUNDARY,
+    "go": re.compile(r"^(?:func|type)[ \t]"),
+    "rust": re.compile(
+        r"^[ \t]{0,4}(?:pub(?:\([^)]*\))?[ \t]+)?(?:async[ \t]+)?(?:fn|impl|struct|enum|trait|mod)\b"
+    ),
+    "java": _JVM_BOUNDARY,
+    "kotlin": _JVM_BOUNDARY,
+    "csharp": _JVM_BOUNDARY,
+    "swift": _JVM_BOUNDARY,
+    "php": re.compile(
+        r"^[ \t]{0,4}(?:(?:public|private|protected|static|abstract|final)[ \t]+)*"
+        r"(?:function|class|interface|trait)\b"
+    ),
+    "ruby": re.compile(r"^[ \t]{0,2}(?:def|class|module)[ \t]"),
+    "c": _C_BOUNDARY,
+    "cpp": _C_BOUNDARY,
+    "sql": re.compile(r"^(?:create|alter|insert|update|delete|select|with)\b", re.IGNORECASE),
+    "markdown": re.compile(r"^#{1,6}[ \t]"),
+}
+
+
+class CodeChunk(NamedTuple):
+    """A contiguous range of lines from one file."""
+
+    text: str
+    start_line: int
+    end_line: int
+
+
+def detect_index_language(path: str) -> Optional[str]:
+    """
+    Get the language a path is indexed as.
+
+    Args:
+        path: Repository-relative file path
+
+    Returns:
+        Language name, or None if the file is not indexed
+    """
+    suffix = Path(path).suffix.lower()
+    return EXTENSION_LANGUAGES.get(suffix) or DOCUMENT_LANGUAGES.get(suffix)
+
+
+def chunk_source(text: str, language: Optional[str], max_chars: int) -> List[CodeChunk]:
+    """
+    Split source text into chunks at language-aware boundaries.
+
+    A section starts at each line matching the language's boundary pattern
+    (a run of matching lines, such as decorators followed by a def, starts
+    one section); languages without a pattern split on blank lines.
+    Consecutive sections are packed into chunks of at most max_chars, and
+    a section longer than that is split by lines.
+
+    Args:
+        text: File content
+        language: Language from detect_index_language
+        max_chars: Maximum characters per chunk (a single longer line is
+            kept whole)
+
+    Returns:
+        Non-blank chunks in file order with 1-based inclusive line ranges
+    """
+    lines = text.splitlines(keepends=True)
+    boundary = CHUNK_BOUNDARIES.get(language or "")
+
+    starts = [0]
+    previous_matched = False
+    for index in range(1, len(lines)):
+        line = lines[index]
+        if boundary is not None:
+            matched = boundary.match(line) is not None
+            if matched and not previous_matched:
+                starts.append(index)
+            previous_matched = matched
+        elif line.strip() and not lines[index - 1].strip():
+            starts.append(index)
+    sections = list(zip(starts, starts[1:] + [len(lines)]))
+
+    ranges: List[Tuple[int, int]] = []
+    current: Optional[List[int]] = None
+    current_size = 0
+    for start, end in sections:
+        size = sum(len(line) for line in lines[start:end])
+        if current is not None and current_size + size <= max_chars:
+            current[1] = end
+            current_size += size
+            continue
+        if current is not None:
+            ranges.append((current[0], current[1]))
+        if size <= max_chars:
+            current, current_size = [start, end], size
+            continue
+
+        # Oversized section: split by lines
+        current = None
+        window_start, window_size = start, 0
+        for index in range(start, end):
+            if window_size and window_size + len(lines[index]) > max_chars:
+                ranges.append((window_start, index))
+                window_start, window_size = index, 0
+            window_size += len(lines[index])
+        ranges.append((window_start, end))
+    if current is not None:
+        ranges.append((current[0], current[1]))
+
+    chunks = []
+    for start, end in ranges:
+        chunk_text = "".join(lines[start:end])
+        if chunk_text.strip():
+            chunks.append(CodeChunk(text=chunk_text, start_line=start + 1, end_line=end))
+    return chunks
+
+
+class CodeIndexService:
+    """
+    Incremental code index stored in the Qdrant "code" collection.
+
+    Attributes:
+        qdrant: Qdrant service holding the collection
+        embeddings: Local embedding service used for chunks and queries
+        max_file_bytes: Blobs larger than this are not indexed
+        chunk_max_chars: Maximum characters per chunk
+        embed_batch_size: Chunks embedded and upserted per request
+        read_batch_size: Blobs looked up and read from git per batch
+    """
+
+    def __init__(
+        self,
+        qdrant: Optional[QdrantService] = None,
+        embeddings: Optional[LocalEmbeddingService] = None,
+        max_file_bytes: Optional[int] = None,
+        chunk_max_chars: Optional[int] = None,
+        embed_batch_size: Optional[int] = None,
+        read_batch_size: Optional[int] = None,
+    ) -> None:
+        config = settings.code_index
+        self.qdrant = qdrant or get_qdrant_service()
+        self.embeddings = embeddings or get_embedding_service()
+        self.max_file_bytes = max_file_bytes or config.max_file_bytes
+        self.chunk_max_chars = chunk_max_chars or config.chunk_max_chars
+        self.embed_batch_size = embed_batch_size or config.embed_batch_size
+        self.read_batch_size = read_batch_size or config.read_batch_size
+        self._collection_ready = False
+
+    @staticmethod
+    def point_id(project_id: UUID, path: str, blob_sha: str, chunk_index: int) -> str:
+        """Deterministic point ID for one chunk of a blob at a path."""
+        return str(uuid.uuid5(POINT_NAMESPACE, f"{project_id}:{path}:{blob_sha}:{chunk_index}"))
+
+    # ============= Indexing =============
+
+    async def sync(
+        self,
+        project_id: UUID,
+        git: AsyncGitService,
+        base_sha: Optional[str],
+        head_sha: str,
+    ) -> Dict[str, int]:
+        """
+        Index the changes between two commits, or the whole tree at head.
+
+        Without a usable base commit every blob at head is considered
+        (already indexed blobs are still skipped) and points for paths no
+        longer in the tree are removed.
+
+        Args:
+            project_id: Project UUID
+            git: Async git facade for the project's repository
+            base_sha: Previously indexed commit, or None
+            head_sha: Commit to index
+
+        Returns:
+            Indexing counts (see index_changes)
+        """
+        if base_sha and await git.resolve_commit(base_sha):
+            changes = await git.diff_tree(base_sha, head_sha)
+            return await self.index_changes(project_id, git, changes)
+
+        tree = await git.list_tree(head_sha)
+        changes = [
+            {"status": "M", "path": path, "sha": entry["sha"], "size": entry["size"]}
+            for path, entry in tree.items()
+        ]
+        stats = await self.index_changes(project_id, git, changes)
+
+        missing = Filter(must=[self._project_condition(project_id)])
+        if tree:
+            missing.must_not = [FieldCondition(key="metadata.path", match=MatchAny(any=list(tree)))]
+        await self.qdrant.delete_by_filter(CODE_COLLECTION, missing)
+        return stats
+
+    async def index_changes(
+        self,
+        project_id: UUID,
+        git: AsyncGitService,
+        changes: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Apply a list of tree changes to the index.
+
+        Args:
+            project_id: Project UUID
+            git: Async git facade for the project's repository
+            changes: Changes as returned by GitService.diff_tree
+
+        Returns:
+            Dict with files_indexed, files_unchanged, files_skipped (binary
+            or blank blobs), chunks_indexed and paths_removed counts
+        """
+        await self._ensure_collection()
+
+        removed: List[str] = []
+        candidates: List[Dict[str, Any]] = []
+        for change in changes:
+            if change["status"] == "D":
+                removed.append(change["path"])
+                continue
+            if change.get("old_path"):
+                removed.append(change["old_path"])
+            if detect_index_language(change["path"]) and 0 < change["size"] <= self.max_file_bytes:
+                candidates.append(change)
+            elif change["status"] != "A":
+                removed.append(change["path"])
+
+        stats = {
+            "files_indexed": 0,
+            "files_unchanged": 0,
+            "files_skipped": 0,
+            "chunks_indexed": 0,
+            "paths_removed": len(removed),
+        }
+        if removed:
+            await self.qdrant.delete_by_filter(
+                CODE_COLLECTION,
+                Filter(
+                    must=[
+                        self._project_condition(project_id),
+                        FieldCondition(key="metadata.path", match=MatchAny(any=removed)),
+                    ]
+                ),
+            )
+
+        for offset in range(0, len(candidates), self.read_batch_size):
+            batch = candidates[offset : offset + self.read_batch_size]
+            indexed = await self.qdrant.get_existing_ids(
+                CODE_COLLECTION,
+                [self.point_id(project_id, c["path"], c["sha"], 0) for c in batch],
+            )
+            fresh = [
+                c for c in batch if self.point_id(project_id, c["path"], c["sha"], 0) not in indexed
+            ]
+            stats["files_unchanged"] += len(batch) - len(fresh)
+            if not fresh:
+                continue
+
+            blobs = await git.read_blobs(list({change["sha"] for change in fresh}))
+            points: List[Dict[str, Any]] = []
+            skipped = 0
+            for change in fresh:
+                file_points = self._file_points(project_id, change, blobs[change["sha"]])
+                if not file_points:
+                    file_points = [self._marker_point(project_id, change)]
+                    skipped += 1
+                # Chunk 0 is written last, so its presence marks a fully indexed blob
+                points.extend(reversed(file_points))
+            await self._upsert(points)
+
+            # Drop chunks of the versions these blobs replaced
+            await self.qdrant.delete_by_filter(
+                CODE_COLLECTION,
+                Filter(
+                    must=[self._project_condition(project_id)],
+                    should=[
+                        Filter(
+                            must=[
+                                FieldCondition(
+                                    key="metadata.path", match=MatchValue(value=change["path"])
+                                )
+                            ],
+                            must_not=[
+                                FieldCondition(
+                                    key="metadata.blob_sha", match=MatchValue(value=change["sha"])
+                                )
+                            ],
+                        )
+                        for change in fresh
+                    ],
+                ),
+            )
+            stats["files_indexed"] += len(fresh) - skipped
+            stats["files_skipped"] += skipped
+            stats["chunks_indexed"] += len(points) - skipped
+
+        logger.info(
+            f"Indexed code for project {project_id}: {stats['files_indexed']} files "
+            f"({stats['chunks_indexed']} chunks), {stats['files_unchanged']} unchanged, "
+            f"{stats['files_skipped']} skipped, {stats['paths_removed']} paths removed"
+        )
+        return stats
+
+    def _file_points(
+        self, project_id: UUID, change: Dict[str, Any], content: bytes
+    ) -> List[Dict[str, Any]]:
+        """Build unembedded points for one blob's chunks."""
+        if b"\x00" in content:
+            return []
+
+        path, blob_sha = change["path"], change["sha"]
+        language = detect_index_language(path)
+        created_at = datetime.now(timezone.utc).isoformat()
+        chunks = chunk_source(
+            content.decode("utf-8", errors="replace"), language, self.chunk_max_chars
+        )
+        return [
+            {
+                "id": self.point_id(project_id, path, blob_sha, index),
+                "text": chunk.text,
+                "embed_text": f"{path}\n{chunk.text}",
+                "metadata": {
+                    "source": CODE_INDEX_SOURCE,
+                    "project_id": str(project_id),
+                    "path": path,
+                    "blob_sha": blob_sha,
+                    "language": language,
+                    "chunk_index": index,
+                    "start_line": chunk.start_line,
+                    "end_line": chunk.end_line,
+                },
+                "created_at": created_at,
+            }
+            for index, chunk in enumerate(chunks)
+        ]
+
+    def _marker_point(self, project_id: UUID, change: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the chunk 0 marker of a blob that produced no chunks."""
+        path, blob_sha = change["path"], change["sha"]
+        return {
+            "id": self.point_id(project_id, path, blob_sha, 0),
+            "text": "",
+            "embed_text": path,
+            "metadata": {
+                "source": CODE_INDEX_MARKER_SOURCE,
+                "project_id": str(project_id),
+                "path": path,
+                "blob_sha": blob_sha,
+                "chunk_index": 0,
+            },
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def _upsert(self, points: List[Dict[str, Any]]) -> None:
+        """Embed and upsert points in batches."""
+        for offset in range(0, len(points), self.embed_batch_size):
+            batch = points[offset : offset + self.embed_batch_size]
+            vectors = await self.embeddings.generate_batch_embeddings(
+                [point["embed_text"] for point in batch], batch_size=self.embed_batch_size
+            )
+            await self.qdrant.upsert_embedded(
+                CODE_COLLECTION,
+                [
+                    {
+                        "id": point["id"],
+                        "vector": vector,
+                        "text": point["text"],
+                        "metadata": point["metadata"],
+                        "created_at": point["created_at"],
+                    }
+                    for point, vector in zip(batch, vectors)
+                ],
+            )
+
+    async def _ensure_collection(self) -> None:
+        """Create the collection and its filter indexes once per service."""
+        if self._collection_ready:
+            return
+        if not await self.qdrant.collection_exists(CODE_COLLECTION):
+            await self.qdrant.create_collection(CODE_COLLECTION)
+        for field_name in ("metadata.project_id", "metadata.path", "metadata.blob_sha"):
+            await self.qdrant.create_payload_index(CODE_COLLECTION, field_name)
+        self._collection_ready = True
+
+    @staticmethod
+    def _project_condition(project_id: UUID) -> FieldCondition:
+        return FieldCondition(key="metadata.project_id", match=MatchValue(value=str(project_id)))
+
+    # ============= Retrieval =============
+
+    async def search(
+        self,
+        project_id: UUID,
+        query: str,
+        limit: int = 10,
+        score_threshold: float = 0.3,
+        language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find indexed code chunks relevant to a query.
+
+        Args:
+            project_id: Project UUID
+            query: Natural language or code query
+            limit: Maximum number of chunks
+            score_threshold: Minimum similarity score
+            language: Optional language filter
+
+        Returns:
+            Chunks with score, text and metadata (path, lines, blob SHA)
+        """
+        conditions = [
+            FieldCondition(key="metadata.source", match=MatchValue(value=CODE_INDEX_SOURCE)),
+            self._project_condition(project_id),
+        ]
+        if language:
+            conditions.append(
+                FieldCondition(key="metadata.language", match=MatchValue(value=language))
+            )
+
+        vector = await self.embeddings.generate_embedding(query)
+        return await self.qdrant.search_by_vector(
+            CODE_COLLECTION,
+            vector,
+            limit=limit,
+            score_threshold=score_threshold,
+            points_filter=Filter(must=conditions),
+        )
+
+
+# Global service instance
+_code_index_service: Optional[CodeIndexService] = None
+
+
+def get_code_index_service() -> CodeIndexService:
+    """
+    Get global code index service instance.
+
+    Returns:
+        CodeIndexService configured from settings
+    """
+    global _code_index_service
+
+    if _code_index_service is None:
+        _code_index_service = CodeIndexService()
+
+    return _code_index_service
@@ -9,21 +9,69 @@ This module provides the business logic layer for file management, handling:
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from uuid import UUID
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.config import settings
 from ardha.models.file import File
 from ardha.repositories.file import FileRepository
 from ardha.schemas.file import FileType
+from ardha.services.async_git_service import AsyncGitService
 from ardha.services.git_service import GitService
 from ardha.services.project_service import ProjectService
 
 logger = logging.getLogger(__name__)
 
+# Extensions treated as binary when indexing files from git
+BINARY_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".zip", ".exe", ".bin"}
+
+# Programming language by file extension
+EXTENSION_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".h": "c",
+    ".cs": "csharp",
+    ".php": "php",
+    ".rb": "ruby",
+    ".go": "go",
+    ".rs": "rust",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".html": "html",
+    ".css": "css",
+    ".scss": "scss",
+    ".sass": "sass",
+    ".less": "less",
+    ".sql": "sql",
+    ".sh": "bash",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".xml": "xml",
+}
+
+# File columns rewritten when git reports a rename
+RENAMED_FIELDS = (
+    "path",
+    "name",
+    "extension",
+    "file_type",
+    "language",
+    "content_hash",
+    "size_bytes",
+    "last_modified_at",
+)
+
 
 # ============= Custom Exceptions =============
 
@@ -75,6 +123,7 @@ class FileService:
         self.repository = FileRepository(db)
         self.project_service = ProjectService(db)
         self.git_service = GitService(project_root)
+        self.git = AsyncGitService(project_root)
 
     # ============= Core File Operations =============
 
@@ -119,7 +168,7 @@ class FileService:
 
         try:
             # Write file to filesystem
-            self.git_service.write_file(file_path, content)
+            await self.git.write_file(file_path, content)
 
             # Create file record
             file_data = {
@@ -146,7 +195,7 @@ class FileService:
                 if not commit_message:
                     commit_message = f"Create file: {file_path}"
 
-                commit_info = self.git_service.commit(
+                commit_info = await self.git.commit(
                     message=commit_message,
                     author_name=await self._get_user_name(user_id),
                     author_email=await self._get_user_email(user_id),
@@ -213,13 +262,21 @@ class FileService:
         Raises:
             FileNotFoundError: If file not found
             FilePermissionError: If user lacks permissions
+            FileValidationError: If the file is too large to return inline
         """
         file = await self.get_file(file_id, user_id)
 
         try:
             # Try to get content from git first
             if self.git_service.is_initialized():
-                return self.git_service.read_file(file.path, ref)
+                info = await self.git.blob_info(file.path, ref)
+                if info["size"] > settings.files.max_file_size:
+                    raise FileValidationError(
+                        f"File is {info['size']} bytes, larger than the "
+                        f"{settings.files.max_file_size} byte inline limit; "
+                        "use the raw content endpoint"
+                    )
+                return await self.git.read_file(file.path, ref)
 
             # Fallback to database content
             if file.content:
@@ -227,10 +284,49 @@ class FileService:
 
             raise FileNotFoundError(f"File content not available for {file.path}")
 
+        except FileValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get file content for {file.path}: {e}")
             raise FileOperationError(f"Failed to get file content: {e}")
 
+    async def open_file_stream(
+        self, file_id: UUID, user_id: UUID, ref: str = "HEAD"
+    ) -> Tuple[File, Dict[str, Any], AsyncIterator[bytes]]:
+        """
+        Open file content at a ref as a byte stream.
+
+        Content is read from git in chunks and capped at
+        settings.git.blob_max_bytes, so large or binary files never have
+        to fit in memory.
+
+        Args:
+            file_id: File UUID
+            user_id: User requesting content
+            ref: Git reference (default: HEAD)
+
+        Returns:
+            Tuple of (file, blob info with "sha", "size" and "truncated",
+            async iterator of content chunks)
+
+        Raises:
+            FileNotFoundError: If file not found in database or at ref
+            FilePermissionError: If user lacks permissions
+            FileOperationError: If the project has no git repository
+        """
+        file = await self.get_file(file_id, user_id)
+        if not self.git_service.is_initialized():
+            raise FileOperationError("File content streaming requires a git repository")
+
+        try:
+            info = await self.git.blob_info(file.path, ref)
+        except OSError as e:
+            raise FileNotFoundError(str(e))
+
+        max_bytes = settings.git.blob_max_bytes
+        info = {**info, "truncated": info["size"] > max_bytes}
+        return file, info, self.git.stream_blob(info["sha"], max_bytes)
+
     async def update_file_content(
         self,
         file_id: UUID,
@@ -272,7 +368,7 @@ class FileService:
 
         try:
             # Update file in filesystem
-            self.git_service.write_file(file.path, content)
+            await self.git.write_file(file.path, content)
 
             # Update file record
             updated_file = await self.repository.update_content(
@@ -289,7 +385,7 @@ class FileService:
                 if not commit_message:
                     commit_message = f"Update file: {file.path}"
 
-                commit_info = self.git_service.commit(
+                commit_info = await self.git.commit(
                     message=commit_message,
                     author_name=await self._get_user_name(user_id),
                     author_email=await self._get_user_email(user_id),
@@ -367,7 +463,7 @@ class FileService:
         # Try to stage in git if requested
         if commit and self.git_service.is_initialized():
             try:
-                self.git_service.rename_file(file.path, new_path, stage=True)
+                await self.git.rename_file(file.path, new_path, stage=True)
             except Exception:
                 # Git staging failed, but file was moved successfully
                 pass
@@ -393,7 +489,7 @@ class FileService:
             if not commit_message:
                 commit_message = f"Rename file: {file.path} → {new_path}"
 
-            commit_info = self.git_service.commit(
+            commit_info = await self.git.commit(
                 message=commit_message,
                 author_name=await self._get_user_name(user_id),
                 author_email=await self._get_user_email(user_id),
@@ -457,7 +553,7 @@ class FileService:
         # Try to stage in git if requested
         if commit and self.git_service.is_initialized():
             try:
-                self.git_service.delete_file(file.path, stage=True)
+                await self.git.delete_file(file.path, stage=True)
             except Exception:
                 # Git staging failed, but file was deleted successfully
                 pass
@@ -470,7 +566,7 @@ class FileService:
             if not commit_message:
                 commit_message = f"Delete file: {file.path}"
 
-            self.git_service.commit(
+            await self.git.commit(
                 message=commit_message,
                 author_name=await self._get_user_name(user_id),
                 author_email=await self._get_user_email(user_id),
@@ -526,11 +622,22 @@ class FileService:
                     recursive=True,
                 )
             elif search:
+                file_types = [file_type] if file_type else None
                 files = await self.repository.search_files(
                     project_id=project_id,
                     query=search,
                     search_content=True,
+                    file_types=file_types,
+                    skip=skip,
+                    limit=limit,
+                )
+                total = await self.repository.count_search_results(
+                    project_id=project_id,
+                    query=search,
+                    search_content=True,
+                    file_types=file_types,
                 )
+                return files, total
             else:
                 files = await self.repository.list_by_project(
                     project_id=project_id,
@@ -590,23 +697,23 @@ class FileService:
             raise FilePermissionError("Must be a project member to search files")
 
         try:
-            # Search files
+            # Filtering, ranking and pagination all run in the database
             files = await self.repository.search_files(
                 project_id=project_id,
                 query=query,
                 search_content=search_content,
+                file_types=file_types,
+                skip=skip,
+                limit=limit,
+            )
+            total = await self.repository.count_search_results(
+                project_id=project_id,
+                query=query,
+                search_content=search_content,
+                file_types=file_types,
             )
 
-            # Filter by file types if specified
-            if file_types:
-                file_type_values = [ft.value for ft in file_types]
-                files = [f for f in files if f.file_type in file_type_values]
-
-            # Apply pagination
-            total = len(files)
-            paginated_files = files[skip : skip + limit]
-
-            return paginated_files, total
+            return files, total
 
         except Exception as e:
             logger.error(f"Failed to search files in project {project_id}: {e}")
@@ -639,7 +746,7 @@ class FileService:
             # Get commit history from git
             commits = []
             if self.git_service.is_initialized():
-                git_commits = self.git_service.get_file_history(file.path, max_commits)
+                git_commits = await self.git.get_file_history(file.path, max_commits)
                 commits = git_commits
 
             return file, commits
@@ -650,14 +757,20 @@ class FileService:
 
     async def sync_from_git(self, project_id: UUID, user_id: UUID) -> int:
         """
-        Scan git repository and sync files to database.
+        Sync the file index with the git repository's HEAD tree.
+
+        After the first sync only the tree diff between the last synced
+        commit and HEAD is applied (`git diff-tree`); a full tree walk
+        happens on the first sync or when the last synced commit is gone.
+        Existing rows are loaded once as a path index and all changes are
+        written with bulk statements. Git work runs in a worker thread.
 
         Args:
             project_id: Project UUID
             user_id: User performing sync
 
         Returns:
-            Count of synced files
+            Count of files added, updated, renamed or deleted
 
         Raises:
             FilePermissionError: If user lacks permissions
@@ -676,92 +789,121 @@ class FileService:
             return 0
 
         try:
-            synced_count = 0
-            new_files = 0
-            updated_files = 0
-
-            # Get all tracked files from git using ls-files command
-            repo = self.git_service.repo
+            project = await self.project_service.get_project(project_id)
+            base_sha = project.files_synced_sha
 
-            # Get list of all tracked files
-            tracked_files = repo.git.ls_files().splitlines()
+            head_sha = await self.git.resolve_commit("HEAD")
+            if head_sha is None or head_sha == base_sha:
+                return 0
 
-            for file_path in tracked_files:
-                # Skip empty paths
-                if not file_path:
+            if base_sha and await self.git.resolve_commit(base_sha):
+                changes = await self.git.diff_tree(base_sha, head_sha)
+                full_walk = False
+            else:
+                tree = await self.git.list_tree(head_sha)
+                full_walk = True
+
+            index = await self.repository.get_path_hashes(project_id)
+            if full_walk:
+                changes = self._changes_from_tree(tree, index)
+
+            now = datetime.now(timezone.utc)
+            upserts: List[Dict[str, Any]] = []
+            renames: List[Dict[str, Any]] = []
+            deletes: List[str] = []
+
+            for change in changes:
+                path = change["path"]
+                if change["status"] == "D":
+                    deletes.append(path)
                     continue
 
-                try:
-                    # Get file info from git
-                    head_commit = repo.head.commit
-                    blob = head_commit.tree / file_path
-
-                    # Get file metadata
-                    content_hash = str(blob.hexsha)
-                    size_bytes = int(blob.size)
-
-                    # Check if file exists in database
-                    existing_file = await self.repository.get_by_path(project_id, file_path)
-
-                    if existing_file:
-                        # Update existing file if changed
-                        if existing_file.content_hash != content_hash:
-                            await self.repository.update(
-                                file_id=existing_file.id,
-                                update_data={
-                                    "content_hash": content_hash,
-                                    "size_bytes": size_bytes,
-                                    "last_modified_at": datetime.now(),
-                                },
-                            )
-                            updated_files += 1
-                    else:
-                        # Create new file record
-                        # Detect if binary by checking extension
-                        binary_extensions = {
-                            ".jpg",
-                            ".jpeg",
-                            ".png",
-                            ".gif",
-                            ".zip",
-                            ".exe",
-                            ".bin",
-                        }
-                        is_binary = Path(file_path).suffix.lower() in binary_extensions
-
-                        file_data = {
-                            "project_id": project_id,
-                            "path": file_path,
-                            "name": Path(file_path).name,
-                            "extension": Path(file_path).suffix,
-                            "content": None,  # Don't store large content in DB
-                            "content_hash": content_hash,
-                            "size_bytes": size_bytes,
-                            "file_type": self._detect_file_type(file_path),
-                            "language": self._detect_language(file_path),
-                            "is_binary": is_binary,
-                        }
-
-                        file = File(**file_data)
-                        await self.repository.create(file)
-                        new_files += 1
-
-                    synced_count += 1
-
-                except Exception as file_error:
-                    logger.warning(f"Failed to sync file {file_path}: {file_error}")
-                    continue
+                row = self._file_row(project_id, change, now)
+                if change["status"] == "R":
+                    if change["old_path"] in index and path not in index:
+                        # Move in place so the row keeps its ID and commit links
+                        renames.append(
+                            {"old_path": change["old_path"]}
+                            | {key: row[key] for key in RENAMED_FIELDS}
+                        )
+                        continue
+                    deletes.append(change["old_path"])
+
+                if index.get(path) != (change["sha"], False):
+                    upserts.append(row)
+
+            renamed = await self.repository.bulk_rename(project_id, renames)
+            written = await self.repository.bulk_upsert(upserts)
+            deleted = await self.repository.bulk_soft_delete(project_id, deletes)
+
+            await self.project_service.repository.update(project_id, files_synced_sha=head_sha)
+            self._schedule_code_index(project_id, None if full_walk else base_sha, head_sha)
 
             logger.info(
-                f"Synced {synced_count} files for project {project_id} "
-                f"({new_files} new, {updated_files} updated)"
+                f"Synced files for project {project_id} to {head_sha[:7]} "
+                f"({'full walk' if full_walk else f'diff from {base_sha[:7]}'}): "
+                f"{written} written, {renamed} renamed, {deleted} deleted"
             )
-            return synced_count
+            return written + renamed + deleted
 
         except Exception as e:
             logger.error(f"Failed to sync files from git for project {project_id}: {e}")
             raise FileOperationError(f"Failed to sync files from git: {e}")
 
+    def _schedule_code_index(
+        self, project_id: UUID, base_sha: Optional[str], head_sha: str
+    ) -> None:
+        """Queue code indexing for the synced commit range (None base: whole tree)."""
+        if not settings.code_index.enabled:
+            return
+        try:
+            from ardha.jobs.git_jobs import index_project_code
+
+            index_project_code.apply_async(  # type: ignore
+                args=[str(project_id), str(self.git.repo_path), base_sha, head_sha]
+            )
+        except Exception as e:
+            # Code indexing is best effort and never fails the file sync
+            logger.warning(f"Failed to queue code indexing for project {project_id}: {e}")
+
+    @staticmethod
+    def _changes_from_tree(
+        tree: Dict[str, Dict], index: Dict[str, Tuple[Optional[str], bool]]
+    ) -> List[Dict[str, Any]]:
+        """Express a full tree listing as changes against the stored path index."""
+        changes: List[Dict[str, Any]] = [
+            {"status": "M", "path": path, "sha": entry["sha"], "size": entry["size"]}
+            for path, entry in tree.items()
+            if index.get(path) != (entry["sha"], False)
+        ]
+        changes.extend(
+            {"status": "D", "path": path}
+            for path, (_, is_deleted) in index.items()
+            if not is_deleted and path not in tree
+        )
+        return changes
+
+    def _file_row(
+        self, project_id: UUID, change: Dict[str, Any], modified_at: datetime
+    ) -> Dict[str, Any]:
+        """Build a File row for a changed blob."""
+        path = Path(change["path"])
+        return {
+            "id": uuid4(),
+            "project_id": project_id,
+            "path": change["path"],
+            "name": path.name,
+            "extension": path.suffix,
+            "content": None,  # Don't store large content in DB
+            "content_hash": change["sha"],
+            "size_bytes": change["size"],
+            "file_type": self._detect_file_type(change["path"]),
+            "language": self._detect_language(change["path"]),
+            "is_binary": path.suffix.lower() in BINARY_EXTENSIONS,
+            "is_deleted": False,
+            "last_modified_at": modified_at,
+        }
+
     # ============= Helper Methods =============
 
     async def _validate_file_creation(self, project_id: UUID, file_path: str, content: str) -> None:
@@ -895,38 +1037,7 @@ class FileService:
 
     def _detect_language(self, file_path: str) -> Optional[str]:
         """Detect programming language from file extension."""
-        ext_to_lang = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".jsx": "javascript",
-            ".tsx": "typescript",
-            ".java": "java",
-            ".cpp": "cpp",
-            ".c": "c",
-            ".h": "c",
-            ".cs": "csharp",
-            ".php": "php",
-            ".rb": "ruby",
-            ".go": "go",
-            ".rs": "rust",
-            ".swift": "swift",
-            ".kt": "kotlin",
-            ".html": "html",
-            ".css": "css",
-            ".scss": "scss",
-            ".sass": "sass",
-            ".less": "less",
-            ".sql": "sql",
-            ".sh": "bash",
-            ".json": "json",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".xml": "xml",
-        }
-
-        file_ext = Path(file_path).suffix.lower()
-        return ext_to_lang.get(file_ext)
+        return EXTENSION_LANGUAGES.get(Path(file_path).suffix.lower())
 
     async def _get_user_name(self, user_id: UUID) -> str:
         """Get user name for git operations."""
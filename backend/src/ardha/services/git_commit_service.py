@@ -8,22 +8,30 @@ This module provides the business logic layer for git commit management, handlin
 - Commit metadata management
 """
 
+import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
-from uuid import UUID
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.config import settings
+from ardha.core.git_exceptions import GitInvalidRefError
 from ardha.models.git_commit import GitCommit
 from ardha.repositories.git_commit import GitCommitRepository
+from ardha.repositories.user_repository import UserRepository
 from ardha.schemas.git_commit import LinkType
+from ardha.services.async_git_service import AsyncGitService
 from ardha.services.git_service import GitService
 from ardha.services.project_service import ProjectService
 
 logger = logging.getLogger(__name__)
 
+# Commits inserted per multi-row INSERT during history sync
+SYNC_BATCH_SIZE = 500
+
 
 # ============= Custom Exceptions =============
 
@@ -75,6 +83,7 @@ class GitCommitService:
         self.repository = GitCommitRepository(db)
         self.project_service = ProjectService(db)
         self.git_service = GitService(Path(project_root))
+        self.git = AsyncGitService(Path(project_root))
 
     # ============= Core Git Commit Operations =============
 
@@ -129,14 +138,14 @@ class GitCommitService:
                 await self._stage_files_by_ids(file_ids)
 
             # Create git commit
-            commit_info = self.git_service.commit(
+            commit_info = await self.git.commit(
                 message=message,
                 author_name=author_name,
                 author_email=author_email,
             )
 
             # Get current branch
-            current_branch = self.git_service.get_current_branch()
+            current_branch = await self.git.get_current_branch()
 
             # Parse commit message for task IDs
             task_info = self.git_service.parse_commit_message(message)
@@ -535,6 +544,12 @@ class GitCommitService:
         """
         Sync commits from git repository to database.
 
+        Streams `git log --numstat` in a worker thread, oldest first, and
+        inserts new commits in batches. When the newest stored commit for the
+        branch is still an ancestor of the branch tip, only commits after it
+        are read; otherwise (first sync, rewritten history, explicit since)
+        the whole range is walked and known SHAs are skipped.
+
         Args:
             project_id: Project UUID
             user_id: User performing sync
@@ -556,51 +571,53 @@ class GitCommitService:
             raise GitCommitPermissionError("Must be project admin or owner to sync commits")
 
         try:
-            # Get commit history from git
-            git_commits = self.git_service.get_commit_history(
-                branch=branch,
-                max_count=1000,  # Limit for performance
-            )
+            revision = branch or "HEAD"
+            branch_name = branch or await self.git.get_current_branch()
+
+            resume_sha = None
+            if since is None:
+                latest = await self.repository.get_latest_commit(project_id, branch=branch_name)
+                if latest and await self.git.is_ancestor(latest.sha, revision):
+                    resume_sha = latest.sha
+
+            existing_shas = await self.repository.get_shas(project_id)
+            author_ids: Dict[str, Optional[UUID]] = {}
 
             synced_count = 0
             new_commits = 0
             updated_commits = 0
 
-            for git_commit in git_commits:
-                # Check if commit already exists
-                existing_commit = await self.repository.get_by_sha(
-                    project_id=project_id,
-                    sha=git_commit["sha"],
-                )
-
-                if not existing_commit:
-                    # Create new commit record
-                    commit_data = {
-                        "project_id": project_id,
-                        "sha": git_commit["sha"],
-                        "message": git_commit["message"],
-                        "author_name": git_commit["author_name"],
-                        "author_email": git_commit["author_email"],
-                        "branch": git_commit.get("branch", "main"),
-                        "committed_at": datetime.fromisoformat(git_commit["committed_at"]),
-                        "is_merge": False,
-                        "files_changed": git_commit["files_changed"],
-                        "insertions": git_commit["insertions"],
-                        "deletions": git_commit["deletions"],
-                        "ardha_user_id": await self._map_git_author_to_user(
-                            git_commit["author_email"]
-                        ),
-                    }
-
-                    commit = GitCommit(**commit_data)
-                    await self.repository.create(commit)
-                    new_commits += 1
-                else:
-                    # Update existing commit if needed
-                    updated_commits += 1
-
-                synced_count += 1
-
+            batches = self.git_service.iter_commit_log(
+                revision=revision,
+                since_sha=resume_sha,
+                since=since,
+                batch_size=SYNC_BATCH_SIZE,
+                reverse=True,
+            )
+            try:
+                while True:
+                    # Advance the blocking git log parser off the event loop
+                    batch = await self.git.read(lambda git: next(batches, None))
+                    if batch is None:
+                        break
+
+                    fresh = [c for c in batch if c["sha"] not in existing_shas]
+                    updated_commits += len(batch) - len(fresh)
+                    synced_count += len(batch)
+
+                    await self._map_git_authors_to_users(
+                        [c["author_email"] for c in fresh], author_ids
+                    )
+                    rows = [self._commit_row(project_id, branch_name, c, author_ids) for c in fresh]
+                    new_commits += await self.repository.bulk_insert(rows)
+                    existing_shas.update(c["sha"] for c in fresh)
+            finally:
+                batches.close()
+
+            logger.info(
+                f"Synced {synced_count} commits for project {project_id} "
+                f"({new_commits} new, resumed from {resume_sha or 'start'})"
+            )
             return {
                 "synced_count": synced_count,
                 "new_commits": new_commits,
@@ -612,6 +629,33 @@ class GitCommitService:
             logger.error(f"Failed to sync commits for project {project_id}: {e}")
             raise GitCommitOperationError(f"Failed to sync commits: {e}")
 
+    @staticmethod
+    def _commit_row(
+        project_id: UUID,
+        branch: str,
+        git_commit: Dict[str, Any],
+        author_ids: Dict[str, Optional[UUID]],
+    ) -> Dict[str, Any]:
+        """Build a GitCommit insert row from a parsed git log entry."""
+        return {
+            "id": uuid4(),
+            "project_id": project_id,
+            "sha": git_commit["sha"],
+            "short_sha": git_commit["short_sha"],
+            "message": git_commit["message"],
+            "author_name": git_commit["author_name"],
+            "author_email": git_commit["author_email"],
+            "branch": branch,
+            "committed_at": git_commit["committed_at"],
+            "is_merge": git_commit["is_merge"],
+            "parent_shas": git_commit["parent_shas"],
+            "files_changed": git_commit["files_changed"],
+            "insertions": git_commit["insertions"],
+            "deletions": git_commit["deletions"],
+            "ardha_user_id": author_ids.get(git_commit["author_email"].lower()),
+            "synced_at": datetime.now(timezone.utc),
+        }
+
     async def get_commit_stats(
         self,
         project_id: UUID,
@@ -715,14 +759,67 @@ class GitCommitService:
         commit = await self.get_commit(commit_id, user_id)
 
         try:
-            # Get diff from git
-            diff = self.git_service.get_diff(ref1=f"{commit.sha}^", ref2=commit.sha)
-            return diff
+            # Collect through the capped stream so huge diffs stay bounded
+            chunks = await self.stream_commit_diff(commit_id, user_id, commit=commit)
+            return b"".join([chunk async for chunk in chunks]).decode("utf-8", errors="replace")
 
+        except GitCommitNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get diff for commit {commit_id}: {e}")
             raise GitCommitOperationError(f"Failed to get commit diff: {e}")
 
+    async def stream_commit_diff(
+        self,
+        commit_id: UUID,
+        user_id: UUID,
+        diff_format: str = "patch",
+        commit: Optional[GitCommit] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the diff a commit introduced, capped per file and in total.
+
+        Caps come from settings.git.diff_max_bytes and diff_max_file_bytes;
+        cut sections end with a marker line (patch) or "truncated" flag
+        (hunks). The commit is checked before streaming starts so errors
+        can still be reported as a normal response.
+
+        Args:
+            commit_id: Commit UUID
+            user_id: User requesting diff
+            diff_format: "patch" for unified diff bytes, "hunks" for one JSON
+                object per changed file per line (NDJSON)
+            commit: Already loaded and permission-checked commit
+
+        Returns:
+            Async iterator of response chunks
+
+        Raises:
+            GitCommitNotFoundError: If commit not found in database or repository
+            GitCommitPermissionError: If user lacks permissions
+        """
+        if commit is None:
+            commit = await self.get_commit(commit_id, user_id)
+
+        try:
+            base = await self.git.diff_base(commit.sha)
+        except GitInvalidRefError:
+            raise GitCommitNotFoundError(f"Commit {commit.sha} not found in repository")
+
+        caps = {
+            "max_bytes": settings.git.diff_max_bytes,
+            "max_file_bytes": settings.git.diff_max_file_bytes,
+        }
+        if diff_format == "hunks":
+            return self._ndjson(self.git.iter_diff_files(base, commit.sha, **caps))
+        return self.git.stream_diff(base, commit.sha, **caps)
+
+    @staticmethod
+    async def _ndjson(items: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+        """Encode items as newline-delimited JSON."""
+        async for item in items:
+            yield (json.dumps(item) + "\n").encode()
+
     async def push_commits(
         self,
         project_id: UUID,
@@ -758,7 +855,7 @@ class GitCommitService:
 
         try:
             # Push to remote
-            self.git_service.push(remote=remote, branch=branch, force=force)
+            await self.git.push(remote=remote, branch=branch, force=force)
 
             # Update pushed_at timestamps for commits
             if branch:
@@ -776,7 +873,7 @@ class GitCommitService:
 
             return {
                 "success": True,
-                "branch": branch or self.git_service.get_current_branch(),
+                "branch": branch or await self.git.get_current_branch(),
                 "remote": remote,
             }
 
@@ -817,7 +914,7 @@ class GitCommitService:
 
         try:
             # Pull from remote
-            self.git_service.pull(remote=remote, branch=branch)
+            await self.git.pull(remote=remote, branch=branch)
 
             # Sync new commits to database
             sync_result = await self.sync_commits_from_git(
@@ -864,10 +961,12 @@ class GitCommitService:
 
         try:
             # Create revert commit in git
-            self.git_service.repo.git.revert(commit.sha, "--no-edit")
+            def revert(git: GitService):
+                git.repo.git.revert(commit.sha, "--no-edit")
+                head = git.repo.head.commit
+                return head, head.stats.total
 
-            # Get the revert commit
-            revert_commit_obj = self.git_service.repo.head.commit
+            revert_commit_obj, revert_stats = await self.git.write(revert)
 
             # Create database record for revert commit
             revert_message = (
@@ -880,12 +979,12 @@ class GitCommitService:
                 "message": revert_message,
                 "author_name": revert_commit_obj.author.name,
                 "author_email": revert_commit_obj.author.email,
-                "branch": self.git_service.get_current_branch(),
+                "branch": await self.git.get_current_branch(),
                 "committed_at": datetime.fromtimestamp(revert_commit_obj.committed_date),
                 "is_merge": False,
-                "files_changed": revert_commit_obj.stats.total["files"],
-                "insertions": revert_commit_obj.stats.total["insertions"],
-                "deletions": revert_commit_obj.stats.total["deletions"],
+                "files_changed": revert_stats["files"],
+                "insertions": revert_stats["insertions"],
+                "deletions": revert_stats["deletions"],
                 "ardha_user_id": user_id,
             }
 
@@ -914,12 +1013,12 @@ class GitCommitService:
         # This would need to resolve file IDs to paths
         # For now, we'll stage all changes
         if self.git_service.is_initialized():
-            status = self.git_service.get_status()
+            status = await self.git.get_status()
             all_files = (
                 status["untracked"] + status["modified"] + status["staged"] + status["deleted"]
             )
             if all_files:
-                self.git_service.stage_files(all_files)
+                await self.git.stage_files(all_files)
 
     async def _link_commit_to_files(self, commit_id: UUID, file_ids: list[UUID]) -> None:
         """Link commit to files with change details."""
@@ -949,8 +1048,23 @@ class GitCommitService:
         # This would typically query the user repository
         return f"user-{user_id.hex[:8]}@ardha.local"
 
-    async def _map_git_author_to_user(self, author_email: str) -> Optional[UUID]:
-        """Map git author email to Ardha user ID."""
-        # This would typically query the user repository
-        # For now, return None to indicate unmapped
-        return None
+    async def _map_git_authors_to_users(
+        self, author_emails: List[str], known: Dict[str, Optional[UUID]]
+    ) -> None:
+        """
+        Resolve git author emails to Ardha user IDs.
+
+        Looks up only emails not already in known, in a single query, and
+        records misses as None so they are not queried again.
+
+        Args:
+            author_emails: Author emails from a batch of commits
+            known: Lowercased email to user ID mapping, updated in place
+        """
+        unseen = {email.lower() for email in author_emails} - known.keys()
+        if not unseen:
+            return
+
+        found = await UserRepository(self.db).get_ids_by_emails(list(unseen))
+        for email in unseen:
+            known[email] = found.get(email)
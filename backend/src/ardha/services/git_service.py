@@ -10,10 +10,11 @@ import logging
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 
 from git import Git, GitCommandError, Repo
+from gitdb.exc import BadObject
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -32,6 +33,60 @@ from ardha.core.git_exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# git log format for streaming history: each record starts with RS (0x1e),
+# header fields are separated by US (0x1f) and the header ends with US NUL,
+# after which -z numstat entries follow as NUL-terminated tokens.
+_LOG_RECORD_SEP = b"\x1e"
+_LOG_HEADER_END = b"\x1f\x00"
+_LOG_FORMAT = "--format=%x1e%H%x1f%P%x1f%an%x1f%ae%x1f%ct%x1f%B%x1f"
+_LOG_READ_SIZE = 64 * 1024
+
+# Tree entry mode of submodules (gitlinks)
+GITLINK_MODE = "160000"
+
+# Well-known SHA of the empty tree, the diff base for root commits
+EMPTY_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+# Streamed diffs that hit a byte cap get a marker line with this prefix;
+# git uses the same "\\ " prefix for "No newline at end of file" notes.
+DIFF_TRUNCATION_PREFIX = b"\\ Diff truncated: "
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+# Task references in commit messages and PR text (e.g. "ARD-12", "#12"),
+# optionally preceded by a closing keyword
+_TASK_REFERENCE = r"(?:TAS|TASK|ARD)-\d+|#\d+"
+_TASK_REFERENCE_PATTERN = re.compile(_TASK_REFERENCE, re.IGNORECASE)
+_CLOSING_PATTERNS = [
+    (re.compile(r"closes?\s+(" + _TASK_REFERENCE + r")", re.IGNORECASE), "closes"),
+    (re.compile(r"fixes?\s+(" + _TASK_REFERENCE + r")", re.IGNORECASE), "fixes"),
+    (re.compile(r"resolves?\s+(" + _TASK_REFERENCE + r")", re.IGNORECASE), "resolves"),
+]
+
+
+def parse_task_references(message: str) -> Dict[str, List[str]]:
+    """
+    Extract task IDs from a commit message or PR text.
+
+    Args:
+        message: Text to scan
+
+    Returns:
+        Dict with deduplicated, uppercased IDs under "mentioned", "closes",
+        "fixes" and "resolves"
+    """
+    references: Dict[str, List[str]] = {"mentioned": [], "closes": [], "fixes": [], "resolves": []}
+    if not message:
+        return references
+
+    mentioned = {match.upper() for match in _TASK_REFERENCE_PATTERN.findall(message)}
+    references["mentioned"] = list(mentioned)
+    for pattern, category in _CLOSING_PATTERNS:
+        references[category] = list({match.upper() for match in pattern.findall(message)})
+
+    return references
+
 
 class GitService:
     """
@@ -915,6 +970,296 @@ class GitService:
             logger.error(f"Failed to get commit history: {e}")
             raise GitOperationError(f"Failed to get commit history: {e}", git_error=e)
 
+    def iter_commit_log(
+        self,
+        revision: str = "HEAD",
+        since_sha: Optional[str] = None,
+        since: Optional[datetime] = None,
+        max_count: Optional[int] = None,
+        batch_size: int = 500,
+        reverse: bool = False,
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream commit history with line statistics in batches.
+
+        Runs a single `git log --numstat -z` process and parses its output
+        incrementally, instead of spawning a diff per commit. The generator
+        is blocking; async callers should advance it in a worker thread.
+
+        Args:
+            revision: Revision to walk from (branch, tag or SHA)
+            since_sha: Only commits not reachable from this SHA (exclusive)
+            since: Only commits newer than this date
+            max_count: Optional maximum number of commits
+            batch_size: Number of commits per yielded batch
+            reverse: Yield oldest commits first
+
+        Yields:
+            Lists of commit dictionaries, newest first unless reverse is set
+
+        Raises:
+            GitOperationError: If git log fails
+        """
+        args = [f"{since_sha}..{revision}" if since_sha else revision, "--numstat", "-z"]
+        args.append(_LOG_FORMAT)
+        if since is not None:
+            args.append(f"--since={since.isoformat()}")
+        if max_count is not None:
+            args.append(f"--max-count={max_count}")
+        if reverse:
+            args.append("--reverse")
+
+        try:
+            process = self.repo.git.log(*args, as_process=True)
+        except GitCommandError as e:
+            logger.error(f"Failed to read commit log: {e}")
+            raise GitOperationError(f"Failed to read commit log: {e}", git_error=e)
+
+        batch: List[Dict] = []
+        buffer = b""
+        try:
+            while True:
+                chunk = process.stdout.read(_LOG_READ_SIZE)
+                if chunk:
+                    buffer += chunk
+                    *records, buffer = buffer.split(_LOG_RECORD_SEP)
+                else:
+                    records, buffer = [buffer], b""
+
+                for record in records:
+                    if record:
+                        batch.append(self._parse_log_record(record))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+
+                if not chunk:
+                    break
+
+            if batch:
+                yield batch
+
+            process.wait()
+
+        except GitCommandError as e:
+            logger.error(f"Failed to read commit log: {e}")
+            raise GitOperationError(f"Failed to read commit log: {e}", git_error=e)
+
+        finally:
+            if process.proc is not None and process.proc.poll() is None:
+                process.proc.kill()
+                process.proc.wait()
+
+    @staticmethod
+    def _parse_log_record(record: bytes) -> Dict:
+        """Parse one record produced with _LOG_FORMAT and -z numstat."""
+        header, _, numstat = record.partition(_LOG_HEADER_END)
+        sha, parents, author_name, author_email, timestamp, message = header.decode(
+            "utf-8", errors="replace"
+        ).split("\x1f", 5)
+        message = message.rstrip("\x1f")
+
+        files_changed = insertions = deletions = 0
+        tokens = iter(numstat.lstrip(b"\n").split(b"\x00"))
+        for token in tokens:
+            if not token:
+                continue
+            added, deleted, path = token.split(b"\t", 2)
+            if not path:
+                # Rename or copy: old and new paths follow as separate tokens
+                next(tokens, None)
+                next(tokens, None)
+            files_changed += 1
+            insertions += int(added) if added != b"-" else 0
+            deletions += int(deleted) if deleted != b"-" else 0
+
+        parent_shas = parents.split()
+        return {
+            "sha": sha,
+            "short_sha": sha[:7],
+            "message": message.strip(),
+            "author_name": author_name,
+            "author_email": author_email,
+            "committed_at": datetime.fromtimestamp(int(timestamp), tz=timezone.utc),
+            "parent_shas": parent_shas,
+            "is_merge": len(parent_shas) > 1,
+            "files_changed": files_changed,
+            "insertions": insertions,
+            "deletions": deletions,
+        }
+
+    def is_ancestor(self, ancestor: str, descendant: str = "HEAD") -> bool:
+        """
+        Check whether a commit is reachable from another.
+
+        Args:
+            ancestor: Candidate ancestor SHA
+            descendant: Revision to test against (default: HEAD)
+
+        Returns:
+            True if ancestor is reachable from descendant, False otherwise
+            (including when either ref does not exist)
+        """
+        try:
+            self.repo.git.merge_base("--is-ancestor", ancestor, descendant)
+            return True
+        except GitCommandError:
+            return False
+
+    # ============= Trees =============
+
+    def resolve_commit(self, ref: str = "HEAD") -> Optional[str]:
+        """
+        Resolve a revision to a commit SHA.
+
+        Args:
+            ref: Revision to resolve (default: HEAD)
+
+        Returns:
+            Full commit SHA, or None if the revision does not exist
+        """
+        try:
+            return self.repo.git.rev_parse("--verify", "--quiet", f"{ref}^{{commit}}")
+        except GitCommandError:
+            return None
+
+    def list_tree(self, ref: str = "HEAD") -> Dict[str, Dict]:
+        """
+        List every file blob in a commit's tree with one `git ls-tree`.
+
+        Submodule entries are skipped.
+
+        Args:
+            ref: Commit to list (default: HEAD)
+
+        Returns:
+            Mapping of path to {"sha", "size"}
+
+        Raises:
+            GitOperationError: If the tree cannot be read
+        """
+        try:
+            output = self.repo.git.ls_tree("-r", "-l", "-z", ref)
+        except GitCommandError as e:
+            logger.error(f"Failed to list tree for {ref}: {e}")
+            raise GitOperationError(f"Failed to list tree: {e}", git_error=e)
+
+        entries: Dict[str, Dict] = {}
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            meta, path = record.split("\t", 1)
+            _, object_type, sha, size = meta.split()
+            if object_type == "blob":
+                entries[path] = {"sha": sha, "size": int(size)}
+        return entries
+
+    def diff_tree(self, old_ref: str, new_ref: str = "HEAD") -> List[Dict]:
+        """
+        List file changes between two commits with one `git diff-tree`.
+
+        Renames are detected. Sizes of added and modified blobs are read
+        through GitPython's persistent cat-file process rather than a
+        subprocess per file. Submodule entries are skipped.
+
+        Args:
+            old_ref: Base commit
+            new_ref: Target commit (default: HEAD)
+
+        Returns:
+            List of changes with "status" (A, M, D or R), "path", "sha",
+            "size" and, for renames, "old_path"
+
+        Raises:
+            GitOperationError: If either commit cannot be read
+        """
+        try:
+            output = self.repo.git.diff_tree(
+                "-r", "--raw", "-z", "-M", "--no-commit-id", old_ref, new_ref
+            )
+        except GitCommandError as e:
+            logger.error(f"Failed to diff trees {old_ref}..{new_ref}: {e}")
+            raise GitOperationError(f"Failed to diff trees: {e}", git_error=e)
+
+        changes: List[Dict] = []
+        tokens = iter(output.split("\x00"))
+        for meta in tokens:
+            if not meta.startswith(":"):
+                continue
+            old_mode, new_mode, _, new_sha, status = meta[1:].split(" ")
+            path = next(tokens)
+            old_path = None
+            if status[0] in ("R", "C"):
+                old_path, path = path, next(tokens)
+            if GITLINK_MODE in (old_mode, new_mode):
+                continue
+
+            change = {"status": status[0], "path": path, "sha": None, "size": 0}
+            if status[0] == "C":
+                change["status"] = "A"
+            elif status[0] == "T":
+                change["status"] = "M"
+            elif status[0] == "R":
+                change["old_path"] = old_path
+
+            if change["status"] != "D":
+                change["sha"] = new_sha
+                change["size"] = self.repo.odb.info(bytes.fromhex(new_sha)).size
+            changes.append(change)
+        return changes
+
+    def diff_stats(self, old_ref: str, new_ref: str = "HEAD") -> List[Dict]:
+        """
+        Get per-file change type and line counts between two commits.
+
+        Uses a single `git diff-tree --raw --numstat` instead of generating
+        and scanning full patches. Binary files report zero line counts.
+
+        Args:
+            old_ref: Base commit (EMPTY_TREE_SHA for a root commit)
+            new_ref: Target commit (default: HEAD)
+
+        Returns:
+            List of {"path", "change_type", "insertions", "deletions",
+            "binary"} and, for renames, "old_path"
+
+        Raises:
+            GitOperationError: If either commit cannot be read
+        """
+        try:
+            output = self.repo.git.diff_tree(
+                "-r", "-z", "-M", "--raw", "--numstat", "--no-commit-id", old_ref, new_ref
+            )
+        except GitCommandError as e:
+            logger.error(f"Failed to get diff stats {old_ref}..{new_ref}: {e}")
+            raise GitOperationError(f"Failed to get diff stats: {e}", git_error=e)
+
+        files: Dict[str, Dict] = {}
+        tokens = iter(output.split("\x00"))
+        for token in tokens:
+            if token.startswith(":"):
+                # Raw entries come first and carry the change type
+                change_type = token.split(" ")[4][0]
+                path = next(tokens)
+                entry = {"path": path, "change_type": change_type}
+                if change_type in ("R", "C"):
+                    entry["old_path"], entry["path"] = path, next(tokens)
+                entry.update(insertions=0, deletions=0, binary=False)
+                files[entry["path"]] = entry
+            elif "\t" in token:
+                added, deleted, path = token.split("\t", 2)
+                if not path:
+                    # Rename or copy: old and new paths follow as separate tokens
+                    next(tokens, None)
+                    path = next(tokens, "")
+                entry = files.get(path)
+                if entry is None:
+                    continue
+                entry["binary"] = added == "-"
+                entry["insertions"] = int(added) if added != "-" else 0
+                entry["deletions"] = int(deleted) if deleted != "-" else 0
+        return list(files.values())
+
     def get_commit_details(self, sha: str) -> Dict:
         """
         Get detailed commit information.
@@ -932,17 +1277,9 @@ class GitService:
             # Get commit
             commit = self.repo.commit(sha)
 
-            # Get file changes
-            files_changed = []
-            for diff in commit.diff(commit.parents[0] if commit.parents else None):
-                files_changed.append(
-                    {
-                        "path": diff.a_path if diff.a_path else diff.b_path,
-                        "change_type": diff.change_type,
-                        "insertions": diff.diff.count(b"+") if diff.diff else 0,
-                        "deletions": diff.diff.count(b"-") if diff.diff else 0,
-                    }
-                )
+            # Get per-file line counts from numstat against the first parent
+            base = commit.parents[0].hexsha if commit.parents else EMPTY_TREE_SHA
+            files_changed = self.diff_stats(base, commit.hexsha)
 
             # Parse commit message for task IDs
             message = commit.message
@@ -957,9 +1294,9 @@ class GitService:
                 "author_name": commit.author.name,
                 "author_email": commit.author.email,
                 "committed_at": datetime.fromtimestamp(commit.committed_date).isoformat(),
-                "files_changed": commit.stats.total["files"],
-                "insertions": commit.stats.total["insertions"],
-                "deletions": commit.stats.total["deletions"],
+                "files_changed": len(files_changed),
+                "insertions": sum(f["insertions"] for f in files_changed),
+                "deletions": sum(f["deletions"] for f in files_changed),
                 "files": files_changed,
                 "task_info": task_info,
                 "parents": [p.hexsha for p in commit.parents],
@@ -971,6 +1308,388 @@ class GitService:
                 raise GitInvalidRefError(f"Invalid commit reference: {sha}")
             raise GitOperationError(f"Failed to get commit details: {e}", git_error=e)
 
+    # ============= Streaming =============
+
+    def diff_base(self, sha: str) -> str:
+        """
+        Get the ref a commit's own changes are diffed against.
+
+        Args:
+            sha: Commit SHA
+
+        Returns:
+            First parent SHA, or EMPTY_TREE_SHA for a root commit
+
+        Raises:
+            GitInvalidRefError: If the commit does not exist
+        """
+        if self.resolve_commit(sha) is None:
+            raise GitInvalidRefError(f"Invalid commit reference: {sha}")
+        return self.resolve_commit(f"{sha}^") or EMPTY_TREE_SHA
+
+    def blob_info(self, file_path: str, ref: str = "HEAD") -> Dict:
+        """
+        Look up the blob for a file at a ref without reading its content.
+
+        Args:
+            file_path: Path to file
+            ref: Git reference (default: HEAD)
+
+        Returns:
+            Dictionary with blob "sha" and "size" in bytes
+
+        Raises:
+            FileNotFoundError: If no file exists at that path and ref
+        """
+        try:
+            sha = self.repo.git.rev_parse("--verify", "--quiet", f"{ref}:{file_path}")
+        except GitCommandError:
+            raise FileNotFoundError(f"File not found: {file_path} at {ref}")
+
+        info = self.repo.odb.info(bytes.fromhex(sha))
+        if info.type != b"blob":
+            raise FileNotFoundError(f"Not a file: {file_path} at {ref}")
+        return {"sha": sha, "size": info.size}
+
+    def stream_blob(
+        self,
+        sha: str,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream blob content from `git cat-file` in chunks.
+
+        The generator is blocking; async callers should advance it in a
+        worker thread.
+
+        Args:
+            sha: Blob SHA (see blob_info)
+            max_bytes: Stop after this many bytes (default: whole blob)
+            chunk_size: Maximum bytes per yielded chunk
+
+        Yields:
+            Raw content chunks
+
+        Raises:
+            GitOperationError: If the blob cannot be read
+        """
+        process = self.repo.git.cat_file("blob", sha, as_process=True)
+        remaining = max_bytes
+        try:
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = process.stdout.read(size)
+                if not chunk:
+                    process.wait()
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+        except GitCommandError as e:
+            logger.error(f"Failed to read blob {sha}: {e}")
+            raise GitOperationError(f"Failed to read blob: {e}", git_error=e)
+
+        finally:
+            self._kill_process(process)
+
+    def read_blobs(self, shas: List[str]) -> Dict[str, bytes]:
+        """
+        Read several blobs through GitPython's persistent cat-file process.
+
+        Avoids one `git cat-file` subprocess per blob when many small
+        files are read together.
+
+        Args:
+            shas: Blob SHAs to read
+
+        Returns:
+            Mapping of blob SHA to raw content
+
+        Raises:
+            GitOperationError: If a blob cannot be read
+        """
+        blobs: Dict[str, bytes] = {}
+        for sha in shas:
+            try:
+                blobs[sha] = self.repo.odb.stream(bytes.fromhex(sha)).read()
+            except (GitCommandError, BadObject, ValueError) as e:
+                logger.error(f"Failed to read blob {sha}: {e}")
+                raise GitOperationError(f"Failed to read blob: {e}", git_error=e)
+        return blobs
+
+    def stream_diff(
+        self,
+        ref1: str,
+        ref2: str,
+        file_path: Optional[str] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_file_bytes: int = 1024 * 1024,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream a unified diff between two commits with byte caps.
+
+        Output is read from `git diff` incrementally. Once one file's patch
+        exceeds max_file_bytes, the rest of that file is replaced by a
+        DIFF_TRUNCATION_PREFIX marker line and streaming continues with the
+        next file; once the whole output would exceed max_bytes, a final
+        marker is written and git is stopped.
+
+        Args:
+            ref1: Base commit
+            ref2: Target commit
+            file_path: Optional path to limit the diff to
+            max_bytes: Cap on total patch bytes
+            max_file_bytes: Cap on patch bytes per file
+            chunk_size: Approximate bytes per yielded chunk
+
+        Yields:
+            Patch chunks
+
+        Raises:
+            GitOperationError: If git diff fails
+        """
+        process = self._start_diff(ref1, ref2, file_path)
+        pending: List[bytes] = []
+        pending_size = total = file_bytes = 0
+        file_truncated = False
+        ends_with_newline = True
+        try:
+            for segment, line_start in self._iter_line_segments(process.stdout, chunk_size):
+                if line_start and segment.startswith(b"diff --git "):
+                    file_bytes = 0
+                    file_truncated = False
+                elif file_truncated:
+                    continue
+                elif file_bytes + len(segment) > max_file_bytes:
+                    file_truncated = True
+                    segment = self._truncation_marker(
+                        f"file diff exceeds {max_file_bytes} bytes", ends_with_newline
+                    )
+
+                if total + len(segment) > max_bytes:
+                    pending.append(
+                        self._truncation_marker(
+                            f"diff exceeds {max_bytes} bytes", ends_with_newline
+                        )
+                    )
+                    yield b"".join(pending)
+                    return
+
+                file_bytes += len(segment)
+                total += len(segment)
+                ends_with_newline = segment.endswith(b"\n")
+                pending.append(segment)
+                pending_size += len(segment)
+                if pending_size >= chunk_size:
+                    yield b"".join(pending)
+                    pending, pending_size = [], 0
+
+            if pending:
+                yield b"".join(pending)
+            process.wait()
+
+        except GitCommandError as e:
+            logger.error(f"Failed to stream diff {ref1}..{ref2}: {e}")
+            raise GitOperationError(f"Failed to stream diff: {e}", git_error=e)
+
+        finally:
+            self._kill_process(process)
+
+    def iter_diff_files(
+        self,
+        ref1: str,
+        ref2: str,
+        file_path: Optional[str] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_file_bytes: int = 1024 * 1024,
+    ) -> Iterator[Dict]:
+        """
+        Stream a diff between two commits as structured per-file hunks.
+
+        Each file is yielded as soon as its patch has been read. Line counts
+        cover the whole file; hunk lines stop once the file's patch exceeds
+        max_file_bytes, and the file is flagged "truncated". If the total
+        exceeds max_bytes, the current file is yielded truncated followed by
+        {"truncated": True, "max_bytes": max_bytes}, and git is stopped.
+
+        Args:
+            ref1: Base commit
+            ref2: Target commit
+            file_path: Optional path to limit the diff to
+            max_bytes: Cap on total hunk line bytes
+            max_file_bytes: Cap on hunk line bytes per file
+
+        Yields:
+            File dictionaries with "path", "old_path", "status" (A, M, D or
+            R), "binary", "additions", "deletions", "truncated" and "hunks"
+            ({"header", "old_start", "old_lines", "new_start", "new_lines",
+            "lines"})
+
+        Raises:
+            GitOperationError: If git diff fails
+        """
+        process = self._start_diff(ref1, ref2, file_path)
+        current: Optional[Dict] = None
+        hunk: Optional[Dict] = None
+        total = file_bytes = 0
+        try:
+            for segment, line_start in self._iter_line_segments(process.stdout):
+                if line_start and segment.startswith(b"diff --git "):
+                    if current is not None:
+                        yield current
+                    current = self._new_diff_file(segment)
+                    hunk = None
+                    file_bytes = 0
+                    continue
+                if current is None:
+                    continue
+
+                text = segment.decode("utf-8", errors="replace")
+                if hunk is None and not text.startswith("@@"):
+                    self._apply_diff_header(current, text.rstrip("\n"))
+                    continue
+
+                if line_start and text.startswith("@@"):
+                    match = _HUNK_HEADER.match(text)
+                    old_start, old_lines, new_start, new_lines = (
+                        match.groups() if match else (0, None, 0, None)
+                    )
+                    hunk = {
+                        "header": text.rstrip("\n"),
+                        "old_start": int(old_start),
+                        "old_lines": int(old_lines) if old_lines is not None else 1,
+                        "new_start": int(new_start),
+                        "new_lines": int(new_lines) if new_lines is not None else 1,
+                        "lines": [],
+                    }
+                    if not current["truncated"]:
+                        current["hunks"].append(hunk)
+                elif line_start and text.startswith("+"):
+                    current["additions"] += 1
+                elif line_start and text.startswith("-"):
+                    current["deletions"] += 1
+
+                if current["truncated"]:
+                    continue
+                if file_bytes + len(segment) > max_file_bytes:
+                    current["truncated"] = True
+                    continue
+                if total + len(segment) > max_bytes:
+                    current["truncated"] = True
+                    yield current
+                    yield {"truncated": True, "max_bytes": max_bytes}
+                    return
+
+                file_bytes += len(segment)
+                total += len(segment)
+                if text.startswith("@@") and line_start:
+                    continue
+                if line_start:
+                    hunk["lines"].append(text.rstrip("\n"))
+                elif hunk["lines"]:
+                    # Continuation of a line longer than one segment
+                    hunk["lines"][-1] += text.rstrip("\n")
+
+            if current is not None:
+                yield current
+            process.wait()
+
+        except GitCommandError as e:
+            logger.error(f"Failed to stream diff {ref1}..{ref2}: {e}")
+            raise GitOperationError(f"Failed to stream diff: {e}", git_error=e)
+
+        finally:
+            self._kill_process(process)
+
+    def _start_diff(self, ref1: str, ref2: str, file_path: Optional[str]):
+        # Keep non-ASCII paths readable instead of C-quoted
+        command = [Git.GIT_PYTHON_GIT_EXECUTABLE, "-c", "core.quotePath=false", "diff"]
+        command.extend(["--no-color", "--no-ext-diff", "-M", ref1, ref2])
+        if file_path:
+            command.extend(["--", file_path])
+        return self.repo.git.execute(command, as_process=True)
+
+    @staticmethod
+    def _kill_process(process) -> None:
+        if process.proc is not None and process.proc.poll() is None:
+            process.proc.kill()
+            process.proc.wait()
+
+    @staticmethod
+    def _iter_line_segments(stream, max_segment: int = _STREAM_CHUNK_SIZE):
+        """
+        Split a byte stream into lines, cutting lines longer than max_segment.
+
+        Yields:
+            (segment, line_start) pairs; line_start is False for the
+            continuation pieces of an overlong line
+        """
+        buffer = b""
+        line_start = True
+        while True:
+            chunk = stream.read(_STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+            start = 0
+            while True:
+                newline = buffer.find(b"\n", start)
+                if newline == -1:
+                    break
+                yield buffer[start : newline + 1], line_start
+                line_start = True
+                start = newline + 1
+            buffer = buffer[start:]
+            while len(buffer) >= max_segment:
+                yield buffer[:max_segment], line_start
+                line_start = False
+                buffer = buffer[max_segment:]
+        if buffer:
+            yield buffer, line_start
+
+    @staticmethod
+    def _truncation_marker(reason: str, at_line_start: bool) -> bytes:
+        marker = DIFF_TRUNCATION_PREFIX + reason.encode() + b"\n"
+        return marker if at_line_start else b"\n" + marker
+
+    @staticmethod
+    def _new_diff_file(header: bytes) -> Dict:
+        # "diff --git a/<path> b/<path>": both halves are equal unless renamed
+        names = header[len(b"diff --git ") :].decode("utf-8", errors="replace").rstrip("\n")
+        half = (len(names) - 1) // 2
+        path = names[half + 3 :] if names[2:half] == names[half + 3 :] else ""
+        return {
+            "path": path,
+            "old_path": None,
+            "status": "M",
+            "binary": False,
+            "additions": 0,
+            "deletions": 0,
+            "truncated": False,
+            "hunks": [],
+        }
+
+    @staticmethod
+    def _apply_diff_header(file: Dict, line: str) -> None:
+        if line.startswith("new file mode"):
+            file["status"] = "A"
+        elif line.startswith("deleted file mode"):
+            file["status"] = "D"
+        elif line.startswith("rename from "):
+            file["status"] = "R"
+            file["old_path"] = line[len("rename from ") :]
+        elif line.startswith("rename to "):
+            file["path"] = line[len("rename to ") :]
+        elif line.startswith("Binary files "):
+            file["binary"] = True
+        elif line.startswith("--- a/") and not file["path"]:
+            file["path"] = line[len("--- a/") :]
+        elif line.startswith("+++ b/"):
+            file["path"] = line[len("+++ b/") :]
+
     # ============= Helper Methods =============
 
     def parse_commit_message(self, message: str) -> Dict[str, List[str]]:
@@ -983,49 +1702,7 @@ class GitService:
         Returns:
             Dictionary with extracted task IDs
         """
-        if not message:
-            return {
-                "mentioned": [],
-                "closes": [],
-                "fixes": [],
-                "resolves": [],
-            }
-
-        # Patterns for task IDs
-        task_pattern = r"(?:TAS|TASK|ARD)-\d+|#\d+"
-
-        # Find all mentioned task IDs
-        mentioned = re.findall(task_pattern, message, re.IGNORECASE)
-        mentioned = [id.upper() for id in mentioned]
-
-        # Find closing keywords
-        closing_patterns = [
-            (r"closes?\s+(" + task_pattern + r")", "closes"),
-            (r"fixes?\s+(" + task_pattern + r")", "fixes"),
-            (r"resolves?\s+(" + task_pattern + r")", "resolves"),
-        ]
-
-        closes = []
-        fixes = []
-        resolves = []
-
-        for pattern, category in closing_patterns:
-            matches = re.findall(pattern, message, re.IGNORECASE)
-            for match in matches:
-                task_id = match.upper() if isinstance(match, str) else match[0].upper()
-                if category == "closes":
-                    closes.append(task_id)
-                elif category == "fixes":
-                    fixes.append(task_id)
-                elif category == "resolves":
-                    resolves.append(task_id)
-
-        return {
-            "mentioned": list(set(mentioned)),
-            "closes": list(set(closes)),
-            "fixes": list(set(fixes)),
-            "resolves": list(set(resolves)),
-        }
+        return parse_task_references(message)
 
     async def map_git_author_to_user(
         self,
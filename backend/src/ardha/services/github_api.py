@@ -9,7 +9,7 @@ import asyncio
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from cryptography.fernet import Fernet
@@ -89,18 +89,26 @@ class GitHubAPIClient:
     - Commit and status operations
     """
 
-    def __init__(self, access_token: str, base_url: str = "https://api.github.com"):
+    def __init__(
+        self,
+        access_token: str,
+        base_url: str = "https://api.github.com",
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
         """
         Initialize GitHub API client.
 
         Args:
             access_token: GitHub personal access token or OAuth token
             base_url: GitHub API base URL (for GitHub Enterprise)
+            executor: Shared executor for PyGithub calls (a private one is
+                created and owned by the client if omitted)
         """
         self._token = access_token
         self._base_url = base_url
         self._client: Optional[Github] = None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=4)
 
     @property
     def client(self) -> Github:
@@ -1497,14 +1505,41 @@ class GitHubAPIClient:
             logger.error(f"Unexpected error getting rate limit: {e}")
             raise GitHubAPIError(f"Failed to get rate limit: {e}")
 
+    def rate_limit_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the rate limit reported by the most recent response.
+
+        Reads the X-RateLimit headers PyGithub already recorded, so no request
+        is made.
+
+        Returns:
+            Dict with limit, remaining and reset, or None before the first response
+        """
+        if self._client is None:
+            return None
+
+        requester = self._client.requester
+        remaining, limit = requester.rate_limiting
+        if remaining < 0:
+            return None
+
+        reset = requester.rate_limiting_resettime
+        return {
+            "limit": limit,
+            "remaining": remaining,
+            "reset": datetime.fromtimestamp(reset, tz=timezone.utc) if reset else None,
+        }
+
     async def close(self) -> None:
         """
         Close the GitHub client and cleanup resources.
 
-        Should be called when done with the client.
+        Should be called when done with a client that is not pooled. A shared
+        executor passed in by the caller is left running.
         """
-        if self._client:
-            # PyGithub doesn't have explicit close, but we shutdown executor
+        if self._owns_executor:
             self._executor.shutdown(wait=False)
+        if self._client:
+            self._client.close()
             self._client = None
             logger.debug("GitHub client closed")
@@ -0,0 +1,189 @@
+"""
+Shared GitHub API client pool.
+
+Keeps one authenticated GitHubAPIClient per integration so repeated
+operations reuse its HTTP connections instead of building a new PyGithub
+client, connection pool and thread pool per call:
+- Clients are keyed by integration ID and share one executor
+- Decrypted tokens (and their clients) expire after a TTL
+- A rotated token or a deleted integration drops the entry
+- Per-integration rate limit state comes from the last response headers
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+
+from ardha.core.config import settings
+from ardha.models.github_integration import GitHubIntegration
+from ardha.services.github_api import GitHubAPIClient, TokenEncryption
+
+logger = logging.getLogger(__name__)
+
+
+class PooledClient(NamedTuple):
+    """Pool entry for one integration."""
+
+    expires_at: float
+    encrypted_token: str
+    token: str
+    client: GitHubAPIClient
+
+
+class GitHubClientPool:
+    """
+    LRU pool of authenticated GitHub API clients, one per integration.
+
+    Evicted or expired clients are not closed, since a request may still be
+    running on them; their connections are released when they are
+    garbage collected.
+
+    Attributes:
+        max_clients: Maximum pooled integrations before the least recently
+            used is evicted
+        token_ttl: Lifetime in seconds of a decrypted token and its client
+            (0 disables pooling)
+        max_workers: Size of the executor shared by all pooled clients
+        base_url: GitHub API base URL
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 256,
+        token_ttl: float = 900.0,
+        max_workers: int = 16,
+        base_url: str = "https://api.github.com",
+    ) -> None:
+        self.max_clients = max_clients
+        self.token_ttl = token_ttl
+        self.max_workers = max_workers
+        self.base_url = base_url
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._entries: "OrderedDict[UUID, PooledClient]" = OrderedDict()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Executor shared by all pooled clients (created on first use)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="github-api"
+            )
+        return self._executor
+
+    def get(self, integration: GitHubIntegration) -> GitHubAPIClient:
+        """
+        Get the pooled API client for an integration.
+
+        Callers must not close the returned client.
+
+        Args:
+            integration: Integration whose stored token authenticates the client
+
+        Returns:
+            Authenticated GitHubAPIClient shared with other callers
+        """
+        return self._entry(integration).client
+
+    def get_token(self, integration: GitHubIntegration) -> str:
+        """
+        Get the decrypted access token for an integration.
+
+        Args:
+            integration: Integration with an encrypted access token
+
+        Returns:
+            Plain text GitHub token
+        """
+        return self._entry(integration).token
+
+    def rate_limit(self, integration_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get the last known rate limit for an integration's token.
+
+        Args:
+            integration_id: Integration UUID
+
+        Returns:
+            Dict with limit, remaining and reset, or None if unknown
+        """
+        entry = self._entries.get(integration_id)
+        return entry.client.rate_limit_state() if entry else None
+
+    def invalidate(self, integration_id: UUID) -> None:
+        """Drop the pooled token and client for an integration."""
+        self._entries.pop(integration_id, None)
+
+    def clear(self) -> None:
+        """Drop all pooled tokens and clients."""
+        self._entries.clear()
+
+    def close(self) -> None:
+        """Drop all entries and shut down the shared executor."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _entry(self, integration: GitHubIntegration) -> PooledClient:
+        """Get a live entry for an integration, creating it if needed."""
+        now = time.monotonic()
+        entry = self._entries.get(integration.id)
+        if (
+            entry
+            and entry.expires_at > now
+            and entry.encrypted_token == integration.access_token_encrypted
+        ):
+            self._entries.move_to_end(integration.id)
+            return entry
+
+        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
+        entry = PooledClient(
+            expires_at=now + self.token_ttl,
+            encrypted_token=integration.access_token_encrypted,
+            token=token,
+            client=GitHubAPIClient(token, base_url=self.base_url, executor=self.executor),
+        )
+        if self.token_ttl > 0:
+            self._entries[integration.id] = entry
+            self._entries.move_to_end(integration.id)
+            while len(self._entries) > self.max_clients:
+                self._entries.popitem(last=False)
+            logger.debug(f"Pooled GitHub client for integration {integration.id}")
+        return entry
+
+
+def _on_integration_delete(mapper, connection, target: GitHubIntegration) -> None:
+    # Token rotation needs no hook: entries are checked against the stored token
+    get_github_client_pool().invalidate(target.id)
+
+
+event.listen(GitHubIntegration, "after_delete", _on_integration_delete)
+
+
+# Global client pool instance
+_client_pool: Optional[GitHubClientPool] = None
+
+
+def get_github_client_pool() -> GitHubClientPool:
+    """
+    Get global GitHub client pool instance.
+
+    Returns:
+        GitHubClientPool configured from settings
+    """
+    global _client_pool
+
+    if _client_pool is None:
+        _client_pool = GitHubClientPool(
+            max_clients=settings.github.client_pool_size,
+            token_ttl=settings.github.token_cache_ttl_seconds,
+            max_workers=settings.github.client_executor_workers,
+            base_url=settings.github.api_url,
+        )
+
+    return _client_pool
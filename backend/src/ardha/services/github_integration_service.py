@@ -6,6 +6,7 @@ handling GitHub integration setup, pull request management, webhook configuratio
 and task automation.
 """
 
+import asyncio
 import logging
 import secrets
 from datetime import datetime, timezone
@@ -15,6 +16,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.config import settings
 from ardha.core.github_exceptions import (
     GitHubAPIError,
     GitHubAuthenticationError,
@@ -25,6 +27,13 @@ from ardha.repositories.github_integration import GitHubIntegrationRepository
 from ardha.repositories.pull_request import PullRequestRepository
 from ardha.services.git_commit_service import GitCommitService
 from ardha.services.github_api import GitHubAPIClient, TokenEncryption
+from ardha.services.github_client_pool import get_github_client_pool
+from ardha.services.github_sync import (
+    GitHubSyncClient,
+    get_github_etag_cache,
+    parse_github_datetime,
+    pull_request_to_dict,
+)
 from ardha.services.project_service import ProjectService
 from ardha.services.task_service import TaskService
 
@@ -145,29 +154,31 @@ class GitHubIntegrationService:
                 f"{existing.repository_name}"
             )
 
-        # Verify token with GitHub API
-        client = GitHubAPIClient(access_token)
+        # Verify token with GitHub API (one-off client: the token is not stored yet)
+        pool = get_github_client_pool()
+        client = GitHubAPIClient(access_token, base_url=pool.base_url, executor=pool.executor)
         try:
             user_info = await client.verify_token()
             logger.info(f"Verified GitHub token for user: {user_info['login']}")
+
+            # Check repository access
+            repo_accessible = await client.check_repository_access(
+                repository_owner, repository_name
+            )
+            if not repo_accessible:
+                raise GitHubAPIError(
+                    f"Cannot access repository {repository_owner}/{repository_name}. "
+                    "Verify the token has repo permissions."
+                )
+
+            # Get repository details
+            repo_data = await client.get_repository(repository_owner, repository_name)
         except GitHubAuthenticationError:
             logger.error("Invalid GitHub access token")
             raise
         finally:
             await client.close()
 
-        # Check repository access
-        repo_accessible = await client.check_repository_access(repository_owner, repository_name)
-        if not repo_accessible:
-            raise GitHubAPIError(
-                f"Cannot access repository {repository_owner}/{repository_name}. "
-                "Verify the token has repo permissions."
-            )
-
-        # Get repository details
-        repo_data = await client.get_repository(repository_owner, repository_name)
-        await client.close()
-
         # Encrypt access token
         encrypted_token = TokenEncryption.encrypt_token(access_token)
 
@@ -281,7 +292,8 @@ class GitHubIntegrationService:
         # If updating access token, verify it first
         if "access_token" in update_data:
             new_token = update_data["access_token"]
-            client = GitHubAPIClient(new_token)
+            pool = get_github_client_pool()
+            client = GitHubAPIClient(new_token, base_url=pool.base_url, executor=pool.executor)
             try:
                 await client.verify_token()
                 # Encrypt new token
@@ -349,8 +361,7 @@ class GitHubIntegrationService:
         # Delete webhooks from GitHub (best effort)
         if integration.webhook_url:
             try:
-                token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-                client = GitHubAPIClient(token)
+                client = get_github_client_pool().get(integration)
                 webhooks = await client.list_webhooks(
                     integration.repository_owner,
                     integration.repository_name,
@@ -363,7 +374,6 @@ class GitHubIntegrationService:
                             integration.repository_name,
                             webhook["id"],
                         )
-                await client.close()
             except Exception as e:
                 logger.warning(f"Failed to delete webhooks from GitHub: {e}")
 
@@ -385,13 +395,16 @@ class GitHubIntegrationService:
         """
         Sync pull requests from GitHub to database.
 
-        Fetches PRs from GitHub, creates/updates database records,
-        links to tasks, and associates with commits.
+        Lists PRs most recently updated first and stops at the integration's
+        prs_synced_at cursor, so repeat syncs only fetch what changed. PR
+        details and commit lists are fetched concurrently with conditional
+        requests; database writes are then applied in one pass.
 
         Args:
             project_id: Project UUID
             user_id: User requesting sync
-            full_sync: If True, sync all PRs; if False, sync only recent
+            full_sync: If True, sync all PRs ignoring the cursor; if False,
+                sync PRs updated since the last sync (open PRs on first sync)
 
         Returns:
             Count of synced PRs
@@ -414,57 +427,77 @@ class GitHubIntegrationService:
                 f"No GitHub integration found for project {project_id}"
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
+        owner, repo = integration.repository_owner, integration.repository_name
+        since = None if full_sync else integration.prs_synced_at
+        state = "all" if full_sync or since else "open"
+        token = get_github_client_pool().get_token(integration)
 
         synced_count = 0
 
         try:
-            # Fetch PRs from GitHub
-            state = "all" if full_sync else "open"
-            prs_data = await client.list_pull_requests(
-                integration.repository_owner,
-                integration.repository_name,
-                state=state,
-            )
+            async with GitHubSyncClient(
+                token,
+                namespace=str(integration.id),
+                etag_cache=get_github_etag_cache(),
+                base_url=settings.github.api_url,
+                max_concurrency=settings.github.sync_concurrency,
+                rate_limit_reserve=settings.github.rate_limit_reserve,
+                max_rate_limit_wait=settings.github.rate_limit_max_wait_seconds,
+                timeout=settings.github.request_timeout_seconds,
+            ) as client:
+                pulls = await client.list_pull_requests(owner, repo, state=state, since=since)
+
+                async def fetch(pr_number: int) -> List:
+                    return await asyncio.gather(
+                        client.get_pull_request(owner, repo, pr_number),
+                        client.get_pull_request_commit_shas(owner, repo, pr_number),
+                    )
 
-            # Process each PR
-            for pr_data in prs_data:
-                # Check if PR exists
-                pr = await self.pr_repo.get_by_number(
-                    integration.id,
-                    pr_data["number"],
+                # Requests run concurrently, bounded by the client's limit
+                fetched = await asyncio.gather(*(fetch(pull["number"]) for pull in pulls))
+
+                logger.info(
+                    f"Fetched {len(fetched)} PRs from {owner}/{repo} with "
+                    f"{client.requests_made} requests ({client.not_modified} not modified)"
                 )
 
+            # Apply to the database (one session, so sequentially) with batched lookups
+            from ardha.repositories.git_commit import GitCommitRepository
+
+            existing = await self.pr_repo.get_by_numbers(
+                integration.id, [pull["number"] for pull in pulls]
+            )
+            commit_ids = await GitCommitRepository(self.db).get_ids_by_shas(
+                project_id, [sha for _, shas in fetched for sha in shas]
+            )
+
+            for pr_data, shas in fetched:
+                pr = existing.get(pr_data["number"])
                 if pr:
-                    # Update existing PR
-                    full_pr_data = await client.get_pull_request(
-                        integration.repository_owner,
-                        integration.repository_name,
-                        pr_data["number"],
-                    )
-                    await self.pr_repo.update_from_github(pr.id, full_pr_data)
+                    pr.update_from_github(pr_data)
                 else:
-                    # Create new PR
-                    full_pr_data = await client.get_pull_request(
-                        integration.repository_owner,
-                        integration.repository_name,
-                        pr_data["number"],
-                    )
                     pr = await self._create_pr_from_github(
                         integration,
-                        full_pr_data,
+                        pull_request_to_dict(pr_data),
                     )
 
                 # Link to tasks (parse PR description)
                 await self._link_pr_to_tasks(pr)
 
-                # Link to commits
-                await self._link_pr_to_commits(pr, integration, client)
+                # Link to commits already in the database
+                linked = [commit_ids[sha] for sha in shas if sha in commit_ids]
+                if linked:
+                    await self.pr_repo.link_to_commits(pr.id, linked)
 
                 synced_count += 1
 
+            # Advance the cursor to the newest update seen
+            seen = [parse_github_datetime(pull.get("updated_at")) for pull in pulls] + [since]
+            seen = [value for value in seen if value]
+            if seen:
+                integration.prs_synced_at = max(seen)
+            await self.db.flush()
+
             # Update integration sync timestamp
             await self.integration_repo.update_connection_status(
                 integration.id,
@@ -484,8 +517,6 @@ class GitHubIntegrationService:
                 str(e),
             )
             raise
-        finally:
-            await client.close()
 
         return synced_count
 
@@ -541,57 +572,52 @@ class GitHubIntegrationService:
         if not base_branch:
             base_branch = integration.default_branch
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
-
-        try:
-            # Create PR on GitHub
-            pr_data = await client.create_pull_request(
-                integration.repository_owner,
-                integration.repository_name,
-                title=title,
-                body=body,
-                head=head_branch,
-                base=base_branch,
-                draft=draft,
-            )
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
+
+        # Create PR on GitHub
+        pr_data = await client.create_pull_request(
+            integration.repository_owner,
+            integration.repository_name,
+            title=title,
+            body=body,
+            head=head_branch,
+            base=base_branch,
+            draft=draft,
+        )
 
-            # Create PR in database
-            pr = await self._create_pr_from_github(
-                integration,
-                pr_data,
-                author_user_id=user_id,
-            )
+        # Create PR in database
+        pr = await self._create_pr_from_github(
+            integration,
+            pr_data,
+            author_user_id=user_id,
+        )
 
-            # Store pr_number before any session issues
-            pr_number = pr.pr_number
-            pr_id = pr.id
-
-            # Link to tasks if provided
-            if linked_task_ids:
-                await self.pr_repo.link_to_tasks(
-                    pr_id,
-                    linked_task_ids,
-                    link_type="implements",
-                    linked_from="pr_creation",
-                )
+        # Store pr_number before any session issues
+        pr_number = pr.pr_number
+        pr_id = pr.id
 
-            # Update statistics
-            await self.integration_repo.update_statistics(
-                integration.id,
-                total_prs=1,
+        # Link to tasks if provided
+        if linked_task_ids:
+            await self.pr_repo.link_to_tasks(
+                pr_id,
+                linked_task_ids,
+                link_type="implements",
+                linked_from="pr_creation",
             )
 
-            # Refresh PR to ensure all attributes are loaded
-            await self.db.refresh(pr)
+        # Update statistics
+        await self.integration_repo.update_statistics(
+            integration.id,
+            total_prs=1,
+        )
 
-            logger.info(f"Created PR #{pr_number} for project {project_id}: {title}")
+        # Refresh PR to ensure all attributes are loaded
+        await self.db.refresh(pr)
 
-            return pr
+        logger.info(f"Created PR #{pr_number} for project {project_id}: {title}")
 
-        finally:
-            await client.close()
+        return pr
 
     async def get_pull_request(
         self,
@@ -658,32 +684,27 @@ class GitHubIntegrationService:
                 f"GitHub integration {pr.github_integration_id} not found"
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
-        try:
-            # Fetch latest PR data from GitHub
-            pr_data = await client.get_pull_request(
-                integration.repository_owner,
-                integration.repository_name,
-                pr.pr_number,
-            )
-
-            # Update database record
-            updated_pr = await self.pr_repo.update_from_github(pr.id, pr_data)
+        # Fetch latest PR data from GitHub
+        pr_data = await client.get_pull_request(
+            integration.repository_owner,
+            integration.repository_name,
+            pr.pr_number,
+        )
 
-            if not updated_pr:
-                raise GitHubPRNotFoundError(f"PR {pr_id} not found during update")
+        # Update database record
+        updated_pr = await self.pr_repo.update_from_github(pr.id, pr_data)
 
-            # Update linked commits if head SHA changed
-            if pr_data.get("head_sha") != updated_pr.head_sha:
-                await self._link_pr_to_commits(updated_pr, integration, client)
+        if not updated_pr:
+            raise GitHubPRNotFoundError(f"PR {pr_id} not found during update")
 
-            logger.info(f"Updated PR #{updated_pr.pr_number} from GitHub")
+        # Update linked commits if head SHA changed
+        if pr_data.get("head_sha") != updated_pr.head_sha:
+            await self._link_pr_to_commits(updated_pr, integration, client)
 
-        finally:
-            await client.close()
+        logger.info(f"Updated PR #{updated_pr.pr_number} from GitHub")
 
         return updated_pr
 
@@ -741,61 +762,56 @@ class GitHubIntegrationService:
                 operation="merge",
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
-
-        try:
-            # Merge PR on GitHub
-            await client.merge_pull_request(
-                integration.repository_owner,
-                integration.repository_name,
-                pr.pr_number,
-                commit_message=commit_message,
-                merge_method=merge_method,
-            )
-
-            # Update PR state
-            updated_pr = await self.pr_repo.update_state(
-                pr.id,
-                "merged",
-                merged_at=datetime.now(timezone.utc),
-            )
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
-            if not updated_pr:
-                raise GitHubPRNotFoundError(f"PR {pr_id} not found during merge")
-
-            # Store attributes before session issues
-            pr_number = updated_pr.pr_number
-            closes_task_ids = updated_pr.closes_task_ids
-
-            # Close linked tasks
-            if closes_task_ids:
-                for task_id_str in closes_task_ids:
-                    try:
-                        task_id = UUID(task_id_str)
-                        await self.task_service.update_status(
-                            task_id=task_id,
-                            user_id=user_id,
-                            new_status="done",
-                        )
-                        logger.info(f"Auto-closed task {task_id} from PR merge")
-                    except Exception as e:
-                        logger.warning(f"Failed to auto-close task {task_id_str}: {e}")
+        # Merge PR on GitHub
+        await client.merge_pull_request(
+            integration.repository_owner,
+            integration.repository_name,
+            pr.pr_number,
+            commit_message=commit_message,
+            merge_method=merge_method,
+        )
 
-            # Update statistics
-            await self.integration_repo.update_statistics(
-                integration.id,
-                merged_prs=1,
-            )
+        # Update PR state
+        updated_pr = await self.pr_repo.update_state(
+            pr.id,
+            "merged",
+            merged_at=datetime.now(timezone.utc),
+        )
 
-            # Refresh to ensure all attributes loaded
-            await self.db.refresh(updated_pr)
+        if not updated_pr:
+            raise GitHubPRNotFoundError(f"PR {pr_id} not found during merge")
+
+        # Store attributes before session issues
+        pr_number = updated_pr.pr_number
+        closes_task_ids = updated_pr.closes_task_ids
+
+        # Close linked tasks
+        if closes_task_ids:
+            for task_id_str in closes_task_ids:
+                try:
+                    task_id = UUID(task_id_str)
+                    await self.task_service.update_status(
+                        task_id=task_id,
+                        user_id=user_id,
+                        new_status="done",
+                    )
+                    logger.info(f"Auto-closed task {task_id} from PR merge")
+                except Exception as e:
+                    logger.warning(f"Failed to auto-close task {task_id_str}: {e}")
+
+        # Update statistics
+        await self.integration_repo.update_statistics(
+            integration.id,
+            merged_prs=1,
+        )
 
-            logger.info(f"Merged PR #{pr_number} using {merge_method} method")
+        # Refresh to ensure all attributes loaded
+        await self.db.refresh(updated_pr)
 
-        finally:
-            await client.close()
+        logger.info(f"Merged PR #{pr_number} using {merge_method} method")
 
         return updated_pr
 
@@ -838,45 +854,40 @@ class GitHubIntegrationService:
                 f"GitHub integration {pr.github_integration_id} not found"
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
-        try:
-            # Close PR on GitHub
-            await client.update_pull_request(
-                integration.repository_owner,
-                integration.repository_name,
-                pr.pr_number,
-                state="closed",
-            )
-
-            # Update PR state
-            updated_pr = await self.pr_repo.update_state(
-                pr.id,
-                "closed",
-                closed_at=datetime.now(timezone.utc),
-            )
+        # Close PR on GitHub
+        await client.update_pull_request(
+            integration.repository_owner,
+            integration.repository_name,
+            pr.pr_number,
+            state="closed",
+        )
 
-            if not updated_pr:
-                raise GitHubPRNotFoundError(f"PR {pr_id} not found during close")
+        # Update PR state
+        updated_pr = await self.pr_repo.update_state(
+            pr.id,
+            "closed",
+            closed_at=datetime.now(timezone.utc),
+        )
 
-            # Store pr_number before session issues
-            pr_number = updated_pr.pr_number
+        if not updated_pr:
+            raise GitHubPRNotFoundError(f"PR {pr_id} not found during close")
 
-            # Update statistics
-            await self.integration_repo.update_statistics(
-                integration.id,
-                closed_prs=1,
-            )
+        # Store pr_number before session issues
+        pr_number = updated_pr.pr_number
 
-            # Refresh to ensure all attributes loaded
-            await self.db.refresh(updated_pr)
+        # Update statistics
+        await self.integration_repo.update_statistics(
+            integration.id,
+            closed_prs=1,
+        )
 
-            logger.info(f"Closed PR #{pr_number} without merging")
+        # Refresh to ensure all attributes loaded
+        await self.db.refresh(updated_pr)
 
-        finally:
-            await client.close()
+        logger.info(f"Closed PR #{pr_number} without merging")
 
         return updated_pr
 
@@ -924,39 +935,33 @@ class GitHubIntegrationService:
         # Generate webhook secret
         webhook_secret = secrets.token_urlsafe(32)
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
-
-        try:
-            # Create webhook via GitHub API
-            webhook_data = await client.create_webhook(
-                integration.repository_owner,
-                integration.repository_name,
-                webhook_url=webhook_url,
-                events=events,
-                secret=webhook_secret,
-            )
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
-            # Update integration with webhook info
-            await self.integration_repo.update(
-                integration.id,
-                {
-                    "webhook_secret": webhook_secret,
-                    "webhook_url": webhook_url,
-                    "webhook_events": events,
-                },
-            )
+        # Create webhook via GitHub API
+        webhook_data = await client.create_webhook(
+            integration.repository_owner,
+            integration.repository_name,
+            webhook_url=webhook_url,
+            events=events,
+            secret=webhook_secret,
+        )
 
-            logger.info(
-                f"Created webhook for {integration.repository_owner}/"
-                f"{integration.repository_name}"
-            )
+        # Update integration with webhook info
+        await self.integration_repo.update(
+            integration.id,
+            {
+                "webhook_secret": webhook_secret,
+                "webhook_url": webhook_url,
+                "webhook_events": events,
+            },
+        )
 
-            return webhook_data
+        logger.info(
+            f"Created webhook for {integration.repository_owner}/" f"{integration.repository_name}"
+        )
 
-        finally:
-            await client.close()
+        return webhook_data
 
     async def verify_connection(self, project_id: UUID, user_id: UUID) -> Dict:
         """
@@ -989,9 +994,8 @@ class GitHubIntegrationService:
                 f"No GitHub integration found for project {project_id}"
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
         connection_info = {
             "connected": False,
@@ -1054,8 +1058,7 @@ class GitHubIntegrationService:
                 str(e),
             )
 
-        finally:
-            await client.close()
+        connection_info["rate_limit"] = client.rate_limit_state()
 
         logger.info(
             f"Verified connection for project {project_id}: "
@@ -1097,39 +1100,34 @@ class GitHubIntegrationService:
                 f"GitHub integration {pr.github_integration_id} not found"
             )
 
-        # Create GitHub API client
-        token = TokenEncryption.decrypt_token(integration.access_token_encrypted)
-        client = GitHubAPIClient(token)
+        # Get pooled GitHub API client
+        client = get_github_client_pool().get(integration)
 
-        try:
-            # Fetch check runs from GitHub
-            checks_data = await client.get_pr_checks(
-                integration.repository_owner,
-                integration.repository_name,
-                pr.pr_number,
-            )
-
-            # Update PR checks status
-            all_passed = all(
-                check.get("conclusion") == "success"
-                for check in checks_data.get("checks", [])
-                if check.get("status") == "completed"
-            )
-            checks_status = "success" if all_passed else "pending"
+        # Fetch check runs from GitHub
+        checks_data = await client.get_pr_checks(
+            integration.repository_owner,
+            integration.repository_name,
+            pr.pr_number,
+        )
 
-            await self.pr_repo.update_checks_status(
-                pr.id,
-                checks_status=checks_status,
-                checks_count=checks_data.get("total_count", 0),
-                required_checks_passed=all_passed,
-            )
+        # Update PR checks status
+        all_passed = all(
+            check.get("conclusion") == "success"
+            for check in checks_data.get("checks", [])
+            if check.get("status") == "completed"
+        )
+        checks_status = "success" if all_passed else "pending"
 
-            logger.info(f"Fetched {checks_data['total_count']} checks for PR #{pr.pr_number}")
+        await self.pr_repo.update_checks_status(
+            pr.id,
+            checks_status=checks_status,
+            checks_count=checks_data.get("total_count", 0),
+            required_checks_passed=all_passed,
+        )
 
-            return checks_data
+        logger.info(f"Fetched {checks_data['total_count']} checks for PR #{pr.pr_number}")
 
-        finally:
-            await client.close()
+        return checks_data
 
     async def list_pull_requests(
         self,
@@ -0,0 +1,433 @@
+"""
+GitHub REST client for bulk pull request sync.
+
+Used by GitHubIntegrationService.sync_pull_requests in place of per-PR
+PyGithub calls:
+- Async HTTP (httpx) with a bounded number of requests in flight
+- Conditional requests: ETags and response bodies are cached in Redis per
+  resource, so unchanged resources return 304, which GitHub does not count
+  against the rate limit
+- Rate-limit-aware scheduling from X-RateLimit-* headers: requests pause
+  when the remaining quota reaches a reserve, and secondary limits
+  (Retry-After) are waited out and retried
+- Pull requests are listed by most recently updated, with early stop at
+  an updated_at cursor for incremental sync
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from redis.asyncio import Redis
+
+from ardha.core.config import settings
+from ardha.core.github_exceptions import (
+    GitHubAPIError,
+    GitHubAuthenticationError,
+    GitHubRateLimitError,
+    GitHubRepositoryNotFoundError,
+)
+from ardha.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Largest page GitHub serves for list endpoints
+PAGE_SIZE = 100
+
+# Cached conditional response: (etag, body, next page URL)
+CachedResponse = Tuple[str, Any, Optional[str]]
+
+
+def parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp ("...Z") to an aware datetime."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def pull_request_to_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a REST pull request into the dict shape GitHubAPIClient returns.
+
+    Args:
+        data: Pull request object from the GitHub REST API
+
+    Returns:
+        Dict with the same keys as GitHubAPIClient.get_pull_request
+    """
+    head = data.get("head") or {}
+    base = data.get("base") or {}
+    user = data.get("user") or {}
+    return {
+        "number": data["number"],
+        "id": data["id"],
+        "title": data["title"],
+        "body": data.get("body") or "",
+        "state": data["state"],
+        "html_url": data["html_url"],
+        "api_url": data["url"],
+        "head_branch": head.get("ref"),
+        "base_branch": base.get("ref"),
+        "head_sha": head.get("sha"),
+        "draft": data.get("draft", False),
+        "mergeable": data.get("mergeable"),
+        "merged": data.get("merged", False),
+        "merged_at": data.get("merged_at"),
+        "closed_at": data.get("closed_at"),
+        "additions": data.get("additions", 0),
+        "deletions": data.get("deletions", 0),
+        "changed_files": data.get("changed_files", 0),
+        "commits": data.get("commits", 0),
+        "author": user.get("login"),
+        "created_at": data.get("created_at"),
+        "updated_at": data.get("updated_at"),
+    }
+
+
+class ETagCache:
+    """
+    Redis store of ETags and bodies for conditional GitHub requests.
+
+    Redis failures are logged and treated as misses so sync never depends
+    on the cache.
+
+    Attributes:
+        redis: Async Redis client
+        ttl: Entry lifetime in seconds (0 disables the cache)
+        key_prefix: Redis key prefix
+    """
+
+    def __init__(self, redis: Redis, ttl: int = 604800, key_prefix: str = "ardha:github:etag"):
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def key(self, namespace: str, url: str) -> str:
+        """Build the Redis key for a resource URL within a namespace."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{namespace}:{digest}"
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached (etag, body, next_url), or None on a miss."""
+        if self.ttl <= 0:
+            return None
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"ETag cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry["etag"], entry["body"], entry.get("next")
+
+    async def put(self, key: str, etag: str, body: Any, next_url: Optional[str]) -> None:
+        """Store a response body under its ETag."""
+        if self.ttl <= 0:
+            return
+        entry = json.dumps({"etag": etag, "body": body, "next": next_url}, separators=(",", ":"))
+        try:
+            await self.redis.set(key, entry, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"ETag cache write failed: {e}")
+
+
+class GitHubSyncClient:
+    """
+    Async GitHub REST client with conditional requests and rate-limit pacing.
+
+    Use as an async context manager. Requests from all concurrent callers
+    share one connection pool, one concurrency limit and one view of the
+    token's rate limit.
+
+    Attributes:
+        namespace: ETag cache namespace (ETags are per token, so per integration)
+        max_concurrency: Maximum requests in flight
+        rate_limit_reserve: Remaining requests kept unused before pausing
+        max_rate_limit_wait: Longest pause in seconds before raising
+        max_retries: Retries after a secondary rate limit response
+        requests_made: Requests sent (including retries)
+        not_modified: Requests answered with 304 from the ETag cache
+    """
+
+    def __init__(
+        self,
+        token: str,
+        namespace: str,
+        etag_cache: Optional[ETagCache] = None,
+        base_url: str = "https://api.github.com",
+        max_concurrency: int = 8,
+        rate_limit_reserve: int = 100,
+        max_rate_limit_wait: float = 300,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.namespace = namespace
+        self.etag_cache = etag_cache
+        self.max_concurrency = max_concurrency
+        self.rate_limit_reserve = rate_limit_reserve
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.max_retries = max_retries
+        self.requests_made = 0
+        self.not_modified = 0
+
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency),
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_remaining: Optional[int] = None
+        self._rate_reset: Optional[int] = None
+
+    async def __aenter__(self) -> "GitHubSyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    # ============= Pull Requests =============
+
+    async def list_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "all",
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List pull requests, most recently updated first.
+
+        Pagination stops at the first pull request updated before since;
+        pull requests updated exactly at since are included again.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: PR state ('open', 'closed', 'all')
+            since: Only return pull requests updated at or after this time
+
+        Returns:
+            List of REST pull request objects (summary fields)
+        """
+        url: Optional[str] = f"/repos/{owner}/{repo}/pulls"
+        params: Optional[Dict[str, Any]] = {
+            "state": state,
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": PAGE_SIZE,
+        }
+        pulls: List[Dict[str, Any]] = []
+
+        while url:
+            page, url = await self._get(url, params)
+            params = None  # The next-page URL already carries the query
+            for pull in page:
+                updated_at = parse_github_datetime(pull.get("updated_at"))
+                if since and updated_at and updated_at < since:
+                    return pulls
+                pulls.append(pull)
+
+        return pulls
+
+    async def get_pull_request(self, owner: str, repo: str, pr_number: int) -> Dict[str, Any]:
+        """Get a full REST pull request object (includes change statistics)."""
+        pull, _ = await self._get(f"/repos/{owner}/{repo}/pulls/{pr_number}")
+        return pull
+
+    async def get_pull_request_commit_shas(
+        self, owner: str, repo: str, pr_number: int
+    ) -> List[str]:
+        """Get the SHAs of a pull request's commits in order."""
+        url: Optional[str] = f"/repos/{owner}/{repo}/pulls/{pr_number}/commits"
+        params: Optional[Dict[str, Any]] = {"per_page": PAGE_SIZE}
+        shas: List[str] = []
+
+        while url:
+            page, url = await self._get(url, params)
+            params = None
+            shas.extend(commit["sha"] for commit in page)
+
+        return shas
+
+    # ============= Requests =============
+
+    async def _get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Conditionally GET a resource.
+
+        Returns:
+            Tuple of (JSON body, next page URL or None)
+
+        Raises:
+            GitHubRateLimitError: If the rate limit would need a longer wait
+            GitHubAuthenticationError: For 401/403 responses
+            GitHubRepositoryNotFoundError: For 404 responses
+            GitHubAPIError: For other error responses
+        """
+        request_url = str(self._http.build_request("GET", url, params=params).url)
+        cache_key = self.etag_cache.key(self.namespace, request_url) if self.etag_cache else ""
+        cached = await self.etag_cache.get(cache_key) if self.etag_cache else None
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                await self._wait_for_quota()
+                self.requests_made += 1
+                response = await self._http.get(request_url, headers=headers)
+            self._record_rate_limit(response.headers)
+
+            if response.status_code == 304 and cached:
+                self.not_modified += 1
+                return cached[1], cached[2]
+
+            if self._is_rate_limited(response):
+                delay = self._retry_delay(response)
+                if attempt == self.max_retries or delay > self.max_rate_limit_wait:
+                    raise GitHubRateLimitError(
+                        f"GitHub rate limit exceeded for {request_url}",
+                        reset_at=self._reset_datetime(),
+                    )
+                logger.warning(f"GitHub rate limited {request_url}, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code >= 400:
+                self._raise_for_status(response)
+
+            body = response.json()
+            next_url = response.links.get("next", {}).get("url")
+            etag = response.headers.get("ETag")
+            if etag and self.etag_cache:
+                await self.etag_cache.put(cache_key, etag, body, next_url)
+            return body, next_url
+
+        raise GitHubRateLimitError(f"GitHub rate limit exceeded for {request_url}")
+
+    async def _wait_for_quota(self) -> None:
+        """Pause until the rate limit resets once remaining quota hits the reserve."""
+        # Headers lag by at most max_concurrency requests, well inside the reserve
+        if self._rate_remaining is None or self._rate_reset is None:
+            return
+        if self._rate_remaining > self.rate_limit_reserve:
+            return
+
+        delay = self._rate_reset - time.time() + 1
+        if delay <= 0:
+            return
+        if delay > self.max_rate_limit_wait:
+            raise GitHubRateLimitError(
+                f"GitHub rate limit reserve reached ({self._rate_remaining} left)",
+                reset_at=self._reset_datetime(),
+            )
+
+        logger.warning(
+            f"GitHub rate limit reserve reached ({self._rate_remaining} left), "
+            f"waiting {delay:.0f}s for reset"
+        )
+        await asyncio.sleep(delay)
+        self._rate_remaining = None
+
+    def _record_rate_limit(self, headers: httpx.Headers) -> None:
+        """Track the lowest remaining quota reported for the current window."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        remaining_value, reset_value = int(remaining), int(reset)
+        # Responses arrive out of order; within one window the lowest count is current
+        if (
+            self._rate_reset is None
+            or reset_value > self._rate_reset
+            or self._rate_remaining is None
+            or remaining_value < self._rate_remaining
+        ):
+            self._rate_remaining = remaining_value
+            self._rate_reset = reset_value
+
+    def _reset_datetime(self) -> Optional[datetime]:
+        """Rate limit reset time as an aware datetime."""
+        if self._rate_reset is None:
+            return None
+        return datetime.fromtimestamp(self._rate_reset, tz=timezone.utc)
+
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """Whether a response is a primary or secondary rate limit rejection."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+        )
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            return max(0.0, int(reset) - time.time() + 1)
+        return 60.0
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Convert an error response to the matching GitHub exception."""
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        message = data.get("message", response.reason_phrase) if isinstance(data, dict) else ""
+        status_code = response.status_code
+
+        if status_code in (401, 403):
+            raise GitHubAuthenticationError(
+                f"GitHub authentication failed: {message}", status_code=status_code
+            )
+        if status_code == 404:
+            raise GitHubRepositoryNotFoundError(f"Not found: {response.request.url.path}")
+        raise GitHubAPIError(
+            f"GitHub API error: {message}",
+            status_code=status_code,
+            response=data if isinstance(data, dict) else None,
+        )
+
+
+# Global ETag cache instance
+_etag_cache: Optional[ETagCache] = None
+
+
+def get_github_etag_cache() -> ETagCache:
+    """
+    Get global GitHub ETag cache instance.
+
+    Returns:
+        ETagCache on the shared Redis client
+    """
+    global _etag_cache
+
+    if _etag_cache is None:
+        _etag_cache = ETagCache(get_redis(), ttl=settings.github.etag_ttl_seconds)
+
+    return _etag_cache
@@ -4,26 +4,43 @@ GitHub Webhook Service for event processing.
 This module processes GitHub webhook events to automate task status updates,
 PR synchronization, and commit tracking. Handles signature verification,
 event routing, and idempotent processing.
+
+Webhook secrets are cached in-process per repository so the receiving
+endpoint verifies signatures without a database round trip. Changes made
+by other workers reach this cache after at most secret_cache_ttl_seconds.
 """
 
 import hashlib
 import hmac
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, List, Optional
-from uuid import UUID
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.config import settings
+from ardha.core.task_graph import get_task_graph_cache
+from ardha.models.github_integration import GitHubIntegration
 from ardha.models.github_webhook import GitHubWebhookDelivery
+from ardha.repositories.git_commit import GitCommitRepository
 from ardha.repositories.github_integration import GitHubIntegrationRepository
 from ardha.repositories.pull_request import PullRequestRepository
+from ardha.repositories.task_repository import TaskRepository
+from ardha.repositories.user_repository import UserRepository
 from ardha.services.git_commit_service import GitCommitService
+from ardha.services.git_service import parse_task_references
 from ardha.services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT when storing pushed commits (GitHub sends up to 2048)
+PUSH_BATCH_SIZE = 500
+
 
 # ============= Custom Exceptions =============
 
@@ -40,6 +57,100 @@ class WebhookProcessingError(Exception):
     pass
 
 
+# ============= Webhook Secret Cache =============
+
+# Cached lookup result: (integration_id, webhook_secret), or None if no integration
+IntegrationSecret = Optional[Tuple[UUID, Optional[str]]]
+
+
+class WebhookSecretCache:
+    """
+    In-process TTL cache mapping repositories to integration secrets.
+
+    Misses (no integration for a repository) are cached too, so unknown
+    repositories cannot drive a database query per request.
+
+    Attributes:
+        ttl: Entry lifetime in seconds (0 disables caching)
+        max_entries: Maximum entries before the oldest are evicted
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, IntegrationSecret]]" = (
+            OrderedDict()
+        )
+
+    async def get(
+        self,
+        owner: str,
+        name: str,
+        load: Callable[[], Awaitable[Optional[GitHubIntegration]]],
+    ) -> IntegrationSecret:
+        """
+        Get the integration ID and secret for a repository.
+
+        Args:
+            owner: Repository owner login
+            name: Repository name
+            load: Loads the integration from the database on a miss
+
+        Returns:
+            (integration_id, webhook_secret), or None if no integration exists
+        """
+        key = (owner, name)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        integration = await load()
+        value = (integration.id, integration.webhook_secret) if integration else None
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, owner: str, name: str) -> None:
+        """Drop the cached entry for a repository."""
+        self._entries.pop((owner, name), None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def _on_integration_change(mapper, connection, target: GitHubIntegration) -> None:
+    get_webhook_secret_cache().invalidate(target.repository_owner, target.repository_name)
+
+
+event.listen(GitHubIntegration, "after_insert", _on_integration_change)
+event.listen(GitHubIntegration, "after_update", _on_integration_change)
+event.listen(GitHubIntegration, "after_delete", _on_integration_change)
+
+
+# Global secret cache instance
+_webhook_secret_cache: Optional[WebhookSecretCache] = None
+
+
+def get_webhook_secret_cache() -> WebhookSecretCache:
+    """
+    Get global webhook secret cache instance.
+
+    Returns:
+        WebhookSecretCache configured from settings
+    """
+    global _webhook_secret_cache
+
+    if _webhook_secret_cache is None:
+        _webhook_secret_cache = WebhookSecretCache(ttl=settings.webhooks.secret_cache_ttl_seconds)
+
+    return _webhook_secret_cache
+
+
 # ============= Service Class =============
 
 
@@ -84,12 +195,14 @@ class GitHubWebhookService:
         event_type: str,
         action: Optional[str],
         payload: dict,
-        signature: str,
+        signature: Optional[str] = None,
     ) -> dict:
         """
-        Process GitHub webhook event.
+        Process a verified GitHub webhook event.
 
-        Verifies signature, routes to appropriate handler, and records delivery.
+        Signatures are checked when the delivery is received, before it is
+        queued. Processing is idempotent per delivery ID: a delivery already
+        recorded as processed is skipped, so queue redeliveries are safe.
 
         Args:
             integration_id: GitHub integration UUID
@@ -97,38 +210,46 @@ class GitHubWebhookService:
             event_type: GitHub event type (pull_request, push, etc.)
             action: Optional event action (opened, closed, etc.)
             payload: Webhook payload
-            signature: X-Hub-Signature-256 header value
+            signature: X-Hub-Signature-256 header value (stored for auditing)
 
         Returns:
             Dict with processing result
 
         Raises:
-            WebhookVerificationError: If signature is invalid
             WebhookProcessingError: If processing fails
         """
-        # Verify signature
-        if not await self.verify_webhook_signature(integration_id, payload, signature):
-            logger.warning(f"Invalid webhook signature for delivery {delivery_id}")
-            raise WebhookVerificationError("Invalid webhook signature")
-
-        # Record webhook delivery
-        delivery = GitHubWebhookDelivery(
-            github_integration_id=integration_id,
-            delivery_id=delivery_id,
-            event_type=event_type,
-            action=action,
-            payload=payload,
-            status="received",
-        )
+        delivery = await self.integration_repo.get_webhook_delivery(delivery_id)
+        if delivery and delivery.status == "processed":
+            logger.info(f"Webhook delivery {delivery_id} already processed, skipping")
+            return {
+                "status": "duplicate",
+                "delivery_id": delivery_id,
+                "event_type": event_type,
+            }
 
-        try:
-            delivery = await self.integration_repo.record_webhook_delivery(
-                integration_id,
-                delivery,
+        if delivery:
+            delivery.retry_count += 1
+        else:
+            # Record webhook delivery
+            delivery = GitHubWebhookDelivery(
+                github_integration_id=integration_id,
+                delivery_id=delivery_id,
+                event_type=event_type,
+                action=action,
+                payload=payload,
+                status="received",
+                signature=signature,
+                signature_verified=True,
             )
-        except Exception as e:
-            logger.error(f"Failed to record webhook delivery: {e}")
-            raise WebhookProcessingError(f"Failed to record delivery: {e}")
+
+            try:
+                delivery = await self.integration_repo.record_webhook_delivery(
+                    integration_id,
+                    delivery,
+                )
+            except Exception as e:
+                logger.error(f"Failed to record webhook delivery: {e}")
+                raise WebhookProcessingError(f"Failed to record delivery: {e}")
 
         # Route to appropriate handler
         try:
@@ -247,13 +368,17 @@ class GitHubWebhookService:
         """
         Handle push webhook event.
 
-        Syncs commits to database and links to tasks from commit messages.
+        Stores pushed commits that are not known yet and links commits to the
+        tasks their messages reference; pushes to the default branch also
+        close tasks referenced with a closing keyword. All messages are parsed
+        up front, so the number of queries does not grow with the number of
+        commits or task references (inserts are batched).
 
         Args:
             payload: Webhook payload dictionary
         """
         repo_data = payload.get("repository", {})
-        commits = payload.get("commits", [])
+        commits = [c for c in payload.get("commits", []) if c.get("id")]
         ref = payload.get("ref", "")
 
         repo_owner = repo_data.get("owner", {}).get("login")
@@ -269,37 +394,94 @@ class GitHubWebhookService:
         if not integration:
             logger.warning(f"No integration found for repository {repo_owner}/{repo_name}")
             return
+        if not commits:
+            return
 
-        # Process each commit
-        for commit_data in commits:
-            sha = commit_data.get("id")
-            message = commit_data.get("message", "")
+        project_id = integration.project_id
+        commit_repo = GitCommitRepository(self.db)
+        task_repo = TaskRepository(self.db)
 
-            # Check if commit exists in database
-            from ardha.repositories.git_commit import (
-                GitCommitRepository,
+        # Parse every message once and resolve all referenced tasks in one query
+        references = {c["id"]: parse_task_references(c.get("message", "")) for c in commits}
+        tasks: Dict[str, Tuple[UUID, str]] = {}
+        if integration.auto_link_tasks:
+            identifiers = {i for refs in references.values() for i in refs["mentioned"]}
+            tasks = await task_repo.get_refs_by_identifiers(project_id, list(identifiers))
+
+        # Store commits that are not known yet
+        commit_ids = await commit_repo.get_ids_by_shas(project_id, list(references))
+        new_commits = [c for c in commits if c["id"] not in commit_ids and c.get("message")]
+        if new_commits:
+            emails = [(c.get("author") or {}).get("email") or "" for c in new_commits]
+            author_ids = await UserRepository(self.db).get_ids_by_emails(
+                [email for email in emails if email]
             )
+            rows = [
+                self._commit_row_from_payload(
+                    project_id, branch, c, references[c["id"]], tasks, author_ids
+                )
+                for c in new_commits
+            ]
+            for start in range(0, len(rows), PUSH_BATCH_SIZE):
+                commit_ids.update(
+                    await commit_repo.insert_new(rows[start : start + PUSH_BATCH_SIZE])
+                )
 
-            commit_repo = GitCommitRepository(self.db)
-            existing_commit = await commit_repo.get_by_sha(
-                integration.project_id, sha
-            )
+            # Commits inserted concurrently by another sync were skipped above
+            missing = [c["id"] for c in new_commits if c["id"] not in commit_ids]
+            if missing:
+                commit_ids.update(await commit_repo.get_ids_by_shas(project_id, missing))
 
-            if not existing_commit and sha and message:
-                # Create commit record (simplified - full implementation would sync via commit_service)
-                logger.info(f"Found new commit {sha[:7]} - would sync to database")
-                # TODO: Implement full commit sync
-
-            # Parse commit message for task IDs and update task status
-            if message and integration.auto_link_tasks:
-                await self._update_tasks_from_commit(
-                    message,
-                    integration.project_id,
-                    sha,
-                    is_default_branch=(branch == integration.default_branch),
-                )
+        if not tasks:
+            logger.info(f"Completed push event processing for {len(commits)} commits")
+            return
 
-        logger.info(f"Completed push event processing for {len(commits)} commits")
+        # Link commits to tasks, and collect tasks closed by default-branch commits
+        links: Dict[Tuple[UUID, UUID], str] = {}
+        closed_by: Dict[UUID, str] = {}
+        is_default_branch = branch == integration.default_branch
+        for commit_data in commits:
+            sha = commit_data["id"]
+            refs = references[sha]
+            closing = set(refs["closes"] + refs["fixes"] + refs["resolves"])
+            commit_id = commit_ids.get(sha)
+
+            for identifier in refs["mentioned"]:
+                if identifier not in tasks:
+                    continue
+                task_id, task_status = tasks[identifier]
+                if commit_id:
+                    links[(task_id, commit_id)] = "closes" if identifier in closing else "mentioned"
+                if identifier in closing and is_default_branch and task_status != "done":
+                    closed_by.setdefault(task_id, sha)
+
+        link_rows = [
+            {"task_id": task_id, "commit_id": commit_id, "link_type": link_type}
+            for (task_id, commit_id), link_type in links.items()
+        ]
+        for start in range(0, len(link_rows), PUSH_BATCH_SIZE):
+            await commit_repo.bulk_link_tasks(link_rows[start : start + PUSH_BATCH_SIZE])
+
+        # Close tasks with one UPDATE and log their activities with one INSERT
+        completed = await task_repo.complete_tasks(list(closed_by))
+        if completed:
+            await get_task_graph_cache().invalidate_on_commit(self.db, [integration.project_id])
+        await task_repo.log_activities(
+            [
+                {
+                    "task_id": task_id,
+                    "user_id": None,  # System action
+                    "action": "commit_closed",
+                    "comment": f"Automatically closed by commit {closed_by[task_id][:7]}",
+                }
+                for task_id in completed
+            ]
+        )
+
+        logger.info(
+            f"Completed push event processing for {len(commits)} commits: "
+            f"{len(new_commits)} stored, {len(links)} task links, {len(completed)} tasks closed"
+        )
 
     async def handle_pull_request_review_event(self, payload: dict) -> None:
         """
@@ -494,29 +676,27 @@ class GitHubWebhookService:
 
     # ============= Signature Verification =============
 
-    async def verify_webhook_signature(
-        self,
-        integration_id: UUID,
-        payload: dict,
-        signature_header: str,
+    @staticmethod
+    def verify_webhook_signature(
+        secret: Optional[str],
+        body: bytes,
+        signature_header: Optional[str],
     ) -> bool:
         """
-        Verify webhook signature using HMAC-SHA256.
+        Verify webhook signature using HMAC-SHA256 over the raw request body.
+
+        The body must be the exact bytes GitHub sent; re-serializing the
+        parsed JSON changes whitespace and key order and breaks the digest.
 
         Args:
-            integration_id: GitHub integration UUID
-            payload: Webhook payload dictionary
+            secret: Integration webhook secret
+            body: Raw request body
             signature_header: X-Hub-Signature-256 header value
 
         Returns:
             True if signature is valid, False otherwise
         """
-        integration = await self.integration_repo.get_by_id(integration_id)
-        if not integration or not integration.webhook_secret:
-            logger.warning(
-                f"Cannot verify signature: integration {integration_id} "
-                f"not found or missing webhook_secret"
-            )
+        if not secret or not signature_header:
             return False
 
         # GitHub sends signature as 'sha256=<hash>'
@@ -525,23 +705,12 @@ class GitHubWebhookService:
 
         expected_signature = signature_header[7:]  # Remove 'sha256=' prefix
 
-        # Convert payload to string (as received)
-        import json
-
-        payload_str = json.dumps(payload, separators=(",", ":"))
-
         # Compute HMAC-SHA256
-        mac = hmac.new(
-            integration.webhook_secret.encode("utf-8"),
-            msg=payload_str.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        )
+        mac = hmac.new(secret.encode("utf-8"), msg=body, digestmod=hashlib.sha256)
         computed_signature = mac.hexdigest()
 
         # Constant-time comparison
-        is_valid = hmac.compare_digest(computed_signature, expected_signature)
-        logger.debug(f"Webhook signature verification for {integration_id}: {is_valid}")
-        return is_valid
+        return hmac.compare_digest(computed_signature, expected_signature)
 
     # ============= Task ID Extraction =============
 
@@ -610,6 +779,7 @@ class GitHubWebhookService:
                 if task and task.status != "done":
                     # Update task status (bypass user requirement for automated update)
                     await task_repo.update_status(task_id, "done")
+                    await get_task_graph_cache().invalidate_on_commit(self.db, [task.project_id])
 
                     # Log activity
                     await task_repo.log_activity(
@@ -772,58 +942,45 @@ class GitHubWebhookService:
             f"Linked PR to {len(mentioned_uuids)} mentioned and {len(closes_uuids)} closing tasks"
         )
 
-    async def _update_tasks_from_commit(
-        self,
-        commit_message: str,
+    @staticmethod
+    def _commit_row_from_payload(
         project_id: UUID,
-        commit_sha: str,
-        is_default_branch: bool = False,
-    ) -> None:
-        """
-        Update task status from commit message.
-
-        Args:
-            commit_message: Commit message text
-            project_id: Project UUID
-            commit_sha: Commit SHA
-            is_default_branch: Whether commit is to default branch
-        """
-        # Parse commit message
-        from tempfile import gettempdir
-
-        from ardha.services.git_service import GitService
-
-        temp_path = Path(gettempdir())  # Use system temp dir
-        git_service = GitService(temp_path)  # noqa: S108
-        task_info = git_service.parse_commit_message(commit_message)
-
-        # Get closing task IDs
-        closes_ids = (
-            task_info.get("closes", []) + task_info.get("fixes", []) + task_info.get("resolves", [])
-        )
-
-        if not closes_ids:
-            return
-
-        # Get task repository
-        from ardha.repositories.task_repository import TaskRepository
-
-        task_repo = TaskRepository(self.db)
-
-        # Update tasks if on default branch
-        if is_default_branch:
-            for task_id in closes_ids:
-                task = await task_repo.get_by_identifier(project_id, task_id)
-                if task and task.status != "done":
-                    # Update status
-                    await task_repo.update_status(task.id, "done")
-
-                    # Log activity
-                    await task_repo.log_activity(
-                        task_id=task.id,
-                        user_id=None,  # System action
-                        action="commit_closed",
-                        comment=f"Automatically closed by commit {commit_sha[:7]}",
-                    )
-
-                    logger.info(f"Auto-closed task {task.identifier} from commit {commit_sha[:7]}")
+        branch: str,
+        commit_data: dict,
+        references: Dict[str, List[str]],
+        tasks: Dict[str, Tuple[UUID, str]],
+        author_ids: Dict[str, UUID],
+    ) -> Dict[str, Any]:
+        """Build a GitCommit insert row from a push payload commit."""
+        author = commit_data.get("author") or {}
+        email = author.get("email") or ""
+        closing = references["closes"] + references["fixes"] + references["resolves"]
+        now = datetime.now(timezone.utc)
+        try:
+            committed_at = datetime.fromisoformat(commit_data["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            committed_at = now
+
+        return {
+            "id": uuid4(),
+            "project_id": project_id,
+            "sha": commit_data["id"],
+            "short_sha": commit_data["id"][:7],
+            "message": commit_data["message"],
+            "author_name": author.get("name") or author.get("username") or "unknown",
+            "author_email": email,
+            "branch": branch,
+            "committed_at": committed_at,
+            "pushed_at": now,
+            "is_merge": False,
+            "parent_shas": None,
+            "files_changed": sum(
+                len(commit_data.get(key) or []) for key in ("added", "removed", "modified")
+            ),
+            "insertions": 0,
+            "deletions": 0,
+            "linked_task_ids": sorted(i for i in references["mentioned"] if i in tasks) or None,
+            "closes_task_ids": sorted({i for i in closing if i in tasks}) or None,
+            "ardha_user_id": author_ids.get(email.lower()),
+            "synced_at": now,
+        }
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ardha.models.milestone import Milestone
 from ardha.repositories.milestone_repository import MilestoneRepository
+from ardha.repositories.task_aggregate_repository import TaskStats
 from ardha.schemas.requests.milestone import MilestoneCreateRequest, MilestoneUpdateRequest
 from ardha.services.project_service import ProjectService
 
@@ -511,7 +512,8 @@ class MilestoneService:
         """
         Get milestone summary with statistics.
 
-        Includes task counts by status, total/completed tasks, and auto-calculated progress.
+        Includes task counts by status, total/completed tasks, estimate hours,
+        and auto-calculated progress.
 
         Args:
             milestone_id: UUID of the milestone
@@ -527,48 +529,48 @@ class MilestoneService:
         # Get milestone with permission check
         milestone = await self.get_milestone(milestone_id, user_id)
 
-        # Get task statistics
-        task_stats = await self.repository.count_milestone_tasks(milestone_id)
-        total_tasks = sum(task_stats.values())
-        completed_tasks = task_stats.get("done", 0)
-
-        # Calculate auto progress
-        auto_progress = await self.repository.calculate_progress(milestone_id)
+        # Get task statistics (one read of the milestone's task aggregates)
+        stats = await self.repository.aggregates.get_stats(milestone_id)
 
         return {
             "milestone": milestone,
-            "task_stats": task_stats,
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "auto_progress": auto_progress,
+            "task_stats": stats.by_status,
+            "total_tasks": stats.total,
+            "completed_tasks": stats.completed,
+            "auto_progress": stats.progress,
+            "estimate_hours": stats.estimate_hours,
+            "completed_estimate_hours": stats.completed_estimate_hours,
         }
 
     async def get_project_roadmap(
         self,
         project_id: UUID,
         user_id: UUID,
-    ) -> list[Milestone]:
+    ) -> list[tuple[Milestone, TaskStats]]:
         """
-        Get project roadmap (all milestones ordered).
+        Get project roadmap (all milestones ordered, with task statistics).
 
-        Perfect for roadmap/timeline visualization.
+        Perfect for roadmap/timeline visualization. Milestones and their task
+        aggregates are read in a single query.
 
         Args:
             project_id: UUID of the project
             user_id: UUID of user making the request
 
         Returns:
-            List of Milestone objects ordered by order/dates
+            List of (Milestone, TaskStats) tuples ordered by order
 
         Raises:
             InsufficientMilestonePermissionsError: If user lacks permissions
         """
-        return await self.get_project_milestones(
-            project_id,
-            user_id,
-            skip=0,
-            limit=1000,  # Get all for roadmap view
-        )
+        # Check permissions
+        if not await self.project_service.check_permission(project_id, user_id, "member"):
+            logger.warning(
+                f"User {user_id} lacks permission to view milestones for project {project_id}"
+            )
+            raise InsufficientMilestonePermissionsError("Only project members can view milestones")
+
+        return await self.repository.get_milestones_with_stats(project_id)
 
     async def get_upcoming_milestones(
         self,
@@ -4,19 +4,22 @@ Notification service for managing user notifications.
 This module provides business logic for notifications including:
 - Creating and sending notifications
 - Checking user preferences and quiet hours
-- Managing read/unread status
+- Managing read/unread status, with unread counts and recent inboxes cached in Redis
 - Integration with WebSocket and email delivery
+- Set-based fan-out of one notification to many recipients
+- Daily/weekly email digests built from pending notifications
 - Statistics and maintenance operations
 """
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ardha.core.email_service import EmailService
+from ardha.core.notification_cache import InboxSnapshot, get_notification_cache
 from ardha.core.websocket_manager import get_websocket_manager
 from ardha.models.notification import Notification
 from ardha.models.notification_preference import NotificationPreference
@@ -42,6 +45,33 @@ class InsufficientNotificationPermissionsError(Exception):
     pass
 
 
+# ============= Digest Grouping =============
+
+# Page size for the digest builder's pending-notification scan
+DIGEST_SCAN_SIZE = 5000
+
+
+def group_digests(
+    rows: Sequence[Tuple[Notification, NotificationPreference]],
+) -> Dict[UUID, List[Notification]]:
+    """
+    Group pending notifications into one digest per user.
+
+    Notifications whose type the owner has disabled are left out.
+
+    Args:
+        rows: (notification, owner's preferences) tuples, ordered by user
+
+    Returns:
+        Dict mapping user UUID to that user's notifications, oldest first
+    """
+    digests: Dict[UUID, List[Notification]] = {}
+    for notification, preference in rows:
+        if preference.is_enabled(notification.type):
+            digests.setdefault(notification.user_id, []).append(notification)
+    return digests
+
+
 # ============= Service Class =============
 
 
@@ -59,6 +89,7 @@ class NotificationService:
         user_repo: User repository for user data access
         ws_manager: WebSocketManager for real-time delivery
         email_service: EmailService for email delivery
+        cache: NotificationCache for unread counts and recent inboxes
     """
 
     def __init__(self, db: AsyncSession):
@@ -74,6 +105,7 @@ class NotificationService:
         self.user_repo = UserRepository(db)
         self.ws_manager = get_websocket_manager()
         self.email_service = EmailService()
+        self.cache = get_notification_cache()
 
     # ============= Creation & Sending =============
 
@@ -113,24 +145,16 @@ class NotificationService:
             SQLAlchemyError: If database operation fails
         """
         try:
-            # Check user preferences
+            # Check user preferences (one load covers type toggles and quiet hours)
             preferences = await self.preference_repo.get_or_create_default(user_id)
 
-            # Check if notification type is enabled
-            is_enabled = await self.preference_repo.is_notification_enabled(
-                user_id, notification_type
-            )
-
-            if not is_enabled:
+            if not preferences.is_enabled(notification_type):
                 logger.info(f"Notification type {notification_type} disabled for user {user_id}")
                 # Still create notification but mark internal note
                 if not data:
                     data = {}
                 data["_preference_disabled"] = True
 
-            # Check quiet hours
-            in_quiet_hours = await self.preference_repo.is_in_quiet_hours(user_id)
-
             # Create notification in database
             notification = await self.notification_repo.create(
                 {
@@ -145,27 +169,8 @@ class NotificationService:
                 }
             )
 
-            # Send via WebSocket if enabled and not in quiet hours
-            if is_enabled and not in_quiet_hours:
-                await self._send_websocket_notification(notification)
-
-            # Queue email if enabled and appropriate frequency
-            if (
-                is_enabled
-                and preferences.email_enabled
-                and not in_quiet_hours
-                and preferences.email_frequency == "instant"
-            ):
-                await self._send_email_notification(notification)
-            elif (
-                is_enabled
-                and preferences.email_enabled
-                and preferences.email_frequency in ["daily", "weekly"]
-            ):
-                logger.debug(
-                    f"Queuing notification {notification.id} for "
-                    f"{preferences.email_frequency} digest"
-                )
+            await self.cache.add([notification])
+            await self._deliver([notification], {user_id: preferences})
 
             logger.info(f"Created notification {notification.id} for user {user_id}")
 
@@ -175,6 +180,80 @@ class NotificationService:
             logger.error(f"Error creating notification: {e}", exc_info=True)
             raise
 
+    async def notify_users(
+        self,
+        user_ids: Iterable[UUID],
+        notification_type: str,
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None,
+        link_type: Optional[str] = None,
+        link_id: Optional[UUID] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> List[Notification]:
+        """
+        Create and send one notification to many users as a set.
+
+        Loads every recipient's preferences with one query, inserts all
+        notifications with one multi-row INSERT, publishes the WebSocket
+        deliveries as one batch and queues instant emails for a background
+        worker, so the cost on the request path does not grow with the
+        number of round trips per recipient.
+
+        Args:
+            user_ids: Target user UUIDs (duplicates are ignored)
+            notification_type: Type of notification
+            title: Notification title (max 200 chars)
+            message: Notification message (max 1000 chars)
+            data: Additional context data (optional)
+            link_type: Type of linked entity (optional)
+            link_id: UUID of linked entity (optional)
+            expires_at: Expiration datetime (optional)
+
+        Returns:
+            Created Notification objects in recipient order
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        recipients = list(dict.fromkeys(user_ids))
+        if not recipients:
+            return []
+
+        try:
+            preferences = await self.preference_repo.get_or_create_for_users(recipients)
+
+            rows = []
+            for user_id in recipients:
+                row_data = data
+                if not preferences[user_id].is_enabled(notification_type):
+                    row_data = {**(data or {}), "_preference_disabled": True}
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "type": notification_type,
+                        "title": title,
+                        "message": message,
+                        "data": row_data,
+                        "link_type": link_type,
+                        "link_id": link_id,
+                        "expires_at": expires_at,
+                    }
+                )
+
+            notifications = await self.notification_repo.insert_many(rows)
+            await self.cache.add(notifications)
+            await self._deliver(notifications, preferences)
+
+            logger.info(
+                f"Fanned out {notification_type} notification to {len(notifications)} users"
+            )
+            return notifications
+
+        except Exception as e:
+            logger.error(f"Error fanning out notifications: {e}", exc_info=True)
+            raise
+
     async def send_notification(self, notification: Notification) -> bool:
         """
         Send existing notification via all enabled channels.
@@ -190,12 +269,8 @@ class NotificationService:
         try:
             # Check preferences
             preferences = await self.preference_repo.get_or_create_default(notification.user_id)
-
-            is_enabled = await self.preference_repo.is_notification_enabled(
-                notification.user_id, notification.type
-            )
-
-            in_quiet_hours = await self.preference_repo.is_in_quiet_hours(notification.user_id)
+            is_enabled = preferences.is_enabled(notification.type)
+            in_quiet_hours = preferences.is_quiet_hours()
 
             # Send via WebSocket
             if is_enabled and not in_quiet_hours:
@@ -237,21 +312,13 @@ class NotificationService:
             raise ValueError("Cannot bulk create more than 100 notifications")
 
         try:
+            # Missing default preferences are committed with the notifications
+            preferences = await self.preference_repo.get_or_create_for_users(
+                [data["user_id"] for data in notifications]
+            )
             created_notifications = await self.notification_repo.bulk_create(notifications)
-
-            # Send via WebSocket for all enabled notifications
-            for notif in created_notifications:
-                try:
-                    is_enabled = await self.preference_repo.is_notification_enabled(
-                        notif.user_id, notif.type
-                    )
-                    in_quiet_hours = await self.preference_repo.is_in_quiet_hours(notif.user_id)
-
-                    if is_enabled and not in_quiet_hours:
-                        await self._send_websocket_notification(notif)
-
-                except Exception as e:
-                    logger.warning(f"Error sending notification {notif.id}: {e}")
+            await self.cache.add(created_notifications)
+            await self._deliver(created_notifications, preferences)
 
             logger.info(f"Bulk created {len(created_notifications)} notifications")
             return created_notifications
@@ -272,6 +339,9 @@ class NotificationService:
         """
         Get user's notifications with pagination.
 
+        Pages within the cached inbox and the unread count are served from
+        Redis; only deeper pages and cache misses query the database.
+
         Args:
             user_id: User UUID
             skip: Number of records to skip for pagination
@@ -285,22 +355,28 @@ class NotificationService:
             ValueError: If skip or limit are invalid
         """
         try:
+            inbox = await self._get_inbox(user_id)
+
             if unread_only:
-                all_unread = await self.notification_repo.get_unread_by_user(user_id)
+                all_unread = [n for n in inbox.notifications if not n.is_read]
+                if len(all_unread) < inbox.unread_count:
+                    # Some unread notifications are older than the cached inbox
+                    all_unread = await self.notification_repo.get_unread_by_user(user_id)
                 # Apply pagination manually for unread filter
                 notifications = all_unread[skip : skip + limit]
                 total = len(all_unread)
             else:
-                notifications = await self.notification_repo.get_by_user(user_id, skip, limit)
+                if inbox.complete or skip + limit <= len(inbox.notifications):
+                    notifications = inbox.notifications[skip : skip + limit]
+                else:
+                    notifications = await self.notification_repo.get_by_user(user_id, skip, limit)
                 # Get total count (approximate from returned list)
                 total = skip + len(notifications)
 
-            unread_count = await self.notification_repo.get_unread_count(user_id)
-
             return {
                 "notifications": notifications,
                 "total": total,
-                "unread_count": unread_count,
+                "unread_count": inbox.unread_count,
             }
 
         except Exception as e:
@@ -334,13 +410,13 @@ class NotificationService:
                     f"User {user_id} does not own notification {notification_id}"
                 )
 
-            # Mark as read
-            updated_notification = await self.notification_repo.mark_as_read(notification_id)
-            if not updated_notification:
-                raise NotificationNotFoundError(f"Notification {notification_id} not found")
+            # Mark as read (a no-op if it already was)
+            token = await self.cache.begin_change(user_id)
+            changed, read_at = await self.notification_repo.mark_read(user_id, [notification_id])
+            await self.cache.mark_read(user_id, changed, read_at, token)
 
             logger.info(f"Marked notification {notification_id} as read")
-            return updated_notification
+            return notification
 
         except (NotificationNotFoundError, InsufficientNotificationPermissionsError):
             raise
@@ -359,9 +435,11 @@ class NotificationService:
             Number of notifications marked as read
         """
         try:
-            count = await self.notification_repo.mark_all_as_read(user_id)
-            logger.info(f"Marked {count} notifications as read for user {user_id}")
-            return count
+            token = await self.cache.begin_change(user_id)
+            changed, read_at = await self.notification_repo.mark_read(user_id)
+            await self.cache.mark_read(user_id, changed, read_at, token)
+            logger.info(f"Marked {len(changed)} notifications as read for user {user_id}")
+            return len(changed)
 
         except Exception as e:
             logger.error(f"Error marking all notifications as read: {e}", exc_info=True)
@@ -392,7 +470,11 @@ class NotificationService:
                 )
 
             # Delete notification
+            token = await self.cache.begin_change(user_id)
             await self.notification_repo.delete(notification_id)
+            await self.cache.remove(
+                user_id, notification_id, was_unread=not notification.is_read, token=token
+            )
             logger.info(f"Deleted notification {notification_id}")
 
         except (NotificationNotFoundError, InsufficientNotificationPermissionsError):
@@ -464,39 +546,27 @@ class NotificationService:
             user_id: User UUID
 
         Returns:
-            Dictionary with notification statistics
+            Dictionary with notification statistics (total_count and by_type
+            cover the cached inbox, i.e. the most recent notifications) and
+            the five most recent notifications as detached instances
         """
         try:
-            # Get all notifications for counting
-            all_notifications = await self.notification_repo.get_by_user(user_id, skip=0, limit=100)
-
-            # Get unread count
-            unread_count = await self.notification_repo.get_unread_count(user_id)
+            # Every figure comes from the cached inbox, so polls stay off the database
+            inbox = await self._get_inbox(user_id)
 
             # Count by type
             by_type: Dict[str, int] = {}
-            for notif in all_notifications:
+            for notif in inbox.notifications:
                 by_type[notif.type] = by_type.get(notif.type, 0) + 1
 
             # Get recent notifications (last 5)
-            recent_notifications = await self.notification_repo.get_by_user(
-                user_id, skip=0, limit=5
-            )
+            recent_notifications = inbox.notifications[:5]
 
             return {
-                "total_count": len(all_notifications),
-                "unread_count": unread_count,
+                "total_count": len(inbox.notifications),
+                "unread_count": inbox.unread_count,
                 "by_type": by_type,
-                "recent_notifications": [
-                    {
-                        "id": str(notif.id),
-                        "type": notif.type,
-                        "title": notif.title,
-                        "is_read": notif.is_read,
-                        "created_at": notif.created_at.isoformat(),
-                    }
-                    for notif in recent_notifications
-                ],
+                "recent_notifications": recent_notifications,
             }
 
         except Exception as e:
@@ -505,19 +575,85 @@ class NotificationService:
 
     # ============= Maintenance =============
 
+    async def send_digests(self, frequency: str) -> Dict[str, int]:
+        """
+        Email one digest to every user with pending notifications for a period.
+
+        Scans unread, not yet emailed notifications of users whose email
+        frequency matches, a page of users at a time, sends one email per
+        user and marks the included notifications as emailed so the next
+        period starts empty. Users whose digest fails to send keep their
+        notifications pending for the next run.
+
+        Args:
+            frequency: Digest period ("daily" or "weekly")
+
+        Returns:
+            Dict with users, sent, failed and notifications counts
+        """
+        stats = {"users": 0, "sent": 0, "failed": 0, "notifications": 0}
+        after_user: Optional[UUID] = None
+
+        while True:
+            rows = await self.notification_repo.get_pending_email(
+                frequency, after_user=after_user, limit=DIGEST_SCAN_SIZE
+            )
+            if not rows:
+                break
+
+            users = list(dict.fromkeys(notification.user_id for notification, _ in rows))
+            if len(rows) == DIGEST_SCAN_SIZE and len(users) > 1:
+                # The last user may continue past this page; start the next page with them
+                users.pop()
+            after_user = users[-1]
+            page_users = set(users)
+            scanned = [row for row in rows if row[0].user_id in page_users]
+            digests = group_digests(scanned)
+
+            emailed: List[UUID] = [
+                notification.id
+                for notification, preference in scanned
+                if not preference.is_enabled(notification.type)
+            ]
+            for user_id, notifications in digests.items():
+                stats["users"] += 1
+                user = notifications[0].user
+                if user and await self.email_service.send_digest(user, notifications, frequency):
+                    stats["sent"] += 1
+                    stats["notifications"] += len(notifications)
+                    emailed.extend(notification.id for notification in notifications)
+                else:
+                    stats["failed"] += 1
+
+            await self.notification_repo.mark_emailed(emailed)
+
+            if len(rows) < DIGEST_SCAN_SIZE:
+                break
+
+        logger.info(
+            f"Sent {stats['sent']} {frequency} digests covering "
+            f"{stats['notifications']} notifications ({stats['failed']} failed)"
+        )
+        return stats
+
     async def cleanup_old_notifications(self, days: int = 30) -> int:
         """
         Delete notifications older than specified days.
 
+        Drops whole monthly partitions (see
+        NotificationRepository.delete_old_notifications).
+
         Args:
             days: Number of days (default: 30)
 
         Returns:
-            Number of notifications deleted
+            Number of monthly partitions dropped
         """
         try:
             count = await self.notification_repo.delete_old_notifications(days)
-            logger.info(f"Cleaned up {count} old notifications (older than {days} days)")
+            if count:
+                await self.cache.clear()
+            logger.info(f"Cleaned up {count} old notification partitions (older than {days} days)")
             return count
 
         except Exception as e:
@@ -533,6 +669,8 @@ class NotificationService:
         """
         try:
             count = await self.notification_repo.delete_expired_notifications()
+            if count:
+                await self.cache.clear()
             logger.info(f"Cleaned up {count} expired notifications")
             return count
 
@@ -542,6 +680,105 @@ class NotificationService:
 
     # ============= Internal Methods =============
 
+    async def _get_inbox(self, user_id: UUID) -> InboxSnapshot:
+        """
+        Get a user's unread count and recent notifications.
+
+        Served from the cache; on a miss both are loaded with one database
+        round trip each and stored for the next poll.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            InboxSnapshot with notifications newest first
+        """
+        inbox = await self.cache.get_inbox(user_id)
+        if inbox is not None:
+            return inbox
+
+        generation = await self.cache.begin_fill(user_id)
+        unread_count, notifications = await self.notification_repo.get_inbox(
+            user_id, self.cache.inbox_size
+        )
+        await self.cache.fill(user_id, generation, unread_count, notifications)
+        return InboxSnapshot(
+            unread_count, notifications, len(notifications) < self.cache.inbox_size
+        )
+
+    async def _deliver(
+        self,
+        notifications: List[Notification],
+        preferences: Dict[UUID, NotificationPreference],
+    ) -> None:
+        """
+        Deliver created notifications according to their owners' preferences.
+
+        Notifications that are enabled and outside quiet hours are sent over
+        WebSocket in one batch; those whose owners want instant email are
+        queued for the email worker. Notifications of users on a daily or
+        weekly frequency stay pending for send_digests.
+
+        Args:
+            notifications: Created notifications
+            preferences: Preferences of every notification owner
+        """
+        now = datetime.now(timezone.utc)
+        live: List[Notification] = []
+        emails: List[Notification] = []
+
+        for notification in notifications:
+            preference = preferences[notification.user_id]
+            if not preference.is_enabled(notification.type):
+                continue
+
+            if preference.is_quiet_hours(now):
+                continue
+
+            live.append(notification)
+            if preference.email_enabled and preference.email_frequency == "instant":
+                emails.append(notification)
+
+        if live:
+            try:
+                await self.ws_manager.send_personal_messages(
+                    [(n.user_id, self._websocket_message(n)) for n in live]
+                )
+            except Exception as e:
+                logger.error(f"Error sending {len(live)} WebSocket notifications: {e}")
+
+        if emails:
+            self._queue_emails(emails)
+
+    def _queue_emails(self, notifications: List[Notification]) -> None:
+        """Hand instant notification emails to the background email worker."""
+        try:
+            from ardha.jobs.notification_jobs import send_notification_emails
+
+            send_notification_emails.apply_async(  # type: ignore
+                args=[[str(notification.id) for notification in notifications]]
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue {len(notifications)} notification emails: {e}")
+
+    @staticmethod
+    def _websocket_message(notification: Notification) -> Dict[str, Any]:
+        """Build the WebSocket frame for a notification."""
+        return {
+            "type": "notification",
+            "data": {
+                "id": str(notification.id),
+                "type": notification.type,
+                "title": notification.title,
+                "message": notification.message,
+                "data": notification.data,
+                "link_type": notification.link_type,
+                "link_id": str(notification.link_id) if notification.link_id else None,
+                "created_at": notification.created_at.isoformat(),
+                "is_read": notification.is_read,
+            },
+        }
+
     async def _send_websocket_notification(self, notification: Notification) -> bool:
         """
         Send notification via WebSocket for real-time delivery.
@@ -553,22 +790,9 @@ class NotificationService:
             True if sent successfully, False otherwise
         """
         try:
-            message = {
-                "type": "notification",
-                "data": {
-                    "id": str(notification.id),
-                    "type": notification.type,
-                    "title": notification.title,
-                    "message": notification.message,
-                    "data": notification.data,
-                    "link_type": notification.link_type,
-                    "link_id": str(notification.link_id) if notification.link_id else None,
-                    "created_at": notification.created_at.isoformat(),
-                    "is_read": notification.is_read,
-                },
-            }
-
-            success = await self.ws_manager.send_personal_message(notification.user_id, message)
+            success = await self.ws_manager.send_personal_message(
+                notification.user_id, self._websocket_message(notification)
+            )
 
             if success:
                 logger.debug(f"Sent WebSocket notification {notification.id}")
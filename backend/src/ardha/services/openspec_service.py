@@ -459,8 +459,6 @@ class OpenSpecService:
         await self.repo.update_sync_status(proposal_id, "syncing")
         await self.db.flush()
 
-        created_tasks = []
-
         try:
             # Parse tasks from tasks_content
             if not proposal.tasks_content:
@@ -473,57 +471,41 @@ class OpenSpecService:
 
             logger.info(f"Parsed {len(parsed_tasks)} tasks from proposal '{proposal.name}'")
 
-            # Create tasks in database
-            for parsed_task in parsed_tasks:
-                # Prepare task data
-                task_data = {
-                    "title": parsed_task.title,
-                    "description": parsed_task.description,
-                    "status": "todo",
-                    "phase": parsed_task.phase,
-                    "estimate_hours": parsed_task.estimated_hours,
-                    "openspec_change_path": proposal.directory_path,
-                    "ai_generated": True,
-                    "ai_confidence": 0.85,  # Default confidence for OpenSpec tasks
-                    "ai_reasoning": f"Generated from OpenSpec proposal: {proposal.name}",
-                }
-
-                # Create task via task service
-                task = await self.task_service.create_task(
-                    project_id=proposal.project_id,
-                    task_data=task_data,
-                    created_by_id=user_id,
-                )
-
-                # Link task to proposal
-                await self.task_service.link_openspec_proposal(
-                    task_id=task.id,
-                    proposal_id=proposal_id,
-                )
-
-                created_tasks.append(task)
-
-                logger.info(
-                    f"Created task {task.identifier} from parsed task {parsed_task.identifier}"
-                )
-
-            # Handle task dependencies (second pass after all tasks created)
-            # Map parsed identifiers to created task UUIDs
-            identifier_to_task = {task.identifier: task for task in created_tasks}
-
+            # Resolve dependencies between parsed tasks to batch positions
+            position = {parsed_task.identifier: i for i, parsed_task in enumerate(parsed_tasks)}
+            dependencies = []
             for i, parsed_task in enumerate(parsed_tasks):
-                if parsed_task.dependencies:
-                    task = created_tasks[i]
-
-                    for dep_identifier in parsed_task.dependencies:
-                        # Find matching task by identifier pattern
-                        # Note: OpenSpec identifiers may not match generated identifiers
-                        # For MVP, we'll skip dependencies that can't be resolved
+                for dep_identifier in parsed_task.dependencies:
+                    if dep_identifier in position:
+                        dependencies.append((i, position[dep_identifier]))
+                    else:
                         logger.warning(
-                            f"Task dependency resolution not fully implemented: "
-                            f"{task.identifier} depends on {dep_identifier}"
+                            f"Skipping dependency of {parsed_task.identifier} on "
+                            f"{dep_identifier}: not a task of proposal '{proposal.name}'"
                         )
 
+            # Create all tasks, their dependencies and proposal links in one batch
+            created_tasks = await self.task_service.bulk_create_tasks(
+                project_id=proposal.project_id,
+                tasks_data=[
+                    {
+                        "title": parsed_task.title,
+                        "description": parsed_task.description,
+                        "status": "todo",
+                        "phase": parsed_task.phase,
+                        "estimate_hours": parsed_task.estimated_hours,
+                        "openspec_change_path": proposal.directory_path,
+                        "ai_generated": True,
+                        "ai_confidence": 0.85,  # Default confidence for OpenSpec tasks
+                        "ai_reasoning": f"Generated from OpenSpec proposal: {proposal.name}",
+                    }
+                    for parsed_task in parsed_tasks
+                ],
+                created_by_id=user_id,
+                openspec_proposal_id=proposal_id,
+                dependencies=dependencies,
+            )
+
             # Update sync status to synced
             await self.repo.update_sync_status(
                 proposal_id=proposal_id,
@@ -10,6 +10,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.principal_cache import get_principal_cache
 from ardha.models.project import Project
 from ardha.models.project_member import ProjectMember
 from ardha.repositories.project_repository import ProjectRepository
@@ -448,7 +449,8 @@ class ProjectService:
         Returns:
             True if user has required permission, False otherwise
         """
-        user_role = await self.repository.get_member_role(project_id, user_id)
+        roles = await self.get_user_roles(user_id)
+        user_role = roles.get(project_id)
         if not user_role:
             return False
 
@@ -457,6 +459,27 @@ class ProjectService:
 
         return user_level >= required_level
 
+    async def get_user_roles(self, user_id: UUID) -> dict[UUID, str]:
+        """
+        Get all of a user's project roles.
+
+        Served from the principal cache when possible; on a miss the full
+        role map is loaded in one query and cached, so repeated permission
+        checks in a request cost no database round trips.
+
+        Args:
+            user_id: UUID of the user
+
+        Returns:
+            Mapping of project UUID to role
+        """
+        principal_cache = get_principal_cache()
+        roles = await principal_cache.get_roles(user_id)
+        if roles is None:
+            roles = await self.repository.get_member_roles(user_id)
+            await principal_cache.set_roles(user_id, roles)
+        return roles
+
     async def get_member_count(self, project_id: UUID) -> int:
         """
         Get the number of members in a project.
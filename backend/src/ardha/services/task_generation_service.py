@@ -9,17 +9,25 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import select
+
 from ..core.config import settings
 from ..core.database import async_session_factory, get_db
+from ..core.task_graph import get_task_graph_cache
 from ..models.project import Project
 from ..models.task import Task
 from ..models.task_activity import TaskActivity
-from ..models.task_dependency import TaskDependency
 from ..models.user import User
+from ..repositories.task_repository import TaskRepository
 from .openspec_service import get_openspec_service
+from .task_service import TaskService
 
 logger = logging.getLogger(__name__)
 
+# Values allowed by the tasks table check constraints
+TASK_PRIORITIES = {"urgent", "high", "medium", "low"}
+TASK_COMPLEXITIES = {"trivial", "simple", "medium", "complex", "very_complex"}
+
 
 class TaskGenerationService:
     """
@@ -56,63 +64,25 @@ class TaskGenerationService:
         Raises:
             Exception: If database operation fails
         """
-        task_ids = []
-        epic_ids = []
+        epic_ids: List[UUID] = []
 
         try:
-            async with async_session_factory() as session:
-                # Process tasks in order to maintain dependencies
-                for task_data in task_breakdown:
-                    # Skip epics for now (they're just containers)
-                    if task_data.get("is_epic", False):
-                        continue
-
-                    # Generate task identifier
-                    task_identifier = await self._generate_task_identifier(task_data, session)
-
-                    # Determine task type
-                    task_type = self._determine_task_type(task_data)
-
-                    # Create task
-                    task = Task(
-                        identifier=task_identifier,
-                        title=task_data.get("title", "Untitled Task"),
-                        description=task_data.get("description", ""),
-                        priority=task_data.get("priority", "medium"),
-                        status="pending_approval",  # Generated tasks need approval
-                        project_id=project_id,
-                        created_by=user_id,
-                        estimate_hours=task_data.get("estimated_hours"),
-                        actual_hours=None,
-                        completion_percentage=0.0,
-                        metadata={
-                            "generated_by_workflow": True,
-                            "workflow_id": str(workflow_id),
-                            "is_subtask": task_data.get("is_subtask", False),
-                            "is_main_task": task_data.get("is_main_task", False),
-                            "epic_id": task_data.get("epic_id"),
-                            "parent_task_id": task_data.get("parent_task_id"),
-                            "acceptance_criteria": task_data.get("acceptance_criteria", []),
-                            "required_skills": task_data.get("required_skills", []),
-                            "complexity": task_data.get("complexity", "medium"),
-                            "task_type": task_type,  # Store task type in metadata
-                        },
-                    )
-
-                    session.add(task)
-                    await session.flush()  # Get the task ID
-                    task_ids.append(task.id)
-
-                    # Track epic IDs separately
-                    if task_data.get("is_epic", False):
-                        epic_ids.append(task.id)
-
-                    self.logger.info(
-                        f"Saved task: {task_identifier} - {task_data.get('title', 'Untitled')}"
-                    )
+            # Skip epics (they're just containers)
+            generated = [
+                task_data for task_data in task_breakdown if not task_data.get("is_epic", False)
+            ]
 
+            async with async_session_factory() as session:
+                tasks = await TaskService(session).bulk_create_tasks(
+                    project_id=project_id,
+                    tasks_data=[
+                        self._build_task_data(task_data, workflow_id) for task_data in generated
+                    ],
+                    created_by_id=user_id,
+                )
                 await session.commit()
 
+            task_ids = [task.id for task in tasks]
             self.logger.info(f"Saved {len(task_ids)} tasks to database for project {project_id}")
             return task_ids, epic_ids
 
@@ -140,39 +110,36 @@ class TaskGenerationService:
         Raises:
             Exception: If database operation fails
         """
-        dependency_ids = []
-
         try:
             # Create mapping from task identifiers to IDs
             task_id_map = self._create_task_id_mapping(task_breakdown, task_ids)
 
-            async with async_session_factory() as session:
-                for dep_data in task_dependencies:
-                    task_id_key = dep_data.get("task_id")
-                    depends_on_key = dep_data.get("depends_on")
-                    task_id = task_id_map.get(task_id_key) if task_id_key else None
-                    depends_on_task_id = task_id_map.get(depends_on_key) if depends_on_key else None
-
-                    if not task_id or not depends_on_task_id:
-                        self.logger.warning(f"Skipping dependency - missing task IDs: {dep_data}")
-                        continue
-
-                    # Create dependency
-                    dependency = TaskDependency(
-                        task_id=task_id,
-                        depends_on_task_id=depends_on_task_id,
-                        dependency_type=dep_data.get("dependency_type", "finish_to_start"),
-                        created_by=task_ids[0] if task_ids else None,  # First task as creator
-                    )
+            pairs = []
+            for dep_data in task_dependencies:
+                task_id_key = dep_data.get("task_id")
+                depends_on_key = dep_data.get("depends_on")
+                task_id = task_id_map.get(task_id_key) if task_id_key else None
+                depends_on_task_id = task_id_map.get(depends_on_key) if depends_on_key else None
 
-                    session.add(dependency)
-                    await session.flush()
-                    dependency_ids.append(dependency.id)
+                if not task_id or not depends_on_task_id:
+                    self.logger.warning(f"Skipping dependency - missing task IDs: {dep_data}")
+                    continue
 
-                    self.logger.info(f"Saved dependency: {task_id} -> {depends_on_task_id}")
+                pairs.append((task_id, depends_on_task_id))
 
+            async with async_session_factory() as session:
+                dependency_ids = await TaskRepository(session).add_dependencies(pairs)
+                project_ids = list(
+                    await session.scalars(
+                        select(Task.project_id).where(
+                            Task.id.in_({task_id for task_id, _ in pairs})
+                        )
+                    )
+                )
                 await session.commit()
 
+            await get_task_graph_cache().invalidate(project_ids)
+
             self.logger.info(f"Saved {len(dependency_ids)} task dependencies")
             return dependency_ids
 
@@ -230,30 +197,34 @@ class TaskGenerationService:
             self.logger.error(f"Failed to link OpenSpec to project: {e}")
             return False
 
-    async def _generate_task_identifier(self, task_data: Dict[str, Any], session) -> str:
+    def _build_task_data(self, task_data: Dict[str, Any], workflow_id: UUID) -> Dict[str, Any]:
         """
-        Generate unique task identifier.
+        Map a generated task to task columns.
+
+        Values outside the task check constraints fall back to defaults.
 
         Args:
-            task_data: Task data
-            session: Database session for querying existing tasks
+            task_data: Generated task
+            workflow_id: Workflow execution ID
 
         Returns:
-            Unique task identifier
+            Task creation data for TaskService.bulk_create_tasks
         """
-        # Get project ID from the first task (they all belong to same project)
-        project_id = task_data.get("project_id")
-
-        # Query existing task identifiers for this project
-        from sqlalchemy import func, select
-
-        result = await session.execute(
-            select(func.count(Task.id)).where(Task.project_id == project_id)
-        )
-        task_count = result.scalar() or 0
-
-        # Generate identifier like TAS-001, TAS-002, etc.
-        return f"TAS-{task_count + 1:03d}"
+        priority = task_data.get("priority", "medium")
+        complexity = task_data.get("complexity")
+        return {
+            "title": task_data.get("title", "Untitled Task"),
+            "description": task_data.get("description", ""),
+            "status": "todo",
+            "priority": priority if priority in TASK_PRIORITIES else "medium",
+            "complexity": complexity if complexity in TASK_COMPLEXITIES else None,
+            "estimate_hours": task_data.get("estimated_hours"),
+            "ai_generated": True,
+            "ai_reasoning": (
+                f"Generated by task generation workflow {workflow_id} "
+                f"({self._determine_task_type(task_data)})"
+            ),
+        }
 
     def _determine_task_type(self, task_data: Dict[str, Any]) -> str:
         """
@@ -5,6 +5,7 @@ This module provides the business logic layer for tasks, handling:
 - Permission checks
 - Status transition validation
 - Circular dependency detection
+- Dependency graph views (transitive blockers, execution plan)
 - Activity logging
 - OpenSpec integration
 - Git commit linking
@@ -17,6 +18,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.core.task_graph import GraphNode, TaskGraph, TaskPlan, get_task_graph_cache
 from ardha.repositories.task_repository import TaskRepository
 from ardha.services.project_service import ProjectService
 
@@ -61,6 +63,51 @@ VALID_TRANSITIONS = {
 }
 
 
+# ============= Batch Validation =============
+
+
+def _check_batch_dependencies(task_count: int, dependencies: list[tuple[int, int]]) -> None:
+    """
+    Validate dependencies between tasks of one batch before they are created.
+
+    Args:
+        task_count: Number of tasks in the batch
+        dependencies: (task index, depends-on task index) pairs
+
+    Raises:
+        ValueError: If an index is outside the batch
+        CircularDependencyError: If the dependencies contain a cycle
+    """
+    depends_on: dict[int, list[int]] = {}
+    for task, dependency in dependencies:
+        if not (0 <= task < task_count and 0 <= dependency < task_count):
+            raise ValueError(
+                f"Dependency ({task}, {dependency}) refers to a task outside the batch"
+            )
+        depends_on.setdefault(task, []).append(dependency)
+
+    # Iterative three-color depth-first search
+    state: dict[int, int] = {}  # 1 = on the current path, 2 = done
+    for start in depends_on:
+        if state.get(start):
+            continue
+        stack = [(start, iter(depends_on[start]))]
+        state[start] = 1
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                state[node] = 2
+                stack.pop()
+            elif state.get(child) == 1:
+                raise CircularDependencyError(
+                    f"Dependencies within the batch form a cycle through task {child}"
+                )
+            elif not state.get(child):
+                state[child] = 1
+                stack.append((child, iter(depends_on.get(child, []))))
+
+
 class TaskService:
     """
     Service layer for task business logic.
@@ -84,6 +131,7 @@ class TaskService:
         self.db = db
         self.repository = TaskRepository(db)
         self.project_service = ProjectService(db)
+        self.graph_cache = get_task_graph_cache()
 
     # ============= Core Task Operations =============
 
@@ -141,9 +189,139 @@ class TaskService:
             ),
         )
 
+        await self.graph_cache.invalidate_on_commit(self.db, [project_id])
+
         logger.info(f"Created task {task.identifier} by user {created_by_id}")
         return task
 
+    async def bulk_create_tasks(
+        self,
+        project_id: UUID,
+        tasks_data: list[dict[str, Any]],
+        created_by_id: UUID,
+        openspec_proposal_id: UUID | None = None,
+        dependencies: list[tuple[int, int]] | None = None,
+    ) -> list[Any]:  # Returns list[Task]
+        """
+        Create a batch of tasks with their tags, dependencies and activities.
+
+        Checks permissions once, reserves all identifiers in one counter
+        update and writes tasks, tags, dependencies and activity entries with
+        one multi-row INSERT each, so the number of round trips does not
+        grow with the batch size. Dependencies refer to tasks of the same
+        batch and are checked for cycles in memory before anything is
+        written.
+
+        Args:
+            project_id: Project UUID
+            tasks_data: Task creation data; each entry may include "tags",
+                a list of tag names to attach
+            created_by_id: User creating the tasks
+            openspec_proposal_id: OpenSpec proposal to link every task to
+            dependencies: (task index, depends-on task index) pairs within
+                tasks_data
+
+        Returns:
+            Created tasks in input order
+
+        Raises:
+            InsufficientTaskPermissionsError: If user lacks permissions
+            CircularDependencyError: If the dependencies contain a cycle
+            ValueError: If a dependency refers outside the batch
+        """
+        dependencies = list(dict.fromkeys(dependencies or []))
+        _check_batch_dependencies(len(tasks_data), dependencies)
+
+        if not await self.project_service.check_permission(
+            project_id=project_id,
+            user_id=created_by_id,
+            required_role="member",
+        ):
+            raise InsufficientTaskPermissionsError(
+                "Must be at least a project member to create tasks"
+            )
+
+        if not tasks_data:
+            return []
+
+        tag_names = [list(task_data.get("tags") or []) for task_data in tasks_data]
+        rows = [
+            {
+                **{key: value for key, value in task_data.items() if key != "tags"},
+                "created_by_id": created_by_id,
+                **({"openspec_proposal_id": openspec_proposal_id} if openspec_proposal_id else {}),
+            }
+            for task_data in tasks_data
+        ]
+        tasks = await self.repository.bulk_create(project_id, rows)
+
+        activities: list[dict[str, Any]] = [
+            {
+                "task_id": task.id,
+                "user_id": created_by_id,
+                "action": "created",
+                "new_value": json.dumps(
+                    {"title": task.title, "status": task.status, "priority": task.priority}
+                ),
+            }
+            for task in tasks
+        ]
+
+        if openspec_proposal_id:
+            activities.extend(
+                {
+                    "task_id": task.id,
+                    "user_id": None,  # System action
+                    "action": "openspec_linked",
+                    "new_value": str(openspec_proposal_id),
+                }
+                for task in tasks
+            )
+
+        all_tag_names = [name for names in tag_names for name in names]
+        if all_tag_names:
+            tags = await self.repository.get_or_create_tags(project_id, all_tag_names)
+            await self.repository.add_tags_to_tasks(
+                [
+                    (task.id, tags[name].id)
+                    for task, names in zip(tasks, tag_names)
+                    for name in names
+                ]
+            )
+            activities.extend(
+                {
+                    "task_id": task.id,
+                    "user_id": created_by_id,
+                    "action": "tag_added",
+                    "new_value": name,
+                }
+                for task, names in zip(tasks, tag_names)
+                for name in dict.fromkeys(names)
+            )
+
+        if dependencies:
+            await self.repository.add_dependencies(
+                [(tasks[task].id, tasks[depends_on].id) for task, depends_on in dependencies]
+            )
+            activities.extend(
+                {
+                    "task_id": tasks[task].id,
+                    "user_id": created_by_id,
+                    "action": "dependency_added",
+                    "new_value": tasks[depends_on].identifier,
+                }
+                for task, depends_on in dependencies
+            )
+
+        await self.repository.log_activities(activities)
+        await self.graph_cache.invalidate_on_commit(self.db, [project_id])
+
+        logger.info(
+            f"Created {len(tasks)} tasks with {len(dependencies)} dependencies "
+            f"in project {project_id} by user {created_by_id}"
+        )
+        return tasks
+
     async def get_task(self, task_id: UUID, user_id: UUID) -> Any:  # Returns Task
         """
         Get task by ID with permission check.
@@ -274,6 +452,9 @@ class TaskService:
                 new_value=str(values["new"]),
             )
 
+        if changes:
+            await self.graph_cache.invalidate_on_commit(self.db, [task.project_id])
+
         logger.info(f"Updated task {task.identifier}: {list(changes.keys())}")
         return task
 
@@ -308,6 +489,7 @@ class TaskService:
         success = await self.repository.delete(task_id)
 
         if success:
+            await self.graph_cache.invalidate_on_commit(self.db, [task.project_id])
             logger.info(f"Deleted task {task.identifier} by user {user_id}")
 
         return success
@@ -370,6 +552,8 @@ class TaskService:
             new_value=new_status,
         )
 
+        await self.graph_cache.invalidate_on_commit(self.db, [task.project_id])
+
         logger.info(f"Task {task.identifier} status: {old_status} → {new_status}")
         return task
 
@@ -532,6 +716,8 @@ class TaskService:
             new_value=depends_on_task.identifier,
         )
 
+        await self.graph_cache.invalidate_on_commit(self.db, [task.project_id])
+
         logger.info(f"Added dependency: {task.identifier} depends on {depends_on_task.identifier}")
         return dependency
 
@@ -585,6 +771,7 @@ class TaskService:
                 ),
             )
 
+            await self.graph_cache.invalidate_on_commit(self.db, [task.project_id])
             logger.info(f"Removed dependency from task {task.identifier}")
 
         return success
@@ -597,7 +784,8 @@ class TaskService:
         """
         Check if adding dependency would create circular dependency.
 
-        Uses graph traversal to detect cycles.
+        A cycle forms exactly when depends_on_task already depends on task,
+        directly or indirectly; one recursive query answers that.
 
         Args:
             task_id: Task that would depend on another
@@ -610,29 +798,79 @@ class TaskService:
         if task_id == depends_on_task_id:
             return True
 
-        # BFS to check if depends_on_task already depends on task (directly or indirectly)
-        visited = set()
-        queue = [depends_on_task_id]
+        return await self.repository.depends_on_transitively(depends_on_task_id, task_id)
+
+    async def get_transitive_blockers(self, task_id: UUID, user_id: UUID) -> list[Any]:
+        """
+        Get every incomplete task this task waits on, directly or indirectly.
+
+        Args:
+            task_id: Task UUID
+            user_id: User requesting blockers
+
+        Returns:
+            Blocking tasks ordered by creation
+
+        Raises:
+            TaskNotFoundError: If task not found
+            InsufficientTaskPermissionsError: If user lacks access
+        """
+        await self.get_task(task_id, user_id)
+        return await self.repository.get_transitive_dependencies(task_id, incomplete_only=True)
+
+    async def get_dependency_graph(self, project_id: UUID, user_id: UUID) -> TaskGraph:
+        """
+        Get a project's task dependency graph, served from cache when warm.
+
+        Args:
+            project_id: Project UUID
+            user_id: User requesting the graph
+
+        Returns:
+            TaskGraph of all project tasks
+
+        Raises:
+            InsufficientTaskPermissionsError: If user lacks access
+        """
+        if not await self.project_service.check_permission(
+            project_id=project_id,
+            user_id=user_id,
+            required_role="viewer",
+        ):
+            raise InsufficientTaskPermissionsError("Must be a project member to view tasks")
 
-        while queue:
-            current_task_id = queue.pop(0)
+        graph = await self.graph_cache.get(project_id)
+        if graph is not None:
+            return graph
 
-            if current_task_id == task_id:
-                # Found cycle: depends_on_task → ... → task
-                return True
+        generation = await self.graph_cache.begin_fill(project_id)
+        tasks, edges = await self.repository.get_dependency_graph(project_id)
+        graph = TaskGraph.build(project_id, (GraphNode(**task) for task in tasks), edges)
+        await self.graph_cache.fill(graph, generation)
+        return graph
 
-            if current_task_id in visited:
-                continue
+    async def get_execution_plan(
+        self, project_id: UUID, user_id: UUID
+    ) -> tuple[TaskGraph, TaskPlan]:
+        """
+        Get a project's tasks in dependency order with levels and critical path.
 
-            visited.add(current_task_id)
+        Args:
+            project_id: Project UUID
+            user_id: User requesting the plan
 
-            # Get dependencies of current task
-            dependencies = await self.repository.get_dependencies(current_task_id)
-            for dep in dependencies:
-                if dep.id not in visited:
-                    queue.append(dep.id)
+        Returns:
+            Tuple of (dependency graph, plan computed from it)
 
-        return False
+        Raises:
+            InsufficientTaskPermissionsError: If user lacks access
+            CircularDependencyError: If stored dependencies contain a cycle
+        """
+        graph = await self.get_dependency_graph(project_id, user_id)
+        try:
+            return graph, graph.plan()
+        except ValueError as e:
+            raise CircularDependencyError(str(e)) from e
 
     # ============= Tag Management =============
 
@@ -6,11 +6,13 @@ This module provides reusable test fixtures for notification API testing includi
 - Notification preferences
 - Mock email service
 - WebSocket test utilities
+- In-memory NotificationRepository for service tests without a database
 """
 
 from datetime import datetime, timezone
-from typing import Dict, List
-from uuid import uuid4
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
@@ -377,3 +379,93 @@ async def websocket_client():
                 self.connected = False
 
     return WebSocketTestClient()
+
+
+# ============= Repository Stand-ins =============
+
+
+class InMemoryNotificationRepository:
+    """
+    Stand-in for NotificationRepository recording the queries it serves.
+
+    Attributes:
+        notifications: Stored notifications read by inbox and mark_read queries
+        calls: Names of inbox and insert queries run, in order
+        inserted: Rows passed to insert_many()
+        pending_email: (notification, preference) rows awaiting email, by user
+        emailed: Notification IDs passed to mark_emailed()
+        scans: Number of get_pending_email() queries
+        on_commit: Awaited after mark_read() commits, e.g. to run a concurrent poll
+    """
+
+    def __init__(
+        self,
+        notifications: Optional[List[Notification]] = None,
+        calls: Optional[List[str]] = None,
+        pending_email: Optional[List[Tuple[Any, NotificationPreference]]] = None,
+    ) -> None:
+        self.notifications = notifications or []
+        self.calls = calls if calls is not None else []
+        self.inserted: List[Dict[str, Any]] = []
+        self.pending_email = sorted(
+            pending_email or [], key=lambda row: (row[0].user_id, row[0].created_at)
+        )
+        self.emailed: List[UUID] = []
+        self.scans = 0
+        self.on_commit: Optional[Callable[[], Awaitable[None]]] = None
+
+    def _owned(self, user_id: UUID) -> List[Notification]:
+        owned = [n for n in self.notifications if n.user_id == user_id]
+        return sorted(owned, key=lambda n: n.created_at, reverse=True)
+
+    async def get_inbox(self, user_id: UUID, limit: int):
+        self.calls.append("get_inbox")
+        owned = self._owned(user_id)
+        return sum(not n.is_read for n in owned), owned[:limit]
+
+    async def get_by_user(self, user_id: UUID, skip: int = 0, limit: int = 50):
+        self.calls.append("get_by_user")
+        return self._owned(user_id)[skip : skip + limit]
+
+    async def get_by_id(self, notification_id: UUID):
+        return next((n for n in self.notifications if n.id == notification_id), None)
+
+    async def get_unread_by_user(self, user_id: UUID):
+        self.calls.append("get_unread_by_user")
+        return [n for n in self._owned(user_id) if not n.is_read]
+
+    async def mark_read(self, user_id: UUID, notification_ids: Optional[List[UUID]] = None):
+        now = datetime.now(timezone.utc)
+        changed = []
+        for notification in self._owned(user_id):
+            if not notification.is_read and (
+                notification_ids is None or notification.id in notification_ids
+            ):
+                notification.is_read, notification.read_at = True, now
+                changed.append(notification.id)
+        if self.on_commit is not None:
+            await self.on_commit()
+        return changed, now
+
+    async def insert_many(self, rows: List[Dict[str, Any]]):
+        self.calls.append("insert_many")
+        self.inserted.extend(rows)
+        now = datetime.now(timezone.utc)
+        return [SimpleNamespace(id=uuid4(), created_at=now, is_read=False, **row) for row in rows]
+
+    async def get_pending_email(
+        self, email_frequency: str, after_user: Optional[UUID] = None, limit: int = 5000
+    ):
+        self.scans += 1
+        pending = [
+            row
+            for row in self.pending_email
+            if row[1].email_frequency == email_frequency
+            and row[0].id not in self.emailed
+            and (after_user is None or row[0].user_id > after_user)
+        ]
+        return pending[:limit]
+
+    async def mark_emailed(self, notification_ids: List[UUID]) -> int:
+        self.emailed.extend(notification_ids)
+        return len(notification_ids)
@@ -0,0 +1,109 @@
+"""
+Test fixtures for rows created directly in the test database.
+
+Provides a persisted user and project (without going through the API) and
+a task factory, for repository tests that exercise SQL and triggers on the
+tasks table, and a helper rendering statements as PostgreSQL SQL.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import uuid4
+
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.models.project import Project
+from ardha.models.task import Task
+from ardha.models.user import User
+
+
+@pytest_asyncio.fixture
+async def db_user(test_db: AsyncSession) -> User:
+    """
+    Create a user row.
+
+    Args:
+        test_db: Test database session
+
+    Returns:
+        Committed User instance
+    """
+    user = User(
+        id=uuid4(),
+        email="rows@example.com",
+        username="rowsuser",
+        full_name="Rows User",
+        password_hash="hashed_password",
+    )
+    test_db.add(user)
+    await test_db.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def db_project(test_db: AsyncSession, db_user: User) -> Project:
+    """
+    Create a project row owned by db_user.
+
+    Args:
+        test_db: Test database session
+        db_user: Project owner
+
+    Returns:
+        Committed Project instance
+    """
+    project = Project(
+        id=uuid4(),
+        name="Rows Project",
+        slug="rows-project",
+        owner_id=db_user.id,
+        visibility="private",
+    )
+    test_db.add(project)
+    await test_db.commit()
+    return project
+
+
+def make_task(
+    project: Project,
+    number: int,
+    created_at: Optional[datetime] = None,
+    **fields: Any,
+) -> Task:
+    """
+    Build an unsaved task of a project, created by the project owner.
+
+    Args:
+        project: Owning project
+        number: Task number (used for identifier and title)
+        created_at: Creation time (server default when omitted)
+        **fields: Any other Task columns
+
+    Returns:
+        Task instance to add to a session
+    """
+    task = Task(
+        project_id=project.id,
+        identifier=f"ROW-{number:03d}",
+        title=f"Task {number}",
+        created_by_id=project.owner_id,
+        **fields,
+    )
+    if created_at is not None:
+        task.created_at = created_at
+    return task
+
+
+def compiled(statement: Any) -> str:
+    """
+    Render a statement as PostgreSQL SQL.
+
+    Args:
+        statement: SQLAlchemy statement, e.g. one passed to a mocked execute()
+
+    Returns:
+        SQL text with bind parameter placeholders
+    """
+    return str(statement.compile(dialect=postgresql.dialect()))
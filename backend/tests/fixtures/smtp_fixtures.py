@@ -0,0 +1,90 @@
+"""
+SMTP test fixtures for testing email delivery.
+
+This module provides a local SMTP sink: a minimal asyncio SMTP server that
+accepts every message, records connections and messages, and can drop its
+connections to simulate a server closing idle sessions.
+"""
+
+import asyncio
+import email
+from email.message import Message
+from typing import AsyncGenerator, List, Set
+
+import pytest
+
+
+class SMTPSink:
+    """Minimal in-process SMTP server that stores received messages."""
+
+    def __init__(self) -> None:
+        self.port = 0
+        self.connections = 0
+        self.logins = 0
+        self.messages: List[Message] = []
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.drop_connections()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def drop_connections(self) -> None:
+        """Close every open client connection without a reply."""
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        try:
+            await reply("220 sink ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode().strip().upper()
+
+                if command.startswith(("EHLO", "HELO")):
+                    await reply("250-sink\r\n250-AUTH PLAIN\r\n250 8BITMIME")
+                elif command.startswith("AUTH"):
+                    self.logins += 1
+                    await reply("235 Authentication successful")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = b""
+                    while (chunk := await reader.readline()) not in (b".\r\n", b""):
+                        data += chunk
+                    self.messages.append(email.message_from_bytes(data))
+                    await reply("250 Queued")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("250 OK")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+@pytest.fixture
+async def smtp_sink() -> AsyncGenerator[SMTPSink, None]:
+    """Running local SMTP sink."""
+    sink = SMTPSink()
+    await sink.start()
+    yield sink
+    await sink.stop()
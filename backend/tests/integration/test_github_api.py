@@ -5,12 +5,22 @@ Tests GitHub integration setup, pull request management, webhook processing,
 and task automation features.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ardha.services.github_client_pool import get_github_client_pool
+
+
+@pytest.fixture(autouse=True)
+def clear_github_client_pool():
+    """Drop pooled clients so each test's patched GitHubAPIClient is used."""
+    get_github_client_pool().clear()
+    yield
+    get_github_client_pool().clear()
+
 
 @pytest.mark.asyncio
 class TestGitHubIntegration:
@@ -126,9 +136,7 @@ class TestGitHubIntegration:
         github_integration,
     ):
         """Test deleting GitHub integration."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -158,9 +166,7 @@ class TestGitHubIntegration:
         mock_env_encryption_key,
     ):
         """Test setting up GitHub webhook."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -203,9 +209,7 @@ class TestPullRequests:
         mock_env_encryption_key,
     ):
         """Test creating pull request via API."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -293,18 +297,23 @@ class TestPullRequests:
         mock_github_api_responses,
     ):
         """Test syncing PRs from GitHub."""
+        pr = mock_github_api_responses["pull_request"]
+        raw_pr = {
+            **pr,
+            "url": pr["api_url"],
+            "head": {"ref": pr["head_branch"], "sha": pr["head_sha"]},
+            "base": {"ref": pr["base_branch"]},
+            "user": {"login": pr["author"]},
+        }
         with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
+            "ardha.services.github_integration_service.GitHubSyncClient"
         ) as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
-            mock_client.list_pull_requests.return_value = [
-                mock_github_api_responses["pull_request"]
-            ]
-            mock_client.get_pull_request.return_value = mock_github_api_responses["pull_request"]
-            mock_client.get_pr_commits.return_value = []
-            mock_client.close = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.list_pull_requests.return_value = [raw_pr]
+            mock_client.get_pull_request.return_value = raw_pr
+            mock_client.get_pull_request_commit_shas.return_value = []
 
             request_data = {"full_sync": False}
 
@@ -328,9 +337,7 @@ class TestPullRequests:
         mock_env_encryption_key,
     ):
         """Test merging pull request."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -364,9 +371,7 @@ class TestPullRequests:
         mock_env_encryption_key,
     ):
         """Test closing pull request without merging."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
@@ -568,9 +573,7 @@ class TestTaskAutomation:
         await test_db.refresh(pr)
 
         # Mock GitHub API
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
             mock_client.merge_pull_request.return_value = {
@@ -630,15 +633,13 @@ class TestGitHubStatistics:
         github_integration,
     ):
         """Test verifying GitHub connection status."""
-        with patch(
-            "ardha.services.github_integration_service.GitHubAPIClient"
-        ) as mock_client_class:
+        with patch("ardha.services.github_client_pool.GitHubAPIClient") as mock_client_class:
             # Setup mocks
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
             mock_client.verify_token.return_value = {"login": "testuser"}
             mock_client.check_repository_access.return_value = True
-            mock_client.close = AsyncMock()
+            mock_client.rate_limit_state = Mock(return_value=None)
 
             response = await client.get(
                 f"/api/v1/github/projects/{github_integration.project_id}/github/connection",
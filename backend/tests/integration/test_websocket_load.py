@@ -0,0 +1,165 @@
+"""
+Load test for idle WebSocket connections and REST pool availability.
+
+Holds 1,000 idle notification WebSockets open through the ASGI app while
+issuing REST requests that need a database session. The database pool is
+simulated with the production limits (pool_size=20, max_overflow=0) so the
+test runs without PostgreSQL: if sockets held sessions, REST requests
+would queue behind them and time out.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import AsyncGenerator, List
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from ardha.api.v1.routes import websocket
+from ardha.core import websocket_manager as ws_module
+from ardha.core.database import get_db
+from ardha.core.security import create_access_token
+
+IDLE_SOCKETS = 1000
+POOL_SIZE = 20
+POOL_TIMEOUT = 0.5
+REST_SAMPLES = 50
+
+
+class FakePool:
+    """Connection pool stand-in with a hard size limit and checkout timeout."""
+
+    def __init__(self, size: int, timeout: float) -> None:
+        self._slots = asyncio.Semaphore(size)
+        self.timeout = timeout
+        self.checked_out = 0
+
+    async def session(self) -> AsyncGenerator[object, None]:
+        """Dependency replacing get_db: holds a pool slot until the request ends."""
+        await asyncio.wait_for(self._slots.acquire(), timeout=self.timeout)
+        self.checked_out += 1
+        try:
+            yield object()
+        finally:
+            self.checked_out -= 1
+            self._slots.release()
+
+
+class IdleSocket:
+    """ASGI WebSocket client that connects and then stays silent."""
+
+    def __init__(self, app: FastAPI, token: str) -> None:
+        self.app = app
+        self.token = token
+        self.accepted = asyncio.Event()
+        self._release = asyncio.Event()
+        self._connected = False
+
+    async def receive(self) -> dict:
+        if not self._connected:
+            self._connected = True
+            return {"type": "websocket.connect"}
+        await self._release.wait()
+        return {"type": "websocket.disconnect", "code": 1000}
+
+    async def send(self, message: dict) -> None:
+        if message["type"] == "websocket.accept":
+            self.accepted.set()
+
+    async def run(self) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": "/api/v1/ws/notifications",
+            "raw_path": b"/api/v1/ws/notifications",
+            "query_string": f"token={self.token}".encode(),
+            "headers": [],
+            "client": ("127.0.0.1", 12345),
+            "server": ("test", 80),
+            "subprotocols": [],
+        }
+        await self.app(scope, self.receive, self.send)
+
+    def close(self) -> None:
+        self._release.set()
+
+
+@pytest.fixture
+def pool() -> FakePool:
+    """Simulated database pool with production limits."""
+    return FakePool(POOL_SIZE, POOL_TIMEOUT)
+
+
+@pytest_asyncio.fixture
+async def load_app(pool: FakePool, monkeypatch) -> AsyncGenerator[FastAPI, None]:
+    """App exposing the WebSocket router plus a REST route that needs a session."""
+    monkeypatch.setattr(ws_module.WebSocketManager, "_instance", None)
+    monkeypatch.setattr(ws_module, "_manager_instance", None)
+
+    app = FastAPI()
+    app.include_router(websocket.router, prefix="/api/v1")
+
+    @app.get("/api/v1/db-ping")
+    async def db_ping(db: object = Depends(get_db)) -> dict:
+        return {"ok": True}
+
+    app.dependency_overrides[get_db] = pool.session
+    yield app
+
+    manager = ws_module.get_websocket_manager()
+    for writer in list(manager.writers.values()):
+        await writer.close()
+
+
+async def measure_rest_latency(app: FastAPI) -> List[float]:
+    """Issue REST requests that each borrow a session; return latencies in seconds."""
+    latencies: List[float] = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(REST_SAMPLES):
+            started = time.perf_counter()
+            response = await client.get("/api/v1/db-ping")
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200
+    return latencies
+
+
+@pytest.mark.asyncio
+async def test_idle_websockets_do_not_hold_db_sessions(load_app: FastAPI, pool: FakePool):
+    """Test 1,000 idle sockets hold no sessions and REST latency stays flat."""
+    baseline = await measure_rest_latency(load_app)
+
+    sockets = [
+        IdleSocket(load_app, create_access_token({"sub": str(uuid4())}))
+        for _ in range(IDLE_SOCKETS)
+    ]
+    tasks = [asyncio.create_task(sock.run()) for sock in sockets]
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(sock.accepted.wait() for sock in sockets)), timeout=30
+        )
+
+        # Every socket is connected and idle, none is holding a pool slot
+        stats = await ws_module.get_websocket_manager().get_connection_stats()
+        assert stats["total_connections"] == IDLE_SOCKETS
+        assert pool.checked_out == 0
+
+        under_load = await measure_rest_latency(load_app)
+
+    finally:
+        for sock in sockets:
+            sock.close()
+        await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=30)
+
+    baseline_p50 = statistics.median(baseline)
+    loaded_p50 = statistics.median(under_load)
+
+    # Requests never waited for a pool slot (a starved pool would hit POOL_TIMEOUT)
+    assert max(under_load) < POOL_TIMEOUT
+    # Latency stays flat: median within a few milliseconds of the idle baseline
+    assert loaded_p50 < baseline_p50 + 0.01
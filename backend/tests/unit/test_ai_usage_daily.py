@@ -0,0 +1,292 @@
+"""
+Unit tests for the AI usage daily aggregate and spend totals.
+
+Checks against the test database that logging an operation upserts its
+daily row, that statistics and reports are served from the aggregate in
+one query, and that budget checks read Redis running totals seeded from
+the aggregate.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.core.ai_spend import PENDING_INCREMENTS, AISpendCounter
+from ardha.jobs.cost_jobs import generate_daily_cost_report
+from ardha.models.ai_usage_daily import AIUsageDaily
+from ardha.models.chat import Chat
+from ardha.repositories.ai_usage_repository import AIUsageRepository
+from ardha.services.chat_service import ChatBudgetExceededError, ChatService
+from tests.fixtures.project_fixtures import compiled
+
+
+def daily_row(**overrides) -> SimpleNamespace:
+    row = {
+        "usage_date": date(2026, 10, 17),
+        "user_id": uuid4(),
+        "project_id": None,
+        "model_name": "gpt-4",
+        "operation": "chat",
+        "operations": 1,
+        "tokens_input": 100,
+        "tokens_output": 50,
+        "cost": Decimal("0.010000"),
+        "username": "alice",
+        "email": "alice@example.com",
+        "project_name": None,
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestDailyAggregate:
+    """Test cases for AIUsageRepository reads and writes of ai_usage_daily."""
+
+    @pytest.mark.asyncio
+    async def test_create_upserts_daily_row(self, test_db, db_user, db_project):
+        """Test logged operations are summed into one row per key, personal ones included."""
+        repository = AIUsageRepository(test_db)
+        day = date(2026, 10, 17)
+        for project_id, model_name, cost in [
+            (db_project.id, "gpt-4", "0.25"),
+            (db_project.id, "gpt-4", "0.50"),
+            (None, "gpt-4", "0.10"),
+            (None, "gpt-4", "0.20"),
+            (db_project.id, "claude-3", "1.00"),
+        ]:
+            await repository.create(
+                user_id=db_user.id,
+                model_name=model_name,
+                operation="chat",
+                tokens_input=10,
+                tokens_output=5,
+                cost=Decimal(cost),
+                project_id=project_id,
+                usage_date=day,
+            )
+        await test_db.commit()
+
+        rows = (await test_db.scalars(select(AIUsageDaily).order_by(AIUsageDaily.cost))).all()
+        assert [(row.project_id, row.model_name, row.operations, row.cost) for row in rows] == [
+            (None, "gpt-4", 2, Decimal("0.30")),
+            (db_project.id, "gpt-4", 2, Decimal("0.75")),
+            (db_project.id, "claude-3", 1, Decimal("1.00")),
+        ]
+        assert rows[1].tokens_input == 20
+        assert await repository.get_daily_cost(day, user_id=db_user.id) == Decimal("2.05")
+        assert await repository.get_daily_cost(day, project_id=db_project.id) == Decimal("1.75")
+
+    @pytest.mark.asyncio
+    async def test_usage_stats_from_one_query(self):
+        """Test totals, operation counts and model usage come from one grouped query."""
+        db = Mock()
+        db.execute = AsyncMock(
+            return_value=[
+                SimpleNamespace(
+                    operation="chat",
+                    model_name="gpt-4",
+                    count=3,
+                    tokens_input=300,
+                    tokens_output=150,
+                    cost=Decimal("0.30"),
+                ),
+                SimpleNamespace(
+                    operation="workflow",
+                    model_name="gpt-4",
+                    count=1,
+                    tokens_input=50,
+                    tokens_output=25,
+                    cost=Decimal("0.05"),
+                ),
+            ]
+        )
+
+        stats = await AIUsageRepository(db).get_user_usage_stats(
+            uuid4(), date(2026, 10, 1), date(2026, 10, 18)
+        )
+
+        assert db.execute.await_count == 1
+        assert "FROM ai_usage_daily" in compiled(db.execute.call_args.args[0])
+        assert stats["total_cost"] == Decimal("0.35")
+        assert stats["total_tokens_input"] == 350
+        assert stats["operation_counts"] == {"chat": 3, "workflow": 1}
+        assert stats["model_usage"] == {"gpt-4": {"count": 4, "cost": Decimal("0.35")}}
+
+
+class TestSpendCounter:
+    """Test cases for AISpendCounter running totals."""
+
+    @pytest.mark.asyncio
+    async def test_add_only_increments_seeded_totals(self, redis_client):
+        """Test increments skip unseeded keys so totals are never partial."""
+        counter = AISpendCounter(redis_client)
+        user_id, project_id, day = uuid4(), uuid4(), date(2026, 10, 18)
+
+        await counter.add(user_id, project_id, day, Decimal("0.25"))
+        assert await counter.get("user", user_id, day) is None
+
+        generation = await counter.begin_seed("user", user_id, day)
+        assert await counter.seed("user", user_id, day, Decimal("1.25"), generation)
+        await counter.add(user_id, project_id, day, Decimal("0.25"))
+
+        assert await counter.get("user", user_id, day) == Decimal("1.50")
+        assert await counter.get("project", project_id, day) is None
+
+    @pytest.mark.asyncio
+    async def test_seed_racing_an_increment_is_dropped(self, redis_client):
+        """Test a total loaded before an increment is not stored without it."""
+        counter = AISpendCounter(redis_client)
+        user_id, day = uuid4(), date(2026, 10, 18)
+
+        generation = await counter.begin_seed("user", user_id, day)
+        # The operation commits and is counted after the seed's database read
+        await counter.add(user_id, None, day, Decimal("0.25"))
+
+        assert not await counter.seed("user", user_id, day, Decimal("1.00"), generation)
+        assert await counter.get("user", user_id, day) is None
+
+    @pytest.mark.asyncio
+    async def test_add_on_commit_waits_for_commit(self, redis_client):
+        """Test increments apply after commit and are discarded on rollback."""
+        counter = AISpendCounter(redis_client)
+        user_id, day = uuid4(), date(2026, 10, 18)
+        assert await counter.seed("user", user_id, day, Decimal("1.00"), "0")
+        db = AsyncSession()
+
+        await db.begin()
+        counter.add_on_commit(db, user_id, None, day, Decimal("0.25"))
+        await db.rollback()
+        await db.begin()
+        counter.add_on_commit(db, user_id, None, day, Decimal("0.50"))
+        assert await counter.get("user", user_id, day) == Decimal("1.00")
+
+        await db.commit()
+        await asyncio.sleep(0)
+
+        assert await counter.get("user", user_id, day) == Decimal("1.50")
+        assert db.sync_session.info.get(PENDING_INCREMENTS) is None
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_seeds_once(self, redis_client):
+        """Test a miss loads from the database and later reads hit Redis."""
+        counter = AISpendCounter(redis_client)
+        loader = AsyncMock(return_value=Decimal("0.75"))
+        user_id, day = uuid4(), date(2026, 10, 18)
+
+        assert await counter.get_or_load("user", user_id, day, loader) == Decimal("0.75")
+        assert await counter.get_or_load("user", user_id, day, loader) == Decimal("0.75")
+        loader.assert_awaited_once()
+        assert 0 < await redis_client.ttl(counter._key("user", user_id, day)) <= 3600
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_loader(self):
+        """Test Redis errors are treated as misses."""
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        counter = AISpendCounter(redis)
+
+        total = await counter.get_or_load(
+            "user", uuid4(), date(2026, 10, 18), AsyncMock(return_value=Decimal("1.5"))
+        )
+
+        assert total == Decimal("1.5")
+
+
+class TestBudgetCheck:
+    """Test cases for ChatService budget checks against spend totals."""
+
+    @pytest.fixture
+    def service(self, redis_client):
+        service = ChatService(Mock())
+        service.spend_counter = AISpendCounter(redis_client)
+        service.ai_usage_repo.get_daily_cost = AsyncMock(return_value=Decimal("0.50"))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_budget_read_from_running_total(self, service):
+        """Test the aggregate is read once, then the Redis total is used."""
+        chat = Chat(id=uuid4(), user_id=uuid4(), project_id=None)
+
+        await service._check_chat_budget(chat)
+        await service.spend_counter.add(chat.user_id, None, date.today(), Decimal("1.60"))
+
+        with pytest.raises(ChatBudgetExceededError, match="Daily AI budget"):
+            await service._check_chat_budget(chat)
+        service.ai_usage_repo.get_daily_cost.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_project_budget(self, service):
+        """Test a project budget blocks chats once the project's total reaches it."""
+        chat = Chat(id=uuid4(), user_id=uuid4(), project_id=uuid4())
+
+        with patch("ardha.services.chat_service.settings") as settings:
+            settings.ai.daily_budget_user = 2.0
+            settings.ai.daily_budget_project = 0.5
+
+            with pytest.raises(ChatBudgetExceededError, match="for project"):
+                await service._check_chat_budget(chat)
+
+        service.ai_usage_repo.get_daily_cost.assert_awaited_with(
+            date.today(), project_id=chat.project_id
+        )
+
+
+class TestDailyCostReport:
+    """Test cases for the daily cost report built from the aggregate."""
+
+    @pytest.mark.asyncio
+    async def test_report_from_one_query(self):
+        """Test every breakdown is built from one read of yesterday's rows."""
+        alice, bob, project_id = uuid4(), uuid4(), uuid4()
+        rows = [
+            daily_row(user_id=alice, operations=2, cost=Decimal("0.20")),
+            daily_row(
+                user_id=alice,
+                project_id=project_id,
+                project_name="Ardha",
+                operation="workflow",
+                model_name="claude-3",
+                cost=Decimal("0.50"),
+            ),
+            daily_row(user_id=bob, username="bob", email="bob@example.com", cost=Decimal("0.90")),
+        ]
+        repository = Mock()
+        repository.get_daily_rows = AsyncMock(return_value=rows)
+
+        @asynccontextmanager
+        async def session_factory():
+            yield Mock()
+
+        with (
+            patch("ardha.jobs.cost_jobs.async_session_factory", session_factory),
+            patch("ardha.jobs.cost_jobs.AIUsageRepository", return_value=repository),
+        ):
+            result = await generate_daily_cost_report()
+
+        yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).date()
+        repository.get_daily_rows.assert_awaited_once_with(yesterday, yesterday, with_names=True)
+
+        report = result["report"]
+        assert report["summary"]["total_cost"] == 1.6
+        assert report["summary"]["total_operations"] == 4
+        assert report["summary"]["total_tokens"] == 450
+        operations = {op["operation"]: op["count"] for op in report["operation_breakdown"]}
+        assert operations == {"chat": 3, "workflow": 1}
+        assert [user["username"] for user in report["user_breakdown"]] == ["bob", "alice"]
+        assert report["user_breakdown"][1]["operations"] == 3
+        assert report["project_breakdown"] == [
+            {
+                "project_id": str(project_id),
+                "project_name": "Ardha",
+                "operations": 1,
+                "cost": 0.5,
+            }
+        ]
@@ -0,0 +1,341 @@
+"""
+Unit tests for precomputed analytics rollups.
+
+Checks period bucketing, that task changes (including reopening and
+deleting) mark the days to rebuild and that rebuilt rollups follow them,
+against the test database; that the rollup job only revisits those days
+and AI usage since its watermark; and that chart series are served from
+rollups with gaps zero-filled.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from ardha.jobs.analytics_jobs import ROLLUP_WATERMARK, build_analytics_rollups
+from ardha.models.ai_usage_daily import AIUsageDaily
+from ardha.models.analytics_rollup import AnalyticsRollup
+from ardha.models.task import Task
+from ardha.repositories.analytics_repository import AnalyticsRepository, period_start
+from ardha.services.analytics_service import AnalyticsService, InsufficientAnalyticsPermissionsError
+from tests.fixtures.project_fixtures import make_task
+
+
+class TestRollupRepository:
+    """Test cases for AnalyticsRepository rollup building."""
+
+    def test_week_starts_on_monday(self):
+        """Test days map to their period start."""
+        sunday = date(2026, 10, 18)
+
+        assert period_start(sunday, "day") == sunday
+        assert period_start(sunday, "week") == date(2026, 10, 12)
+        assert period_start(date(2026, 10, 12), "week") == date(2026, 10, 12)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_without_changes_is_free(self):
+        """Test nothing is written when no period changed."""
+        db = Mock()
+        db.execute = AsyncMock()
+
+        assert await AnalyticsRepository(db).rebuild("day", []) == 0
+        db.execute.assert_not_awaited()
+
+
+def noon(days_ago: int) -> datetime:
+    """Midday UTC, some days ago (so the UTC day is unambiguous)."""
+    today = datetime.now(UTC).replace(hour=12, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days_ago)
+
+
+@pytest.mark.asyncio
+class TestRollupsAgainstDatabase:
+    """Test cases for the dirty-day triggers and rebuild SQL, run against the database."""
+
+    @pytest.fixture
+    def run_job(self, test_db):
+        """Run build_analytics_rollups on the test session."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield test_db
+
+        async def run():
+            with patch("ardha.jobs.analytics_jobs.async_session_factory", session_factory):
+                return await build_analytics_rollups()
+
+        return run
+
+    async def test_task_changes_mark_days(self, test_db, db_project):
+        """Test inserts, rollup-column updates, reopening and deletes mark their days."""
+        repository = AnalyticsRepository(test_db)
+        created, completed = noon(5), noon(3)
+
+        async def claim():
+            days = await repository.claim_dirty_days()
+            await test_db.commit()
+            return days
+
+        task = make_task(db_project, 1, created_at=created)
+        test_db.add(task)
+        await test_db.commit()
+        assert await claim() == {created.date()}
+
+        task.status, task.started_at, task.completed_at = "done", created, completed
+        await test_db.commit()
+        assert await claim() == {created.date(), completed.date()}
+
+        task.title = "Renamed"
+        await test_db.commit()
+        assert await claim() == set()
+
+        # Reopening clears completed_at; the day it was completed on is still marked
+        task.status, task.completed_at = "in_progress", None
+        await test_db.commit()
+        assert await claim() == {created.date(), completed.date()}
+
+        task.status, task.completed_at = "done", completed
+        await test_db.commit()
+        await claim()
+        await test_db.execute(delete(Task).where(Task.id == task.id))
+        await test_db.commit()
+        assert await claim() == {created.date(), completed.date()}
+
+        await repository.mark_dirty_days([completed.date()])
+        await repository.mark_dirty_days([completed.date()])
+        await test_db.commit()
+        assert await claim() == {completed.date()}
+
+    async def test_rebuild_follows_reopened_and_deleted_tasks(
+        self, test_db, db_user, db_project, run_job
+    ):
+        """Test rollups count, percentiles and AI cost, then drop reopened and deleted tasks."""
+        repository = AnalyticsRepository(test_db)
+        day_a, day_b = noon(6), noon(4)
+        first = make_task(
+            db_project,
+            1,
+            created_at=day_a,
+            assignee_id=db_user.id,
+            status="done",
+            started_at=day_b - timedelta(hours=48),
+            completed_at=day_b,
+        )
+        second = make_task(
+            db_project,
+            2,
+            created_at=day_a,
+            assignee_id=db_user.id,
+            status="done",
+            started_at=day_b - timedelta(hours=12),
+            completed_at=day_b,
+        )
+        test_db.add_all([first, second, make_task(db_project, 3, created_at=day_b)])
+        test_db.add(
+            AIUsageDaily(
+                usage_date=day_b.date(),
+                user_id=db_user.id,
+                project_id=db_project.id,
+                model_name="gpt-4",
+                operation="chat",
+                operations=2,
+                tokens_input=100,
+                tokens_output=50,
+                cost=Decimal("0.5"),
+            )
+        )
+        await test_db.commit()
+        user_id, project_id, second_id = db_user.id, db_project.id, second.id
+
+        async def rollups(scope, scope_id, period="day"):
+            test_db.expire_all()
+            start = period_start(day_a.date(), period)
+            rows = await repository.get_series(scope, scope_id, period, start, day_b.date())
+            return {row.period_start: row for row in rows}
+
+        await run_job()
+
+        project = await rollups("project", project_id)
+        assert project[day_a.date()].tasks_created == 2
+        rollup = project[day_b.date()]
+        assert (rollup.tasks_created, rollup.tasks_completed) == (1, 2)
+        assert rollup.cycle_time_p50_hours == pytest.approx(30.0)
+        assert rollup.cycle_time_p90_hours == pytest.approx(44.4)
+        assert (rollup.ai_operations, rollup.ai_tokens, rollup.ai_cost) == (2, 150, Decimal("0.5"))
+        user = await rollups("user", user_id)
+        assert (user[day_b.date()].tasks_completed, user[day_b.date()].ai_cost) == (
+            2,
+            Decimal("0.5"),
+        )
+
+        first.status, first.completed_at = "in_progress", None
+        await test_db.execute(delete(Task).where(Task.id == second_id))
+        await test_db.commit()
+        result = await run_job()
+
+        assert result["changed_days"] >= 2
+        project = await rollups("project", project_id)
+        assert project[day_a.date()].tasks_created == 1
+        rollup = project[day_b.date()]
+        assert (rollup.tasks_created, rollup.tasks_completed) == (1, 0)
+        assert rollup.cycle_time_p50_hours is None
+        assert rollup.ai_cost == Decimal("0.5")
+        weeks = (await rollups("project", project_id, "week")).values()
+        assert sum(week.tasks_created for week in weeks) == 2
+        assert sum(week.tasks_completed for week in weeks) == 0
+        assert (await repository.claim_dirty_days()) == set()
+
+
+class TestRollupJob:
+    """Test cases for the build_analytics_rollups job."""
+
+    @pytest.fixture
+    def job(self):
+        session = Mock()
+        session.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        repository = Mock()
+        repository.claim_dirty_days = AsyncMock(return_value={date(2026, 10, 13)})
+        repository.find_changed_days = AsyncMock(
+            return_value={date(2026, 10, 14), date(2026, 10, 20)}
+        )
+        repository.rebuild = AsyncMock(return_value=3)
+        repository.set_watermark = AsyncMock()
+        repository.mark_dirty_days = AsyncMock()
+        session.rollback = AsyncMock()
+
+        with (
+            patch("ardha.jobs.analytics_jobs.async_session_factory", session_factory),
+            patch("ardha.jobs.analytics_jobs.AnalyticsRepository", return_value=repository),
+        ):
+            yield repository, session
+
+    @pytest.mark.asyncio
+    async def test_incremental_from_watermark(self, job):
+        """Test only periods containing changed days are rebuilt."""
+        repository, session = job
+        watermark = datetime.now(UTC) - timedelta(hours=1)
+        repository.get_watermark = AsyncMock(return_value=watermark)
+
+        result = await build_analytics_rollups()
+
+        since = repository.find_changed_days.call_args.args[0]
+        assert since == watermark - timedelta(minutes=10)
+        rebuilt = {call.args[0]: call.args[1] for call in repository.rebuild.call_args_list}
+        assert rebuilt["day"] == {date(2026, 10, 13), date(2026, 10, 14), date(2026, 10, 20)}
+        assert rebuilt["week"] == {date(2026, 10, 12), date(2026, 10, 19)}
+        assert repository.set_watermark.call_args.args[0] == ROLLUP_WATERMARK
+        assert repository.set_watermark.call_args.args[1] > watermark
+        # The claim is committed before the rebuild, then the rebuild itself
+        assert session.commit.await_count == 2
+        repository.mark_dirty_days.assert_not_awaited()
+        assert result["statistics"]["week"] == {"periods": 2, "rows": 3}
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_re_marks_claimed_days(self, job):
+        """Test days claimed by a run whose rebuild fails are rebuilt by the next run."""
+        repository, session = job
+        repository.get_watermark = AsyncMock(return_value=datetime.now(UTC))
+        repository.rebuild = AsyncMock(side_effect=RuntimeError("deadlock"))
+
+        with pytest.raises(RuntimeError):
+            await build_analytics_rollups()
+
+        session.rollback.assert_awaited_once()
+        repository.mark_dirty_days.assert_awaited_once_with({date(2026, 10, 13)})
+        repository.set_watermark.assert_not_awaited()
+        assert session.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_first_run_backfills(self, job):
+        """Test the first run scans the configured backfill window."""
+        repository, _ = job
+        repository.get_watermark = AsyncMock(return_value=None)
+
+        await build_analytics_rollups()
+
+        since = repository.find_changed_days.call_args.args[0]
+        assert datetime.now(UTC) - since >= timedelta(days=90)
+        rebuilt = {call.args[0]: call.args[1] for call in repository.rebuild.call_args_list}
+        window = {since.date() + timedelta(days=offset) for offset in range(91)}
+        assert window <= rebuilt["day"]
+
+
+class TestAnalyticsService:
+    """Test cases for chart series served from rollups."""
+
+    @pytest.fixture
+    def service(self):
+        service = AnalyticsService(Mock())
+        service.project_service = Mock()
+        service.project_service.check_permission = AsyncMock(return_value=True)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_series_zero_fills_gaps(self, service):
+        """Test every week in range gets a point and throughput is per day."""
+        project_id = uuid4()
+        service.repository.get_series = AsyncMock(
+            return_value=[
+                AnalyticsRollup(
+                    period="week",
+                    period_start=date(2026, 10, 5),
+                    scope="project",
+                    scope_id=project_id,
+                    tasks_created=9,
+                    tasks_completed=14,
+                    cycle_time_p50_hours=20.0,
+                    cycle_time_p90_hours=71.5,
+                    ai_operations=30,
+                    ai_tokens=12000,
+                    ai_cost=Decimal("1.250000"),
+                )
+            ]
+        )
+
+        series = await service.get_project_series(
+            project_id, uuid4(), "week", date(2026, 9, 30), date(2026, 10, 18)
+        )
+
+        assert [point.period_start for point in series.points] == [
+            date(2026, 9, 28),
+            date(2026, 10, 5),
+            date(2026, 10, 12),
+        ]
+        assert series.points[0].tasks_completed == 0
+        assert series.points[1].throughput_per_day == 2.0
+        assert series.points[1].cycle_time_p90_hours == 71.5
+        assert series.total_tasks_completed == 14
+        assert series.total_ai_cost == 1.25
+        service.repository.get_series.assert_awaited_once_with(
+            "project", project_id, "week", date(2026, 9, 28), date(2026, 10, 12)
+        )
+
+    @pytest.mark.asyncio
+    async def test_project_series_requires_membership(self, service):
+        """Test non-members cannot read project analytics."""
+        service.project_service.check_permission = AsyncMock(return_value=False)
+
+        with pytest.raises(InsufficientAnalyticsPermissionsError):
+            await service.get_project_series(uuid4(), uuid4())
+
+    @pytest.mark.asyncio
+    async def test_invalid_range_rejected(self, service):
+        """Test reversed and oversized ranges are rejected before querying."""
+        service.repository.get_series = AsyncMock()
+
+        with pytest.raises(ValueError):
+            await service.get_user_series(uuid4(), "day", date(2026, 10, 18), date(2026, 10, 1))
+        with pytest.raises(ValueError):
+            await service.get_user_series(uuid4(), "day", date(2024, 1, 1), date(2026, 10, 1))
+
+        service.repository.get_series.assert_not_awaited()
@@ -0,0 +1,240 @@
+"""
+Unit tests for the async git execution layer.
+
+Tests reader/writer locking, the immutable result cache, and that the
+facade serves repeated reads at a commit without running git while
+keeping the event loop free during slow operations.
+"""
+
+import asyncio
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ardha.services.async_git_service import AsyncGitService, GitResultCache, RepoLock
+from ardha.services.git_service import GitService
+from tests.fixtures.git_fixtures import temp_dir, temp_git_repo  # noqa: F401
+
+
+@pytest.fixture
+def async_git(temp_git_repo):  # noqa: F811
+    """Facade over a temp repo with its own executor and cache."""
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield AsyncGitService(temp_git_repo, executor=executor, cache=GitResultCache())
+    executor.shutdown(wait=True)
+
+
+def commit_file(repo_path, name: str, content: str) -> None:
+    """Write and commit a file in the test repository."""
+    (repo_path / name).write_text(content)
+    subprocess.run(["git", "add", name], cwd=repo_path, check=True)
+    subprocess.run(["git", "commit", "-qm", f"Update {name}"], cwd=repo_path, check=True)
+
+
+class TestRepoLock:
+    """Test cases for RepoLock."""
+
+    @pytest.mark.asyncio
+    async def test_readers_share_writers_exclude(self):
+        """Test readers overlap while a writer waits for all of them."""
+        lock = RepoLock()
+        events = []
+
+        async def reader(name: str):
+            async with lock.read():
+                events.append(f"{name} in")
+                await asyncio.sleep(0.02)
+                events.append(f"{name} out")
+
+        async def writer():
+            async with lock.write():
+                events.append("writer in")
+                await asyncio.sleep(0.01)
+                events.append("writer out")
+
+        await asyncio.gather(reader("a"), reader("b"), writer())
+
+        assert events[:2] == ["a in", "b in"]
+        assert events.index("writer in") > max(events.index("a out"), events.index("b out"))
+
+    @pytest.mark.asyncio
+    async def test_queued_writer_blocks_later_readers(self):
+        """Test a waiting writer is served before readers that arrive after it."""
+        lock = RepoLock()
+        order = []
+
+        async def hold_read():
+            async with lock.read():
+                await asyncio.sleep(0.02)
+                order.append("first reader")
+
+        async def write():
+            async with lock.write():
+                order.append("writer")
+
+        async def late_read():
+            await asyncio.sleep(0.005)
+            async with lock.read():
+                order.append("late reader")
+
+        await asyncio.gather(hold_read(), write(), late_read())
+
+        assert order == ["first reader", "writer", "late reader"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_queue(self):
+        """Test cancelling a queued writer lets later readers proceed."""
+        lock = RepoLock()
+
+        async with lock.read():
+            waiting = asyncio.create_task(lock.write().__aenter__())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+
+        async with lock.read():
+            pass
+
+        assert lock._readers == 0
+        assert lock._writer is False
+
+
+class TestGitResultCache:
+    """Test cases for GitResultCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test entry and byte limits evict the oldest unused entries."""
+        cache = GitResultCache(max_entries=2, max_bytes=10)
+        cache.put("a", "1234")
+        cache.put("b", "1234")
+        cache.get("a")
+        cache.put("c", "1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1234"
+        assert len(cache) == 2
+
+        cache.put("d", "123456789")
+        assert len(cache) == 1
+        assert cache.size_bytes == 9
+
+    def test_values_are_copied(self):
+        """Test mutating a returned value does not change the cache."""
+        cache = GitResultCache()
+        cache.put("commit", {"files": ["a.py"]})
+
+        cache.get("commit")["files"].append("b.py")
+
+        assert cache.get("commit") == {"files": ["a.py"]}
+
+
+class TestAsyncGitService:
+    """Test cases for AsyncGitService."""
+
+    @pytest.mark.asyncio
+    async def test_read_file_at_sha_is_cached(self, async_git, temp_git_repo, monkeypatch):
+        """Test repeated reads at the same commit never run git again."""
+        sha = await async_git.resolve_commit()
+        calls = []
+        original = GitService.read_file
+
+        def counting_read(self, file_path, ref="HEAD"):
+            calls.append(ref)
+            return original(self, file_path, ref)
+
+        monkeypatch.setattr(GitService, "read_file", counting_read)
+
+        contents = [await async_git.read_file("README.md", sha) for _ in range(5)]
+
+        assert len(set(contents)) == 1
+        assert calls == [sha]
+        assert async_git.cache.hits == 4
+
+    @pytest.mark.asyncio
+    async def test_moving_ref_resolves_each_time(self, async_git, temp_git_repo):  # noqa: F811
+        """Test reads at HEAD follow new commits instead of serving stale content."""
+        first = await async_git.read_file("README.md")
+        commit_file(temp_git_repo, "README.md", "# Updated\n")
+
+        second = await async_git.read_file("README.md")
+
+        assert first != second
+        assert second == "# Updated"
+
+    @pytest.mark.asyncio
+    async def test_diff_and_commit_details_cached(self, async_git, temp_git_repo):  # noqa: F811
+        """Test diffs between commits and commit details are served from cache."""
+        commit_file(temp_git_repo, "notes.txt", "hello\n")
+        head = await async_git.resolve_commit()
+
+        diff = await async_git.get_diff(f"{head}^", head)
+        details = await async_git.get_commit_details(head)
+        assert "notes.txt" in diff
+        assert details["sha"] == head
+
+        misses = async_git.cache.misses
+        assert await async_git.get_diff(f"{head}^", "HEAD") == diff
+        assert (await async_git.get_commit_details("HEAD"))["sha"] == head
+        assert async_git.cache.misses == misses
+
+    @pytest.mark.asyncio
+    async def test_writes_do_not_block_event_loop(self, async_git):
+        """Test a slow git operation runs off the loop while other work continues."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        await async_git.write(lambda git: time.sleep(0.1))
+        ticking.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently(self, async_git):
+        """Test reads on one repository execute in parallel threads."""
+        started = time.monotonic()
+
+        await asyncio.gather(*(async_git.read(lambda git: time.sleep(0.1)) for _ in range(4)))
+
+        assert time.monotonic() - started < 0.3
+
+    @pytest.mark.asyncio
+    async def test_writes_are_serialized(self, async_git):
+        """Test writes on one repository never overlap."""
+        active = []
+        overlaps = []
+
+        def slow_write(git):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+
+        await asyncio.gather(*(async_git.write(slow_write) for _ in range(4)))
+
+        assert max(overlaps) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_blob_in_chunks(self, async_git, temp_git_repo):  # noqa: F811
+        """Test blob streaming yields bounded chunks and stops cleanly when abandoned."""
+        (temp_git_repo / "large.bin").write_bytes(b"x" * 300_000)
+        commit_file(temp_git_repo, "small.txt", "small\n")
+        subprocess.run(["git", "add", "large.bin"], cwd=temp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "Add large"], cwd=temp_git_repo, check=True)
+        info = await async_git.blob_info("large.bin")
+
+        sizes = [len(chunk) async for chunk in async_git.stream_blob(info["sha"])]
+        assert sum(sizes) == 300_000
+        assert max(sizes) <= 64 * 1024
+
+        async for _ in async_git.stream_blob(info["sha"]):
+            break
+        assert await async_git.read_file("small.txt") == "small"
@@ -13,6 +13,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
+from ardha.core.ai_spend import AISpendCounter
 from ardha.models.ai_usage import AIOperation, AIUsage
 from ardha.models.chat import Chat, ChatMode
 from ardha.models.message import Message, MessageRole
@@ -291,9 +292,10 @@ class TestChatService:
         chat = await service.create_chat(user_id=user_id, mode=ChatMode.CHAT.value)
 
         # Mock AI usage to return high usage (90% of budget)
-        mock_usage = MagicMock()
-        mock_usage.cost = Decimal("1.80")  # 90% of $2.00 budget
-        service.ai_usage_repo.get_daily_usage = AsyncMock(return_value=[mock_usage])
+        service.spend_counter = AISpendCounter(MagicMock(), enabled=False)
+        service.ai_usage_repo.get_daily_cost = AsyncMock(
+            return_value=Decimal("1.80")
+        )  # 90% of $2.00 budget
 
         # Mock OpenRouter to avoid actual API calls
         with patch("ardha.services.chat_service.OpenRouterClient") as mock_openrouter:
@@ -320,9 +322,10 @@ class TestChatService:
         chat = await service.create_chat(user_id=user_id, mode=ChatMode.CHAT.value)
 
         # Mock AI usage to return exceeded usage
-        mock_usage = MagicMock()
-        mock_usage.cost = Decimal("2.50")  # Exceeds $2.00 budget
-        service.ai_usage_repo.get_daily_usage = AsyncMock(return_value=[mock_usage])
+        service.spend_counter = AISpendCounter(MagicMock(), enabled=False)
+        service.ai_usage_repo.get_daily_cost = AsyncMock(
+            return_value=Decimal("2.50")
+        )  # Exceeds $2.00 budget
 
         # Act & Assert
         with pytest.raises(ChatBudgetExceededError, match="Daily AI budget"):
@@ -0,0 +1,235 @@
+"""
+Unit tests for the incremental code index.
+
+Indexes a real temporary git repository into an in-memory Qdrant
+collection with a deterministic stand-in for the embedding service,
+checking language-aware chunking, skipping of already indexed (or
+unindexable) blobs and removal of stale chunks.
+"""
+
+import hashlib
+import subprocess
+from typing import List
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from ardha.core.qdrant import QdrantService
+from ardha.services.async_git_service import AsyncGitService
+from ardha.services.code_index_service import CODE_COLLECTION, CodeIndexService, chunk_source
+from tests.fixtures.git_fixtures import temp_dir, temp_git_repo  # noqa: F401
+
+VECTOR_SIZE = 16
+
+PYTHON_SOURCE = """import os
+
+
+@decorator
+def first():
+    return 1
+
+
+class Second:
+    def method(self):
+        return 2
+"""
+
+
+class HashEmbeddingService:
+    """Stand-in for LocalEmbeddingService with deterministic vectors."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    @staticmethod
+    def _vector(text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [byte / 255 for byte in digest[:VECTOR_SIZE]]
+
+    async def generate_batch_embeddings(self, texts, batch_size=None) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    async def generate_embedding(self, text: str) -> List[float]:
+        return self._vector(text)
+
+
+def git(repo_path, *args: str) -> None:
+    """Run a git command in the test repository."""
+    subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+
+
+def head(repo_path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo_path, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+async def index():
+    """CodeIndexService over an in-memory Qdrant collection."""
+    qdrant = QdrantService.__new__(QdrantService)
+    qdrant.client = AsyncQdrantClient(location=":memory:")
+    qdrant.collection_prefix = "test"
+    qdrant.embedding_dim = VECTOR_SIZE
+    service = CodeIndexService(
+        qdrant=qdrant,
+        embeddings=HashEmbeddingService(),
+        chunk_max_chars=200,
+        embed_batch_size=4,
+        read_batch_size=3,
+    )
+    yield service
+    await qdrant.close()
+
+
+async def stored_paths(service: CodeIndexService) -> dict:
+    """Map of indexed path to its blob SHAs."""
+    points = await service.qdrant.get_all_points(CODE_COLLECTION, limit=10000)
+    paths: dict = {}
+    for point in points:
+        metadata = point["payload"]["metadata"]
+        paths.setdefault(metadata["path"], set()).add(metadata["blob_sha"])
+    return paths
+
+
+class TestChunkSource:
+    """Test cases for chunk_source."""
+
+    def test_python_splits_at_definitions(self):
+        """Test decorators stay with their def and sections pack up to the limit."""
+        chunks = chunk_source(PYTHON_SOURCE, "python", max_chars=40)
+
+        assert [chunk.text.splitlines()[0] for chunk in chunks] == [
+            "import os",
+            "@decorator",
+            "class Second:",
+            "        return 2",
+        ]
+        assert (chunks[1].start_line, chunks[1].end_line) == (4, 8)
+        assert "".join(chunk.text for chunk in chunks) == PYTHON_SOURCE
+
+        assert len(chunk_source(PYTHON_SOURCE, "python", max_chars=1000)) == 1
+
+    def test_oversized_section_split_by_lines(self):
+        """Test a section longer than the limit becomes several line windows."""
+        source = "def big():\n" + "    x = 1\n" * 30
+
+        chunks = chunk_source(source, "python", max_chars=100)
+
+        assert all(len(chunk.text) <= 100 for chunk in chunks)
+        assert "".join(chunk.text for chunk in chunks) == source
+        assert chunks[-1].end_line == 31
+
+    def test_unknown_language_splits_on_blank_lines(self):
+        """Test languages without boundaries split into paragraphs."""
+        chunks = chunk_source("a: 1\nb: 2\n\nc: 3\n", None, max_chars=12)
+
+        assert [chunk.text for chunk in chunks] == ["a: 1\nb: 2\n\n", "c: 3\n"]
+
+
+class TestCodeIndexService:
+    """Test cases for CodeIndexService."""
+
+    @pytest.mark.asyncio
+    async def test_full_sync_then_unchanged_blobs_skipped(self, index, temp_git_repo):  # noqa: F811
+        """Test a second pass over the same tree embeds nothing."""
+        (temp_git_repo / "app.py").write_text(PYTHON_SOURCE * 4)
+        (temp_git_repo / "logo.png").write_bytes(b"\x89PNG\x00")
+        for number in range(5):
+            (temp_git_repo / f"mod_{number}.go").write_text(f"func F{number}() {{}}\n")
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Seed")
+        repo = AsyncGitService(temp_git_repo)
+        project_id = uuid4()
+
+        stats = await index.sync(project_id, repo, None, head(temp_git_repo))
+
+        assert stats["files_indexed"] == 7
+        assert set(await stored_paths(index)) == {"README.md", "app.py"} | {
+            f"mod_{n}.go" for n in range(5)
+        }
+        embedded = len(index.embeddings.embedded)
+        assert stats["chunks_indexed"] == embedded > 7
+
+        again = await index.sync(project_id, repo, None, head(temp_git_repo))
+
+        assert again["files_indexed"] == 0
+        assert again["files_unchanged"] == 7
+        assert len(index.embeddings.embedded) == embedded
+
+    @pytest.mark.asyncio
+    async def test_blobs_without_chunks_not_reread(self, index, temp_git_repo):  # noqa: F811
+        """Test binary and blank blobs are marked once and never returned by search."""
+        (temp_git_repo / "data.py").write_bytes(b"\x00\x01compiled")
+        (temp_git_repo / "blank.md").write_text("\n   \n")
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Seed")
+        repo = AsyncGitService(temp_git_repo)
+        project_id = uuid4()
+
+        stats = await index.sync(project_id, repo, None, head(temp_git_repo))
+
+        assert stats["files_skipped"] == 2
+        assert stats["files_indexed"] == 1
+        assert set(await stored_paths(index)) == {"README.md", "data.py", "blank.md"}
+
+        repo.read_blobs = AsyncMock(side_effect=AssertionError("blobs re-read"))
+        again = await index.sync(project_id, repo, None, head(temp_git_repo))
+
+        assert again["files_unchanged"] == 3
+        assert again["files_skipped"] == 0
+        results = await index.search(project_id, "data.py", limit=50, score_threshold=0.0)
+        assert {r["metadata"]["path"] for r in results} == {"README.md"}
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_replaces_stale_chunks(self, index, temp_git_repo):  # noqa: F811
+        """Test changed, deleted and renamed files leave no stale points."""
+        for name in ("keep.py", "edit.py", "drop.py", "move.py"):
+            (temp_git_repo / name).write_text(f"# {name}\n" + PYTHON_SOURCE)
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Seed")
+        repo = AsyncGitService(temp_git_repo)
+        project_id = uuid4()
+        base = head(temp_git_repo)
+        await index.sync(project_id, repo, None, base)
+        before = await stored_paths(index)
+        index.embeddings.embedded.clear()
+
+        (temp_git_repo / "edit.py").write_text("def changed():\n    return True\n")
+        git(temp_git_repo, "rm", "-q", "drop.py")
+        git(temp_git_repo, "mv", "move.py", "moved.py")
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Change files")
+
+        stats = await index.sync(project_id, repo, base, head(temp_git_repo))
+
+        after = await stored_paths(index)
+        assert set(after) == {"README.md", "keep.py", "edit.py", "moved.py"}
+        assert after["keep.py"] == before["keep.py"]
+        assert len(after["edit.py"]) == 1 and after["edit.py"] != before["edit.py"]
+        assert stats["files_indexed"] == 2
+        assert all(
+            text.split("\n", 1)[0] in ("edit.py", "moved.py") for text in index.embeddings.embedded
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_scoped_to_project(self, index, temp_git_repo):  # noqa: F811
+        """Test retrieval returns chunks with location metadata for one project only."""
+        (temp_git_repo / "app.py").write_text(PYTHON_SOURCE)
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Seed")
+        repo = AsyncGitService(temp_git_repo)
+        project_id = uuid4()
+        await index.sync(project_id, repo, None, head(temp_git_repo))
+        await index.sync(uuid4(), repo, None, head(temp_git_repo))
+
+        results = await index.search(project_id, "class Second", limit=50, score_threshold=0.0)
+
+        assert results
+        assert {r["metadata"]["project_id"] for r in results} == {str(project_id)}
+        app_chunk = next(r for r in results if r["metadata"]["path"] == "app.py")
+        assert app_chunk["metadata"]["language"] == "python"
+        assert app_chunk["metadata"]["start_line"] == 1
@@ -0,0 +1,203 @@
+"""
+Unit tests for pooled email delivery and notification digests.
+
+Sends through a local SMTP sink, checking that a batch of emails reuses
+one authenticated connection, that a connection dropped by the server is
+replaced transparently, and that the digest builder sends one email per
+user per period.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from ardha.core.config import get_settings
+from ardha.core.email_service import EmailService, SMTPConnectionPool
+from ardha.models.notification_preference import NotificationPreference
+from ardha.repositories.notification_preference_repository import DEFAULT_PREFERENCES
+from ardha.services import notification_service as notification_service_module
+from ardha.services.notification_service import NotificationService, group_digests
+from tests.fixtures.notification_fixtures import InMemoryNotificationRepository
+from tests.fixtures.smtp_fixtures import smtp_sink  # noqa: F401
+
+
+@pytest.fixture
+def email_service(smtp_sink, monkeypatch):  # noqa: F811
+    """EmailService sending through a pool connected to the SMTP sink."""
+    email_settings = get_settings().email
+    monkeypatch.setattr(email_settings, "smtp_username", "sink-user")
+    monkeypatch.setattr(email_settings, "smtp_password", "sink-password")
+    pool = SMTPConnectionPool(
+        hostname="127.0.0.1",
+        port=smtp_sink.port,
+        username="sink-user",
+        password="sink-password",
+        use_tls=False,
+        size=2,
+        idle_timeout=60,
+        timeout=5,
+    )
+    return EmailService(smtp_pool=pool)
+
+
+def make_user() -> SimpleNamespace:
+    user_id = uuid4()
+    return SimpleNamespace(
+        id=user_id, email=f"{user_id.hex[:8]}@example.com", full_name=None, username="dev"
+    )
+
+
+def make_notification(user: SimpleNamespace, notification_type: str = "mention", age: int = 0):
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=user.id,
+        user=user,
+        type=notification_type,
+        title=f"{notification_type} {age}",
+        message="Something happened",
+        link_type=None,
+        link_id=None,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=age),
+    )
+
+
+def digest_service(email_service: EmailService, rows) -> NotificationService:
+    service = NotificationService(Mock())
+    service.email_service = email_service
+    service.notification_repo = InMemoryNotificationRepository(pending_email=rows)
+    return service
+
+
+def preference(**overrides: Any) -> NotificationPreference:
+    values: Dict[str, Any] = {**DEFAULT_PREFERENCES, "email_frequency": "daily", **overrides}
+    return NotificationPreference(user_id=uuid4(), **values)
+
+
+class TestSMTPConnectionPool:
+    """Test cases for pooled SMTP delivery."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_one_connection(self, email_service, smtp_sink):  # noqa: F811
+        """Test ten emails cost one connection and one login."""
+        for number in range(10):
+            assert await email_service.send_email(
+                f"user{number}@example.com", f"Subject {number}", "<p>Hello</p>"
+            )
+
+        assert len(smtp_sink.messages) == 10
+        assert smtp_sink.connections == 1
+        assert smtp_sink.logins == 1
+        assert email_service.smtp_pool.connections_opened == 1
+        assert smtp_sink.messages[3]["To"] == "user3@example.com"
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_replaced(self, email_service, smtp_sink):  # noqa: F811
+        """Test a connection closed by the server is replaced and the email still sent."""
+        assert await email_service.send_email("a@example.com", "First", "<p>1</p>")
+        smtp_sink.drop_connections()
+
+        assert await email_service.send_email("b@example.com", "Second", "<p>2</p>")
+
+        assert [m["Subject"] for m in smtp_sink.messages] == ["First", "Second"]
+        assert smtp_sink.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_not_reused_after_timeout(
+        self, email_service, smtp_sink  # noqa: F811
+    ):
+        """Test connections idle longer than idle_timeout are reopened."""
+        email_service.smtp_pool.idle_timeout = 0
+        assert await email_service.send_email("a@example.com", "First", "<p>1</p>")
+        assert await email_service.send_email("b@example.com", "Second", "<p>2</p>")
+
+        assert smtp_sink.connections == 2
+
+    def test_templates_compiled_once(self, email_service):
+        """Test every EmailService shares the same compiled templates."""
+        assert EmailService(smtp_pool=email_service.smtp_pool).templates is email_service.templates
+        assert set(email_service.templates) == {
+            "notification_single.html",
+            "notification_digest.html",
+        }
+
+
+class TestNotificationDigests:
+    """Test cases for NotificationService.send_digests."""
+
+    def test_group_digests_skips_disabled_types(self):
+        """Test grouping keeps one list per user without disabled types."""
+        alice, bob = make_user(), make_user()
+        muted = preference(mentions=False)
+        rows = [
+            (make_notification(alice, age=2), preference()),
+            (make_notification(alice, age=1), preference()),
+            (make_notification(bob, "mention"), muted),
+            (make_notification(bob, "system"), muted),
+        ]
+
+        digests = group_digests(rows)
+
+        assert [len(digests[alice.id]), len(digests[bob.id])] == [2, 1]
+        assert digests[bob.id][0].type == "system"
+
+    @pytest.mark.asyncio
+    async def test_one_email_per_user(self, email_service, smtp_sink):  # noqa: F811
+        """Test each user gets a single digest and notifications are marked emailed."""
+        users = [make_user() for _ in range(3)]
+        daily = preference()
+        rows = [(make_notification(user, age=age), daily) for user in users for age in range(4)]
+        rows.append((make_notification(users[0], "system"), preference(email_frequency="weekly")))
+        service = digest_service(email_service, rows)
+
+        stats = await service.send_digests("daily")
+
+        assert stats == {"users": 3, "sent": 3, "failed": 0, "notifications": 12}
+        assert sorted(m["To"] for m in smtp_sink.messages) == sorted(u.email for u in users)
+        assert smtp_sink.messages[0]["Subject"] == "Ardha Daily Digest: 4 notifications"
+        assert smtp_sink.connections == 1
+        assert len(service.notification_repo.emailed) == 12
+
+        again = await service.send_digests("daily")
+
+        assert again["sent"] == 0
+        assert len(smtp_sink.messages) == 3
+
+    @pytest.mark.asyncio
+    async def test_pages_never_split_a_user(
+        self, email_service, smtp_sink, monkeypatch  # noqa: F811
+    ):
+        """Test a user whose notifications span two scan pages gets one digest."""
+        monkeypatch.setattr(notification_service_module, "DIGEST_SCAN_SIZE", 5)
+        users = sorted((make_user() for _ in range(3)), key=lambda user: user.id)
+        daily = preference()
+        rows = [(make_notification(user, age=age), daily) for user in users for age in range(3)]
+        service = digest_service(email_service, rows)
+
+        stats = await service.send_digests("daily")
+
+        assert stats["sent"] == 3
+        assert (
+            sorted(m["Subject"] for m in smtp_sink.messages)
+            == ["Ardha Daily Digest: 3 notifications"] * 3
+        )
+        assert service.notification_repo.scans == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_digest_stays_pending(
+        self, email_service, smtp_sink, monkeypatch  # noqa: F811
+    ):
+        """Test notifications of a user whose digest fails are not marked emailed."""
+        user = make_user()
+        rows = [(make_notification(user), preference())]
+        service = digest_service(email_service, rows)
+        monkeypatch.setattr(get_settings().email, "smtp_password", None)
+
+        stats = await service.send_digests("daily")
+
+        assert stats["failed"] == 1
+        assert service.notification_repo.emailed == []
+        assert smtp_sink.messages == []
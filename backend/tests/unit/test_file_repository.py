@@ -272,6 +272,47 @@ class TestFileRepository:
         results = await file_repo.search_files(project_id, "Utility", search_content=True)
         assert len(results) == 1  # src/utils.py contains "Utility"
 
+    @pytest.mark.asyncio
+    async def test_search_files_ranked_and_paginated(
+        self, file_repo: FileRepository, test_project: Project
+    ):
+        """Test search ranks name matches first and applies type filter and limit in SQL."""
+        for path in ("docs/handlers.md", "src/api/handlers.py", "handlers.py", "src/handle.py"):
+            await file_repo.create(
+                File(
+                    id=uuid4(),
+                    project_id=test_project.id,
+                    path=path,
+                    name=path.split("/")[-1],
+                    file_type="doc" if path.endswith(".md") else "code",
+                    size_bytes=0,
+                )
+            )
+
+        results = await file_repo.search_files(test_project.id, "handlers.py")
+        assert [f.path for f in results[:2]] == ["handlers.py", "src/api/handlers.py"]
+
+        page = await file_repo.search_files(
+            test_project.id, "handle", file_types=[FileType.CODE], limit=2
+        )
+        total = await file_repo.count_search_results(
+            test_project.id, "handle", file_types=[FileType.CODE]
+        )
+        assert len(page) == 2
+        assert total == 3
+        assert all(f.file_type == "code" for f in page)
+
+    @pytest.mark.asyncio
+    async def test_search_files_escapes_wildcards(
+        self, file_repo: FileRepository, sample_files_batch: list[File]
+    ):
+        """Test LIKE wildcards in the query are matched literally."""
+        for file_obj in sample_files_batch:
+            await file_repo.create(file_obj)
+
+        results = await file_repo.search_files(sample_files_batch[0].project_id, "%")
+        assert results == []
+
     @pytest.mark.asyncio
     async def test_update_file(self, file_repo: FileRepository, sample_file: File):
         """Test updating file fields."""
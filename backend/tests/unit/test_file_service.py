@@ -0,0 +1,170 @@
+"""
+Unit tests for FileService git sync.
+
+Runs sync_from_git against a real temporary git repository with an
+in-memory file repository, checking that the first sync walks the tree
+and later syncs apply only the tree diff with bulk writes.
+"""
+
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from ardha.services.file_service import FileService
+from tests.fixtures.git_fixtures import temp_dir, temp_git_repo  # noqa: F401
+
+
+class InMemoryFileRepository:
+    """Stand-in for FileRepository keyed by path."""
+
+    def __init__(self) -> None:
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+
+    async def get_path_hashes(self, project_id: UUID) -> Dict[str, Tuple[Optional[str], bool]]:
+        self.calls.append("get_path_hashes")
+        return {path: (row["content_hash"], row["is_deleted"]) for path, row in self.rows.items()}
+
+    async def bulk_upsert(self, rows: List[Dict[str, Any]]) -> int:
+        self.calls.append("bulk_upsert")
+        for row in rows:
+            existing = self.rows.get(row["path"])
+            if existing:
+                existing.update(
+                    content_hash=row["content_hash"], size_bytes=row["size_bytes"], is_deleted=False
+                )
+            else:
+                self.rows[row["path"]] = dict(row)
+        return len(rows)
+
+    async def bulk_soft_delete(self, project_id: UUID, paths: List[str]) -> int:
+        self.calls.append("bulk_soft_delete")
+        live = [path for path in paths if path in self.rows and not self.rows[path]["is_deleted"]]
+        for path in live:
+            self.rows[path]["is_deleted"] = True
+        return len(live)
+
+    async def bulk_rename(self, project_id: UUID, renames: List[Dict[str, Any]]) -> int:
+        self.calls.append("bulk_rename")
+        for rename in renames:
+            row = self.rows.pop(rename["old_path"])
+            row.update({key: value for key, value in rename.items() if key != "old_path"})
+            self.rows[row["path"]] = row
+        return len(renames)
+
+    def live(self) -> Dict[str, Dict[str, Any]]:
+        return {path: row for path, row in self.rows.items() if not row["is_deleted"]}
+
+
+def git(repo_path, *args: str) -> None:
+    """Run a git command in the test repository."""
+    subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def file_service(temp_git_repo):  # noqa: F811
+    """FileService over a temp repo with in-memory persistence."""
+    service = FileService(Mock(), str(temp_git_repo))
+    service.repository = InMemoryFileRepository()
+
+    project = Mock(files_synced_sha=None)
+
+    async def update_project(project_id, **kwargs):
+        for key, value in kwargs.items():
+            setattr(project, key, value)
+
+    service.project_service = Mock()
+    service.project_service.check_permission = AsyncMock(return_value=True)
+    service.project_service.get_project = AsyncMock(return_value=project)
+    service.project_service.repository.update = AsyncMock(side_effect=update_project)
+    service.project = project
+    service._schedule_code_index = Mock()
+    return service
+
+
+class TestSyncFromGit:
+    """Test cases for sync_from_git."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_walks_tree(self, file_service, temp_git_repo):  # noqa: F811
+        """Test first sync indexes every tracked file and records HEAD."""
+        (temp_git_repo / "src").mkdir()
+        for index in range(50):
+            (temp_git_repo / "src" / f"module_{index}.py").write_text(f"value = {index}\n")
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Add modules")
+
+        written = await file_service.sync_from_git(uuid4(), uuid4())
+
+        live = file_service.repository.live()
+        assert written == 51
+        assert set(live) == {"README.md"} | {f"src/module_{i}.py" for i in range(50)}
+        assert live["src/module_0.py"]["language"] == "python"
+        assert file_service.project.files_synced_sha == file_service.git_service.resolve_commit()
+        assert file_service.repository.calls.count("get_path_hashes") == 1
+        file_service._schedule_code_index.assert_called_once()
+        assert file_service._schedule_code_index.call_args.args[1:] == (
+            None,
+            file_service.project.files_synced_sha,
+        )
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_applies_diff(self, file_service, temp_git_repo):  # noqa: F811
+        """Test later syncs apply adds, modifies, deletes and renames only."""
+        for name in ("keep.py", "edit.py", "drop.py", "move.py"):
+            (temp_git_repo / name).write_text(f"# {name}\n" + "x = 1\n" * 20)
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Seed")
+        await file_service.sync_from_git(uuid4(), uuid4())
+        moved_id = file_service.repository.rows["move.py"]["id"]
+        keep_hash = file_service.repository.rows["keep.py"]["content_hash"]
+
+        (temp_git_repo / "edit.py").write_text("changed = True\n")
+        (temp_git_repo / "new.md").write_text("# New\n")
+        git(temp_git_repo, "rm", "-q", "drop.py")
+        git(temp_git_repo, "mv", "move.py", "moved.py")
+        git(temp_git_repo, "add", "-A")
+        git(temp_git_repo, "commit", "-qm", "Change files")
+
+        changed = await file_service.sync_from_git(uuid4(), uuid4())
+
+        live = file_service.repository.live()
+        assert changed == 4
+        assert set(live) == {"README.md", "keep.py", "edit.py", "new.md", "moved.py"}
+        assert live["moved.py"]["id"] == moved_id
+        assert live["keep.py"]["content_hash"] == keep_hash
+        assert file_service.repository.rows["drop.py"]["is_deleted"] is True
+        base_sha, head_sha = file_service._schedule_code_index.call_args.args[1:]
+        assert base_sha is not None and base_sha != head_sha
+
+    @pytest.mark.asyncio
+    async def test_sync_is_noop_at_same_head(self, file_service, temp_git_repo):  # noqa: F811
+        """Test syncing twice without new commits touches nothing."""
+        await file_service.sync_from_git(uuid4(), uuid4())
+        calls_after_first = list(file_service.repository.calls)
+
+        assert await file_service.sync_from_git(uuid4(), uuid4()) == 0
+        assert file_service.repository.calls == calls_after_first
+
+    @pytest.mark.asyncio
+    async def test_missing_base_falls_back_to_full_walk(
+        self, file_service, temp_git_repo  # noqa: F811
+    ):
+        """Test an unknown last-synced SHA triggers a full walk that removes stale rows."""
+        await file_service.sync_from_git(uuid4(), uuid4())
+        file_service.repository.rows["stale.txt"] = {
+            "path": "stale.txt",
+            "content_hash": "0" * 40,
+            "is_deleted": False,
+        }
+        file_service.project.files_synced_sha = "f" * 40
+        (temp_git_repo / "README.md").write_text("# Rewritten\n")
+        git(temp_git_repo, "commit", "-qam", "Rewrite readme")
+
+        changed = await file_service.sync_from_git(uuid4(), uuid4())
+
+        assert changed == 2
+        assert set(file_service.repository.live()) == {"README.md"}
@@ -0,0 +1,173 @@
+"""
+Unit tests for GitCommitService history sync.
+
+Runs sync_commits_from_git against real temporary git repositories with an
+in-memory commit repository, checking batching, query counts, author
+mapping and resuming from the last synced commit.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from ardha.services import git_commit_service as git_commit_service_module
+from ardha.services.git_commit_service import (
+    SYNC_BATCH_SIZE,
+    GitCommitNotFoundError,
+    GitCommitService,
+)
+from tests.fixtures.git_fixtures import temp_dir, temp_git_repo  # noqa: F401
+
+
+class InMemoryCommitRepository:
+    """Stand-in for GitCommitRepository that records calls."""
+
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.insert_calls = 0
+        self.sha_queries = 0
+
+    async def get_latest_commit(self, project_id: UUID, branch: Optional[str] = None):
+        matching = [row for row in self.rows if branch is None or row["branch"] == branch]
+        return Mock(sha=matching[-1]["sha"]) if matching else None
+
+    async def get_shas(self, project_id: UUID) -> Set[str]:
+        self.sha_queries += 1
+        return {row["sha"] for row in self.rows}
+
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        self.insert_calls += 1
+        self.rows.extend(rows)
+        return len(rows)
+
+
+def add_commits(repo_path: Path, count: int) -> None:
+    """Append count commits to the current branch quickly via git fast-import."""
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo_path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    branch = subprocess.run(
+        ["git", "symbolic-ref", "HEAD"], cwd=repo_path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    lines = []
+    for index in range(count):
+        content = f"line {index}\n"
+        message = f"Commit {index}\n"
+        lines.append(f"commit {branch}")
+        lines.append(
+            f"committer Dev {index % 3} <dev{index % 3}@example.com> {1700000000 + index} +0000"
+        )
+        lines.append(f"data {len(message)}\n{message}")
+        if index == 0:
+            lines.append(f"from {head}")
+        lines.append(f"M 644 inline file{index % 10}.txt")
+        lines.append(f"data {len(content)}\n{content}")
+    stream = "\n".join(lines) + "\n"
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], cwd=repo_path, input=stream.encode(), check=True
+    )
+    subprocess.run(["git", "reset", "--hard", "-q"], cwd=repo_path, check=True)
+
+
+@pytest.fixture
+def sync_service(temp_git_repo, monkeypatch):  # noqa: F811
+    """GitCommitService over a temp repo with in-memory persistence."""
+    service = GitCommitService(Mock(), str(temp_git_repo))
+    service.repository = InMemoryCommitRepository()
+    service.project_service = Mock()
+    service.project_service.check_permission = AsyncMock(return_value=True)
+
+    user_repository = Mock()
+    user_repository.get_ids_by_emails = AsyncMock(return_value={"dev1@example.com": UUID(int=1)})
+    monkeypatch.setattr(
+        git_commit_service_module, "UserRepository", Mock(return_value=user_repository)
+    )
+    service.user_repository = user_repository
+    return service
+
+
+class TestSyncCommitsFromGit:
+    """Test cases for sync_commits_from_git."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_batches_inserts(self, sync_service, temp_git_repo):  # noqa: F811
+        """Test a full sync issues one SHA query and one INSERT per batch."""
+        add_commits(temp_git_repo, 1200)
+
+        stats = await sync_service.sync_commits_from_git(uuid4(), uuid4())
+
+        repository = sync_service.repository
+        assert stats["new_commits"] == 1201
+        assert stats["synced_count"] == 1201
+        assert repository.sha_queries == 1
+        assert repository.insert_calls == -(-1201 // SYNC_BATCH_SIZE)
+        # Oldest commit first, so an interrupted sync never leaves gaps behind the resume point
+        assert repository.rows[0]["message"] == "Initial commit: Add README"
+        assert repository.rows[-1]["message"] == "Commit 1199"
+        # Unseen author emails are resolved with at most one query per batch
+        assert sync_service.user_repository.get_ids_by_emails.await_count <= 3
+        mapped = [row for row in repository.rows if row["ardha_user_id"] == UUID(int=1)]
+        assert len(mapped) == 400
+
+    @pytest.mark.asyncio
+    async def test_resync_resumes_from_last_sha(self, sync_service, temp_git_repo):  # noqa: F811
+        """Test a repeat sync only reads commits after the last stored SHA."""
+        project_id = uuid4()
+        add_commits(temp_git_repo, 5)
+        await sync_service.sync_commits_from_git(project_id, uuid4())
+
+        unchanged = await sync_service.sync_commits_from_git(project_id, uuid4())
+        add_commits(temp_git_repo, 2)
+        resumed = await sync_service.sync_commits_from_git(project_id, uuid4())
+
+        assert unchanged["synced_count"] == 0
+        assert resumed["synced_count"] == 2
+        assert resumed["new_commits"] == 2
+        assert len(sync_service.repository.rows) == 8
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_skips_known(self, sync_service, temp_git_repo):  # noqa: F811
+        """Test a non-ancestor last SHA falls back to a full walk without duplicates."""
+        project_id = uuid4()
+        add_commits(temp_git_repo, 3)
+        await sync_service.sync_commits_from_git(project_id, uuid4())
+
+        subprocess.run(["git", "reset", "--hard", "-q", "HEAD~1"], cwd=temp_git_repo, check=True)
+        add_commits(temp_git_repo, 1)
+        stats = await sync_service.sync_commits_from_git(project_id, uuid4())
+
+        assert stats["synced_count"] == 4
+        assert stats["updated_commits"] == 3
+        assert stats["new_commits"] == 1
+
+
+class TestCommitDiff:
+    """Test cases for commit diff retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_stream_commit_diff_hunks(self, sync_service, temp_git_repo):  # noqa: F811
+        """Test a root commit diff streams as one NDJSON object per file."""
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=temp_git_repo, capture_output=True, text=True
+        ).stdout.strip()
+        commit = Mock(sha=sha)
+
+        chunks = await sync_service.stream_commit_diff(uuid4(), uuid4(), "hunks", commit=commit)
+        lines = b"".join([chunk async for chunk in chunks]).splitlines()
+
+        files = [json.loads(line) for line in lines]
+        assert [f["path"] for f in files] == ["README.md"]
+        assert files[0]["status"] == "A"
+        assert files[0]["additions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_commit_diff_unknown_sha(self, sync_service):
+        """Test a commit missing from the repository is reported before streaming."""
+        with pytest.raises(GitCommitNotFoundError):
+            await sync_service.stream_commit_diff(uuid4(), uuid4(), commit=Mock(sha="0" * 40))
@@ -7,6 +7,8 @@ and remote operations.
 """
 
 import pytest
+from git import GitDB, Repo
+
 from ardha.core.git_exceptions import (
     GitAuthenticationError,
     GitBranchError,
@@ -16,7 +18,7 @@ from ardha.core.git_exceptions import (
     GitRepositoryExistsError,
     GitRepositoryNotFoundError,
 )
-from ardha.services.git_service import GitService
+from ardha.services.git_service import EMPTY_TREE_SHA, GitService
 
 # Import git fixtures
 from tests.fixtures.git_fixtures import (
@@ -447,6 +449,239 @@ class TestHistoryAndLogs:
         with pytest.raises(GitInvalidRefError):
             git_service.get_commit_details("invalid_sha")
 
+    def test_iter_commit_log_matches_history(self, git_service_with_commits):
+        """Test streamed log reports the same commits and stats as get_commit_history."""
+        history = git_service_with_commits.get_commit_history()
+        streamed = [c for batch in git_service_with_commits.iter_commit_log() for c in batch]
+
+        assert [c["sha"] for c in streamed] == [c["sha"] for c in history]
+        for streamed_commit, commit in zip(streamed, history):
+            assert streamed_commit["message"] == commit["message"]
+            assert streamed_commit["files_changed"] == commit["files_changed"]
+            assert streamed_commit["insertions"] == commit["insertions"]
+            assert streamed_commit["deletions"] == commit["deletions"]
+
+    def test_iter_commit_log_batches_and_resume(self, git_service_with_commits):
+        """Test batching, oldest-first order and resuming after a known SHA."""
+        batches = list(git_service_with_commits.iter_commit_log(batch_size=2, reverse=True))
+        commits = [c for batch in batches for c in batch]
+
+        assert [len(batch) for batch in batches] == [2, 2]
+        assert commits[0]["message"] == "Initial commit: Add README"
+        assert commits[0]["parent_shas"] == []
+
+        resumed = list(git_service_with_commits.iter_commit_log(since_sha=commits[1]["sha"]))
+        assert [c["sha"] for batch in resumed for c in batch] == [
+            commits[3]["sha"],
+            commits[2]["sha"],
+        ]
+
+    def test_iter_commit_log_renames_and_binary(self, git_service):
+        """Test rename entries and binary files are counted once with no line stats."""
+        (git_service.repo_path / "README.md").rename(git_service.repo_path / "DOCS.md")
+        (git_service.repo_path / "logo.bin").write_bytes(b"\x00\x01\x02")
+        git_service.repo.git.add("-A")
+        git_service.commit("Rename readme, add binary")
+
+        latest = next(git_service.iter_commit_log(max_count=1))[0]
+
+        assert latest["files_changed"] == 2
+        assert latest["insertions"] == 0
+        assert latest["deletions"] == 0
+
+    def test_is_ancestor(self, git_service_with_commits):
+        """Test is_ancestor for reachable, unreachable and unknown SHAs."""
+        history = git_service_with_commits.get_commit_history()
+
+        assert git_service_with_commits.is_ancestor(history[-1]["sha"]) is True
+        assert git_service_with_commits.is_ancestor(history[0]["sha"], history[-1]["sha"]) is False
+        assert git_service_with_commits.is_ancestor("0" * 40) is False
+
+
+class TestTrees:
+    """Test tree listing and diff methods."""
+
+    def test_resolve_commit(self, git_service_with_commits):
+        """Test resolve_commit returns full SHAs and None for unknown refs."""
+        head = git_service_with_commits.resolve_commit()
+
+        assert head == git_service_with_commits.repo.head.commit.hexsha
+        assert git_service_with_commits.resolve_commit("HEAD~1") != head
+        assert git_service_with_commits.resolve_commit("0" * 40) is None
+        assert git_service_with_commits.resolve_commit("no-such-branch") is None
+
+    def test_list_tree(self, git_service_with_commits):
+        """Test list_tree returns blob SHAs and sizes keyed by path."""
+        tree = git_service_with_commits.list_tree()
+        readme = (git_service_with_commits.repo_path / "README.md").read_bytes()
+
+        assert "README.md" in tree
+        assert tree["README.md"]["size"] == len(readme)
+        assert len(tree["README.md"]["sha"]) == 40
+        assert all("/" not in path or not path.endswith("/") for path in tree)
+
+    def test_diff_tree(self, git_service_with_commits):
+        """Test diff_tree reports adds, modifies, deletes and renames."""
+        service = git_service_with_commits
+        base = service.resolve_commit()
+        tree = service.list_tree(base)
+        renamed, deleted = sorted(path for path in tree if path != "README.md")[:2]
+
+        (service.repo_path / "README.md").write_text("# Changed\n")
+        (service.repo_path / "added.txt").write_text("new\n")
+        service.repo.git.mv(renamed, "moved_" + renamed.replace("/", "_"))
+        service.repo.git.rm(deleted)
+        service.repo.git.add("-A")
+        service.commit("Change tree")
+
+        changes = {change["path"]: change for change in service.diff_tree(base)}
+
+        assert changes["README.md"]["status"] == "M"
+        assert changes["README.md"]["size"] == len("# Changed\n")
+        assert changes["added.txt"]["status"] == "A"
+        assert changes[deleted]["status"] == "D"
+        moved = changes["moved_" + renamed.replace("/", "_")]
+        assert moved["status"] == "R"
+        assert moved["old_path"] == renamed
+        assert moved["sha"] == tree[renamed]["sha"]
+        assert service.diff_tree(service.resolve_commit()) == []
+
+    def test_commit_details_line_counts(self, git_service):
+        """Test get_commit_details counts lines from numstat, not patch bytes."""
+        (git_service.repo_path / "notes.md").write_text("+++ plus\n--- minus\nplain\n")
+        (git_service.repo_path / "data.bin").write_bytes(b"\x00" * 100)
+        git_service.repo.git.add("-A")
+        sha = git_service.commit("Add lines")["sha"]
+
+        details = git_service.get_commit_details(sha)
+        files = {f["path"]: f for f in details["files"]}
+
+        assert files["notes.md"]["insertions"] == 3
+        assert files["notes.md"]["deletions"] == 0
+        assert files["notes.md"]["change_type"] == "A"
+        assert files["data.bin"]["binary"] is True
+        assert files["data.bin"]["change_type"] == "A"
+        assert details["insertions"] == sum(f["insertions"] for f in details["files"])
+
+    def test_diff_base(self, git_service):
+        """Test diff_base uses the parent, or the empty tree for the root commit."""
+        root = git_service.resolve_commit()
+        (git_service.repo_path / "a.txt").write_text("a\n")
+        git_service.repo.git.add("-A")
+        head = git_service.commit("Add a")["sha"]
+
+        assert git_service.diff_base(head) == root
+        assert git_service.diff_base(root) == EMPTY_TREE_SHA
+        with pytest.raises(GitInvalidRefError):
+            git_service.diff_base("0" * 40)
+
+    def test_read_blobs(self, git_service_with_commits):
+        """Test read_blobs returns raw content keyed by blob SHA."""
+        service = git_service_with_commits
+        sha = service.list_tree()["README.md"]["sha"]
+
+        blobs = service.read_blobs([sha])
+
+        assert blobs == {sha: (service.repo_path / "README.md").read_bytes()}
+
+    @pytest.mark.parametrize("odbt", ["cmd", "gitdb"])
+    def test_read_blobs_missing(self, git_service, odbt):
+        """Test an unknown blob raises GitOperationError with either object database."""
+        if odbt == "gitdb":
+            git_service._repo = Repo(git_service.repo_path, odbt=GitDB)
+
+        with pytest.raises(GitOperationError):
+            git_service.read_blobs(["ab" * 20])
+
+
+class TestStreaming:
+    """Test streaming diff and blob methods."""
+
+    def commit_large_change(self, service):
+        base = service.resolve_commit()
+        (service.repo_path / "big.txt").write_text("".join(f"line {i}\n" for i in range(5000)))
+        (service.repo_path / "small.txt").write_text("small\n")
+        service.repo.git.add("-A")
+        return base, service.commit("Add files")["sha"]
+
+    def test_stream_diff_uncapped(self, git_service):
+        """Test streamed patch matches git diff when under the caps."""
+        base, head = self.commit_large_change(git_service)
+
+        streamed = b"".join(git_service.stream_diff(base, head, chunk_size=1024))
+
+        assert streamed.decode().rstrip("\n") == git_service.get_diff(base, head)
+
+    def test_stream_diff_per_file_cap(self, git_service):
+        """Test an oversized file is cut with a marker and later files still stream."""
+        base, head = self.commit_large_change(git_service)
+
+        patch = b"".join(git_service.stream_diff(base, head, max_file_bytes=2048)).decode()
+
+        assert "\\ Diff truncated: file diff exceeds 2048 bytes" in patch
+        assert "+line 4999" not in patch
+        assert "+small" in patch
+
+    def test_stream_diff_total_cap(self, git_service):
+        """Test output stops with a marker at the total cap."""
+        base, head = self.commit_large_change(git_service)
+
+        chunks = list(git_service.stream_diff(base, head, max_bytes=4096, chunk_size=512))
+        patch = b"".join(chunks)
+
+        assert len(patch) < 4096 + 100
+        assert patch.endswith(b"\\ Diff truncated: diff exceeds 4096 bytes\n")
+        assert b"small.txt" not in patch
+
+    def test_iter_diff_files(self, git_service):
+        """Test structured per-file hunks with statuses and counts."""
+        (git_service.repo_path / "old.txt").write_text("".join(f"{i}\n" for i in range(20)))
+        git_service.repo.git.add("-A")
+        base = git_service.commit("Add old")["sha"]
+        git_service.repo.git.mv("old.txt", "new name.txt")
+        (git_service.repo_path / "README.md").write_text("# Changed\n")
+        git_service.repo.git.add("-A")
+        head = git_service.commit("Rename and edit")["sha"]
+
+        files = {f["path"]: f for f in git_service.iter_diff_files(base, head)}
+
+        assert files["new name.txt"]["status"] == "R"
+        assert files["new name.txt"]["old_path"] == "old.txt"
+        readme = files["README.md"]
+        assert readme["status"] == "M"
+        assert (readme["additions"], readme["deletions"]) == (1, 3)
+        hunk = readme["hunks"][0]
+        assert hunk["old_start"] == 1
+        assert "+# Changed" in hunk["lines"]
+
+    def test_iter_diff_files_caps(self, git_service):
+        """Test per-file truncation keeps counts and total cap ends the stream."""
+        base, head = self.commit_large_change(git_service)
+
+        files = list(git_service.iter_diff_files(base, head, max_file_bytes=1024))
+        big = next(f for f in files if f["path"] == "big.txt")
+        assert big["truncated"] is True
+        assert big["additions"] == 5000
+        assert sum(len(line) for h in big["hunks"] for line in h["lines"]) <= 1024
+
+        capped = list(git_service.iter_diff_files(base, head, max_bytes=1024))
+        assert capped[-1] == {"truncated": True, "max_bytes": 1024}
+
+    def test_blob_info_and_stream(self, git_service):
+        """Test blob lookup and capped chunked reads."""
+        content = bytes(range(256)) * 1000
+        (git_service.repo_path / "blob.bin").write_bytes(content)
+        git_service.repo.git.add("-A")
+        git_service.commit("Add blob")
+
+        info = git_service.blob_info("blob.bin")
+
+        assert info["size"] == len(content)
+        assert b"".join(git_service.stream_blob(info["sha"], chunk_size=4096)) == content
+        assert b"".join(git_service.stream_blob(info["sha"], max_bytes=1000)) == content[:1000]
+        with pytest.raises(FileNotFoundError):
+            git_service.blob_info("missing.bin")
+
 
 class TestHelperMethods:
     """Test helper methods."""
@@ -0,0 +1,115 @@
+"""
+Unit tests for the shared GitHub API client pool.
+
+Checks client and token reuse per integration, token rotation, TTL
+expiry, LRU eviction and rate limit state read from response headers.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from ardha.services import github_client_pool as github_client_pool_module
+from ardha.services.github_api import GitHubAPIClient, TokenEncryption
+from ardha.services.github_client_pool import GitHubClientPool
+
+
+def make_integration(token: str = "ghp_test_token") -> SimpleNamespace:
+    """Integration stand-in with an encrypted access token."""
+    return SimpleNamespace(id=uuid4(), access_token_encrypted=TokenEncryption.encrypt_token(token))
+
+
+@pytest.fixture
+def pool():
+    """Client pool, shut down after the test."""
+    client_pool = GitHubClientPool(max_clients=2, token_ttl=60, max_workers=2)
+    yield client_pool
+    client_pool.close()
+
+
+class TestGitHubClientPool:
+    """Test cases for GitHubClientPool."""
+
+    def test_client_reused_per_integration(self, pool, mock_env_encryption_key, monkeypatch):
+        """Test one decrypt and one client per integration, sharing one executor."""
+        decrypt = Mock(wraps=TokenEncryption.decrypt_token)
+        monkeypatch.setattr(github_client_pool_module.TokenEncryption, "decrypt_token", decrypt)
+        first, second = make_integration("ghp_first"), make_integration("ghp_second")
+
+        client = pool.get(first)
+
+        assert pool.get(first) is client
+        assert pool.get_token(first) == "ghp_first"
+        assert pool.get(second) is not client
+        assert pool.get(second)._executor is client._executor is pool.executor
+        assert decrypt.call_count == 2
+
+    def test_rotated_token_rebuilds_client(self, pool, mock_env_encryption_key):
+        """Test a changed stored token replaces the pooled client."""
+        integration = make_integration("ghp_old")
+        client = pool.get(integration)
+
+        integration.access_token_encrypted = TokenEncryption.encrypt_token("ghp_new")
+
+        assert pool.get(integration) is not client
+        assert pool.get_token(integration) == "ghp_new"
+
+    def test_expired_entry_rebuilt(self, pool, mock_env_encryption_key, monkeypatch):
+        """Test tokens and clients are dropped after the TTL."""
+        now = {"value": 1000.0}
+        monkeypatch.setattr(github_client_pool_module.time, "monotonic", lambda: now["value"])
+        integration = make_integration()
+        client = pool.get(integration)
+
+        now["value"] += 59
+        assert pool.get(integration) is client
+        now["value"] += 61
+        assert pool.get(integration) is not client
+
+    def test_least_recently_used_evicted(self, pool, mock_env_encryption_key):
+        """Test the pool keeps at most max_clients integrations."""
+        first, second, third = make_integration(), make_integration(), make_integration()
+        client = pool.get(first)
+        pool.get(second)
+        pool.get(first)
+        pool.get(third)
+
+        assert pool.get(first) is client
+        assert set(pool._entries) == {first.id, third.id}
+
+    def test_zero_ttl_disables_pooling(self, mock_env_encryption_key):
+        """Test a TTL of 0 builds a fresh client per call."""
+        pool = GitHubClientPool(token_ttl=0)
+        integration = make_integration()
+
+        assert pool.get(integration) is not pool.get(integration)
+        pool.close()
+
+    def test_rate_limit_from_last_response(self, pool, mock_env_encryption_key):
+        """Test rate limit state is read from recorded headers without a request."""
+        integration = make_integration()
+        client = pool.get(integration)
+        assert pool.rate_limit(integration.id) is None
+
+        requester = client.client.requester
+        requester.rate_limiting = (4321, 5000)
+        requester.rate_limiting_resettime = 1700000000
+
+        state = pool.rate_limit(integration.id)
+        assert state["remaining"] == 4321
+        assert state["limit"] == 5000
+        assert state["reset"].timestamp() == 1700000000
+        assert pool.rate_limit(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_shared_executor_survives_client_close(self, pool, mock_env_encryption_key):
+        """Test closing one client leaves the shared executor usable."""
+        integration = make_integration()
+        pool.get(integration)
+        standalone = GitHubAPIClient("ghp_other", executor=pool.executor)
+
+        await standalone.close()
+
+        assert await pool.get(integration)._run_sync(lambda: 42) == 42
@@ -0,0 +1,208 @@
+"""
+Unit tests and benchmark for GitHub push event handling.
+
+Runs handle_push_event against in-memory repositories that count database
+round trips, checking that a 500-commit push stores commits, links tasks
+and closes tasks with a fixed number of batched queries.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from ardha.services import github_webhook_service as webhook_module
+from ardha.services.github_webhook_service import PUSH_BATCH_SIZE, GitHubWebhookService
+
+PUSH_COMMITS = 500
+
+
+class QueryCounter:
+    """Shared count of repository calls that would hit the database."""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+
+class InMemoryCommitRepository:
+    """Stand-in for GitCommitRepository."""
+
+    def __init__(self, counter: QueryCounter, known: Dict[str, UUID]) -> None:
+        self.counter = counter
+        self.ids = known
+        self.rows: List[Dict[str, Any]] = []
+        self.links: List[Dict[str, Any]] = []
+
+    async def get_ids_by_shas(self, project_id: UUID, shas: List[str]) -> Dict[str, UUID]:
+        self.counter.calls.append("get_ids_by_shas")
+        return {sha: self.ids[sha] for sha in shas if sha in self.ids}
+
+    async def insert_new(self, rows: List[Dict[str, Any]]) -> Dict[str, UUID]:
+        self.counter.calls.append("insert_new")
+        self.rows.extend(rows)
+        inserted = {row["sha"]: row["id"] for row in rows}
+        self.ids.update(inserted)
+        return inserted
+
+    async def bulk_link_tasks(self, links: List[Dict[str, Any]]) -> int:
+        self.counter.calls.append("bulk_link_tasks")
+        self.links.extend(links)
+        return len(links)
+
+
+class InMemoryTaskRepository:
+    """Stand-in for TaskRepository."""
+
+    def __init__(self, counter: QueryCounter, tasks: Dict[str, Tuple[UUID, str]]) -> None:
+        self.counter = counter
+        self.tasks = tasks
+        self.completed: List[UUID] = []
+        self.activities: List[Dict[str, Any]] = []
+
+    async def get_refs_by_identifiers(
+        self, project_id: UUID, identifiers: List[str]
+    ) -> Dict[str, Tuple[UUID, str]]:
+        self.counter.calls.append("get_refs_by_identifiers")
+        return {i: self.tasks[i] for i in identifiers if i in self.tasks}
+
+    async def complete_tasks(self, task_ids: List[UUID]) -> List[UUID]:
+        self.counter.calls.append("complete_tasks")
+        self.completed.extend(task_ids)
+        return list(task_ids)
+
+    async def log_activities(self, activities: List[Dict[str, Any]]) -> int:
+        self.counter.calls.append("log_activities")
+        self.activities.extend(activities)
+        return len(activities)
+
+
+def make_push_payload(count: int, ref: str = "refs/heads/main") -> dict:
+    """Push payload whose commits mention and close ARD-* tasks."""
+    commits = []
+    for index in range(count):
+        message = f"Work on ARD-{index % 50:03d}"
+        if index % 10 == 0:
+            message = f"Fixes ARD-{index % 50:03d}\n\nAlso touches ARD-{(index + 1) % 50:03d}"
+        commits.append(
+            {
+                "id": f"{index:040x}",
+                "message": message,
+                "timestamp": "2024-11-18T10:00:00-05:00",
+                "author": {"name": f"Dev {index % 3}", "email": f"dev{index % 3}@example.com"},
+                "added": [f"file{index}.py"],
+                "removed": [],
+                "modified": ["README.md"],
+            }
+        )
+    return {
+        "ref": ref,
+        "repository": {"name": "repo", "owner": {"login": "octo"}},
+        "commits": commits,
+    }
+
+
+@pytest.fixture
+def push_env(monkeypatch):
+    """Webhook service wired to in-memory repositories."""
+    counter = QueryCounter()
+    tasks = {f"ARD-{n:03d}": (uuid4(), "done" if n == 0 else "todo") for n in range(50)}
+    commit_repo = InMemoryCommitRepository(counter, known={})
+    task_repo = InMemoryTaskRepository(counter, tasks)
+
+    user_repo = Mock()
+
+    async def get_ids_by_emails(emails):
+        counter.calls.append("get_ids_by_emails")
+        return {"dev1@example.com": UUID(int=1)}
+
+    user_repo.get_ids_by_emails = get_ids_by_emails
+    monkeypatch.setattr(webhook_module, "GitCommitRepository", Mock(return_value=commit_repo))
+    monkeypatch.setattr(webhook_module, "TaskRepository", Mock(return_value=task_repo))
+    monkeypatch.setattr(webhook_module, "UserRepository", Mock(return_value=user_repo))
+
+    integration = SimpleNamespace(
+        id=uuid4(), project_id=uuid4(), default_branch="main", auto_link_tasks=True
+    )
+    integration_repo = Mock()
+    integration_repo.get_by_repository = AsyncMock(return_value=integration)
+    service = GitHubWebhookService(integration_repo, Mock(), Mock(), Mock(), Mock())
+    return SimpleNamespace(
+        service=service,
+        counter=counter,
+        commit_repo=commit_repo,
+        task_repo=task_repo,
+        tasks=tasks,
+    )
+
+
+class TestHandlePushEvent:
+    """Test cases for batched push event handling."""
+
+    @pytest.mark.asyncio
+    async def test_push_benchmark_fixed_query_count(self, push_env):
+        """Benchmark: a 500-commit push costs a fixed number of batched queries."""
+        payload = make_push_payload(PUSH_COMMITS)
+
+        started = time.perf_counter()
+        await push_env.service.handle_push_event(payload)
+        elapsed = time.perf_counter() - started
+
+        calls = push_env.counter.calls
+        batches = -(-PUSH_COMMITS // PUSH_BATCH_SIZE)
+        assert calls.count("get_refs_by_identifiers") == 1
+        assert calls.count("get_ids_by_shas") == 1
+        assert calls.count("get_ids_by_emails") == 1
+        assert calls.count("insert_new") == batches
+        assert calls.count("complete_tasks") == 1
+        assert calls.count("log_activities") == 1
+        assert len(calls) <= 6 + 2 * batches
+        assert elapsed < 1.0
+
+        assert len(push_env.commit_repo.rows) == PUSH_COMMITS
+        # Every commit mentions one task; every tenth also mentions a second one
+        assert len(push_env.commit_repo.links) == PUSH_COMMITS + PUSH_COMMITS // 10
+
+    @pytest.mark.asyncio
+    async def test_default_branch_closes_referenced_tasks(self, push_env):
+        """Test closing keywords on the default branch close each task once."""
+        await push_env.service.handle_push_event(make_push_payload(PUSH_COMMITS))
+
+        closing_links = [
+            link for link in push_env.commit_repo.links if link["link_type"] == "closes"
+        ]
+        assert len(closing_links) == PUSH_COMMITS // 10
+        # "Fixes ARD-000..040" every tenth commit; ARD-000 is already done
+        expected = {push_env.tasks[f"ARD-{n:03d}"][0] for n in (10, 20, 30, 40)}
+        assert set(push_env.task_repo.completed) == expected
+        comments = {a["comment"] for a in push_env.task_repo.activities}
+        assert "Automatically closed by commit " + f"{10:040x}"[:7] in comments
+
+        row = push_env.commit_repo.rows[10]
+        assert row["closes_task_ids"] == ["ARD-010"]
+        assert row["linked_task_ids"] == ["ARD-010", "ARD-011"]
+        assert row["files_changed"] == 2
+        assert push_env.commit_repo.rows[1]["ardha_user_id"] == UUID(int=1)
+
+    @pytest.mark.asyncio
+    async def test_feature_branch_links_without_closing(self, push_env):
+        """Test pushes to other branches link commits but close nothing."""
+        await push_env.service.handle_push_event(make_push_payload(20, ref="refs/heads/feature"))
+
+        assert len(push_env.commit_repo.links) == 22
+        assert push_env.task_repo.completed == []
+        assert "complete_tasks" in push_env.counter.calls
+
+    @pytest.mark.asyncio
+    async def test_known_commits_not_inserted_again(self, push_env):
+        """Test redelivered pushes only link commits that are already stored."""
+        payload = make_push_payload(30)
+        await push_env.service.handle_push_event(payload)
+        push_env.counter.calls.clear()
+
+        await push_env.service.handle_push_event(payload)
+
+        assert "insert_new" not in push_env.counter.calls
+        assert len(push_env.commit_repo.rows) == 30
@@ -0,0 +1,176 @@
+"""
+Unit tests for the concurrent GitHub pull request sync client.
+
+Drives GitHubSyncClient through an httpx mock transport with the ETag
+cache on the test Redis client: conditional requests, the updated-at
+cursor, bounded concurrency and rate-limit handling.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from ardha.core.github_exceptions import GitHubRateLimitError
+from ardha.services.github_sync import ETagCache, GitHubSyncClient, pull_request_to_dict
+
+
+def make_pull(number: int, updated_at: str) -> Dict[str, Any]:
+    """Minimal REST pull request object."""
+    return {
+        "number": number,
+        "id": 1000 + number,
+        "title": f"PR {number}",
+        "body": None,
+        "state": "open",
+        "html_url": f"https://github.com/octo/repo/pull/{number}",
+        "url": f"https://api.github.com/repos/octo/repo/pulls/{number}",
+        "head": {"ref": f"feature/{number}", "sha": f"{number:040d}"},
+        "base": {"ref": "main"},
+        "user": {"login": "octocat"},
+        "updated_at": updated_at,
+    }
+
+
+def make_client(handler, redis_client=None, **kwargs) -> GitHubSyncClient:
+    """Sync client over a mock transport."""
+    etag_cache = ETagCache(redis_client, ttl=60, key_prefix="test:etag") if redis_client else None
+    return GitHubSyncClient(
+        "token",
+        "integration-1",
+        etag_cache=etag_cache,
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestGitHubSyncClient:
+    """Test cases for GitHubSyncClient."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_resource_served_from_etag_cache(self, redis_client):
+        """Test a 304 reuses the cached body and a changed ETag refreshes it."""
+        pull = make_pull(1, "2024-11-18T00:00:00Z")
+        etag = {"value": '"v1"'}
+        conditional: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent = request.headers.get("If-None-Match")
+            conditional.append(sent or "")
+            if sent == etag["value"]:
+                return httpx.Response(304)
+            return httpx.Response(200, json=pull, headers={"ETag": etag["value"]})
+
+        async with make_client(handler, redis_client) as client:
+            first = await client.get_pull_request("octo", "repo", 1)
+            second = await client.get_pull_request("octo", "repo", 1)
+            etag["value"] = '"v2"'
+            pull["title"] = "Renamed"
+            third = await client.get_pull_request("octo", "repo", 1)
+
+        assert first == second == {**pull, "title": "PR 1"}
+        assert third["title"] == "Renamed"
+        assert conditional == ["", '"v1"', '"v1"']
+        assert client.requests_made == 3
+        assert client.not_modified == 1
+
+    @pytest.mark.asyncio
+    async def test_list_stops_at_cursor(self):
+        """Test pagination stops at the first pull request older than since."""
+        pages = {
+            "1": [make_pull(3, "2024-11-20T00:00:00Z"), make_pull(2, "2024-11-19T00:00:00Z")],
+            "2": [make_pull(1, "2024-11-10T00:00:00Z"), make_pull(0, "2024-11-09T00:00:00Z")],
+            "3": [make_pull(-1, "2024-11-08T00:00:00Z")],
+        }
+        requested: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params.get("page", "1")
+            requested.append(page)
+            headers = {}
+            if page != "3":
+                next_url = request.url.copy_set_param("page", str(int(page) + 1))
+                headers["Link"] = f'<{next_url}>; rel="next"'
+            return httpx.Response(200, json=pages[page], headers=headers)
+
+        since = datetime(2024, 11, 19, tzinfo=timezone.utc)
+        async with make_client(handler) as client:
+            pulls = await client.list_pull_requests("octo", "repo", since=since)
+
+        assert [pull["number"] for pull in pulls] == [3, 2]
+        assert requested == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test concurrent callers never exceed max_concurrency requests in flight."""
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            number = int(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(200, json=make_pull(number, "2024-11-18T00:00:00Z"))
+
+        async with make_client(handler, max_concurrency=3) as client:
+            pulls = await asyncio.gather(
+                *(client.get_pull_request("octo", "repo", number) for number in range(12))
+            )
+
+        assert [pull["number"] for pull in pulls] == list(range(12))
+        assert in_flight["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_secondary_rate_limit_retried(self, monkeypatch):
+        """Test a Retry-After response is retried after the advertised delay."""
+        delays: List[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("ardha.services.github_sync.asyncio.sleep", fake_sleep)
+        responses = [
+            httpx.Response(403, json={"message": "secondary"}, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=make_pull(1, "2024-11-18T00:00:00Z")),
+        ]
+
+        async with make_client(lambda request: responses.pop(0)) as client:
+            pull = await client.get_pull_request("octo", "repo", 1)
+
+        assert pull["number"] == 1
+        assert delays == [2.0]
+        assert client.requests_made == 2
+
+    @pytest.mark.asyncio
+    async def test_reserve_raises_when_reset_too_far(self):
+        """Test requests stop at the reserve instead of sleeping past the max wait."""
+        reset = str(int(time.time()) + 3600)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json=make_pull(1, "2024-11-18T00:00:00Z"),
+                headers={"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": reset},
+            )
+
+        async with make_client(handler, rate_limit_reserve=100, max_rate_limit_wait=60) as client:
+            await client.get_pull_request("octo", "repo", 1)
+            with pytest.raises(GitHubRateLimitError) as exc_info:
+                await client.get_pull_request("octo", "repo", 2)
+
+        assert client.requests_made == 1
+        assert exc_info.value.reset_at == datetime.fromtimestamp(int(reset), tz=timezone.utc)
+
+    def test_pull_request_to_dict_flattens_rest_shape(self):
+        """Test REST pull requests map onto the GitHubAPIClient dict keys."""
+        data = pull_request_to_dict(make_pull(7, "2024-11-18T00:00:00Z"))
+
+        assert data["head_branch"] == "feature/7"
+        assert data["base_branch"] == "main"
+        assert data["author"] == "octocat"
+        assert data["api_url"].endswith("/pulls/7")
+        assert data["body"] == ""
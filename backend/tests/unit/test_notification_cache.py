@@ -0,0 +1,286 @@
+"""
+Unit tests for the notification unread-count and inbox cache.
+
+Runs the Lua scripts against Redis (or fakeredis): counter deltas on
+create, read and delete, fan-out in one pipeline, inbox trimming, and
+that a fill racing a concurrent change is discarded. Also checks that
+NotificationService polling stays off the database once the cache is warm.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from ardha.api.v1.routes.notifications import get_notification_stats
+from ardha.core.notification_cache import NotificationCache
+from ardha.models.notification import Notification
+from ardha.services.notification_service import NotificationService
+from tests.fixtures.notification_fixtures import InMemoryNotificationRepository
+
+INBOX_SIZE = 10
+
+
+@pytest.fixture
+def cache(redis_client):
+    """Notification cache backed by the test Redis client."""
+    return NotificationCache(redis_client, ttl=300, inbox_size=INBOX_SIZE)
+
+
+def make_notification(user_id: UUID, age: int = 0, read: bool = False) -> Notification:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc) - timedelta(minutes=age)
+    return Notification(
+        id=uuid4(),
+        user_id=user_id,
+        type="mention",
+        title=f"Mention {age}",
+        message="You were mentioned",
+        data={"age": age},
+        is_read=read,
+        read_at=created_at if read else None,
+        created_at=created_at,
+    )
+
+
+async def warm(cache: NotificationCache, user_id: UUID, notifications: List[Notification]):
+    unread = sum(not n.is_read for n in notifications)
+    assert await cache.fill(user_id, await cache.begin_fill(user_id), unread, notifications)
+
+
+class TestNotificationCache:
+    """Test cases for NotificationCache."""
+
+    @pytest.mark.asyncio
+    async def test_fill_then_read_inbox(self, cache):
+        """Test a filled inbox round-trips with read state, newest first."""
+        user_id = uuid4()
+        assert await cache.get_inbox(user_id) is None
+
+        stored = [make_notification(user_id, age=1), make_notification(user_id, age=2, read=True)]
+        await warm(cache, user_id, stored)
+
+        inbox = await cache.get_inbox(user_id)
+        assert inbox.unread_count == 1
+        assert inbox.complete
+        assert [n.id for n in inbox.notifications] == [n.id for n in stored]
+        assert [n.is_read for n in inbox.notifications] == [False, True]
+        assert inbox.notifications[1].read_at == stored[1].read_at
+        assert inbox.notifications[0].data == {"age": 1}
+        assert await cache.get_unread_count(user_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_fan_out_updates_warm_users_only(self, cache):
+        """Test one add() call updates every warm recipient and leaves cold ones cold."""
+        warm_users = [uuid4() for _ in range(20)]
+        cold_user = uuid4()
+        for user_id in warm_users:
+            await warm(cache, user_id, [])
+
+        await cache.add([make_notification(u) for u in warm_users + [cold_user]])
+        await cache.add([make_notification(warm_users[0], age=-1)])
+
+        assert [await cache.get_unread_count(u) for u in warm_users] == [2] + [1] * 19
+        assert await cache.get_inbox(cold_user) is None
+        inbox = await cache.get_inbox(warm_users[0])
+        assert [n.title for n in inbox.notifications] == ["Mention -1", "Mention 0"]
+
+    @pytest.mark.asyncio
+    async def test_mark_read_and_remove_adjust_counter(self, cache):
+        """Test read and delete change the counter by the rows actually changed."""
+        user_id = uuid4()
+        stored = [make_notification(user_id, age=age) for age in range(4)]
+        await warm(cache, user_id, stored)
+        read_at = datetime.now(timezone.utc)
+
+        token = await cache.begin_change(user_id)
+        await cache.mark_read(user_id, [stored[0].id, stored[1].id], read_at, token)
+        await cache.mark_read(user_id, [], read_at, await cache.begin_change(user_id))
+        await cache.remove(user_id, stored[1].id, False, await cache.begin_change(user_id))
+        await cache.remove(user_id, stored[2].id, True, await cache.begin_change(user_id))
+
+        inbox = await cache.get_inbox(user_id)
+        assert inbox.unread_count == 1
+        assert [(n.id, n.is_read) for n in inbox.notifications] == [
+            (stored[0].id, True),
+            (stored[3].id, False),
+        ]
+        assert inbox.notifications[0].read_at == read_at
+
+    @pytest.mark.asyncio
+    async def test_inbox_trimmed_to_size(self, cache):
+        """Test the inbox keeps the newest entries while the counter keeps counting."""
+        user_id = uuid4()
+        await warm(cache, user_id, [])
+
+        await cache.add([make_notification(user_id, age=age) for age in range(INBOX_SIZE + 5)])
+
+        inbox = await cache.get_inbox(user_id)
+        assert inbox.unread_count == INBOX_SIZE + 5
+        assert len(inbox.notifications) == INBOX_SIZE
+        assert inbox.notifications[-1].title == f"Mention {INBOX_SIZE - 1}"
+        assert not inbox.complete
+
+    @pytest.mark.asyncio
+    async def test_racing_fill_discarded(self, cache):
+        """Test a fill is dropped when the user changed after begin_fill()."""
+        user_id = uuid4()
+        generation = await cache.begin_fill(user_id)
+
+        # A notification is created while the database queries run
+        await cache.add([make_notification(user_id)])
+
+        assert not await cache.fill(user_id, generation, 0, [])
+        assert await cache.get_inbox(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_fill_after_commit_not_counted_twice(self, cache):
+        """Test a fill stored between the write and mark_read() is dropped, not decremented."""
+        user_id = uuid4()
+        stored = [make_notification(user_id, age=age) for age in range(3)]
+        token = await cache.begin_change(user_id)
+
+        # The read commits, then a cold poll fills the cache with the new state
+        stored[0].is_read, stored[0].read_at = True, datetime.now(timezone.utc)
+        await warm(cache, user_id, stored)
+        await cache.mark_read(user_id, [stored[0].id], stored[0].read_at, token)
+
+        assert await cache.get_inbox(user_id) is None
+        await warm(cache, user_id, stored)
+        assert await cache.get_unread_count(user_id) == 2
+
+    @pytest.mark.asyncio
+    async def test_fill_before_change_is_discarded(self, cache):
+        """Test a fill that began before begin_change() is rejected."""
+        user_id = uuid4()
+        generation = await cache.begin_fill(user_id)
+
+        token = await cache.begin_change(user_id)
+        await cache.remove(user_id, uuid4(), True, token)
+
+        assert not await cache.fill(user_id, generation, 1, [])
+        assert await cache.get_inbox(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_clear_invalidates_every_user(self, cache):
+        """Test clear() drops cached state for all users."""
+        users = [uuid4() for _ in range(3)]
+        for user_id in users:
+            await warm(cache, user_id, [make_notification(user_id)])
+
+        assert await cache.clear() == 3
+        assert [await cache.get_inbox(u) for u in users] == [None] * 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_misses(self, redis_client):
+        """Test a disabled cache never stores or returns anything."""
+        cache = NotificationCache(redis_client, enabled=False)
+        user_id = uuid4()
+
+        await cache.fill(user_id, await cache.begin_fill(user_id), 3, [])
+
+        assert await cache.get_inbox(user_id) is None
+        assert await redis_client.keys("*") == []
+
+
+@pytest.fixture
+def polled_service(cache):
+    """NotificationService over a user with 25 notifications and the test cache."""
+    user_id = uuid4()
+    stored = [make_notification(user_id, age=age, read=age % 5 == 0) for age in range(25)]
+    service = NotificationService(Mock())
+    service.notification_repo = InMemoryNotificationRepository(stored)
+    service.cache = cache
+    return service, user_id, stored
+
+
+class TestNotificationServicePolling:
+    """Test cases for cached reads in NotificationService."""
+
+    @pytest.mark.asyncio
+    async def test_polling_hits_database_once(self, polled_service):
+        """Test repeated polls of the first page load from the database once."""
+        service, user_id, stored = polled_service
+
+        for _ in range(50):
+            result = await service.get_user_notifications(user_id, skip=0, limit=5)
+
+        assert service.notification_repo.calls == ["get_inbox"]
+        assert result["unread_count"] == 20
+        assert [n.id for n in result["notifications"]] == [n.id for n in stored[:5]]
+
+    @pytest.mark.asyncio
+    async def test_stats_polling_hits_database_once(self, polled_service):
+        """Test stats are computed from the cached inbox without scanning notifications."""
+        service, user_id, stored = polled_service
+
+        for _ in range(20):
+            stats = await service.get_notification_stats(user_id)
+
+        assert service.notification_repo.calls == ["get_inbox"]
+        assert stats["total_count"] == 10
+        assert stats["unread_count"] == 20
+        assert stats["by_type"] == {"mention": 10}
+        assert [n.id for n in stats["recent_notifications"]] == [n.id for n in stored[:5]]
+
+    @pytest.mark.asyncio
+    async def test_warm_stats_route_runs_no_queries(self, polled_service):
+        """Test the stats endpoint builds its response from the cache alone."""
+        service, user_id, stored = polled_service
+        await service.get_notification_stats(user_id)
+        db = Mock()
+        db.execute = AsyncMock()
+
+        with patch("ardha.api.v1.routes.notifications.NotificationService", return_value=service):
+            response = await get_notification_stats(current_user=Mock(id=user_id), db=db)
+
+        db.execute.assert_not_awaited()
+        assert service.notification_repo.calls == ["get_inbox"]
+        assert [n.id for n in response.recent_notifications] == [n.id for n in stored[:5]]
+        assert response.recent_notifications[0].message == stored[0].message
+        assert response.recent_notifications[0].is_read == stored[0].is_read
+
+    @pytest.mark.asyncio
+    async def test_deep_page_and_unread_overflow_use_database(self, polled_service):
+        """Test pages past the cached inbox fall back to the database."""
+        service, user_id, stored = polled_service
+
+        deep = await service.get_user_notifications(user_id, skip=8, limit=5)
+        unread = await service.get_user_notifications(user_id, unread_only=True, limit=50)
+
+        assert [n.id for n in deep["notifications"]] == [n.id for n in stored[8:13]]
+        assert unread["total"] == 20
+        assert service.notification_repo.calls == [
+            "get_inbox",
+            "get_by_user",
+            "get_unread_by_user",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mark_all_read_updates_cached_count(self, polled_service):
+        """Test mark-all-read zeroes the cached counter without a reload."""
+        service, user_id, _ = polled_service
+        await service.get_user_notifications(user_id, limit=10)
+
+        assert await service.mark_all_read(user_id) == 20
+        result = await service.get_user_notifications(user_id, limit=10)
+
+        assert result["unread_count"] == 0
+        assert all(n.is_read for n in result["notifications"])
+        assert service.notification_repo.calls == ["get_inbox"]
+
+    @pytest.mark.asyncio
+    async def test_poll_between_commit_and_cache_update(self, polled_service):
+        """Test a cold poll racing mark_notification_read() leaves an exact count."""
+        service, user_id, stored = polled_service
+
+        async def poll():
+            assert (await service._get_inbox(user_id)).unread_count == 19
+
+        service.notification_repo.on_commit = poll
+        await service.mark_notification_read(stored[1].id, user_id)
+
+        result = await service.get_user_notifications(user_id, limit=10)
+        assert result["unread_count"] == 19
+        assert await service.cache.get_unread_count(user_id) == 19
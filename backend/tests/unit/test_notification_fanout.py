@@ -0,0 +1,138 @@
+"""
+Unit tests and benchmark for set-based notification fan-out.
+
+Runs BroadcastService.notify_project_members against in-memory
+repositories that count database round trips, checking that a 200-member
+project costs a fixed number of queries, one WebSocket batch and one
+queued email job regardless of member count.
+"""
+
+import time
+from datetime import time as clock_time
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from ardha.models.notification_preference import NotificationPreference
+from ardha.repositories.notification_preference_repository import DEFAULT_PREFERENCES
+from ardha.services.broadcast_service import BroadcastService
+from ardha.services.notification_service import NotificationService
+from tests.fixtures.notification_fixtures import InMemoryNotificationRepository
+
+PROJECT_MEMBERS = 200
+
+
+class InMemoryPreferenceRepository:
+    """Stand-in for NotificationPreferenceRepository."""
+
+    def __init__(self, calls: List[str], stored: Dict[UUID, NotificationPreference]) -> None:
+        self.calls = calls
+        self.stored = stored
+
+    async def get_or_create_for_users(self, user_ids: List[UUID]):
+        self.calls.append("get_or_create_for_users")
+        for user_id in user_ids:
+            self.stored.setdefault(
+                user_id, NotificationPreference(user_id=user_id, **DEFAULT_PREFERENCES)
+            )
+        return {user_id: self.stored[user_id] for user_id in user_ids}
+
+
+@pytest.fixture
+def fanout_env():
+    """BroadcastService wired to in-memory repositories and delivery stand-ins."""
+    calls: List[str] = []
+    preferences: Dict[UUID, NotificationPreference] = {}
+    members = [SimpleNamespace(user_id=uuid4()) for _ in range(PROJECT_MEMBERS)]
+
+    service = NotificationService(Mock())
+    service.preference_repo = InMemoryPreferenceRepository(calls, preferences)
+    service.notification_repo = InMemoryNotificationRepository(calls=calls)
+    service.ws_manager = Mock()
+    service.ws_manager.send_personal_messages = AsyncMock(return_value=0)
+    service.ws_manager.send_personal_message = AsyncMock()
+    service._queue_emails = Mock()
+    service.cache = Mock()
+    service.cache.add = AsyncMock()
+
+    broadcast = BroadcastService(Mock())
+    broadcast.notification_service = service
+    broadcast.project_repo = Mock()
+    broadcast.project_repo.get_project_members = AsyncMock(return_value=members)
+
+    return SimpleNamespace(
+        broadcast=broadcast,
+        service=service,
+        calls=calls,
+        preferences=preferences,
+        members=members,
+    )
+
+
+class TestNotificationFanOut:
+    """Test cases for NotificationService.notify_users via BroadcastService."""
+
+    @pytest.mark.asyncio
+    async def test_project_broadcast_benchmark_constant_queries(self, fanout_env):
+        """Benchmark: 200 members cost one preference query and one insert."""
+        project_id = uuid4()
+        actor = fanout_env.members[0].user_id
+
+        started = time.perf_counter()
+        notifications = await fanout_env.broadcast.notify_project_members(
+            project_id, "system", "Release", "v2 is out", exclude_user=actor
+        )
+        elapsed = time.perf_counter() - started
+
+        assert len(notifications) == PROJECT_MEMBERS - 1
+        assert fanout_env.calls == ["get_or_create_for_users", "insert_many"]
+        assert elapsed < 1.0
+
+        fanout_env.service.ws_manager.send_personal_messages.assert_awaited_once()
+        fanout_env.service.ws_manager.send_personal_message.assert_not_awaited()
+        (messages,) = fanout_env.service.ws_manager.send_personal_messages.await_args.args
+        assert len(messages) == PROJECT_MEMBERS - 1
+        assert actor not in {user_id for user_id, _ in messages}
+        assert messages[0][1]["data"]["link_id"] == str(project_id)
+
+        fanout_env.service._queue_emails.assert_called_once()
+        assert len(fanout_env.service._queue_emails.call_args.args[0]) == PROJECT_MEMBERS - 1
+        fanout_env.service.cache.add.assert_awaited_once_with(notifications)
+
+    @pytest.mark.asyncio
+    async def test_preferences_route_each_recipient(self, fanout_env):
+        """Test disabled types, quiet hours and digest users skip live delivery."""
+        disabled, quiet, digest, instant = [m.user_id for m in fanout_env.members[:4]]
+        prefs = fanout_env.preferences
+        prefs[disabled] = NotificationPreference(
+            user_id=disabled, **{**DEFAULT_PREFERENCES, "mentions": False}
+        )
+        prefs[quiet] = NotificationPreference(user_id=quiet, **DEFAULT_PREFERENCES)
+        prefs[quiet].quiet_hours_start = clock_time(0, 0)
+        prefs[quiet].quiet_hours_end = clock_time(23, 59, 59, 999999)
+        prefs[digest] = NotificationPreference(
+            user_id=digest, **{**DEFAULT_PREFERENCES, "email_frequency": "daily"}
+        )
+
+        notifications = await fanout_env.service.notify_users(
+            [disabled, quiet, digest, instant, instant], "mention", "Hi", "You were mentioned"
+        )
+
+        assert [n.user_id for n in notifications] == [disabled, quiet, digest, instant]
+        rows = {row["user_id"]: row for row in fanout_env.service.notification_repo.inserted}
+        assert rows[disabled]["data"] == {"_preference_disabled": True}
+        assert rows[instant]["data"] is None
+
+        (messages,) = fanout_env.service.ws_manager.send_personal_messages.await_args.args
+        assert [user_id for user_id, _ in messages] == [digest, instant]
+        emailed = fanout_env.service._queue_emails.call_args.args[0]
+        assert [n.user_id for n in emailed] == [instant]
+
+    @pytest.mark.asyncio
+    async def test_no_recipients_touches_nothing(self, fanout_env):
+        """Test an empty recipient set makes no queries."""
+        assert await fanout_env.service.notify_users([], "system", "T", "M") == []
+        assert fanout_env.calls == []
@@ -405,8 +405,7 @@ async def test_sync_tasks_success(
     mock_project_service.check_permission = AsyncMock(return_value=True)
     mock_openspec_repo.update_sync_status = AsyncMock()
     mock_parser.extract_tasks_from_markdown = Mock(return_value=[parsed_task])
-    mock_task_service.create_task = AsyncMock(return_value=created_task)
-    mock_task_service.link_openspec_proposal = AsyncMock()
+    mock_task_service.bulk_create_tasks = AsyncMock(return_value=[created_task])
 
     # Execute
     result = await openspec_service.sync_tasks_to_database(
@@ -417,8 +416,48 @@ async def test_sync_tasks_success(
     # Verify
     assert len(result) == 1
     assert result[0].identifier == "ARD-001"
-    mock_task_service.create_task.assert_called_once()
-    mock_task_service.link_openspec_proposal.assert_called_once()
+    mock_task_service.bulk_create_tasks.assert_called_once()
+    call = mock_task_service.bulk_create_tasks.call_args.kwargs
+    assert call["openspec_proposal_id"] == sample_proposal.id
+    assert call["dependencies"] == []
+
+
+@pytest.mark.asyncio
+async def test_sync_tasks_resolves_dependencies(
+    openspec_service,
+    mock_openspec_repo,
+    mock_parser,
+    mock_task_service,
+    mock_project_service,
+    sample_proposal,
+):
+    """Test dependencies between parsed tasks are passed as batch positions."""
+    sample_proposal.status = "approved"
+    parsed_tasks = [
+        ParsedTask(
+            identifier=f"TAS-00{number}",
+            title=f"Task {number}",
+            dependencies=dependencies,
+            markdown_section=f"## TAS-00{number}: Task {number}",
+        )
+        for number, dependencies in [(1, []), (2, ["TAS-001"]), (3, ["TAS-001", "TAS-999"])]
+    ]
+
+    mock_openspec_repo.get_by_id = AsyncMock(return_value=sample_proposal)
+    mock_project_service.check_permission = AsyncMock(return_value=True)
+    mock_openspec_repo.update_sync_status = AsyncMock()
+    mock_parser.extract_tasks_from_markdown = Mock(return_value=parsed_tasks)
+    mock_task_service.bulk_create_tasks = AsyncMock(return_value=[Mock(), Mock(), Mock()])
+
+    await openspec_service.sync_tasks_to_database(
+        proposal_id=sample_proposal.id,
+        user_id=uuid4(),
+    )
+
+    call = mock_task_service.bulk_create_tasks.call_args.kwargs
+    assert [task["title"] for task in call["tasks_data"]] == ["Task 1", "Task 2", "Task 3"]
+    # The unknown TAS-999 is skipped
+    assert call["dependencies"] == [(1, 0), (2, 0)]
 
 
 @pytest.mark.asyncio
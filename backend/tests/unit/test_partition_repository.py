@@ -0,0 +1,139 @@
+"""
+Unit tests for monthly partition management.
+
+Checks month arithmetic and partition naming, which partitions retention
+drops (only months that end before the cutoff, never the default
+partition), that pre-creation skips existing months, and that notification
+cleanup drops partitions instead of deleting rows.
+"""
+
+from datetime import UTC, datetime
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ardha.repositories.notification_repository import NotificationRepository
+from ardha.repositories.partition_repository import (
+    PartitionRepository,
+    add_months,
+    month_start,
+    partition_month,
+    partition_name,
+)
+
+
+def fake_session(partitions: List[str]) -> Mock:
+    """Async session whose catalog query lists the given partitions."""
+    db = Mock()
+    listing = Mock()
+    listing.scalars.return_value.all.return_value = partitions
+    db.execute = AsyncMock(return_value=listing)
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    return db
+
+
+def executed(db: Mock) -> List[str]:
+    """SQL of every statement after the catalog query."""
+    return [str(call.args[0]) for call in db.execute.call_args_list[1:]]
+
+
+class TestPartitionHelpers:
+    """Test cases for partition naming and month arithmetic."""
+
+    def test_month_start_normalizes_to_utc(self):
+        """Test timestamps map to midnight UTC on the first of their month."""
+        assert month_start(datetime(2026, 10, 18, 15, 30, tzinfo=UTC)) == datetime(
+            2026, 10, 1, tzinfo=UTC
+        )
+        assert month_start(datetime(2026, 10, 31, 23, 30)) == datetime(2026, 10, 1, tzinfo=UTC)
+
+    def test_add_months_crosses_years(self):
+        """Test month shifts wrap around year boundaries in both directions."""
+        october = datetime(2026, 10, 1, tzinfo=UTC)
+
+        assert add_months(october, 3) == datetime(2027, 1, 1, tzinfo=UTC)
+        assert add_months(october, -10) == datetime(2025, 12, 1, tzinfo=UTC)
+        assert add_months(october, 0) == october
+
+    def test_partition_name_round_trips(self):
+        """Test partition names parse back to their month; others are ignored."""
+        name = partition_name("notifications", datetime(2026, 3, 9, tzinfo=UTC))
+
+        assert name == "notifications_p202603"
+        assert partition_month("notifications", name) == datetime(2026, 3, 1, tzinfo=UTC)
+        assert partition_month("notifications", "notifications_default") is None
+        assert partition_month("notifications", "notifications_p202613") is None
+        assert partition_month("task_activities", name) is None
+
+
+class TestPartitionRepository:
+    """Test cases for PartitionRepository."""
+
+    @pytest.mark.asyncio
+    async def test_drop_keeps_month_containing_cutoff(self):
+        """Test only partitions ending before the cutoff month are dropped."""
+        db = fake_session(
+            [
+                "notifications_default",
+                "notifications_p202607",
+                "notifications_p202608",
+                "notifications_p202609",
+                "notifications_p202610",
+            ]
+        )
+
+        dropped = await PartitionRepository(db).drop_partitions_before(
+            "notifications", datetime(2026, 9, 18, tzinfo=UTC)
+        )
+
+        assert dropped == ["notifications_p202607", "notifications_p202608"]
+        assert executed(db) == [
+            "DROP TABLE IF EXISTS notifications_p202607",
+            "DROP TABLE IF EXISTS notifications_p202608",
+        ]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_skips_existing_months(self):
+        """Test pre-creation only creates missing months with UTC bounds."""
+        db = fake_session(["task_activities_p202610", "task_activities_default"])
+
+        created = await PartitionRepository(db).create_partitions(
+            "task_activities", datetime(2026, 10, 18, tzinfo=UTC), 3
+        )
+
+        assert created == ["task_activities_p202611", "task_activities_p202612"]
+        assert executed(db)[1] == (
+            "CREATE TABLE IF NOT EXISTS task_activities_p202612 PARTITION OF task_activities "
+            "FOR VALUES FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')"
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_table_rejected(self):
+        """Test tables that are not partitioned by month are refused."""
+        db = fake_session([])
+
+        with pytest.raises(ValueError):
+            await PartitionRepository(db).drop_partitions_before("users", datetime.now(UTC))
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_old_notifications_drops_partitions(self):
+        """Test notification cleanup drops whole months instead of deleting rows."""
+        current = month_start(datetime.now(UTC))
+        db = fake_session(
+            [partition_name("notifications", add_months(current, -n)) for n in range(4, -1, -1)]
+        )
+
+        # Cutoff falls a day into the month two months back
+        days = (datetime.now(UTC) - add_months(current, -2)).days - 1
+
+        count = await NotificationRepository(db).delete_old_notifications(days=days)
+
+        assert count == 2
+        statements = executed(db)
+        assert all(sql.startswith("DROP TABLE") for sql in statements)
+        assert statements[-1].endswith(partition_name("notifications", add_months(current, -3)))
@@ -0,0 +1,188 @@
+"""
+Unit tests for the principal cache.
+
+Tests user and project-role caching across the in-process and Redis
+tiers, request-scoped reuse, invalidation (including after commit), and that authentication and
+permission checks skip the database on a cache hit.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ardha.core import principal_cache as principal_cache_module
+from ardha.core import security
+from ardha.core.principal_cache import PrincipalCache
+from ardha.core.security import create_access_token, get_current_user
+from ardha.models.project_member import ProjectMember
+from ardha.models.user import User
+from ardha.services.project_service import ProjectService
+
+
+def make_user() -> User:
+    """Create a User row as loaded from the database."""
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid4(),
+        email="cache@example.com",
+        username="cacheuser",
+        full_name="Cache User",
+        password_hash="$2b$12$secret",
+        is_active=True,
+        is_superuser=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def cache(redis_client, monkeypatch):
+    """Principal cache backed by the test Redis client, installed as the global."""
+    instance = PrincipalCache(redis_client, local_ttl=60)
+    monkeypatch.setattr(principal_cache_module, "_principal_cache", instance)
+    PrincipalCache.begin_request()
+    return instance
+
+
+class TestPrincipalCache:
+    """Test cases for PrincipalCache."""
+
+    @pytest.mark.asyncio
+    async def test_user_round_trip_excludes_password(self, cache):
+        """Test cached user is a detached snapshot without credentials."""
+        user = make_user()
+        await cache.set_user(user)
+
+        cached = await cache.get_user(user.id)
+
+        assert cached is not user
+        assert cached.id == user.id
+        assert cached.email == user.email
+        assert cached.password_hash is None
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_workers(self, redis_client):
+        """Test an entry written by one worker is read by another from Redis."""
+        writer = PrincipalCache(redis_client, local_ttl=60)
+        reader = PrincipalCache(redis_client, local_ttl=60)
+        user_id, project_id = uuid4(), uuid4()
+
+        await writer.set_roles(user_id, {project_id: "admin"})
+
+        assert await reader.get_roles(user_id) == {project_id: "admin"}
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_redis(self, redis_client):
+        """Test invalidation removes the entry for workers with a cold local tier."""
+        writer = PrincipalCache(redis_client, local_ttl=60)
+        reader = PrincipalCache(redis_client, local_ttl=0)
+        user_id = uuid4()
+        await writer.set_roles(user_id, {uuid4(): "member"})
+
+        writer.invalidate_roles(user_id)
+        await writer.flush_invalidations()
+
+        assert await writer.get_roles(user_id) is None
+        assert await reader.get_roles(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_membership_event_invalidates(self, cache):
+        """Test ORM membership changes drop the cached role map."""
+        user_id = uuid4()
+        await cache.set_roles(user_id, {uuid4(): "viewer"})
+
+        member = ProjectMember(project_id=uuid4(), user_id=user_id, role="member")
+        principal_cache_module._on_membership_change(None, None, member)
+
+        assert await cache.get_roles(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_entry_filled_before_commit_dropped_after_commit(self, cache, redis_client):
+        """Test a role map read from pre-commit rows is dropped when the change commits."""
+        other_worker = PrincipalCache(redis_client, local_ttl=0)
+        user_id = uuid4()
+        session = Session()
+        session.begin()
+        member = ProjectMember(project_id=uuid4(), user_id=user_id, role="member")
+        session.add(member)
+
+        principal_cache_module._on_membership_change(None, None, member)
+        await asyncio.sleep(0)
+        # A concurrent request still sees the old membership and caches it
+        await other_worker.set_roles(user_id, {uuid4(): "viewer"})
+
+        session.expunge(member)
+        session.commit()
+        await asyncio.gather(*cache._tasks)
+
+        PrincipalCache.begin_request()
+        assert await other_worker.get_roles(user_id) is None
+        assert await cache.get_roles(user_id) is None
+        assert principal_cache_module.PENDING_INVALIDATIONS not in session.info
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_a_miss(self):
+        """Test Redis errors are treated as misses rather than raised."""
+        redis = Mock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = PrincipalCache(redis, local_ttl=0)
+        user_id = uuid4()
+
+        await cache.set_roles(uuid4(), {})
+
+        assert await cache.get_user(user_id) is None
+        assert await cache.get_roles(user_id) is None
+
+
+class TestAuthWithoutDatabase:
+    """Test cases for auth paths served from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_loads_once(self, cache, monkeypatch):
+        """Test repeat authentication does not query the database."""
+        user = make_user()
+        repository = Mock()
+        repository.get_by_id = AsyncMock(return_value=user)
+        monkeypatch.setattr(security, "UserRepository", Mock(return_value=repository))
+        token = create_access_token({"sub": str(user.id)})
+
+        first = await get_current_user(token, Mock())
+        second = await get_current_user(token, Mock())
+
+        assert first.id == second.id == user.id
+        repository.get_by_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_check_permission_loads_role_map_once(self, cache):
+        """Test repeated permission checks across projects cost one query."""
+        user_id, project_a, project_b = uuid4(), uuid4(), uuid4()
+        service = ProjectService(Mock())
+        service.repository = Mock()
+        service.repository.get_member_roles = AsyncMock(
+            return_value={project_a: "admin", project_b: "viewer"}
+        )
+
+        assert await service.check_permission(project_a, user_id, "admin") is True
+        assert await service.check_permission(project_b, user_id, "member") is False
+        assert await service.check_permission(uuid4(), user_id, "viewer") is False
+        assert await ProjectService(Mock()).check_permission(project_a, user_id, "member")
+
+        service.repository.get_member_roles.assert_awaited_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_request_scope_survives_local_expiry(self, redis_client, monkeypatch):
+        """Test a request keeps its role map even with no in-process tier."""
+        cache = PrincipalCache(redis_client, local_ttl=0)
+        monkeypatch.setattr(principal_cache_module, "_principal_cache", cache)
+        PrincipalCache.begin_request()
+        user_id, project_id = uuid4(), uuid4()
+        await cache.set_roles(user_id, {project_id: "owner"})
+
+        redis_client.get = AsyncMock(side_effect=AssertionError("Redis should not be read"))
+
+        assert await cache.get_roles(user_id) == {project_id: "owner"}
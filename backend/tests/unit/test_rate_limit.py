@@ -0,0 +1,203 @@
+"""
+Unit tests for the GCRA rate limiter.
+
+Tests the Lua script against Redis (or fakeredis): burst capacity,
+multi-tier evaluation, non-consuming inspection, and that rejected
+requests do not use up quota.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from ardha.core.rate_limit import RateLimit, RateLimiter, RateLimitResult, RateLimitTier
+
+
+@pytest.fixture
+def limiter(redis_client):
+    """Rate limiter backed by the test Redis client."""
+    return RateLimiter(redis_client, requests_per_minute=5, burst_size=5)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_reject(self, limiter):
+        """Test requests are admitted up to burst and then rejected."""
+        tier = RateLimitTier(name="user", limit=5, period=60)
+        key = limiter.key(tier, uuid4())
+
+        results = [await limiter.check([(key, tier)]) for _ in range(6)]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+        assert results[5].retry_after > 0
+        assert results[5].tier == "user"
+
+    @pytest.mark.asyncio
+    async def test_burst_reports_sustained_limit(self, limiter):
+        """Test a tier with burst headroom reports its sustained limit, not the burst."""
+        tier = RateLimitTier(name="user", limit=5, period=60, burst=8)
+        key = limiter.key(tier, uuid4())
+
+        result = await limiter.check([(key, tier)])
+
+        assert result.limit == 5
+        assert result.remaining == 7
+        assert result.to_headers()["X-RateLimit-Limit"] == "5"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_counted_individually(self, limiter):
+        """Test simultaneous requests each consume a slot (no same-second collapse)."""
+        tier = RateLimitTier(name="user", limit=10, period=60)
+        key = limiter.key(tier, uuid4())
+
+        results = await asyncio.gather(*(limiter.check([(key, tier)]) for _ in range(15)))
+
+        assert sum(r.allowed for r in results) == 10
+
+    @pytest.mark.asyncio
+    async def test_peek_does_not_consume(self, limiter):
+        """Test inspecting quota leaves it unchanged."""
+        tier = RateLimitTier(name="user", limit=3, period=60)
+        key = limiter.key(tier, uuid4())
+
+        for _ in range(5):
+            peeked = await limiter.peek([(key, tier)])
+            assert peeked.remaining == 3
+
+        assert (await limiter.check([(key, tier)])).remaining == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_do_not_consume(self, limiter):
+        """Test a rejection leaves the bucket where it was."""
+        tier = RateLimitTier(name="user", limit=2, period=60)
+        key = limiter.key(tier, uuid4())
+        await limiter.check([(key, tier)])
+        await limiter.check([(key, tier)])
+
+        first_reject = await limiter.check([(key, tier)])
+        for _ in range(10):
+            await limiter.check([(key, tier)])
+        later_reject = await limiter.check([(key, tier)])
+
+        # Retry time does not grow with rejected attempts
+        assert later_reject.retry_after <= first_reject.retry_after
+
+    @pytest.mark.asyncio
+    async def test_multi_tier_most_restrictive_wins(self, limiter):
+        """Test all tiers are checked and the tightest one is reported."""
+        user_tier = RateLimitTier(name="user", limit=100, period=60)
+        project_tier = RateLimitTier(name="project", limit=2, period=60)
+        user_key = limiter.key(user_tier, uuid4())
+        project_key = limiter.key(project_tier, uuid4())
+        limits = [(user_key, user_tier), (project_key, project_tier)]
+
+        first = await limiter.check(limits)
+        await limiter.check(limits)
+        rejected = await limiter.check(limits)
+
+        assert first.tier == "project"
+        assert first.remaining == 1
+        assert rejected.allowed is False
+        assert rejected.tier == "project"
+
+        # User tier was only charged for admitted requests
+        assert (await limiter.peek([(user_key, user_tier)])).remaining == 98
+
+    @pytest.mark.asyncio
+    async def test_legacy_is_allowed_and_headers(self, limiter):
+        """Test legacy API still works and headers do not consume quota."""
+        user_id = uuid4()
+
+        for _ in range(3):
+            headers = await limiter.get_rate_limit_headers(user_id)
+        allowed, info = await limiter.is_allowed(user_id)
+
+        assert headers["X-RateLimit-Remaining"] == "5"
+        assert allowed is True
+        assert info["remaining"] == 4
+        assert info["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_fail_open_on_redis_error(self):
+        """Test requests are allowed if Redis is unavailable."""
+        redis = Mock()
+        redis.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+        limiter = RateLimiter(redis)
+        tier = RateLimitTier(name="user", limit=1)
+
+        result = await limiter.check([("k", tier)])
+
+        assert result.allowed is True
+
+
+class TestRateLimitDependency:
+    """Test cases for the RateLimit FastAPI dependency."""
+
+    def make_request(self, project_id=None):
+        request = Mock()
+        request.method = "POST"
+        request.path_params = {"project_id": str(project_id)} if project_id else {}
+        route = Mock()
+        route.path = "/projects/{project_id}/tasks"
+        request.scope = {"route": route}
+        return request
+
+    def test_limits_for_resolves_keys(self):
+        """Test keys are built per user, project and route template."""
+        limiter = RateLimiter(Mock())
+        user_id, project_id = uuid4(), uuid4()
+        dependency = RateLimit(
+            user=RateLimitTier(name="user", limit=100),
+            project=RateLimitTier(name="project", limit=1000),
+            route=RateLimitTier(name="task_create", limit=30),
+        )
+
+        limits = dependency.limits_for(limiter, self.make_request(project_id), user_id)
+
+        assert [key for key, _ in limits] == [
+            f"rate_limit:user:{user_id}",
+            f"rate_limit:project:{project_id}",
+            f"rate_limit:task_create:POST:/projects/{{project_id}}/tasks:{user_id}",
+        ]
+
+    def test_project_tier_skipped_without_path_param(self):
+        """Test project tier is ignored on routes without a project."""
+        dependency = RateLimit(
+            user=RateLimitTier(name="user", limit=100),
+            project=RateLimitTier(name="project", limit=1000),
+        )
+
+        limits = dependency.limits_for(RateLimiter(Mock()), self.make_request(), uuid4())
+
+        assert [tier.name for _, tier in limits] == ["user"]
+
+    @pytest.mark.asyncio
+    async def test_rejection_raises_429(self, monkeypatch):
+        """Test rejected request raises 429 with rate limit headers."""
+        limiter = Mock()
+        limiter.key = RateLimiter.key.__get__(limiter)
+        limiter.key_prefix = "rate_limit"
+        limiter.check = AsyncMock(
+            return_value=RateLimitResult(
+                allowed=False, limit=10, remaining=0, reset_after=6, retry_after=5.5, tier="chat"
+            )
+        )
+        monkeypatch.setattr(
+            "ardha.core.rate_limit.get_rate_limiter", AsyncMock(return_value=limiter)
+        )
+        user = Mock()
+        user.id = uuid4()
+        dependency = RateLimit(user=RateLimitTier(name="chat", limit=10))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(self.make_request(), Mock(headers={}), user)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.detail["retry_after"] == 6
+        assert exc_info.value.headers["Retry-After"] == "6"
@@ -0,0 +1,228 @@
+"""
+Unit tests for denormalized task aggregates.
+
+Checks TaskStats math over aggregate rows, that milestone summary and
+roadmap reads are single queries on task_aggregates instead of counts
+over tasks, that the maintenance triggers and reconciliation keep the
+counters exact against the database, and that the reconciliation job
+retries projects whose repair raced a task change.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, update
+from sqlalchemy.exc import OperationalError
+
+from ardha.jobs.task_jobs import RECONCILE_ATTEMPTS, reconcile_task_aggregates
+from ardha.models.milestone import Milestone
+from ardha.models.task import Task
+from ardha.models.task_aggregate import TaskAggregate
+from ardha.repositories.milestone_repository import MilestoneRepository
+from ardha.repositories.task_aggregate_repository import TaskAggregateRepository, build_task_stats
+from tests.fixtures.project_fixtures import compiled, make_task
+
+
+class TestTaskStats:
+    """Test cases for TaskStats built from aggregate rows."""
+
+    def test_totals_and_progress(self):
+        """Test totals, completion and estimate sums across statuses."""
+        stats = build_task_stats([("done", 3, 6.0), ("todo", 1, 2.5), ("in_review", 0, 0.0)])
+
+        assert stats.by_status == {
+            "todo": 1,
+            "in_progress": 0,
+            "in_review": 0,
+            "done": 3,
+            "cancelled": 0,
+        }
+        assert stats.total == 4
+        assert stats.completed == 3
+        assert stats.progress == 75
+        assert stats.estimate_hours == 8.5
+        assert stats.completed_estimate_hours == 6.0
+
+    def test_empty_scope(self):
+        """Test a scope without aggregate rows reads as zero."""
+        stats = build_task_stats([])
+
+        assert stats.total == 0
+        assert stats.progress == 0
+        assert stats.estimate_hours == 0.0
+
+
+class TestAggregateReads:
+    """Test cases for reads served from task_aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_summary_stats_read_aggregates_not_tasks(self):
+        """Test milestone counts and progress come from one aggregate query."""
+        db = Mock()
+        result = MagicMock()
+        milestone_id = uuid4()
+        result.all.return_value = [(milestone_id, "done", 1, 2.0), (milestone_id, "todo", 1, 1.0)]
+        db.execute = AsyncMock(return_value=result)
+
+        progress = await MilestoneRepository(db).calculate_progress(milestone_id)
+
+        assert progress == 50
+        db.execute.assert_awaited_once()
+        sql = compiled(db.execute.call_args.args[0])
+        assert "FROM task_aggregates" in sql
+        assert "tasks." not in sql
+
+    @pytest.mark.asyncio
+    async def test_roadmap_is_one_query(self):
+        """Test milestones and their counters come back from a single join."""
+        db = Mock()
+        result = MagicMock()
+        first = Milestone(id=uuid4(), name="Alpha", order=0)
+        second = Milestone(id=uuid4(), name="Beta", order=1)
+        result.all.return_value = [
+            (first, "done", 2, 4.0),
+            (first, "in_progress", 1, 3.0),
+            (second, None, None, None),
+        ]
+        db.execute = AsyncMock(return_value=result)
+
+        roadmap = await MilestoneRepository(db).get_milestones_with_stats(uuid4())
+
+        db.execute.assert_awaited_once()
+        sql = compiled(db.execute.call_args.args[0])
+        assert "LEFT OUTER JOIN task_aggregates ON task_aggregates.scope_id = milestones.id" in sql
+        assert [milestone for milestone, _ in roadmap] == [first, second]
+        assert roadmap[0][1].total == 3
+        assert roadmap[0][1].estimate_hours == 7.0
+        assert roadmap[1][1].total == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_is_one_statement(self):
+        """Test a project is repaired by a single statement returning the drift."""
+        db = Mock()
+        result = MagicMock()
+        result.one.return_value = (2, 1)
+        db.execute = AsyncMock(return_value=result)
+
+        assert await TaskAggregateRepository(db).reconcile(uuid4()) == 3
+        db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestMaintenanceTriggers:
+    """Test cases for the triggers and reconciliation, run against the database."""
+
+    @pytest_asyncio.fixture
+    async def milestone(self, test_db, db_project) -> Milestone:
+        milestone = Milestone(project_id=db_project.id, name="Alpha", order=0)
+        test_db.add(milestone)
+        await test_db.commit()
+        return milestone
+
+    async def test_task_writes_adjust_counters(self, test_db, db_project, milestone):
+        """Test inserts, updates and deletes keep project and milestone counters exact."""
+        repository = TaskAggregateRepository(test_db)
+        tasks = [
+            make_task(db_project, 1, estimate_hours=2.0, milestone_id=milestone.id),
+            make_task(db_project, 2, estimate_hours=3.0, milestone_id=milestone.id),
+            make_task(db_project, 3),
+        ]
+        test_db.add_all(tasks)
+        await test_db.commit()
+
+        project_stats = await repository.get_stats(db_project.id)
+        assert project_stats.by_status["todo"] == 3
+        assert project_stats.estimate_hours == 5.0
+        assert (await repository.get_stats(milestone.id)).total == 2
+
+        tasks[0].status = "done"
+        tasks[1].milestone_id = None
+        tasks[2].title = "Renamed"
+        await test_db.commit()
+
+        project_stats = await repository.get_stats(db_project.id)
+        assert (project_stats.by_status["todo"], project_stats.completed) == (2, 1)
+        assert project_stats.completed_estimate_hours == 2.0
+        milestone_stats = await repository.get_stats(milestone.id)
+        assert (milestone_stats.total, milestone_stats.completed) == (1, 1)
+        assert milestone_stats.estimate_hours == 2.0
+
+        await test_db.execute(delete(Task).where(Task.id == tasks[0].id))
+        await test_db.commit()
+
+        project_stats = await repository.get_stats(db_project.id)
+        assert (project_stats.total, project_stats.completed) == (2, 0)
+        assert project_stats.estimate_hours == 3.0
+        assert (await repository.get_stats(milestone.id)).total == 0
+        assert await repository.reconcile(db_project.id) == 0
+
+    async def test_reconcile_repairs_drift(self, test_db, db_project):
+        """Test drifted counters are rewritten and stray rows removed."""
+        repository = TaskAggregateRepository(test_db)
+        test_db.add_all([make_task(db_project, 1), make_task(db_project, 2, status="done")])
+        await test_db.commit()
+        await test_db.execute(
+            update(TaskAggregate)
+            .where(TaskAggregate.scope_id == db_project.id, TaskAggregate.status == "todo")
+            .values(task_count=5)
+        )
+        test_db.add(
+            TaskAggregate(
+                scope_id=uuid4(),
+                status="todo",
+                scope="milestone",
+                project_id=db_project.id,
+                task_count=1,
+                estimate_hours=0.0,
+            )
+        )
+        await test_db.commit()
+
+        assert await repository.reconcile(db_project.id) == 2
+        await test_db.commit()
+
+        stats = await repository.get_stats(db_project.id)
+        assert (stats.by_status["todo"], stats.completed) == (1, 1)
+        assert await repository.reconcile(db_project.id) == 0
+
+
+class TestReconcileJob:
+    """Test cases for the reconcile_task_aggregates job."""
+
+    @pytest.mark.asyncio
+    async def test_retries_serialization_failures(self):
+        """Test a project is retried and a persistently failing one is reported."""
+        flaky, broken = uuid4(), uuid4()
+        attempts = {flaky: 0, broken: 0}
+
+        async def reconcile(project_id):
+            attempts[project_id] += 1
+            if project_id == broken or attempts[project_id] == 1:
+                raise OperationalError("reconcile", {}, Exception("could not serialize access"))
+            return 2
+
+        session = Mock()
+        session.scalars = AsyncMock(return_value=MagicMock(all=Mock(return_value=[flaky, broken])))
+        session.connection = AsyncMock()
+        session.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        with (
+            patch("ardha.jobs.task_jobs.async_session_factory", session_factory),
+            patch.object(TaskAggregateRepository, "reconcile", side_effect=reconcile),
+        ):
+            result = await reconcile_task_aggregates()
+
+        assert attempts == {flaky: 2, broken: RECONCILE_ATTEMPTS}
+        assert result["rows_repaired"] == 2
+        assert result["failed"] == [str(broken)]
+        assert not result["success"]
+        session.connection.assert_awaited_with(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
@@ -0,0 +1,157 @@
+"""
+Unit tests for bulk task creation.
+
+Runs TaskService.bulk_create_tasks over the real TaskRepository with a
+recording session: the number of statements stays the same whether the
+batch has 10 or 200 tasks, identifiers are reserved in one block, and
+invalid dependencies or missing permissions fail before anything is written.
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from ardha.models.task import Task
+from ardha.models.task_tag import TaskTag
+from ardha.services.task_service import (
+    CircularDependencyError,
+    InsufficientTaskPermissionsError,
+    TaskService,
+)
+
+
+class RecordingSession:
+    """Async session stand-in that answers the bulk creation statements."""
+
+    def __init__(self, slug: str = "ardha") -> None:
+        self.slug = slug
+        self.last_number = 0
+        self.statements: List[Any] = []
+        self.tags: Dict[str, TaskTag] = {}
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        result = Mock()
+        if statement.is_update:
+            # Task counter: last_task_number = last_task_number + :count
+            self.last_number += next(iter(statement.compile().params.values()))
+            result.one_or_none.return_value = (self.last_number, self.slug)
+        elif statement.is_insert and statement.table.name == "task_tags":
+            for row in statement._multi_values[0]:
+                values = {column.key: value for column, value in row.items()}
+                self.tags.setdefault(values["name"], TaskTag(**values))
+        elif statement.is_select:
+            result.scalars.return_value.all.return_value = list(self.tags.values())
+        return result
+
+    async def scalars(self, statement, rows):
+        self.statements.append(statement)
+        result = Mock()
+        result.all.return_value = [Task(**row) for row in rows]
+        return result
+
+
+def make_tasks(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": f"Task {number}",
+            "status": "todo",
+            "priority": "medium",
+            "tags": ["backend", "api"] if number % 2 else ["backend"],
+        }
+        for number in range(count)
+    ]
+
+
+@pytest.fixture
+def bulk_service():
+    """TaskService over a recording session with permission granted."""
+    db = RecordingSession()
+    service = TaskService(db)
+    service.project_service = Mock()
+    service.project_service.check_permission = AsyncMock(return_value=True)
+    service.graph_cache = Mock()
+    service.graph_cache.invalidate_on_commit = AsyncMock()
+    service.repository.log_activities = AsyncMock(wraps=service.repository.log_activities)
+    return service, db
+
+
+class TestBulkCreateTasks:
+    """Test cases for TaskService.bulk_create_tasks."""
+
+    @pytest.mark.asyncio
+    async def test_round_trips_independent_of_batch_size(self, bulk_service):
+        """Test 10 and 200 task batches issue the same handful of statements."""
+        service, db = bulk_service
+        project_id, user_id = uuid4(), uuid4()
+
+        await service.bulk_create_tasks(project_id, make_tasks(10), user_id)
+        small_batch = len(db.statements)
+        db.statements.clear()
+
+        tasks = await service.bulk_create_tasks(
+            project_id,
+            make_tasks(200),
+            user_id,
+            dependencies=[(number, number - 1) for number in range(1, 200)],
+        )
+
+        # counter, tasks, tags x2, tag links, activities (+ dependencies)
+        assert small_batch == 6
+        assert len(db.statements) == small_batch + 1
+        assert service.project_service.check_permission.await_count == 2
+        assert [task.identifier for task in tasks[:2]] == ["ARD-011", "ARD-012"]
+        assert tasks[-1].identifier == "ARD-210"
+        assert set(db.tags) == {"backend", "api"}
+        service.graph_cache.invalidate_on_commit.assert_awaited_with(db, [project_id])
+
+        activities = service.repository.log_activities.call_args.args[0]
+        actions = [activity["action"] for activity in activities]
+        assert actions.count("created") == 200
+        assert actions.count("tag_added") == 300
+        assert actions.count("dependency_added") == 199
+        assert activities[-1]["new_value"] == "ARD-209"
+
+    @pytest.mark.asyncio
+    async def test_proposal_link_written_with_tasks(self, bulk_service):
+        """Test tasks are inserted already linked to the proposal."""
+        service, _ = bulk_service
+        proposal_id = uuid4()
+
+        tasks = await service.bulk_create_tasks(
+            uuid4(), make_tasks(3), uuid4(), openspec_proposal_id=proposal_id
+        )
+
+        assert all(task.openspec_proposal_id == proposal_id for task in tasks)
+        activities = service.repository.log_activities.call_args.args[0]
+        linked = [a for a in activities if a["action"] == "openspec_linked"]
+        assert len(linked) == 3
+        assert all(a["user_id"] is None and a["new_value"] == str(proposal_id) for a in linked)
+
+    @pytest.mark.asyncio
+    async def test_cycle_rejected_before_writes(self, bulk_service):
+        """Test a dependency cycle inside the batch writes nothing."""
+        service, db = bulk_service
+
+        with pytest.raises(CircularDependencyError):
+            await service.bulk_create_tasks(
+                uuid4(), make_tasks(4), uuid4(), dependencies=[(0, 1), (1, 2), (2, 3), (3, 1)]
+            )
+
+        with pytest.raises(ValueError):
+            await service.bulk_create_tasks(uuid4(), make_tasks(2), uuid4(), dependencies=[(0, 5)])
+
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_permission_denied(self, bulk_service):
+        """Test non-members cannot create a batch."""
+        service, db = bulk_service
+        service.project_service.check_permission = AsyncMock(return_value=False)
+
+        with pytest.raises(InsufficientTaskPermissionsError):
+            await service.bulk_create_tasks(uuid4(), make_tasks(2), uuid4())
+
+        assert db.statements == []
@@ -0,0 +1,270 @@
+"""
+Unit tests and benchmark for task dependency graph queries.
+
+Checks plan computation on TaskGraph (topological order, levels, critical
+path, cycle detection), that cycle checks are one recursive query however
+deep the graph, the Redis graph cache, its racing-fill guard and after-commit invalidation, and a
+10k-task synthetic graph planned from a single cached adjacency.
+"""
+
+import asyncio
+import random
+import time
+from typing import List, Tuple
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ardha.core.task_graph import PENDING_INVALIDATIONS, GraphNode, TaskGraph, TaskGraphCache
+from ardha.repositories.task_repository import TaskRepository
+from ardha.services.task_service import CircularDependencyError, TaskService
+
+
+def make_graph(
+    count: int, edges: List[Tuple[int, int]], estimates: dict | None = None
+) -> TaskGraph:
+    """Graph of count tasks; edges are (task index, depends-on index) pairs."""
+    nodes = [
+        GraphNode(
+            id=uuid4(),
+            identifier=f"ARD-{number + 1:03d}",
+            title=f"Task {number}",
+            status="todo",
+            estimate_hours=(estimates or {}).get(number),
+        )
+        for number in range(count)
+    ]
+    return TaskGraph.build(uuid4(), nodes, [(nodes[task].id, nodes[dep].id) for task, dep in edges])
+
+
+def synthetic_graph(count: int, seed: int = 7) -> TaskGraph:
+    """Random DAG where each task depends on up to three earlier tasks."""
+    rng = random.Random(seed)
+    edges = []
+    for task in range(1, count):
+        for dep in rng.sample(range(max(0, task - 200), task), min(task, rng.randint(0, 3))):
+            edges.append((task, dep))
+    estimates = {number: float(rng.randint(1, 8)) for number in range(count)}
+    return make_graph(count, edges, estimates)
+
+
+def assert_dependencies_first(graph: TaskGraph, order: List[UUID]) -> None:
+    position = {task_id: index for index, task_id in enumerate(order)}
+    assert len(position) == len(graph.nodes)
+    for task_id, depends_on_task_id in graph.edges:
+        assert position[depends_on_task_id] < position[task_id]
+
+
+class TestTaskGraph:
+    """Test cases for TaskGraph plan computation."""
+
+    def test_diamond_plan(self):
+        """Test order, levels and critical path on a diamond with a side task."""
+        # 0 <- 1 (5h) <- 3, 0 <- 2 (1h) <- 3, 4 independent
+        graph = make_graph(5, [(1, 0), (2, 0), (3, 1), (3, 2)], {1: 5.0, 2: 1.0})
+        ids = [node.id for node in graph.nodes]
+
+        plan = graph.plan()
+
+        assert plan.order == [ids[0], ids[4], ids[1], ids[2], ids[3]]
+        assert [plan.levels[task_id] for task_id in ids] == [0, 1, 1, 2, 0]
+        assert plan.critical_path == [ids[0], ids[1], ids[3]]
+        assert plan.critical_path_hours == 7.0
+
+    def test_closed_tasks_add_no_remaining_work(self):
+        """Test done tasks stay in the plan but weigh nothing on the critical path."""
+        graph = make_graph(3, [(1, 0), (2, 1)], {0: 8.0, 1: 2.0, 2: 3.0})
+        graph.nodes[0].status = "done"
+
+        path, hours = graph.critical_path()
+
+        assert path == [node.id for node in graph.nodes]
+        assert hours == 5.0
+
+    def test_cycle_rejected(self):
+        """Test a stored cycle is reported instead of dropping tasks."""
+        graph = make_graph(3, [(0, 1), (1, 2), (2, 0)])
+
+        with pytest.raises(ValueError, match="ARD-001"):
+            graph.plan()
+
+    def test_build_drops_edges_outside_project(self):
+        """Test dependencies on unknown tasks are ignored."""
+        graph = make_graph(2, [(1, 0)])
+        graph = TaskGraph.build(graph.project_id, graph.nodes, graph.edges + [(uuid4(), uuid4())])
+
+        assert len(graph.edges) == 1
+
+
+class TestCycleCheck:
+    """Test cases for recursive-CTE cycle detection."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_check_is_one_recursive_query(self):
+        """Test the check is a single WITH RECURSIVE query, not a walk per node."""
+        db = Mock()
+        result = Mock()
+        result.scalar.return_value = True
+        db.execute = AsyncMock(return_value=result)
+        service = TaskService(db)
+        task_id, depends_on_task_id = uuid4(), uuid4()
+
+        assert await service.check_circular_dependency(task_id, depends_on_task_id)
+
+        db.execute.assert_awaited_once()
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH RECURSIVE dependency_closure(id) AS")
+        assert " UNION SELECT task_dependencies.depends_on_task_id" in sql
+        assert "SELECT EXISTS" in sql
+
+    @pytest.mark.asyncio
+    async def test_self_dependency_skips_database(self):
+        """Test a task depending on itself is rejected without a query."""
+        db = Mock()
+        db.execute = AsyncMock()
+        task_id = uuid4()
+
+        assert await TaskService(db).check_circular_dependency(task_id, task_id)
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_transitive_blockers_filter_closed_tasks(self):
+        """Test blockers reuse the closure and only keep open tasks."""
+        db = Mock()
+        db.execute = AsyncMock(return_value=MagicMock())
+
+        await TaskRepository(db).get_transitive_dependencies(uuid4(), incomplete_only=True)
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN dependency_closure ON dependency_closure.id = tasks.id" in sql
+        assert "tasks.status NOT IN" in sql
+
+
+class TestTaskGraphCache:
+    """Test cases for TaskGraphCache and the cached service path."""
+
+    @pytest.fixture
+    def cache(self, redis_client):
+        return TaskGraphCache(redis_client, ttl=300)
+
+    @pytest.mark.asyncio
+    async def test_fill_round_trips(self, cache):
+        """Test a filled graph is returned unchanged."""
+        graph = make_graph(3, [(1, 0), (2, 1)], {0: 2.5})
+        assert await cache.get(graph.project_id) is None
+
+        assert await cache.fill(graph, await cache.begin_fill(graph.project_id))
+
+        assert await cache.get(graph.project_id) == graph
+
+    @pytest.mark.asyncio
+    async def test_racing_fill_discarded(self, cache):
+        """Test a fill that started before an invalidation is not stored."""
+        graph = make_graph(2, [(1, 0)])
+        generation = await cache.begin_fill(graph.project_id)
+
+        await cache.invalidate([graph.project_id])
+
+        assert not await cache.fill(graph, generation)
+        assert await cache.get(graph.project_id) is None
+
+    @pytest.mark.asyncio
+    async def test_fill_before_commit_dropped_after_commit(self, cache):
+        """Test a graph read between a write and its commit is not served after it."""
+        graph = make_graph(2, [(1, 0)])
+        db = AsyncSession()
+        await db.begin()
+
+        await cache.invalidate_on_commit(db, [graph.project_id])
+        # A concurrent read of the pre-commit graph fills after the invalidation
+        assert await cache.fill(graph, await cache.begin_fill(graph.project_id))
+
+        await db.commit()
+        await asyncio.sleep(0)
+
+        assert await cache.get(graph.project_id) is None
+        assert db.sync_session.info.get(PENDING_INVALIDATIONS) is None
+
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_invalidation_pending(self, cache):
+        """Test the after-commit invalidation waits for a transaction that commits."""
+        graph = make_graph(2, [(1, 0)])
+        db = AsyncSession()
+        await db.begin()
+        await cache.invalidate_on_commit(db, [graph.project_id])
+        await db.rollback()
+
+        assert await cache.fill(graph, await cache.begin_fill(graph.project_id))
+        assert await cache.get(graph.project_id) == graph
+
+        await db.begin()
+        await db.commit()
+        await asyncio.sleep(0)
+
+        assert await cache.get(graph.project_id) is None
+
+    @pytest.mark.asyncio
+    async def test_plan_served_from_cache(self, cache):
+        """Test the second plan request does not touch the database."""
+        graph = make_graph(3, [(1, 0), (2, 1)])
+        service = TaskService(Mock())
+        service.graph_cache = cache
+        service.project_service = Mock()
+        service.project_service.check_permission = AsyncMock(return_value=True)
+        service.repository.get_dependency_graph = AsyncMock(
+            return_value=([node.model_dump() for node in graph.nodes], graph.edges)
+        )
+
+        _, first = await service.get_execution_plan(graph.project_id, uuid4())
+        _, second = await service.get_execution_plan(graph.project_id, uuid4())
+
+        service.repository.get_dependency_graph.assert_awaited_once()
+        assert first == second
+        assert first.order == [node.id for node in graph.nodes]
+
+    @pytest.mark.asyncio
+    async def test_stored_cycle_raises(self, cache):
+        """Test a cyclic stored graph surfaces as CircularDependencyError."""
+        graph = make_graph(2, [(0, 1), (1, 0)])
+        service = TaskService(Mock())
+        service.graph_cache = cache
+        service.project_service = Mock()
+        service.project_service.check_permission = AsyncMock(return_value=True)
+        service.repository.get_dependency_graph = AsyncMock(
+            return_value=([node.model_dump() for node in graph.nodes], graph.edges)
+        )
+
+        with pytest.raises(CircularDependencyError):
+            await service.get_execution_plan(graph.project_id, uuid4())
+
+
+class TestTaskGraphBenchmark:
+    """Benchmark on a 10k-task synthetic graph."""
+
+    @pytest.mark.asyncio
+    async def test_10k_task_plan_benchmark(self, redis_client):
+        """Benchmark: plan 10k tasks / ~15k dependencies from one cached adjacency."""
+        graph = synthetic_graph(10_000)
+        cache = TaskGraphCache(redis_client, ttl=300)
+        assert await cache.fill(graph, await cache.begin_fill(graph.project_id))
+
+        cached = await cache.get(graph.project_id)
+        assert cached == graph
+
+        started = time.perf_counter()
+        plan = cached.plan()
+        elapsed = time.perf_counter() - started
+
+        assert len(graph.edges) > 10_000
+        assert_dependencies_first(graph, plan.order)
+        for task_id, depends_on_task_id in graph.edges:
+            assert plan.levels[task_id] > plan.levels[depends_on_task_id]
+        critical = set(plan.critical_path)
+        assert plan.critical_path_hours == sum(
+            node.remaining_hours for node in cached.nodes if node.id in critical
+        )
+        # Linear in tasks + dependencies; a query per visited task could not come close
+        assert elapsed < 1.0, f"10k-task plan took {elapsed:.2f}s"
@@ -0,0 +1,69 @@
+"""
+Unit tests for task identifier allocation.
+
+Checks that identifiers come from a single counter UPDATE ... RETURNING
+per reservation (no task count or project load), that a batch reserves
+consecutive numbers, and that unknown projects are rejected.
+"""
+
+from typing import Optional, Tuple
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from ardha.repositories.task_repository import TaskRepository
+
+
+def counter_session(row: Optional[Tuple[int, str]]) -> Mock:
+    """Async session whose counter UPDATE returns the given row."""
+    db = Mock()
+    result = Mock()
+    result.one_or_none.return_value = row
+    db.execute = AsyncMock(return_value=result)
+    db.get = AsyncMock()
+    return db
+
+
+class TestReserveIdentifiers:
+    """Test cases for TaskRepository.reserve_identifiers."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reserves_consecutive_numbers(self):
+        """Test one statement reserves a block ending at the new counter value."""
+        db = counter_session((12, "ardha-platform"))
+
+        identifiers = await TaskRepository(db).reserve_identifiers(uuid4(), 3)
+
+        assert identifiers == ["ARD-010", "ARD-011", "ARD-012"]
+        db.execute.assert_awaited_once()
+        db.get.assert_not_awaited()
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE projects SET last_task_number=(projects.last_task_number +")
+        assert "RETURNING projects.last_task_number, projects.slug" in sql
+        assert "count(" not in sql
+
+    @pytest.mark.asyncio
+    async def test_numbers_grow_past_three_digits(self):
+        """Test identifiers keep their zero padding and widen after 999."""
+        db = counter_session((1000, "web"))
+
+        assert await TaskRepository(db).reserve_identifiers(uuid4(), 2) == ["WEB-999", "WEB-1000"]
+
+    @pytest.mark.asyncio
+    async def test_zero_count_skips_database(self):
+        """Test reserving nothing does not touch the counter."""
+        db = counter_session((1, "web"))
+
+        assert await TaskRepository(db).reserve_identifiers(uuid4(), 0) == []
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_project_rejected(self):
+        """Test a missing project raises instead of inventing a prefix."""
+        db = counter_session(None)
+
+        with pytest.raises(ValueError):
+            await TaskRepository(db).reserve_identifiers(uuid4())
@@ -0,0 +1,185 @@
+"""
+Unit tests for the durable webhook queue.
+
+Runs the queue and consumer pool against Redis (or fakeredis): delivery
+ID deduplication, per-partition ordering, retries, dead-lettering,
+recovery of entries left unacknowledged by a crashed consumer, and raw-body
+signature verification.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from typing import Dict, List
+
+import pytest
+
+from ardha.core.webhook_queue import WebhookConsumerPool, WebhookQueue
+from ardha.services.github_webhook_service import GitHubWebhookService, WebhookSecretCache
+
+
+@pytest.fixture
+def queue(redis_client):
+    """Webhook queue with two shards on the test Redis client."""
+    return WebhookQueue(redis_client, prefix="test:webhooks", shards=2)
+
+
+def make_pool(queue: WebhookQueue, handler, **kwargs) -> WebhookConsumerPool:
+    """Consumer pool with fast retries and short blocking reads."""
+    options = {"retry_base": 0.01, "retry_max": 0.01, "lease_ttl": 3, "block_ms": 20}
+    options.update(kwargs)
+    return WebhookConsumerPool(queue, handler, **options)
+
+
+async def wait_until(condition, timeout: float = 3.0) -> None:
+    """Poll until condition() is true or fail after timeout."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class TestWebhookQueue:
+    """Test cases for WebhookQueue and WebhookConsumerPool."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_enqueued_once(self, queue):
+        """Test a redelivered delivery ID is not queued again."""
+        assert await queue.enqueue("d-1", "repo-a", {"body": "{}"}) is True
+        assert await queue.enqueue("d-1", "repo-a", {"body": "{}"}) is False
+
+        assert await queue.pending_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_partition_processed_in_order(self, queue):
+        """Test entries of one partition are handled in order, each exactly once."""
+        handled: Dict[str, List[int]] = {"repo-a": [], "repo-b": []}
+
+        async def handler(fields):
+            await asyncio.sleep(0)
+            handled[fields["repo"]].append(int(fields["seq"]))
+
+        for seq in range(20):
+            for repo in handled:
+                await queue.enqueue(f"{repo}-{seq}", repo, {"repo": repo, "seq": str(seq)})
+
+        pool = make_pool(queue, handler)
+        await pool.start()
+        try:
+            await wait_until(lambda: sum(len(seqs) for seqs in handled.values()) == 40)
+        finally:
+            await pool.stop()
+
+        assert handled["repo-a"] == list(range(20))
+        assert handled["repo-b"] == list(range(20))
+        assert await queue.pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_then_dead_letters(self, queue, redis_client):
+        """Test a failing entry is retried, dead-lettered, and does not block later ones."""
+        attempts: List[str] = []
+        done: List[str] = []
+
+        async def handler(fields):
+            attempts.append(fields["delivery_id"])
+            if fields["delivery_id"] == "bad":
+                raise RuntimeError("boom")
+            done.append(fields["delivery_id"])
+
+        await queue.enqueue("bad", "repo-a", {"body": "{}"})
+        await queue.enqueue("good", "repo-a", {"body": "{}"})
+
+        pool = make_pool(queue, handler, max_attempts=3)
+        await pool.start()
+        try:
+            await wait_until(lambda: done == ["good"])
+        finally:
+            await pool.stop()
+
+        assert attempts == ["bad", "bad", "bad", "good"]
+        dead = await redis_client.xrange(queue.dead_letter_key)
+        assert len(dead) == 1
+        assert dead[0][1][b"delivery_id"] == b"bad"
+        assert dead[0][1][b"error"] == b"boom"
+        assert dead[0][1][b"attempts"] == b"3"
+
+    @pytest.mark.asyncio
+    async def test_unacked_entries_recovered_after_crash(self, queue, redis_client):
+        """Test entries read but not acknowledged by a dead consumer are processed."""
+        await queue.enqueue("d-1", "repo-a", {"body": "{}"})
+        shard = queue.shard_for("repo-a")
+        await queue.ensure_group(shard)
+        # A consumer read the entry and died before acknowledging it
+        await redis_client.xreadgroup(
+            queue.group, f"shard-{shard}", {queue.stream_key(shard): ">"}, count=1
+        )
+
+        handled: List[str] = []
+
+        async def handler(fields):
+            handled.append(fields["delivery_id"])
+
+        pool = make_pool(queue, handler)
+        await pool.start()
+        try:
+            await wait_until(lambda: handled == ["d-1"])
+        finally:
+            await pool.stop()
+
+        assert await queue.pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_shard_lease_is_exclusive(self, queue, redis_client):
+        """Test a shard leased by another node is not consumed."""
+        await queue.enqueue("d-1", "repo-a", {"body": "{}"})
+        shard = queue.shard_for("repo-a")
+        await redis_client.set(queue.lease_key(shard), "other-node", px=60000)
+
+        handled: List[str] = []
+
+        async def handler(fields):
+            handled.append(fields["delivery_id"])
+
+        pool = make_pool(queue, handler)
+        await pool.start()
+        await asyncio.sleep(0.1)
+        await pool.stop()
+
+        assert handled == []
+        assert await redis_client.get(queue.lease_key(shard)) == b"other-node"
+
+
+class TestWebhookVerification:
+    """Test cases for raw-body signature verification and the secret cache."""
+
+    def test_signature_uses_raw_body(self):
+        """Test the digest covers the exact bytes, not re-serialized JSON."""
+        body = b'{ "action": "opened",\n  "number": 1 }'
+        signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+        assert GitHubWebhookService.verify_webhook_signature("secret", body, signature)
+        assert not GitHubWebhookService.verify_webhook_signature(
+            "secret", json.dumps(json.loads(body)).encode(), signature
+        )
+        assert not GitHubWebhookService.verify_webhook_signature("other", body, signature)
+        assert not GitHubWebhookService.verify_webhook_signature(None, body, signature)
+
+    @pytest.mark.asyncio
+    async def test_secret_cache_loads_once(self):
+        """Test repeated lookups for a repository hit the database once."""
+        cache = WebhookSecretCache(ttl=60)
+        loads: List[str] = []
+
+        async def load():
+            loads.append("load")
+            return None
+
+        assert await cache.get("octo", "repo", load) is None
+        assert await cache.get("octo", "repo", load) is None
+        assert loads == ["load"]
+
+        cache.invalidate("octo", "repo")
+        await cache.get("octo", "repo", load)
+        assert loads == ["load", "load"]
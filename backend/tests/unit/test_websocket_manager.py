@@ -0,0 +1,400 @@
+"""
+Unit tests for WebSocketManager, connection writers and the Redis backplane.
+
+Tests local delivery, per-connection send queues and backpressure,
+cluster-wide publishing through a mocked backplane, and presence parsing
+without requiring a running Redis server.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from ardha.core import websocket_writer
+from ardha.core.config import settings
+from ardha.core.websocket_backplane import WebSocketBackplane
+from ardha.core.websocket_manager import WebSocketManager
+from ardha.core.websocket_writer import ConnectionWriter
+
+
+@pytest_asyncio.fixture
+async def ws_manager():
+    """Fresh WebSocketManager instance (bypasses the process singleton)."""
+    WebSocketManager._instance = None
+    manager = WebSocketManager()
+    yield manager
+    for writer in list(manager.writers.values()):
+        await writer.close()
+    WebSocketManager._instance = None
+
+
+def make_websocket() -> Mock:
+    """Create a mock WebSocket connection."""
+    websocket = Mock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    return websocket
+
+
+async def flush(manager: WebSocketManager) -> None:
+    """Let writer tasks drain their queues."""
+    for _ in range(100):
+        if all(writer.pending == 0 for writer in manager.writers.values()):
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+def make_backplane() -> Mock:
+    """Create a mock backplane that reports itself as running."""
+    backplane = Mock(spec=WebSocketBackplane)
+    backplane.is_running = True
+    backplane.node_id = "node-a"
+    backplane.add_member = AsyncMock()
+    backplane.remove_member = AsyncMock()
+    backplane.publish = AsyncMock(return_value=1)
+    backplane.get_room_users = AsyncMock(return_value=set())
+    backplane.is_user_connected = AsyncMock(return_value=True)
+    return backplane
+
+
+class TestLocalDelivery:
+    """Test cases for process-local delivery."""
+
+    @pytest.mark.asyncio
+    async def test_send_personal_message_local(self, ws_manager):
+        """Test personal message is delivered to local connection."""
+        user_id = uuid4()
+        websocket = make_websocket()
+        await ws_manager.connect(websocket, user_id)
+        await flush(ws_manager)
+        websocket.send_text.reset_mock()
+
+        sent = await ws_manager.send_personal_message(user_id, {"type": "ping"})
+        await flush(ws_manager)
+
+        assert sent is True
+        websocket.send_text.assert_awaited_once()
+        assert json.loads(websocket.send_text.await_args.args[0]) == {"type": "ping"}
+
+    @pytest.mark.asyncio
+    async def test_send_personal_messages_batch_local(self, ws_manager):
+        """Test a batch reaches each connected user once and skips offline users."""
+        alice, bob, offline = uuid4(), uuid4(), uuid4()
+        ws_alice, ws_bob = make_websocket(), make_websocket()
+        await ws_manager.connect(ws_alice, alice)
+        await ws_manager.connect(ws_bob, bob)
+        await flush(ws_manager)
+        ws_alice.send_text.reset_mock()
+        ws_bob.send_text.reset_mock()
+
+        delivered = await ws_manager.send_personal_messages(
+            [(alice, {"n": 1}), (bob, {"n": 2}), (offline, {"n": 3})]
+        )
+        await flush(ws_manager)
+
+        assert delivered == 2
+        assert json.loads(ws_alice.send_text.await_args.args[0]) == {"n": 1}
+        assert json.loads(ws_bob.send_text.await_args.args[0]) == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_deliver_local_respects_exclude(self, ws_manager):
+        """Test room delivery skips the excluded user."""
+        alice, bob = uuid4(), uuid4()
+        ws_alice, ws_bob = make_websocket(), make_websocket()
+        await ws_manager.connect(ws_alice, alice)
+        await ws_manager.connect(ws_bob, bob)
+        await ws_manager.join_room(alice, "project:1")
+        await ws_manager.join_room(bob, "project:1")
+        await flush(ws_manager)
+        ws_alice.send_text.reset_mock()
+        ws_bob.send_text.reset_mock()
+
+        reached = await ws_manager._deliver_local("project:1", '{"type": "x"}', exclude_user=alice)
+        await flush(ws_manager)
+
+        assert reached == 1
+        ws_alice.send_text.assert_not_awaited()
+        ws_bob.send_text.assert_awaited_once()
+
+
+class TestSendQueues:
+    """Test cases for serialize-once delivery through per-connection writers."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, ws_manager, monkeypatch):
+        """Test a room broadcast encodes the message a single time."""
+        encode_calls = []
+        original = WebSocketManager.encode_message
+
+        def counting_encode(message):
+            encode_calls.append(message)
+            return original(message)
+
+        for _ in range(5):
+            user_id = uuid4()
+            await ws_manager.connect(make_websocket(), user_id)
+            await ws_manager.join_room(user_id, "project:1")
+
+        monkeypatch.setattr(ws_manager, "encode_message", counting_encode)
+        reached = await ws_manager.broadcast_to_room("project:1", {"type": "x"})
+
+        assert reached == 5
+        assert len(encode_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_broadcast(self, ws_manager):
+        """Test 1,000-member broadcast costs about one write, not the sum of writes."""
+        slow_event = asyncio.Event()
+
+        async def slow_send(text):
+            await slow_event.wait()
+
+        sockets = []
+        for index in range(1000):
+            user_id = uuid4()
+            websocket = make_websocket()
+            if index == 0:
+                websocket.send_text = AsyncMock(side_effect=slow_send)
+            await ws_manager.connect(websocket, user_id)
+            await ws_manager.join_room(user_id, "project:big")
+            sockets.append(websocket)
+        await flush(ws_manager)
+
+        started = time.perf_counter()
+        reached = await ws_manager.broadcast_to_room("project:big", {"type": "x"})
+        elapsed = time.perf_counter() - started
+
+        assert reached == 1000
+        assert elapsed < 1.0
+
+        await flush(ws_manager)
+        # Every fast client received the frame while the slow one is still blocked
+        assert all(ws.send_text.await_count == 2 for ws in sockets[1:])
+        slow_event.set()
+
+    @pytest.mark.asyncio
+    async def test_disconnecting_slow_client_does_not_delay_others(self, ws_manager, monkeypatch):
+        """Test a slow socket dropped by backpressure never holds up the other sockets."""
+        monkeypatch.setattr(settings.websocket, "send_queue_size", 2)
+        monkeypatch.setattr(settings.websocket, "backpressure_policy", "disconnect")
+        slow_event = asyncio.Event()
+
+        async def slow_send(text):
+            await slow_event.wait()
+
+        slow_user, fast_user = uuid4(), uuid4()
+        slow_socket, fast_socket = make_websocket(), make_websocket()
+        slow_socket.send_text = AsyncMock(side_effect=slow_send)
+        for user_id, websocket in ((slow_user, slow_socket), (fast_user, fast_socket)):
+            await ws_manager.connect(websocket, user_id)
+            await ws_manager.join_room(user_id, "project:slow")
+        await flush(ws_manager)
+
+        for index in range(5):
+            started = time.perf_counter()
+            await ws_manager.broadcast_to_room("project:slow", {"type": "x", "index": index})
+            assert time.perf_counter() - started < 0.5
+            await flush(ws_manager)
+
+        # The fast socket got every frame; the slow one was disconnected
+        assert fast_socket.send_text.await_count == 6
+        assert await ws_manager.is_user_connected(slow_user) is False
+        assert await ws_manager.is_user_connected(fast_user) is True
+        assert not websocket_writer._close_tasks
+        slow_event.set()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_drop(self):
+        """Test drop policy discards frames once the queue is full."""
+        writer = ConnectionWriter(make_websocket(), max_queue_size=2, backpressure_policy="drop")
+
+        assert writer.offer("a") is True
+        assert writer.offer("b") is True
+        assert writer.offer("c") is False
+        assert writer.dropped_count == 1
+        assert writer.is_closed is False
+
+    @pytest.mark.asyncio
+    async def test_backpressure_disconnect(self):
+        """Test disconnect policy closes the writer and notifies the owner."""
+        on_close = AsyncMock()
+        writer = ConnectionWriter(
+            make_websocket(), max_queue_size=1, backpressure_policy="disconnect", on_close=on_close
+        )
+
+        assert writer.offer("a") is True
+        assert writer.offer("b") is False
+        await asyncio.sleep(0)
+
+        assert writer.is_closed is True
+        assert writer.offer("c") is False
+        on_close.assert_awaited_once_with(writer)
+
+    @pytest.mark.asyncio
+    async def test_write_failure_disconnects(self, ws_manager):
+        """Test a failing socket is removed from the manager."""
+        user_id = uuid4()
+        websocket = make_websocket()
+        websocket.send_text = AsyncMock(side_effect=RuntimeError("socket gone"))
+
+        await ws_manager.connect(websocket, user_id)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert await ws_manager.is_user_connected(user_id) is False
+        assert websocket not in ws_manager.writers
+
+
+class TestClusteredDelivery:
+    """Test cases for delivery through the Redis backplane."""
+
+    @pytest.mark.asyncio
+    async def test_connect_registers_presence(self, ws_manager):
+        """Test connecting registers the personal room on the backplane."""
+        ws_manager.backplane = make_backplane()
+        user_id = uuid4()
+
+        await ws_manager.connect(make_websocket(), user_id)
+
+        ws_manager.backplane.add_member.assert_awaited_once_with(f"user:{user_id}", user_id)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_presence(self, ws_manager):
+        """Test last disconnect removes the user from all backplane rooms."""
+        ws_manager.backplane = make_backplane()
+        user_id = uuid4()
+        websocket = make_websocket()
+        await ws_manager.connect(websocket, user_id)
+        await ws_manager.join_room(user_id, "project:1")
+
+        await ws_manager.disconnect(websocket, user_id)
+
+        removed = {call.args[0] for call in ws_manager.backplane.remove_member.await_args_list}
+        assert removed == {f"user:{user_id}", "project:1"}
+
+    @pytest.mark.asyncio
+    async def test_send_personal_message_publishes(self, ws_manager):
+        """Test personal message is published instead of sent locally."""
+        ws_manager.backplane = make_backplane()
+        user_id = uuid4()
+        websocket = make_websocket()
+        await ws_manager.connect(websocket, user_id)
+        await flush(ws_manager)
+        websocket.send_text.reset_mock()
+
+        sent = await ws_manager.send_personal_message(user_id, {"type": "notification"})
+
+        assert sent is True
+        ws_manager.backplane.publish.assert_awaited_once_with(
+            f"user:{user_id}", '{"type": "notification"}'
+        )
+        websocket.send_text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_personal_messages_publishes_batch(self, ws_manager):
+        """Test a batch is published in one backplane call."""
+        ws_manager.backplane = make_backplane()
+        ws_manager.backplane.publish_many = AsyncMock(return_value=[1, 0])
+        alice, bob = uuid4(), uuid4()
+
+        delivered = await ws_manager.send_personal_messages([(alice, {"n": 1}), (bob, {"n": 2})])
+
+        assert delivered == 1
+        ws_manager.backplane.publish_many.assert_awaited_once_with(
+            [(f"user:{alice}", '{"n": 1}'), (f"user:{bob}", '{"n": 2}')]
+        )
+        ws_manager.backplane.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_personal_message_no_receivers(self, ws_manager):
+        """Test publish with no subscribed workers reports user offline."""
+        ws_manager.backplane = make_backplane()
+        ws_manager.backplane.publish.return_value = 0
+
+        assert await ws_manager.send_personal_message(uuid4(), {"type": "x"}) is False
+
+    @pytest.mark.asyncio
+    async def test_broadcast_counts_cluster_members(self, ws_manager):
+        """Test broadcast returns cluster-wide member count minus excluded user."""
+        ws_manager.backplane = make_backplane()
+        alice, bob, carol = uuid4(), uuid4(), uuid4()
+        ws_manager.backplane.get_room_users.return_value = {alice, bob, carol}
+
+        reached = await ws_manager.broadcast_to_room("project:1", {"type": "x"}, alice)
+
+        assert reached == 2
+        ws_manager.backplane.publish.assert_awaited_once_with("project:1", '{"type": "x"}', alice)
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_falls_back_to_local(self, ws_manager):
+        """Test Redis errors fall back to local delivery."""
+        ws_manager.backplane = make_backplane()
+        ws_manager.backplane.publish.side_effect = ConnectionError("redis down")
+        user_id = uuid4()
+        websocket = make_websocket()
+        await ws_manager.connect(websocket, user_id)
+        await flush(ws_manager)
+        websocket.send_text.reset_mock()
+
+        sent = await ws_manager.send_personal_message(user_id, {"type": "x"})
+        await flush(ws_manager)
+
+        assert sent is True
+        websocket.send_text.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_presence_queries_use_backplane(self, ws_manager):
+        """Test presence queries answer for the whole cluster."""
+        ws_manager.backplane = make_backplane()
+        remote_user = uuid4()
+        ws_manager.backplane.get_room_users.return_value = {remote_user}
+
+        assert await ws_manager.is_user_connected(remote_user) is True
+        assert await ws_manager.get_room_users("project:1") == {remote_user}
+
+
+class TestWebSocketBackplane:
+    """Test cases for backplane presence parsing and envelopes."""
+
+    @pytest.mark.asyncio
+    async def test_get_room_users_parses_members(self):
+        """Test presence members from several nodes are merged by user."""
+        user_a, user_b = uuid4(), uuid4()
+        redis = Mock()
+        redis.zrangebyscore = AsyncMock(
+            return_value=[
+                f"node-1|{user_a}".encode(),
+                f"node-2|{user_a}".encode(),
+                f"node-2|{user_b}".encode(),
+                b"garbage",
+            ]
+        )
+        backplane = WebSocketBackplane(redis, deliver_local=AsyncMock(), node_id="node-1")
+
+        assert await backplane.get_room_users("project:1") == {user_a, user_b}
+
+    @pytest.mark.asyncio
+    async def test_publish_envelope(self):
+        """Test published envelope carries room, exclusion and message."""
+        excluded = uuid4()
+        redis = Mock()
+        redis.publish = AsyncMock(return_value=2)
+        backplane = WebSocketBackplane(redis, deliver_local=AsyncMock(), prefix="test:ws")
+
+        receivers = await backplane.publish("project:1", '{"type": "x"}', excluded)
+
+        assert receivers == 2
+        channel, payload = redis.publish.await_args.args
+        assert channel == "test:ws:room:project:1"
+        assert json.loads(payload) == {
+            "room_id": "project:1",
+            "exclude_user": str(excluded),
+            "payload": '{"type": "x"}',
+        }